@@ -30,6 +30,8 @@ import pymbar.timeseries
 
 import multiprocessing
 from multiprocessing import Process
+from AlGDock.WorkerPool import WorkerPool, SharedReplicas
+from AlGDock import Minimization
 
 # For profiling. Unnecessary for normal execution.
 # from memory_profiler import profile
@@ -83,6 +85,84 @@ class NullDevice():
   def write(self, s):
     pass
 
+class SweepBuffer():
+  """
+  Storage for configurations and energies from replica exchange
+  that is thinned as it is filled.
+
+  Stored sweeps are at least spacing sweeps apart. The spacing follows
+  a running estimate of the stride, based on the autocorrelation time,
+  and is half of the stride, so that there is a stored sweep near
+  every sweep that would be selected if all of them had been stored.
+  The arrays grow as needed.
+  """
+  def __init__(self, K, natoms, capacity=16):
+    self.spacing = 1
+    self.n = 0
+    self.sweeps = np.zeros(capacity, dtype=int)
+    self.confs = np.zeros((capacity, K, natoms, 3))
+    self.energies = {}
+
+  def append(self, sweep, confs, E):
+    """
+    Stores the configurations and energies from a sweep,
+    if it is at least spacing sweeps after the last stored sweep
+    """
+    if (self.n>0) and (sweep - self.sweeps[self.n-1] < self.spacing):
+      return
+    if self.n==len(self.sweeps):
+      self._resize(2*len(self.sweeps))
+    self.sweeps[self.n] = sweep
+    for k in range(len(confs)):
+      self.confs[self.n,k] = confs[k]
+    for term in E.keys():
+      if not term in self.energies.keys():
+        self.energies[term] = np.zeros((len(self.sweeps), len(E[term])))
+      self.energies[term][self.n] = E[term]
+    self.n += 1
+
+  def thin(self, spacing):
+    """
+    Sets the spacing between stored sweeps.
+    If it increases, sweeps that are closer are dropped.
+    """
+    if spacing>self.spacing:
+      keep = self._spaced(spacing)
+      self.n = len(keep)
+      self.sweeps[:self.n] = self.sweeps[keep]
+      self.confs[:self.n] = self.confs[keep]
+      for term in self.energies.keys():
+        self.energies[term][:self.n] = self.energies[term][keep]
+    self.spacing = spacing
+
+  def select(self, stride, nsweeps):
+    """
+    Returns indices of the stored sweeps that are closest to
+    sweeps stride-1, 2*stride-1, ..., up to nsweeps
+    """
+    targets = np.arange(min(stride-1,nsweeps-1), nsweeps, stride)
+    sweeps = self.sweeps[:self.n]
+    right = np.minimum(np.searchsorted(sweeps, targets), self.n-1)
+    left = np.maximum(right-1, 0)
+    closest = np.where(np.abs(sweeps[left]-targets) <= \
+      np.abs(sweeps[right]-targets), left, right)
+    return np.unique(closest)
+
+  def _spaced(self, spacing):
+    # Indices of stored sweeps that are at least spacing apart
+    keep = []
+    for i in range(self.n):
+      if (len(keep)==0) or (self.sweeps[i]-self.sweeps[keep[-1]]>=spacing):
+        keep.append(i)
+    return np.array(keep, dtype=int)
+
+  def _resize(self, capacity):
+    self.sweeps = np.resize(self.sweeps, capacity)
+    self.confs = np.resize(self.confs, (capacity,)+self.confs.shape[1:])
+    for term in self.energies.keys():
+      self.energies[term] = np.resize(self.energies[term], \
+        (capacity, self.energies[term].shape[1]))
+
 ##############
 # Main Class #
 ##############
@@ -125,6 +205,16 @@ last modified {2}
     else:
       self._cores = min(kwargs['cores'], available_cores)
     print "using %d/%d available cores"%(self._cores, available_cores)
+    self._pool = None # Persistent worker pool for replica exchange
+
+    if kwargs['grid_precision'] is None:
+      self._grid_precision = 'double'
+    else:
+      self._grid_precision = kwargs['grid_precision']
+    if kwargs['grid_layout'] is None:
+      self._grid_layout = 'linear'
+    else:
+      self._grid_layout = kwargs['grid_layout']
 
     if kwargs['rotate_matrix'] is not None:
       self._view_args_rotate_matrix = kwargs['rotate_matrix']
@@ -291,6 +381,11 @@ last modified {2}
                         join(kwargs['dir_grid'],'pbsa.nc'),
                         join(kwargs['dir_grid'],'pbsa.dx'),
                         join(kwargs['dir_grid'],'pbsa.dx.gz')])},
+      # Fine patches of the grids are optional
+      'fine_grids':dict([(key, a.findPath([kwargs['grid_%s_fine'%key]] + \
+          [FN for FN in [join(kwargs['dir_grid'],'%s.fine.%s'%(name,ext)) \
+            for ext in ['nc','dx','dx.gz']] if os.path.isfile(FN)])) \
+        for (key,name) in [('LJr','LJr'),('LJa','LJa'),('ELE','electrostatic')]]),
       'score':'default' if kwargs['score']=='default' \
                         else a.findPath([kwargs['score']]),
       'dir_cool':self.dir['cool']}
@@ -365,6 +460,7 @@ last modified {2}
         'min_repX_acc':0.3,
         'sweeps_per_cycle':1000,
         'attempts_per_sweep':25,
+        'repX_mode':'neighbors',
         'steps_per_sweep':50,
         'darts_per_sweep':0,
         'snaps_per_independent':3.0,
@@ -377,6 +473,8 @@ last modified {2}
       'site':None, 'site_center':None, 'site_direction':None,
       'site_max_X':None, 'site_max_R':None,
       'site_density':50., 'site_measured':None,
+      'first_state_sampler':'Random', 'random_dock_streaming':False,
+      'speculative_states':1,
       'MCMC_moves':1,
       'rmsd':False}.items() + \
       [('receptor_'+phase,None) for phase in allowed_phases])
@@ -578,9 +676,9 @@ last modified {2}
     from AlGDock.Integrators.SmartDarting.SmartDarting \
       import SmartDartingIntegrator # @UnresolvedImport
     self.sampler['cool_SmartDarting'] = SmartDartingIntegrator(\
-      self.universe, self.molecule, False)
+      self.universe, self.molecule, False, cores=self._cores)
     self.sampler['dock_SmartDarting'] = SmartDartingIntegrator(\
-      self.universe, self.molecule, True)
+      self.universe, self.molecule, True, cores=self._cores)
     from AlGDock.Integrators.ExternalMC.ExternalMC import ExternalMCIntegrator
     self.sampler['ExternalMC'] = ExternalMCIntegrator(\
       self.universe, self.molecule, step_size=0.25*MMTK.Units.Ang)
@@ -607,6 +705,9 @@ last modified {2}
       else:
         raise Exception('Unrecognized sampler!')
 
+    from BatchEnergies import BatchEnergyEvaluator # @UnresolvedImport
+    self._batch_energy = BatchEnergyEvaluator(self.universe)
+
     # Load progress
     self._postprocess(readOnly=True)
     self.calc_f_L(readOnly=True)
@@ -776,6 +877,8 @@ last modified {2}
     
     # Main loop for initial cooling:
     # choose new temperature, randomly select seeds, simulate
+    states_prescreened = 0
+    rejected = False # Whether the step is smaller after a rejected state
     while (not self.cool_protocol[-1]['crossed']):
       # Choose new temperature
       To = self.cool_protocol[-1]['T']
@@ -794,6 +897,18 @@ last modified {2}
             crossed = True
       else:
         raise Exception('No variance in configuration energies')
+
+      # Only simulate states with a predicted acceptance within the window
+      (T_s, adjusted) = self._prescreen_state('cool', \
+        lambda T_c: self._predicted_repX_acc(Es_MM/R*(1/T_c-1/To)), \
+        To, T, T_END, shrink_only=rejected)
+      if adjusted:
+        self.tee("  predicted repX acceptance at %d K "%T + \
+          "is outside the window; using %d K"%T_s)
+        if abs(T_s-To)<abs(T-To):
+          states_prescreened += 1
+        T = T_s
+        crossed = (T==T_END)
       self.cool_protocol.append(\
         {'T':T, 'a':(self.T_HIGH-T)/(self.T_HIGH-self.T_TARGET), 'MM':True, 'crossed':crossed})
 
@@ -846,6 +961,7 @@ last modified {2}
         confs = confs_o
         Es_MM = Es_MM_o
         tL_tensor = tL_tensor_o*1.25 # Use a smaller step
+        rejected = True
         self.tee("  rejected new state, as estimated repX" + \
           " acceptance is too low!")
       elif (mean_acc>0.99) and (not crossed):
@@ -853,9 +969,11 @@ last modified {2}
         # reject the previous state and restart
         self.confs['cool']['replicas'][-1] = confs[np.random.randint(len(confs))]
         self.cool_protocol.pop(-2)
+        rejected = False
         self.tee("  rejected previous state, as estimated repX" + \
           " acceptance is too high!")
       else:
+        rejected = False
         self.confs['cool']['replicas'].append(confs[np.random.randint(len(confs))])
         self.confs['cool']['samples'].append([confs])
         if len(self.confs['cool']['samples'])>2 and \
@@ -906,6 +1024,8 @@ last modified {2}
     self.tee("Elapsed time for initial %sing of "%direction_name + \
       "%d states: "%len(self.cool_protocol) + \
       HMStime(time.time()-cool_start_time))
+    self.tee("  predicted acceptance avoided " + \
+      "%d simulations of rejected states"%states_prescreened)
     self._clear_lock('cool')
     self.sampler['cool_SmartDarting'].confs = []
     return True
@@ -1091,48 +1211,62 @@ last modified {2}
       [('T',self.T_HIGH),('site',True)])
     self._set_universe_evaluator(lambda_scalables)
 
+    # Translation i belongs to replicate i%n_replicates. The error of the
+    # free energy estimate is from the spread between replicates.
+    n_replicates = 5
+
     # Either loads or generates the random translations and rotations for the first state of docking
     if not (hasattr(self,'_random_trans') and hasattr(self,'_random_rotT')):
       self._max_n_trans = 10000
       # Default density of points is 50 per nm**3
       self._n_trans = max(min(np.int(np.ceil(self._forceFields['site'].volume*self.params['dock']['site_density'])),self._max_n_trans),5)
+      self._n_trans = n_replicates*int(np.ceil(float(self._n_trans)/n_replicates))
+      # Translations and rotations are from quasi-random sequences,
+      # so that the placements cover the site and orientations evenly.
+      # Each replicate of the translations is a differently shifted
+      # sequence, so the replicates are independent.
+      points = np.array([self._forceFields['site'].randomPoints(\
+        self._max_n_trans//n_replicates) for r in range(n_replicates)])
       self._random_trans = np.ndarray((self._max_n_trans), dtype=Vector)
-      for ind in range(self._max_n_trans):
-        self._random_trans[ind] = Vector(self._forceFields['site'].randomPoint())
+      for (ind, point) in enumerate(\
+          np.transpose(points, (1,0,2)).reshape((-1,3))):
+        self._random_trans[ind] = Vector(point)
       self._max_n_rot = 100
       self._n_rot = 100
-      self._random_rotT = np.ndarray((self._max_n_rot,3,3))
-      from AlGDock.Integrators.ExternalMC.ExternalMC import random_rotate
-      for ind in range(self._max_n_rot):
-        self._random_rotT[ind,:,:] = np.transpose(random_rotate())
+      from AlGDock.QuasiRandom import rotations
+      self._random_rotT = np.transpose(rotations(self._max_n_rot), (0,2,1))
     else:
       self._max_n_trans = self._random_trans.shape[0]
       self._n_rot = self._random_rotT.shape[0]
 
+    self._random_dock_reservoir = None
+    if self.params['dock']['first_state_sampler']=='FFT':
+      return self.FFT_dock(cool0_confs, cool0_Es_MM, lambda_o)
+    if self.params['dock']['random_dock_streaming']:
+      return self._stream_random_dock(cool0_confs, cool0_Es_MM, lambda_o, \
+        n_replicates)
+    # Placements are indexed by conformer, rotation, and translation
+    self._random_dock_placements = None
+
     # Get interaction energies.
-    # Loop over configurations, random rotations, and random translations
+    # Configurations, random rotations, and random translations
+    # are evaluated in batches
     E = {}
     for term in (['MM','site']+self._scalables):
       # Large array creation may cause MemoryError
       E[term] = np.zeros((self.params['dock']['seeds_per_state'], \
         self._max_n_rot,self._n_trans))
     self.tee("  allocated memory for interaction energies")
+    random_trans = np.array([t.array for t in self._random_trans])
 
     converged = False
     n_trans_o = 0
     n_trans_n = self._n_trans
     while not converged:
-      for c in range(self.params['dock']['seeds_per_state']):
-        E['MM'][c,:,:] = cool0_Es_MM[c]
-        for i_rot in range(self._n_rot):
-          conf_rot = Configuration(self.universe,\
-            np.dot(cool0_confs[c], self._random_rotT[i_rot,:,:]))
-          for i_trans in range(n_trans_o, n_trans_n):
-            self.universe.setConfiguration(conf_rot)
-            self.universe.translateTo(self._random_trans[i_trans])
-            eT = self.universe.energyTerms()
-            for (key,value) in eT.iteritems():
-              E[term_map[key]][c,i_rot,i_trans] += value
+      E_n = self._random_dock_energies(cool0_confs, cool0_Es_MM, \
+        random_trans[n_trans_o:n_trans_n])
+      for term in E_n.keys():
+        E[term][:,:self._n_rot,n_trans_o:n_trans_n] = E_n[term]
       E_c = {}
       for term in E.keys():
         # Large array creation may cause MemoryError
@@ -1141,17 +1275,17 @@ last modified {2}
       (u_kln,N_k) = self._u_kln([E_c],\
         [lambda_o,self._next_dock_state(E=E_c, lambda_o=lambda_o)])
       du = u_kln[0,1,:] - u_kln[0,0,:]
-      bootstrap_reps = 50
-      f_grid0 = np.zeros(bootstrap_reps)
-      for b in range(bootstrap_reps):
-        du_b = du[np.random.randint(0, len(du), len(du))]
-        f_grid0[b] = -np.log(np.exp(-du_b+min(du_b)).mean()) + min(du_b)
-      f_grid0_std = f_grid0.std()
+      du_min = min(du)
+      replicate = (np.arange(len(du))%n_trans_n)%n_replicates
+      (f_grid0, f_grid0_std) = self._replicate_free_energy(\
+        np.log(np.bincount(replicate, weights=np.exp(-du + du_min), \
+          minlength=n_replicates)) - du_min, \
+        np.bincount(replicate, minlength=n_replicates))
       converged = f_grid0_std<0.1
       if not converged:
         self.tee("  with %s translations "%n_trans_n + \
                  "the predicted free energy difference is %f (%f)"%(\
-                 f_grid0.mean(),f_grid0_std))
+                 f_grid0,f_grid0_std))
         if n_trans_n == self._max_n_trans:
           break
         n_trans_o = n_trans_n
@@ -1170,7 +1304,7 @@ last modified {2}
              "%d translations and %d rotations "%(n_trans_n,self._n_rot))
     self.tee("  the predicted free energy difference between the" + \
              " first and second docking states is " + \
-             "%f (%f)"%(f_grid0.mean(),f_grid0_std))
+             "%f (%f)"%(f_grid0,f_grid0_std))
 
     ravel_start_time = time.time()
     for term in E.keys():
@@ -1180,6 +1314,319 @@ last modified {2}
 
     return (cool0_confs, E)
 
+  def _replicate_free_energy(self, log_sums, counts):
+    """
+    Returns the free energy, -ln <exp(-du)>, and its standard error
+    from independently randomized quasi-random replicates, where
+    log_sums are the logarithms of the sums of exp(-du) in each replicate
+    and counts are the numbers of placements in each replicate.
+    
+    The error of quasi-random estimates is usually much smaller than
+    that of independent samples, so it is estimated from the spread
+    between replicates rather than from the variance of du.
+    """
+    f = -(np.logaddexp.reduce(log_sums) - np.log(np.sum(counts)))
+    f_r = -(log_sums - np.log(counts))
+    return (f, f_r.std(ddof=1)/np.sqrt(len(f_r)))
+
+  def _batch_grid_terms(self):
+    """
+    Returns BatchGridTerm objects for the scalable grids,
+    at full strength, for the ligand in self.universe
+    """
+    from AlGDock.ForceFields.Grid import BatchInterpolation
+    if not 'grids' in self._forceFields.keys():
+      self._load_grids()
+    if self._forceFields['grids'] is not None:
+      grid_FFs = [self._forceFields['grids']]
+    else:
+      grid_FFs = [self._forceFields[scalable] for scalable in self._scalables]
+    terms = []
+    for grid_FF in grid_FFs:
+      terms += BatchInterpolation.terms_from_force_field(grid_FF, self.universe)
+    for term in terms:
+      term.strength = 1.0
+    return terms
+
+  def _random_dock_energies(self, cool0_confs, cool0_Es_MM, trans, \
+      chunk_size=2**21):
+    """
+    Returns the energies of the cooling state 0 configurations
+    with each of the random rotations and with their centers of mass
+    at each translation in trans, an array with shape (n_trans,3),
+    as a dictionary of arrays with shape (nconfs, self._n_rot, n_trans).
+
+    Rotated configurations are built by one matrix product and
+    translated by broadcasting. The MM energy does not change,
+    the site energy only depends on the translation,
+    and the grid energies are evaluated in batches of placements
+    with up to chunk_size atoms.
+    """
+    terms = self._batch_grid_terms()
+    masses = self.universe.masses().array
+    confs = np.array(cool0_confs)
+    (nconfs, natoms) = confs.shape[:2]
+    shape = (nconfs, self._n_rot, len(trans))
+
+    E = {}
+    E['MM'] = np.empty(shape)
+    E['MM'][:] = np.array(cool0_Es_MM)[:,None,None]
+    E['site'] = np.empty(shape)
+    E['site'][:] = self._forceFields['site'].centerOfMassEnergies(trans)
+    for term in terms:
+      E[term.name] = np.zeros(shape)
+    if len(trans)==0:
+      return E
+
+    # Rotated configurations with their centers of mass at the origin
+    rotated = np.einsum('cnj,rjk->crnk', confs, \
+      self._random_rotT[:self._n_rot])
+    com = np.einsum('n,crnk->crk', masses, rotated)/masses.sum()
+    rotated -= com[:,:,None,:]
+    n_rot_chunk = max(1, chunk_size//(len(trans)*natoms))
+    for c in range(nconfs):
+      for start in range(0, self._n_rot, n_rot_chunk):
+        rot = rotated[c,start:start+n_rot_chunk]
+        placed = rot[:,None,:,:] + trans[None,:,None,:]
+        placed = placed.reshape((-1,natoms,3))
+        for term in terms:
+          E[term.name][c,start:start+len(rot),:] = \
+            term.energies(placed).reshape((len(rot),len(trans)))
+    return E
+
+  def _placement_energies(self, cool0_confs, cool0_Es_MM, placements):
+    """
+    Returns the energies of placements, a dictionary with arrays of
+    conformer indices, 'conf', rotation indices, 'rotation',
+    and center of mass positions, 'translation'
+    """
+    terms = self._batch_grid_terms()
+    confs = self._random_dock_confs(cool0_confs, placements)
+    E = {}
+    E['MM'] = np.array(cool0_Es_MM)[placements['conf']]
+    E['site'] = self._forceFields['site'].centerOfMassEnergies(\
+      placements['translation'])
+    for term in terms:
+      E[term.name] = term.energies(confs)
+    return E
+
+  def _stream_random_dock(self, cool0_confs, cool0_Es_MM, lambda_o, \
+      n_replicates):
+    """
+      Randomly places the ligand into the receptor, like random_dock,
+      without storing the energies of every placement
+
+      The energies of a uniform sample of up to self._max_n_trans placements
+      are stored and used to choose the second docking state. Placements
+      are then evaluated one conformer at a time. For each, the running
+      log-sum-exp of exp(-du), where du is the reduced energy difference
+      between the first and second states, is accumulated for the free
+      energy estimate, separately for each of the n_replicates replicates of
+      the translations. A reservoir of seeds_per_state
+      placements is weighted by exp(-du) (Efraimidis and Spirakis, 2006)
+      and used to seed the second state in initial_dock.
+    """
+    random_trans = np.array([t.array for t in self._random_trans])
+    nconfs = len(cool0_confs)
+    n_seeds = self.params['dock']['seeds_per_state']
+
+    # A uniform sample of placements
+    n_placements = nconfs*self._n_rot*self._n_trans
+    ind = np.unique(np.random.randint(n_placements, \
+      size=min(self._max_n_trans, n_placements)))
+    (c, i_rot, i_trans) = np.unravel_index(ind, \
+      (nconfs, self._n_rot, self._n_trans))
+    self._random_dock_placements = {'conf':c, 'rotation':i_rot, \
+      'translation':random_trans[i_trans]}
+    E = self._placement_energies(cool0_confs, cool0_Es_MM, \
+      self._random_dock_placements)
+    lambda_n = self._next_dock_state(E=E, lambda_o=lambda_o)
+
+    log_sums = -np.inf*np.ones(n_replicates)
+    counts = np.zeros(n_replicates, dtype=int)
+    reservoir = {'key':np.zeros(0), 'conf':np.zeros(0, dtype=int), \
+      'rotation':np.zeros(0, dtype=int), 'trans_ind':np.zeros(0, dtype=int)}
+
+    converged = False
+    n_trans_o = 0
+    n_trans_n = self._n_trans
+    while not converged:
+      n_new = n_trans_n - n_trans_o
+      for c in range(nconfs):
+        E_c = self._random_dock_energies([cool0_confs[c]], [cool0_Es_MM[c]], \
+          random_trans[n_trans_o:n_trans_n])
+        for term in E_c.keys():
+          E_c[term] = np.ravel(E_c[term])
+        (u_kln,N_k) = self._u_kln([E_c],[lambda_o,lambda_n])
+        du = u_kln[0,1,:] - u_kln[0,0,:]
+
+        # Running log-sum-exp of the Boltzmann factors in each replicate
+        replicate = (np.arange(len(du))%n_new + n_trans_o)%n_replicates
+        u_max = (-du).max()
+        with np.errstate(divide='ignore'): # for replicates without placements
+          log_sums = np.logaddexp(log_sums, u_max + np.log(np.bincount(\
+            replicate, weights=np.exp(-du - u_max), minlength=n_replicates)))
+        counts += np.bincount(replicate, minlength=n_replicates)
+
+        # Keep the placements with the lowest keys, log(-log(U)) + du,
+        # where U is uniform, in the reservoir. This is the order of
+        # the largest keys, U**(1/w) with weights w = exp(-du).
+        key = np.log(-np.log(np.random.uniform(size=len(du)))) + du
+        keep = np.argsort(key)[:n_seeds]
+        candidates = {'key':key[keep], \
+          'conf':np.ones(len(keep), dtype=int)*c, \
+          'rotation':keep//n_new, 'trans_ind':keep%n_new + n_trans_o}
+        for k in reservoir.keys():
+          reservoir[k] = np.concatenate((reservoir[k], candidates[k]))
+        keep = np.argsort(reservoir['key'])[:n_seeds]
+        for k in reservoir.keys():
+          reservoir[k] = reservoir[k][keep]
+
+      (f_grid0, f_grid0_std) = self._replicate_free_energy(log_sums, counts)
+      converged = f_grid0_std<0.1
+      if not converged:
+        self.tee("  with %s translations "%n_trans_n + \
+                 "the predicted free energy difference is %f (%f)"%(\
+                 f_grid0,f_grid0_std))
+        if n_trans_n == self._max_n_trans:
+          break
+        n_trans_o = n_trans_n
+        n_trans_n = min(n_trans_n + 25, self._max_n_trans)
+
+    if self._n_trans != n_trans_n:
+      self._n_trans = n_trans_n
+
+    self._random_dock_reservoir = {'lambda':lambda_n, \
+      'conf':reservoir['conf'], 'rotation':reservoir['rotation'], \
+      'translation':random_trans[reservoir['trans_ind']]}
+    self.tee("  %d ligand configurations "%len(cool0_Es_MM) + \
+             "were randomly docked into the binding site using "+ \
+             "%d translations and %d rotations "%(n_trans_n,self._n_rot))
+    self.tee("  the predicted free energy difference between the" + \
+             " first and second docking states is " + \
+             "%f (%f), from streaming %d placements"%(\
+             f_grid0,f_grid0_std,np.sum(counts)))
+    return (cool0_confs, E)
+
+  def FFT_dock(self, cool0_confs, cool0_Es_MM, lambda_o):
+    """
+      Systematically places the ligand into the receptor grids
+      along grid points using a Fast Fourier Transform
+
+      For each conformer and rotation, every translation of the center of
+      mass onto a grid point in the binding site is scored by the soft
+      grids, sLJr and sELE, at full strength. The free energy of turning
+      on the soft grids, self._FFT_f, is computed from all of the placements.
+
+      The energies of a uniform sample of the placements are returned and
+      used to choose the second docking state, like in _stream_random_dock.
+      Averages over all of the placements are estimated by stratification:
+      the placements with the lowest scores are counted exactly and the
+      rest of the sample represents the other placements. The error of
+      this estimate is its difference from self._FFT_f. Seeds for the
+      second state are drawn from both strata with their Boltzmann weights.
+    """
+    from AlGDock.FFTDock import FFTDock
+
+    terms = self._batch_grid_terms()
+    masses = self.universe.masses().array
+    max_R = max([np.sqrt(np.sum((conf - \
+      np.dot(masses, conf)/masses.sum())**2, axis=1)).max() \
+      for conf in cool0_confs])
+    FFT_start_time = time.time()
+    docker = FFTDock([term for term in terms if term.name in ['sLJr','sELE']], \
+      self._forceFields['site'], masses, max_R)
+    rotations = self._random_rotT[:self._n_rot]
+    result = docker.dock(cool0_confs, rotations, self._max_n_trans, \
+      R*self.T_HIGH, n_sample=self._max_n_trans)
+    self.tee("  scored %d placements of %d ligand configurations "%(\
+      result['n'], len(cool0_confs)) + \
+      "with %d rotations by FFT in "%len(rotations) + \
+      HMStime(time.time()-FFT_start_time))
+    self._FFT_f = result['f']
+    self.tee("  the free energy of turning on the soft grids" + \
+      " is %f RT"%self._FFT_f)
+
+    # The second docking state is chosen from the uniform sample
+    keys = ['conf','rotation','translation']
+    self._random_dock_placements = dict([(key, result['sample'][key]) \
+      for key in keys])
+    E = self._placement_energies(cool0_confs, cool0_Es_MM, \
+      self._random_dock_placements)
+    lambda_n = self._next_dock_state(E=E, lambda_o=lambda_o)
+
+    # Strata of the placements with the lowest scores
+    # and of the other placements in the sample
+    rest = ~np.in1d(result['sample']['index'], result['index'])
+    strata = [dict([(key, result[key]) for key in keys]), \
+      dict([(key, result['sample'][key][rest]) for key in keys])]
+    n_rest = result['n'] - len(result['index'])
+    counts = [1., float(n_rest)/max(np.sum(rest),1)]
+    def log_weights(du):
+      # Logarithms of the Boltzmann factors of placements in all strata,
+      # times the number of placements that each represents
+      return np.concatenate([-du[s] + np.log(counts[s]) \
+        for s in range(2)])
+    scores = [result['score'], result['sample']['score'][rest]]
+    f_error = abs(-(np.logaddexp.reduce(log_weights(\
+      [score/(R*self.T_HIGH) for score in scores])) - np.log(result['n'])) \
+      - self._FFT_f)
+
+    du = []
+    for stratum in strata:
+      if len(stratum['conf'])==0:
+        du.append(np.zeros(0))
+        continue
+      (u_kln,N_k) = self._u_kln([self._placement_energies(\
+        cool0_confs, cool0_Es_MM, stratum)],[lambda_o,lambda_n])
+      du.append(u_kln[0,1,:] - u_kln[0,0,:])
+    log_w = log_weights(du)
+    f_grid0 = -(np.logaddexp.reduce(log_w) - np.log(result['n']))
+    self.tee("  the predicted free energy difference between the" + \
+             " first and second docking states is " + \
+             "%f (%f)"%(f_grid0,f_error))
+
+    # Seeds for the second docking state
+    p = np.exp(log_w - log_w.max())
+    inds = np.random.choice(len(p), \
+      size=self.params['dock']['seeds_per_state'], p=p/p.sum())
+    self._random_dock_reservoir = dict([(key, np.concatenate(\
+      (strata[0][key], strata[1][key]))[inds]) for key in keys])
+    self._random_dock_reservoir['lambda'] = lambda_n
+    return (cool0_confs, E)
+
+  def _random_dock_confs(self, cool0_confs, placements):
+    """
+    Returns the configurations of placements, as an array with shape
+    (len(placements['conf']), natoms, 3). Each is a rotated cooling state 0
+    configuration with its center of mass at a translation.
+    """
+    rotated = np.einsum('mnj,mjk->mnk', \
+      np.array(cool0_confs)[placements['conf']], \
+      self._random_rotT[placements['rotation']])
+    masses = self.universe.masses().array
+    com = np.einsum('n,mnk->mk', masses, rotated)/masses.sum()
+    return rotated + (placements['translation'] - com)[:,None,:]
+
+  def _random_dock_conf(self, cool0_confs, ind, placements=None):
+    """
+    Returns a configuration from the first state of docking,
+    a rotated cooling state 0 configuration with its center of mass
+    at a translation, for an index into the energies from random_dock
+    or into placements
+    """
+    if placements is None:
+      placements = getattr(self, '_random_dock_placements', None)
+    if placements is not None:
+      (c, i_rot) = (placements['conf'][ind], placements['rotation'][ind])
+      trans = placements['translation'][ind]
+    else:
+      (c,i_rot,i_trans) = np.unravel_index(ind, \
+        (self.params['dock']['seeds_per_state'], self._n_rot, self._n_trans))
+      trans = self._random_trans[i_trans].array
+    return self._random_dock_confs(cool0_confs, {'conf':np.array([c]), \
+      'rotation':np.array([i_rot]), 'translation':np.array([trans])})[0]
+
   def initial_dock(self, randomOnly=False, undock=True):
     """
       Docks the ligand into the receptor
@@ -1271,10 +1718,28 @@ last modified {2}
     # randomly select seeds,
     # simulate
     rejectStage = 0
+    states_prescreened = 0
     while (not self.dock_protocol[-1]['crossed']):
       # Determine next value of the protocol
       lambda_n = self._next_dock_state(E = E, lambda_o = lambda_o, \
           pow = rejectStage, undock = undock)
+      # Only simulate states with a predicted acceptance within the window.
+      # There is no acceptance test after the first state of random docking.
+      if (len(self.dock_protocol)>(not undock)) and \
+          (lambda_n['a']!=lambda_o['a']):
+        u_o = self._u_kln([E],[lambda_o])
+        a_end = 0.0 if undock else 1.0
+        (a, adjusted) = self._prescreen_state('dock', \
+          lambda a_c: self._predicted_repX_acc(self._u_kln([E], \
+            [self._lambda(a_c, process='dock', lambda_o=lambda_o)]) - u_o), \
+          lambda_o['a'], lambda_n['a'], a_end, shrink_only=(rejectStage>0))
+        if adjusted:
+          self.tee("  predicted replica exchange acceptance at progress " + \
+            "%f is outside the window; using %f"%(lambda_n['a'], a))
+          if abs(a-lambda_o['a'])<abs(lambda_n['a']-lambda_o['a']):
+            states_prescreened += 1
+          lambda_n = self._lambda(a, process='dock', lambda_o=lambda_o, \
+            crossed=(a==a_end))
       self.dock_protocol.append(lambda_n)
       if len(self.dock_protocol)>1000:
         self._clear('dock')
@@ -1300,16 +1765,21 @@ last modified {2}
         # Cooling state 0 configurations, randomly oriented
         # Use the lowest energy configuration in the first docking state for replica exchange
         ind = np.argmin(u_n)
-        (c,i_rot,i_trans) = np.unravel_index(ind, (self.params['dock']['seeds_per_state'], self._n_rot, self._n_trans))
-        repX_conf = np.add(np.dot(cool0_confs[c], self._random_rotT[i_rot,:,:]),\
-                           self._random_trans[i_trans].array)
+        repX_conf = self._random_dock_conf(cool0_confs, ind)
         self.confs['dock']['replicas'] = [repX_conf]
         self.confs['dock']['samples'] = [[repX_conf]]
         self.dock_Es = [[dict([(key,np.array([val[ind]])) for (key,val) in E.iteritems()])]]
-        seeds = []
-        for ind in seedIndicies:
-          (c,i_rot,i_trans) = np.unravel_index(ind, (self.params['dock']['seeds_per_state'], self._n_rot, self._n_trans))
-          seeds.append(np.add(np.dot(cool0_confs[c], self._random_rotT[i_rot,:,:]), self._random_trans[i_trans].array))
+        reservoir = getattr(self, '_random_dock_reservoir', None)
+        if (reservoir is not None) and \
+            (reservoir['lambda']['a']==lambda_n['a']):
+          # Placements that were weighted while streaming random_dock
+          seeds = list(self._random_dock_confs(cool0_confs, reservoir))
+          seeds = [seeds[ind%len(seeds)] \
+            for ind in range(self.params['dock']['seeds_per_state'])]
+        else:
+          seeds = []
+          for ind in seedIndicies:
+            seeds.append(self._random_dock_conf(cool0_confs, ind))
         confs = None
         E = {}
       else: # Seeds from last state
@@ -1320,6 +1790,24 @@ last modified {2}
       confs_o = confs
       E_o = E
 
+      # Speculatively simulate states with smaller steps at the same time,
+      # so that a rejected step does not need to be retried
+      lambdas = [lambda_n]
+      seeds_c = [seeds]
+      if (self.params['dock']['speculative_states']>1) and \
+          (self._cores>1) and (len(self.dock_protocol)>(1+(not undock))):
+        for k in range(1, self.params['dock']['speculative_states']):
+          a = lambda_o['a'] + (lambda_n['a'] - lambda_o['a'])/1.25**k
+          lambda_c = self._lambda(a, process='dock', lambda_o=lambda_o, \
+            crossed=False)
+          du = self._u_kln([E],[lambda_c]) - u_o
+          weights = np.exp(-du+min(du))
+          seedIndicies = np.random.choice(len(u_o), \
+            size = self.params['dock']['seeds_per_state'], \
+            p=weights/sum(weights))
+          lambdas.append(lambda_c)
+          seeds_c.append([np.copy(confs[ind]) for ind in seedIndicies])
+
       # Simulate
       sim_start_time = time.time()
       self._set_universe_evaluator(lambda_n)
@@ -1327,15 +1815,44 @@ last modified {2}
         self.tee(self.sampler['dock_SmartDarting'].set_confs(\
           self.confs['dock']['SmartDarting']))
         self.confs['dock']['SmartDarting'] = self.sampler['dock_SmartDarting'].confs
-      (confs, Es_tot, lambda_n['delta_t'], sampler_metrics) = \
-        self._initial_sim_state(seeds, 'dock', lambda_n)
+      states = self._initial_sim_states(seeds_c, 'dock', lambdas)
+      for (lambda_c, state) in zip(lambdas, states):
+        lambda_c['delta_t'] = state[2]
+
+      if len(lambdas)>1:
+        # Keep the largest step that meets min_repX_acc
+        Es = [self._energyTerms(state[0]) for state in states]
+        accs = [self._mean_repX_acc([E_o, E_c], [lambda_o, lambda_c]) \
+          for (E_c, lambda_c) in zip(Es, lambdas)]
+        passed = [c for c in range(len(lambdas)) \
+          if accs[c]>=self.params['dock']['min_repX_acc']]
+        if len(passed)>0:
+          c = passed[0]
+        else:
+          # The smallest step is rejected below,
+          # after the steps that would have been retried
+          c = len(lambdas)-1
+          rejectStage += len(lambdas)-1
+        self.tee("  speculatively simulated progress " + \
+          ", ".join(['%f'%lambda_c['a'] for lambda_c in lambdas]) + \
+          " with estimated replica exchange acceptance rates " + \
+          ", ".join(['%f'%acc for acc in accs]) + \
+          "; keeping progress %f"%lambdas[c]['a'])
+        lambda_n = lambdas[c]
+        self.dock_protocol[-1] = lambda_n
+        seeds = seeds_c[c]
+        self.confs['dock']['seeds'] = seeds
+        self._set_universe_evaluator(lambda_n)
+        (confs, Es_tot, delta_t, sampler_metrics) = states[c]
+        E = Es[c]
+      else:
+        (confs, Es_tot, delta_t, sampler_metrics) = states[0]
+        # Get state energies
+        E = self._energyTerms(confs)
 
       if self.params['dock']['darts_per_seed']>0:
         self.confs['dock']['SmartDarting'] += confs
 
-      # Get state energies
-      E = self._energyTerms(confs)
-
       self.tee("  generated %d configurations "%len(confs) + \
                "with progress %f "%lambda_n['a'] + \
                "in " + HMStime(time.time()-sim_start_time))
@@ -1348,10 +1865,7 @@ last modified {2}
       if len(self.dock_protocol)>(1+(not undock)):
         # Estimate the mean replica exchange acceptance rate
         # between the previous and new state
-        (u_kln,N_k) = self._u_kln([[E_o],[E]], self.dock_protocol[-2:])
-        N = min(N_k)
-        acc = np.exp(-u_kln[0,1,:N]-u_kln[1,0,:N]+u_kln[0,0,:N]+u_kln[1,1,:N])
-        mean_acc = np.mean(np.minimum(acc,np.ones(acc.shape)))
+        mean_acc = self._mean_repX_acc([E_o, E], self.dock_protocol[-2:])
         
         if (mean_acc<self.params['dock']['min_repX_acc']):
           # If the acceptance probability is too low,
@@ -1439,6 +1953,8 @@ last modified {2}
     self.tee("Elapsed time for initial docking of " + \
       "%d states: "%len(self.dock_protocol) + \
       HMStime(time.time()-dock_start_time))
+    self.tee("  predicted acceptance avoided " + \
+      "%d simulations of rejected states"%states_prescreened)
     self._clear_lock('dock')
     self.sampler['dock_SmartDarting'].confs = []
     return True
@@ -1793,24 +2309,23 @@ last modified {2}
         self.confs['rmsd'])**2).sum()/self.molecule.nhatoms) \
           for c in range(len(confs))])
 
-    # Grid interpolation energies
-    from AlGDock.ForceFields.Grid.Interpolation import InterpolationForceField
+    # Grid interpolation energies.
+    # Each grid is loaded once and all of the inverse powers
+    # are interpolated together for all of the poses.
+    from AlGDock.ForceFields.Grid import Interpolation
+    from AlGDock.ForceFields.Grid import BatchInterpolation
+    inv_powers = -np.arange(1,13,dtype=float)
     for grid_type in ['LJa','LJr']:
+      grid_data = Interpolation.load_grid(self._FNs['grids'][grid_type])
+      scaling_factor = BatchInterpolation._scaling_factor(self.universe, \
+        'scaling_factor_'+grid_type, 1.0)
       for interpolation_type in ['Trilinear','BSpline']: # ,'Tricubic']:
+        print interpolation_type + ' interpolation of the ' + \
+          grid_type + ' grid with inverse powers of 1 to %d'%len(inv_powers)
         key = '%s_%sTransform'%(grid_type,interpolation_type)
-        Es[key] = np.zeros((12,len(confs)),dtype=np.float)
-        for p in range(12):
-          print interpolation_type + ' interpolation of the ' + \
-            grid_type + ' grid with an inverse power of %d'%(p+1)
-          FF = InterpolationForceField(self._FNs['grids'][grid_type], \
-            name='%f'%(p+1),
-            interpolation_type=interpolation_type, strength=1.0,
-            scaling_property='scaling_factor_'+grid_type, \
-            inv_power=-float(p+1))
-          self.universe.setForceField(FF)
-          for c in range(len(confs)):
-            self.universe.setConfiguration(Configuration(self.universe,confs[c]))
-            Es[key][p,c] = self.universe.energy()
+        sweep = BatchInterpolation.BatchTransformSweep(grid_data, \
+          scaling_factor, inv_powers, interpolation_type=interpolation_type)
+        Es[key] = sweep.energies(np.array(confs))
 
     # Implicit solvent energies
     self._load_programs(self.params['dock']['phases'])
@@ -1878,7 +2393,7 @@ last modified {2}
       self.delta_t = 1.5*MMTK.Units.fs
 
     # Reuse evaluators that have been stored
-    evaluator_key = '-'.join(repr(v) for v in lambda_n.values())
+    evaluator_key = repr(sorted(lambda_n.items()))
     if evaluator_key in self._evaluators.keys():
       self.universe._evaluator[(None,None,None)] = \
         self._evaluators[evaluator_key]
@@ -1946,49 +2461,23 @@ last modified {2}
         else:
           raise Exception('Binding site type not recognized!')
       fflist.append(self._forceFields['site'])
-    for scalable in self._scalables:
-      if (scalable in lambda_n.keys()) and lambda_n[scalable]>0:
-        # Load the force field if it has not been loaded
-        if not scalable in self._forceFields.keys():
-          loading_start_time = time.time()
-          grid_FN = self._FNs['grids'][{'sLJr':'LJr','sLJa':'LJa','sELE':'ELE',
-            'LJr':'LJr','LJa':'LJa','ELE':'ELE'}[scalable]]
-          grid_scaling_factor = 'scaling_factor_' + \
-            {'sLJr':'LJr','sLJa':'LJa','sELE':'electrostatic', \
-             'LJr':'LJr','LJa':'LJa','ELE':'electrostatic'}[scalable]
-
-          # Determine the grid threshold
-          if scalable=='sLJr':
-            grid_thresh = 10.0
-          elif scalable=='sELE':
-            # The maximum value is set so that the electrostatic energy
-            # less than or equal to the Lennard-Jones repulsive energy
-            # for every heavy atom at every grid point
-            scaling_factors_ELE = np.array([ \
-              self.molecule.getAtomProperty(a, 'scaling_factor_electrostatic') \
-                for a in self.molecule.atomList()],dtype=float)
-            scaling_factors_LJr = np.array([ \
-              self.molecule.getAtomProperty(a, 'scaling_factor_LJr') \
-                for a in self.molecule.atomList()],dtype=float)
-            scaling_factors_ELE = scaling_factors_ELE[scaling_factors_LJr>10]
-            scaling_factors_LJr = scaling_factors_LJr[scaling_factors_LJr>10]
-            grid_thresh = min(abs(scaling_factors_LJr*10.0/scaling_factors_ELE))
-          else:
-            grid_thresh = -1 # There is no threshold for grid points
-
-          from AlGDock.ForceFields.Grid.Interpolation \
-            import InterpolationForceField
-          self._forceFields[scalable] = InterpolationForceField(grid_FN, \
-            name=scalable, interpolation_type='Trilinear', \
-            strength=lambda_n[scalable], scaling_property=grid_scaling_factor,
-            inv_power=-2 if scalable=='LJr' else None, \
-            grid_thresh=grid_thresh)
-          self.tee('  %s grid loaded from %s in %s'%(scalable, grid_FN, \
-            HMStime(time.time()-loading_start_time)))
-
-        # Set the force field strength to the desired value
-        self._forceFields[scalable].params['strength'] = lambda_n[scalable]
-        fflist.append(self._forceFields[scalable])
+    scalables = [scalable for scalable in self._scalables \
+      if (scalable in lambda_n.keys()) and lambda_n[scalable]>0]
+    if len(scalables)>0:
+      # Load the force fields if they have not been loaded
+      if not 'grids' in self._forceFields.keys():
+        self._load_grids()
+      if self._forceFields['grids'] is not None:
+        # Set the strength of each grid in the combined force field
+        self._forceFields['grids'].params['strength'] = \
+          [lambda_n[scalable] if scalable in scalables else 0. \
+            for scalable in self._scalables]
+        fflist.append(self._forceFields['grids'])
+      else:
+        for scalable in scalables:
+          # Set the force field strength to the desired value
+          self._forceFields[scalable].params['strength'] = lambda_n[scalable]
+          fflist.append(self._forceFields[scalable])
 
     compoundFF = fflist[0]
     for ff in fflist[1:]:
@@ -2001,50 +2490,137 @@ last modified {2}
     self.universe._evaluator[(None,None,None)] = eval
     self._evaluators[evaluator_key] = eval
 
+  def _load_grid(self, scalable):
+    """
+    Loads the interpolation force field for a scalable grid
+    """
+    from AlGDock.ForceFields.Grid.Interpolation \
+      import InterpolationForceField
+    return InterpolationForceField(**self._grid_FF_args(scalable))
+
+  def _grid_FF_args(self, scalable):
+    """
+    Returns the arguments of the interpolation force field
+    for a scalable grid
+    """
+    grid_key = {'sLJr':'LJr','sLJa':'LJa','sELE':'ELE',
+      'LJr':'LJr','LJa':'LJa','ELE':'ELE'}[scalable]
+    grid_FN = self._FNs['grids'][grid_key]
+    # An optional fine patch around the binding site
+    fine_grid_FN = self._FNs['fine_grids'][grid_key] \
+      if 'fine_grids' in self._FNs.keys() else None
+    grid_scaling_factor = 'scaling_factor_' + \
+      {'sLJr':'LJr','sLJa':'LJa','sELE':'electrostatic', \
+       'LJr':'LJr','LJa':'LJa','ELE':'electrostatic'}[scalable]
+
+    # Determine the grid threshold
+    if scalable=='sLJr':
+      grid_thresh = 10.0
+    elif scalable=='sELE':
+      # The maximum value is set so that the electrostatic energy
+      # less than or equal to the Lennard-Jones repulsive energy
+      # for every heavy atom at every grid point
+      scaling_factors_ELE = np.array([ \
+        self.molecule.getAtomProperty(a, 'scaling_factor_electrostatic') \
+          for a in self.molecule.atomList()],dtype=float)
+      scaling_factors_LJr = np.array([ \
+        self.molecule.getAtomProperty(a, 'scaling_factor_LJr') \
+          for a in self.molecule.atomList()],dtype=float)
+      scaling_factors_ELE = scaling_factors_ELE[scaling_factors_LJr>10]
+      scaling_factors_LJr = scaling_factors_LJr[scaling_factors_LJr>10]
+      grid_thresh = min(abs(scaling_factors_LJr*10.0/scaling_factors_ELE))
+    else:
+      grid_thresh = -1 # There is no threshold for grid points
+
+    return {'FN':grid_FN, 'name':scalable, 'interpolation_type':'Trilinear', \
+      'strength':1.0, 'scaling_property':grid_scaling_factor, \
+      'inv_power':-2 if scalable=='LJr' else None, \
+      'grid_thresh':grid_thresh, 'precision':self._grid_precision, \
+      'fine_FN':fine_grid_FN, 'layout':self._grid_layout}
+
+  def _load_grids(self):
+    """
+    Loads force fields for all the scalable grids.
+
+    If the grids have the same points, they are combined into
+    a single force field that interpolates all of them at once,
+    self._forceFields['grids']. Otherwise, each grid has its own
+    force field and self._forceFields['grids'] is None.
+    """
+    from AlGDock.ForceFields.Grid.Interpolation \
+      import MultiInterpolationForceField, clear_grid_cache
+    grid_FFs = []
+    for scalable in self._scalables:
+      loading_start_time = time.time()
+      grid_FFs.append(self._load_grid(scalable))
+      self.tee('  %s grid loaded from %s in %s'%(scalable, \
+        grid_FFs[-1].params['FN'], HMStime(time.time()-loading_start_time)))
+    try:
+      self._forceFields['grids'] = \
+        MultiInterpolationForceField(grid_FFs, name='grids')
+      self.tee('  combined grids for %s'%', '.join(self._scalables))
+    except Exception as e:
+      self.tee('  grids are not combined: '+str(e))
+      self._forceFields['grids'] = None
+      for (scalable, grid_FF) in zip(self._scalables, grid_FFs):
+        self._forceFields[scalable] = grid_FF
+    # The soft and hard versions of a grid are read from the same file,
+    # which is only needed while the force fields are loaded
+    clear_grid_cache()
+
   def _initial_sim_state(self, seeds, process, lambda_k):
     """
     Initializes a state, returning the configurations and potential energy.
     """
-    
+    return self._initial_sim_states([seeds], process, [lambda_k])[0]
+
+  def _initial_sim_states(self, seeds, process, lambdas):
+    """
+    Initializes several states at once, where seeds[s] are the seeds
+    for the state lambdas[s]. Returns a list with the configurations,
+    potential energies, time step, and sampler metrics of each state.
+    """
+    all_seeds = [seed for seeds_s in seeds for seed in seeds_s]
+    all_lambdas = [lambdas[s] for s in range(len(seeds)) \
+      for seed in seeds[s]]
     results = []
     if self._cores>1:
       # Multiprocessing code
-      m = multiprocessing.Manager()
-      task_queue = m.Queue()
-      done_queue = m.Queue()
-      for k in range(len(seeds)):
-        task_queue.put((seeds[k], process, lambda_k, True, k))
-      processes = [multiprocessing.Process(target=self._sim_one_state_worker, \
-          args=(task_queue, done_queue)) for p in range(self._cores)]
-      for p in range(self._cores):
-        task_queue.put('STOP')
-      for p in processes:
-        p.start()
-      for p in processes:
-        p.join()
-      results = [done_queue.get() for seed in seeds]
-      for p in processes:
-        p.terminate()
+      # The workers are forked after the evaluator for lambdas[0] is set,
+      # so they only need to be started once for all of the states
+      self._set_universe_evaluator(lambdas[0])
+      pool = WorkerPool(self._sim_one_state_worker, self._cores, \
+        SharedReplicas(len(all_seeds), self.universe.numberOfAtoms()))
+      results = self._sim_shared(pool, all_seeds, process, \
+        all_lambdas, True)
+      pool.close()
     else:
       # Single process code
       results = [self._sim_one_state(\
-        seeds[k], process, lambda_k, True, k) for k in range(len(seeds))]
-
-    confs = [result['confs'] for result in results]
-    potEs = [result['Etot'] for result in results]
-    
-    delta_t = np.median([result['delta_t'] for result in results])
-    delta_t = min(max(delta_t, 0.25*MMTK.Units.fs), 2.5*MMTK.Units.fs)
-    sampler_metrics = '  '
-    for s in ['ExternalMC', 'SmartDarting', 'Sampler']:
-      if np.array(['acc_'+s in r.keys() for r in results]).any():
-        acc = np.sum([r['acc_'+s] for r in results])
-        att = np.sum([r['att_'+s] for r in results])
-        time = np.sum([r['time_'+s] for r in results])
-        if att>0:
-          sampler_metrics += '%s acc=%d/%d=%.5f, t=%.3f s; '%(\
-            s,acc,att,float(acc)/att,time)
-    return (confs, np.array(potEs), delta_t, sampler_metrics)
+        all_seeds[k], process, all_lambdas[k], True, k) \
+        for k in range(len(all_seeds))]
+
+    states = []
+    start = 0
+    for seeds_s in seeds:
+      results_s = results[start:start+len(seeds_s)]
+      start += len(seeds_s)
+      confs = [result['confs'] for result in results_s]
+      potEs = [result['Etot'] for result in results_s]
+
+      delta_t = np.median([result['delta_t'] for result in results_s])
+      delta_t = min(max(delta_t, 0.25*MMTK.Units.fs), 2.5*MMTK.Units.fs)
+      sampler_metrics = '  '
+      for s in ['ExternalMC', 'SmartDarting', 'Sampler']:
+        if np.array(['acc_'+s in r.keys() for r in results_s]).any():
+          acc = np.sum([r['acc_'+s] for r in results_s])
+          att = np.sum([r['att_'+s] for r in results_s])
+          time = np.sum([r['time_'+s] for r in results_s])
+          if att>0:
+            sampler_metrics += '%s acc=%d/%d=%.5f, t=%.3f s; '%(\
+              s,acc,att,float(acc)/att,time)
+      states.append((confs, np.array(potEs), delta_t, sampler_metrics))
+    return states
   
   def _replica_exchange(self, process):
     """
@@ -2189,32 +2765,45 @@ last modified {2}
       upper_inds = np.array(lower_inds) + interval
       pairs_to_swap += zip(lower_inds,upper_inds)
 
-    from repX import attempt_swaps
+    from repX import attempt_swaps, attempt_independence_swaps
 
     # Setting the force field will load grids
     # before multiple processes are spawned
     for k in range(K):
       self._set_universe_evaluator(lambdas[k])
     
-    # If it has not been set up, set up Smart Darting
-    if self.params[process]['darts_per_sweep']>0:
-      if self.sampler[process+'_SmartDarting'].confs==[]:
-        self.tee(self.sampler[process+'_SmartDarting'].set_confs(\
-          self.confs[process]['SmartDarting']))
-        self.confs[process]['SmartDarting'] = \
-          self.sampler[process+'_SmartDarting'].confs
+    self._set_up_SmartDarting(process)
     
-    storage = {}
-    for var in ['confs','state_inds','energies']:
-      storage[var] = []
+    # The state indices are stored for every sweep. Configurations and
+    # energies are thinned as they are stored, based on a running estimate
+    # of the autocorrelation time of the state indices, which is updated
+    # every tau_interval sweeps.
+    nsweeps = self.params[process]['sweeps_per_cycle']
+    per_independent = self.params[process]['snaps_per_independent']
+    repXpath = np.zeros((nsweeps,K), dtype=int)
+    storage = SweepBuffer(K, self.universe.numberOfAtoms())
+    # There will be at least per_independent and
+    # up to sweeps_per_cycle saved samples.
+    # max(int(np.ceil((1+2*tau_ac)/per_independent)),1) is the minimum stride,
+    # which is based on per_independent samples per autocorrelation time.
+    # max(int(np.ceil(nsweeps/per_independent)),1)
+    # is the maximum stride, which gives per_independent samples if possible.
+    max_stride = max(int(np.ceil(nsweeps/per_independent)),1)
+    stride_from_tau = lambda tau_ac: \
+      min(max(int(np.ceil((1+2*tau_ac)/per_independent)),1), max_stride)
+    tau_interval = 25
     
     cycle_start_time = time.time()
 
     if self._cores>1:
-      # Multiprocessing setup
-      m = multiprocessing.Manager()
-      task_queue = m.Queue()
-      done_queue = m.Queue()
+      # Multiprocessing setup.
+      # Use the persistent pool from _sim_process if it is available.
+      # Otherwise, start a pool that lasts for this cycle.
+      if self._pool is None:
+        pool = WorkerPool(self._sim_one_state_worker, self._cores, \
+          SharedReplicas(K, self.universe.numberOfAtoms()))
+      else:
+        pool = self._pool
 
     # GMC
     do_gMC = self.params[process]['GMC_attempts'] > 0
@@ -2237,28 +2826,16 @@ last modified {2}
     self.timing['repX'] = 0.
 
     # Do replica exchange
-    state_inds = range(K)
-    inv_state_inds = range(K)
-    for sweep in range(self.params[process]['sweeps_per_cycle']):
+    state_inds = np.arange(K)
+    inv_state_inds = np.arange(K)
+    for sweep in range(nsweeps):
       E = {}
       for term in terms:
         E[term] = np.zeros(K, dtype=float)
       # Sample within each state
       if self._cores>1:
-        for k in range(K):
-          task_queue.put((confs[k], process, lambdas[state_inds[k]], False, k))
-        for p in range(self._cores):
-          task_queue.put('STOP')
-        processes = [multiprocessing.Process(target=self._sim_one_state_worker, \
-            args=(task_queue, done_queue)) for p in range(self._cores)]
-        for p in processes:
-          p.start()
-        for p in processes:
-          p.join()
-        unordered_results = [done_queue.get() for k in range(K)]
-        results = sorted(unordered_results, key=lambda d: d['reference'])
-        for p in processes:
-          p.terminate()
+        results = self._sim_shared(pool, confs, process, \
+          [lambdas[state_inds[k]] for k in range(K)], False)
       else:
         # Single process code
         results = [self._sim_one_state(confs[k], process, \
@@ -2298,15 +2875,29 @@ last modified {2}
       (u_ij,N_k) = self._u_kln(E, [lambdas[state_inds[c]] for c in range(K)])
       # Do the replica exchange
       repX_start_time = time.time()
-      (state_inds, inv_state_inds) = \
-        attempt_swaps(state_inds, inv_state_inds, u_ij, pairs_to_swap, \
-          self.params[process]['attempts_per_sweep'])
+      if self.params[process]['repX_mode']=='Gibbs':
+        (state_inds, inv_state_inds) = \
+          attempt_independence_swaps(state_inds, inv_state_inds, u_ij, K**3)
+      else:
+        (state_inds, inv_state_inds) = \
+          attempt_swaps(state_inds, inv_state_inds, u_ij, pairs_to_swap, \
+            self.params[process]['attempts_per_sweep'])
       self.timing['repX'] += (time.time()-repX_start_time)
 
       # Store data in local variables
-      storage['confs'].append(list(confs))
-      storage['state_inds'].append(list(state_inds))
-      storage['energies'].append(copy.deepcopy(E))
+      repXpath[sweep] = state_inds
+      storage.append(sweep, confs, E)
+      if ((sweep+1)%tau_interval==0) and (sweep+1<nsweeps):
+        try:
+          tau_ac = pymbar.timeseries.integratedAutocorrelationTimeMultiple(\
+            repXpath[:sweep+1].T)
+          storage.thin(max(stride_from_tau(tau_ac)/2,1))
+        except Exception:
+          pass # The estimate is not defined if the path has not changed
+
+    if (self._cores>1) and (pool is not self._pool):
+      pool.close()
+    sweeps_per_second = nsweeps/(time.time()-cycle_start_time)
 
     # GMC
     if do_gMC:
@@ -2317,25 +2908,15 @@ last modified {2}
         HMStime(time_gMC)))
 
     # Estimate relaxation time from autocorrelation
-    state_inds = np.array(storage['state_inds'])
-    tau_ac = pymbar.timeseries.integratedAutocorrelationTimeMultiple(state_inds.T)
-    # There will be at least per_independent and up to sweeps_per_cycle saved samples
-    # max(int(np.ceil((1+2*tau_ac)/per_independent)),1) is the minimum stride,
-    # which is based on per_independent samples per autocorrelation time.
-    # max(self.params['dock']['sweeps_per_cycle']/per_independent)
-    # is the maximum stride, which gives per_independent samples if possible.
-    per_independent = self.params[process]['snaps_per_independent']
-    stride = min(max(int(np.ceil((1+2*tau_ac)/per_independent)),1), \
-                 max(int(np.ceil(self.params[process]['sweeps_per_cycle']/per_independent)),1))
+    tau_ac = pymbar.timeseries.integratedAutocorrelationTimeMultiple(repXpath.T)
+    stride = stride_from_tau(tau_ac)
 
-    store_indicies = np.array(\
-      range(min(stride-1,self.params[process]['sweeps_per_cycle']-1), \
-      self.params[process]['sweeps_per_cycle'], stride), dtype=int)
+    store_indicies = storage.select(stride, nsweeps)
     nsaved = len(store_indicies)
 
     self.tee("  generated %d configurations for %d replicas"%(nsaved, len(confs)) + \
       " in cycle %d in %s"%(cycle, HMStime(time.time()-cycle_start_time)) + \
-      " (tau_ac=%f)"%(tau_ac))
+      " (tau_ac=%f, %.2f sweeps/s)"%(tau_ac, sweeps_per_second))
     MC_report = " "
     for move_type in ['ExternalMC','SmartDarting','Sampler']:
       total_acc = np.sum(acc[move_type])
@@ -2350,7 +2931,7 @@ last modified {2}
     # Get indicies for storing global variables
     inv_state_inds = np.zeros((nsaved,K),dtype=int)
     for snap in range(nsaved):
-      state_inds = storage['state_inds'][store_indicies[snap]]
+      state_inds = repXpath[storage.sweeps[store_indicies[snap]]]
       for state in range(K):
         inv_state_inds[snap][state_inds[state]] = state
 
@@ -2362,15 +2943,15 @@ last modified {2}
     for state in range(K):
       E_state = {}
       if state==0:
-        E_state['repXpath'] = storage['state_inds']
+        E_state['repXpath'] = repXpath.tolist()
         E_state['acc'] = acc
         E_state['att'] = att
       for term in terms:
-        E_state[term] = np.array([storage['energies'][store_indicies[snap]][term][inv_state_inds[snap][state]] for snap in range(nsaved)])
+        E_state[term] = storage.energies[term][store_indicies, inv_state_inds[:,state]]
       Es.append([E_state])
 
     self.confs[process]['replicas'] = \
-      [storage['confs'][store_indicies[-1]][inv_state_inds[-1][state]] \
+      [np.copy(storage.confs[store_indicies[-1]][inv_state_inds[-1][state]]) \
        for state in range(K)]
 
     for state in range(K):
@@ -2380,7 +2961,7 @@ last modified {2}
       if self.params[process]['keep_intermediate'] or \
           ((process=='cool') and (state==0)) or \
           (state==(K-1)):
-        confs = [storage['confs'][store_indicies[snap]][inv_state_inds[snap][state]] for snap in range(nsaved)]
+        confs = [np.copy(storage.confs[store_indicies[snap]][inv_state_inds[snap][state]]) for snap in range(nsaved)]
         self.confs[process]['samples'][state].append(confs)
       else:
         self.confs[process]['samples'][state].append([])
@@ -2389,23 +2970,94 @@ last modified {2}
       self._set_universe_evaluator(getattr(self,process+'_protocol')[-1])
       confs_SmartDarting = [np.copy(conf) \
         for conf in self.confs[process]['samples'][state][-1]]
-      self.tee(self.sampler[process+'_SmartDarting'].set_confs(\
-        confs_SmartDarting + self.confs[process]['SmartDarting']))
+      if self.sampler[process+'_SmartDarting'].confs is \
+          self.confs[process]['SmartDarting']:
+        # The current targets are already minimized
+        self.tee(self.sampler[process+'_SmartDarting'].set_confs(\
+          confs_SmartDarting, append=True))
+      else:
+        self.tee(self.sampler[process+'_SmartDarting'].set_confs(\
+          confs_SmartDarting + self.confs[process]['SmartDarting']))
       self.confs[process]['SmartDarting'] = \
         self.sampler[process+'_SmartDarting'].confs
+      # The workers have copies of the old smart darting targets
+      if self._pool is not None:
+        self._stop_pool()
+        self._start_pool(process)
 
     setattr(self,'_%s_cycle'%process,cycle + 1)
     self._save(process)
     self.tee("")
     self._clear_lock(process)
 
-  def _sim_one_state_worker(self, input, output):
+  def _start_pool(self, process):
+    """
+    Starts a pool of workers that persists across replica exchange sweeps.
+
+    Grids and evaluators for every state in the protocol are loaded
+    before the workers are forked, so each worker keeps its own
+    universe, force fields, and cached evaluators for the whole pool lifetime.
+    """
+    if (self._cores<2) or (self._pool is not None):
+      return
+    for lambda_k in getattr(self,process+'_protocol'):
+      self._set_universe_evaluator(lambda_k)
+    # The workers need the smart darting targets when they are forked
+    self._set_up_SmartDarting(process)
+    self._pool = WorkerPool(self._sim_one_state_worker, self._cores, \
+      SharedReplicas(len(getattr(self,process+'_protocol')), \
+        self.universe.numberOfAtoms()))
+
+  def _set_up_SmartDarting(self, process):
+    """
+    If it has not been set up, sets up Smart Darting
+    """
+    if self.params[process]['darts_per_sweep']>0:
+      if self.sampler[process+'_SmartDarting'].confs==[]:
+        self.tee(self.sampler[process+'_SmartDarting'].set_confs(\
+          self.confs[process]['SmartDarting']))
+        self.confs[process]['SmartDarting'] = \
+          self.sampler[process+'_SmartDarting'].confs
+
+  def _stop_pool(self):
+    """
+    Stops the persistent pool of workers
+    """
+    if self._pool is not None:
+      self._pool.close()
+      self._pool = None
+
+  def _sim_shared(self, pool, seeds, process, lambdas, initialize):
+    """
+    Simulates each seed in the corresponding state using a pool of workers.
+
+    The seeds are copied into the shared memory of the pool and the
+    workers write their results back in place, so only replica indices
+    and thermodynamic states pass through the queues.
     """
-    Executes a task from the queue
+    shared = pool.shared
+    for k in range(len(seeds)):
+      shared.confs[k] = seeds[k]
+    pool.map([(k, process, lambdas[k], initialize, k) \
+      for k in range(len(seeds))])
+    return [shared.load(k) for k in range(len(seeds))]
+
+  def _sim_one_state_worker(self, input, output, shared=None):
+    """
+    Executes a task from the queue.
+    
+    If shared is a SharedReplicas object, the first argument of the task
+    is the replica slot, which contains the seed and receives the results.
     """
     for args in iter(input.get, 'STOP'):
-      result = self._sim_one_state(*args)
-      output.put(result)
+      if shared is None:
+        result = self._sim_one_state(*args)
+        output.put(result)
+      else:
+        k = args[0]
+        result = self._sim_one_state(np.copy(shared.confs[k]), *args[1:])
+        shared.store(k, result)
+        output.put({'reference':result['reference']})
 
   def _sim_one_state(self, seed, process, lambda_k, \
       initialize=False, reference=0):
@@ -2508,17 +3160,21 @@ last modified {2}
       self.timing[process+'_repX_start'] = time.time()
       start_cycle = getattr(self,'_%s_cycle'%process)
       cycle_times = []
-      while ((getattr(self,'_%s_cycle'%process) < self.params[process]['repX_cycles'])):
-        cycle_start_time = time.time()
-        self._replica_exchange(process)
-        cycle_times.append(time.time()-cycle_start_time)
-        if self.run_type=='timed':
-          remaining_time = self.timing['max']*60 - (time.time()-self.timing['start'])
-          cycle_time = np.mean(cycle_times)
-          self.tee("  projected cycle time: %s, remaining time: %s"%(\
-            HMStime(cycle_time), HMStime(remaining_time)), process=process)
-          if cycle_time>remaining_time:
-            return False
+      self._start_pool(process)
+      try:
+        while ((getattr(self,'_%s_cycle'%process) < self.params[process]['repX_cycles'])):
+          cycle_start_time = time.time()
+          self._replica_exchange(process)
+          cycle_times.append(time.time()-cycle_start_time)
+          if self.run_type=='timed':
+            remaining_time = self.timing['max']*60 - (time.time()-self.timing['start'])
+            cycle_time = np.mean(cycle_times)
+            self.tee("  projected cycle time: %s, remaining time: %s"%(\
+              HMStime(cycle_time), HMStime(remaining_time)), process=process)
+            if cycle_time>remaining_time:
+              return False
+      finally:
+        self._stop_pool()
       self.tee("\nElapsed time for %d cycles of replica exchange was %s"%(\
          (getattr(self,'_%s_cycle'%process) - start_cycle), \
           HMStime(time.time() - self.timing[process+'_repX_start'])), \
@@ -2596,9 +3252,14 @@ last modified {2}
     else:
       raise Exception('Input configuration format not recognized')
 
+    # Only the starting poses, which are the same in every run,
+    # are kept in the minimization cache. The seeds are random.
+    cachable = [True]*len(confs)
+
     # based on the seeds
     if self.confs['dock']['seeds'] is not None:
       confs = confs + self.confs['dock']['seeds']
+      cachable += [False]*len(self.confs['dock']['seeds'])
       count['initial_dock'] = len(self.confs['dock']['seeds'])
 
     if len(confs)==0:
@@ -2607,6 +3268,7 @@ last modified {2}
     if site:
       # Filters out configurations not in the binding site
       confs_in_site = []
+      cachable_in_site = []
       Es_in_site = dict([(label,[]) for label in Es.keys()])
       old_eval = None
       if (None,None,None) in self.universe._evaluator.keys():
@@ -2616,11 +3278,13 @@ last modified {2}
         self.universe.setConfiguration(Configuration(self.universe, confs[n]))
         if self.universe.energy()<1.:
           confs_in_site.append(confs[n])
+          cachable_in_site.append(cachable[n])
           for label in Es.keys():
             Es_in_site[label].append(Es[label][n])
       if old_eval is not None:
         self.universe._evaluator[(None,None,None)] = old_eval
       confs = confs_in_site
+      cachable = cachable_in_site
       Es = Es_in_site
       
     try:
@@ -2630,27 +3294,30 @@ last modified {2}
 
     if minimize:
       Es = {}
-      from MMTK.Minimization import SteepestDescentMinimizer # @UnresolvedImport
-      minimizer = SteepestDescentMinimizer(self.universe)
+      settings = Minimization.default_settings
+      evaluator_key = getattr(\
+        self.universe._evaluator[(None,None,None)], 'key', None)
+      cache = self._load_minimization_cache()
+      cache_keys = [self._minimization_cache_key(confs[n], evaluator_key, \
+        settings) if cachable[n] else None for n in range(len(confs))]
+      # Configurations that are not in the cache are minimized in parallel
+      inds = [n for n in range(len(confs)) \
+        if (cache_keys[n] is None) or (cache_keys[n] not in cache.keys())]
+      n_cached = len(confs) - len(inds)
+
+      min_start_time = time.time()
+      results = dict(zip(inds, zip(*Minimization.energies(self.universe, \
+        [confs[n] for n in inds], minimize_confs=True, cores=self._cores, \
+        settings=settings))))
+      new_entries = dict([(cache_keys[n], results[n]) for n in inds \
+        if cache_keys[n] is not None])
+      if len(new_entries)>0:
+        self._save_minimization_cache(new_entries)
 
       minimized_confs = []
       minimized_energies = []
-      min_start_time = time.time()
-      for conf in confs:
-        self.universe.setConfiguration(Configuration(self.universe, conf))
-        x_o = np.copy(self.universe.configuration().array)
-        e_o = self.universe.energy()
-        for rep in range(50):
-          minimizer(steps = 25)
-          x_n = np.copy(self.universe.configuration().array)
-          e_n = self.universe.energy()
-          diff = abs(e_o-e_n)
-          if np.isnan(e_n) or diff<0.05 or diff>1000.:
-            self.universe.setConfiguration(Configuration(self.universe, x_o))
-            break
-          else:
-            x_o = x_n
-            e_o = e_n
+      for n in range(len(confs)):
+        (x_o, e_o) = results[n] if n in results.keys() else cache[cache_keys[n]]
         if not np.isnan(e_o):
           minimized_confs.append(x_o)
           minimized_energies.append(e_o)
@@ -2658,14 +3325,13 @@ last modified {2}
       energies = minimized_energies
       self.tee("\n  minimized %d configurations in "%len(confs) + \
         HMStime(time.time()-min_start_time) + \
+        ", %d from the minimization cache"%n_cached + \
         "\n  the first %d energies are: "%min(len(confs),10) + \
         ', '.join(['%.2f'%e for e in energies[:10]]))
     else:
       # Evaluate energies
-      energies = []
-      for conf in confs:
-        self.universe.setConfiguration(Configuration(self.universe, conf))
-        energies.append(self.universe.energy())
+      energies = Minimization.energies(self.universe, confs, \
+        cores=self._cores)[1]
 
     if sort:
       # Sort configurations by DECREASING energy
@@ -2689,6 +3355,87 @@ last modified {2}
     self.tee("  keeping {nconfs}{minimized} configurations out of {xtal} from xtal, {dock6} from dock6, {initial_dock} from initial docking, and {duplicated} duplicated\n".format(**count))
     return (confs, Es)
 
+  def _minimization_cache_key(self, conf, evaluator_key, settings):
+    """
+    Returns the key of a configuration in the minimization cache, a hash of
+    its coordinates, the evaluator, the files, binding site, and grid
+    settings that define the force fields, and the minimizer settings.
+    Returns None if the evaluator is unknown.
+    """
+    if evaluator_key is None:
+      return None
+    import hashlib
+    context = [(key, self._FNs[key]) for key in \
+      ['ligand_database','forcefield','frcmodList','prmtop', \
+       'grids','fine_grids'] if key in self._FNs.keys()]
+    context += [(key, self.params['dock'][key]) for key in \
+      ['site','site_center','site_direction','site_max_X','site_max_R']]
+    context += [(scalable, sorted(self._grid_FF_args(scalable).items())) \
+      for scalable in self._scalables]
+    h = hashlib.sha1(np.ascontiguousarray(conf, dtype=float).tostring())
+    h.update(evaluator_key)
+    h.update(repr(context))
+    h.update(repr(sorted(settings.items())))
+    return h.hexdigest()
+
+  def _load_minimization_cache(self):
+    """
+    Returns the dictionary of minimized configurations and energies,
+    loading it from the docking directory the first time.
+    The file is a series of pickled dictionaries,
+    which are appended by _save_minimization_cache.
+    If part of the file cannot be read, the file is rewritten
+    with the entries that were loaded.
+    """
+    if getattr(self, '_minimization_cache', None) is None:
+      self._minimization_cache = {}
+      cache_FN = join(self.dir['dock'],'minimized.pkl.gz')
+      if os.path.isfile(cache_FN):
+        import struct, zlib
+        F = gzip.open(cache_FN,'r')
+        try:
+          while True:
+            self._minimization_cache.update(pickle.load(F))
+        except EOFError:
+          pass
+        except (IOError, struct.error, zlib.error, \
+            pickle.UnpicklingError, ValueError) as e:
+          # Entries after an incomplete one cannot be read
+          self.tee('  error loading %s: %s'%(cache_FN, e) + \
+            '\n  rewriting it with %d entries'%len(self._minimization_cache))
+          # Write to a temporary file and rename it, so other processes
+          # never read a partially written cache
+          tmp_FN = '%s.%d.tmp'%(cache_FN, os.getpid())
+          try:
+            F_tmp = gzip.open(tmp_FN,'w')
+            pickle.dump(self._minimization_cache, F_tmp)
+            F_tmp.close()
+            os.rename(tmp_FN, cache_FN)
+          except (IOError, OSError):
+            if os.path.isfile(tmp_FN):
+              os.remove(tmp_FN)
+        F.close()
+    return self._minimization_cache
+
+  def _save_minimization_cache(self, entries):
+    """
+    Adds entries to the minimization cache and appends them to its file.
+    The entries are compressed in memory and appended in a single write,
+    so entries from jobs that share the docking directory are not mixed.
+    """
+    self._load_minimization_cache().update(entries)
+    import cStringIO
+    buf = cStringIO.StringIO()
+    F = gzip.GzipFile(fileobj=buf, mode='w')
+    pickle.dump(entries, F)
+    F.close()
+    cache_FN = join(self.dir['dock'],'minimized.pkl.gz')
+    fd = os.open(cache_FN, os.O_WRONLY|os.O_APPEND|os.O_CREAT, 0644)
+    try:
+      os.write(fd, buf.getvalue())
+    finally:
+      os.close(fd)
+
   def _run_MBAR(self,u_kln,N_k):
     """
     Estimates the free energy of a transition using BAR and MBAR
@@ -2861,6 +3608,71 @@ last modified {2}
           ' trying time step of %f'%lambda_n['delta_t'])
         return lambda_n
 
+  def _mean_repX_acc(self, Es, lambdas):
+    """
+    Estimates the mean replica exchange acceptance rate between
+    two states, lambdas, from the energies of their samples, Es
+    """
+    (u_kln,N_k) = self._u_kln([[Es[0]],[Es[1]]], lambdas)
+    N = min(N_k)
+    acc = np.exp(-u_kln[0,1,:N]-u_kln[1,0,:N]+u_kln[0,0,:N]+u_kln[1,1,:N])
+    return np.mean(np.minimum(acc,np.ones(acc.shape)))
+
+  def _predicted_repX_acc(self, du):
+    """
+    Predicts the mean replica exchange acceptance rate between the state
+    that was sampled and a new state by reweighting, where du is the
+    difference in reduced energy, u_new - u_old, of the samples.
+
+    The swap of samples x_o and x_n is accepted with probability
+    min(1, exp(du(x_n) - du(x_o))). Samples from the new state
+    are the old samples with weights proportional to exp(-du),
+    so the mean over all pairs is computed after sorting du.
+    """
+    du = np.sort(du)
+    w = np.exp(-(du - du[0]))
+    # Pairs in which du(x_n) >= du(x_o) are always accepted
+    tail = np.cumsum(w[::-1])[::-1]
+    return np.mean(tail + w*np.arange(len(du)))/np.sum(w)
+
+  def _prescreen_state(self, process, predict, x_o, x_n, x_end, \
+      shrink_only=False, max_iterations=12):
+    """
+    Chooses the progress variable of the next state, between x_o, of the
+    current state, and x_end, so that the replica exchange acceptance
+    predicted by predict(x) is within [min_repX_acc, 0.99].
+    The candidate x_n is kept if its prediction is within the window.
+    Otherwise, the window is found by bisection.
+    If shrink_only is True, the step is never lengthened. This is used
+    after a state is rejected, because the prediction is optimistic
+    when the overlap between states is poor.
+
+    Returns the progress variable and whether the candidate was changed.
+    """
+    min_acc = self.params[process]['min_repX_acc']
+    acc = predict(x_n)
+    if acc<min_acc:
+      (lo, hi) = (x_o, x_n)
+    elif (acc>0.99) and (x_n!=x_end) and (not shrink_only):
+      if predict(x_end)>=min_acc:
+        return (x_end, True)
+      (lo, hi) = (x_n, x_end)
+    else:
+      return (x_n, False)
+    # lo is predicted to be above the window and hi below it
+    for iteration in range(max_iterations):
+      x = (lo + hi)/2.
+      acc = predict(x)
+      if acc<min_acc:
+        hi = x
+      elif acc>0.99:
+        lo = x
+      else:
+        return (x, True)
+    if lo==x_o:
+      return (x_n, False)
+    return (lo, True)
+
   def _tL_tensor(self, E, lambda_c, process='dock'):
     T = lambda_c['T']
     if process=='dock':
@@ -3204,18 +4016,36 @@ last modified {2}
     if E is None:
       E = {}
 
+    terms = ['MM','site','misc'] + self._scalables
+    E_array = self._energy_term_array(confs)
+    for t in range(len(terms)):
+      E[terms[t]] = E_array[:,t]
+    return E
+
+  def _energy_term_array(self, confs):
+    """
+    Calculates MMTK energy terms for an (N, natoms, 3) array of configurations.
+    Returns an (N, nterms) array in which the columns are
+    ['MM','site','misc'] + self._scalables.
+    Units are the MMTK standard, kJ/mol
+    """
+    terms = ['MM','site','misc'] + self._scalables
+    E = np.zeros((len(confs), len(terms)), dtype=float)
+    if len(confs)==0:
+      return E
+    confs = np.array(confs, dtype=float)
+
     lambda_full = {'T':self.T_HIGH,'MM':True,'site':True}
     for scalable in self._scalables:
       lambda_full[scalable] = 1
     self._set_universe_evaluator(lambda_full)
-    # Molecular mechanics and grid interaction energies
-    for term in (['MM','site','misc'] + self._scalables):
-      E[term] = np.zeros(len(confs), dtype=float)
-    for c in range(len(confs)):
-      self.universe.setConfiguration(Configuration(self.universe,confs[c]))
-      eT = self.universe.energyTerms()
-      for (key,value) in eT.iteritems():
-        E[term_map[key]][c] += value
+
+    # All the terms are recorded in one pass over the configurations
+    # and added to the column of their type
+    term_names = self.universe.energyEvaluator().term_names
+    (E_total, E_terms) = self._batch_energy(confs, nterms=len(term_names))
+    for n in range(len(term_names)):
+      E[:,terms.index(term_map[term_names[n]])] += E_terms[:,n]
     return E
 
   def _NAMD_Energy(self, confs, moiety, phase, dcd_FN, outputname,
@@ -3717,7 +4547,10 @@ END
       return (np.ceil((x.astype(float)-1)/32)*32+1).astype(int)
 
     self._set_universe_evaluator({'MM':True, 'T':self.T_HIGH, 'ELE':1})
-    gd = self._forceFields['ELE'].grid_data
+    if self._forceFields['grids'] is not None:
+      gd = self._forceFields['grids'].grid_data
+    else:
+      gd = self._forceFields['ELE'].grid_data
     focus_dims = roundUpDime(gd['counts'])
     focus_center = factor*(gd['counts']*gd['spacing']/2. + gd['origin'])
     focus_spacing = factor*gd['spacing'][0]
@@ -151,7 +151,12 @@ arguments = {
   'site_max_R':{'type':float,
     'help':'Maximum radial position for a spherical or cylindrical binding site'},
   'site_density':{'type':float,
-    'help':'Density of center-of-mass points in the first docking state'}}
+    'help':'Density of center-of-mass points in the first docking state'},
+  'first_state_sampler':{'choices':['Random','FFT'],
+    'help':'Placement of the ligand in the first docking state. ' + \
+      '"Random" evaluates random translations of random rotations. ' + \
+      '"FFT" scores every translation onto a grid point in the site ' + \
+      'by Fast Fourier Transforms and evaluates a uniform sample of them.'}}
 
 for process in ['cool','dock']:
   for key in ['protocol', 'therm_speed', 'sampler',
@@ -468,6 +473,7 @@ last modified {2}
       'site':None, 'site_center':None, 'site_direction':None,
       'site_max_X':None, 'site_max_R':None,
       'site_density':50.,
+      'first_state_sampler':'Random',
       'MCMC_moves':1,
       'rmsd':False,
       'score':False,
@@ -1189,6 +1195,11 @@ last modified {2}
       self._max_n_trans = self._random_trans.shape[0]
       self._n_rot = self._random_rotT.shape[0]
 
+    # Placements that are not indexed by conformer, rotation, and translation
+    self._random_dock_placements = None
+    if self.params['dock']['first_state_sampler']=='FFT':
+      return self.FFT_dock(cool0_confs, cool0_Es_MM, lambda_o)
+
     # Get interaction energies.
     # Loop over configurations, random rotations, and random translations
     E = {}
@@ -1260,21 +1271,95 @@ last modified {2}
 
     return (cool0_confs, E)
 
-  def FFT_dock(self):
+  def FFT_dock(self, cool0_confs, cool0_Es_MM, lambda_o):
     """
-      Systemically places the ligand into the receptor grids 
+      Systematically places the ligand into the receptor grids
       along grid points using a Fast Fourier Transform
+
+      For each conformer and rotation, every translation of the center of
+      mass onto a grid point in the binding site is scored by the soft
+      grids, sLJr and sELE, at full strength, as in BPMF.FFT_dock.
+      The energies of a uniform sample of up to self._max_n_trans of the
+      placements are evaluated and returned, and the placements are stored
+      in self._random_dock_placements for initial_dock.
     """
+    from AlGDock.FFTDock import FFTDock
+    from AlGDock.ForceFields.Grid.Interpolation import load_grid
+    from AlGDock.ForceFields.Grid.BatchInterpolation import BatchGridTerm
+
+    terms = []
+    for scalable in ['sLJr','sELE']:
+      grid_data = load_grid(self._FNs['grids'][scalable[1:]], \
+        grid_thresh=self._grid_max_val(scalable))
+      scaling_factor = np.zeros(self.universe.numberOfAtoms())
+      for atom in self.molecule.atomList():
+        scaling_factor[atom.index] = self.molecule.getAtomProperty(atom, \
+          {'sLJr':'scaling_factor_LJr', \
+           'sELE':'scaling_factor_electrostatic'}[scalable])
+      if grid_data['neg_vals']:
+        scaling_factor = -scaling_factor
+      terms.append(BatchGridTerm(grid_data, scaling_factor, name=scalable))
+
+    masses = self.universe.masses().array
+    max_R = max([np.sqrt(np.sum((conf - \
+      np.dot(masses, conf)/masses.sum())**2, axis=1)).max() \
+      for conf in cool0_confs])
+    FFT_start_time = time.time()
+    docker = FFTDock(terms, self._forceFields['site'], masses, max_R)
+    result = docker.dock(cool0_confs, self._random_rotT[:self._n_rot], 1, \
+      RT_HIGH, n_sample=self._max_n_trans)
+    self.tee("  scored %d placements of %d ligand configurations "%(\
+      result['n'], len(cool0_confs)) + \
+      "with %d rotations by FFT in "%self._n_rot + \
+      HMStime(time.time()-FFT_start_time))
+    self.tee("  the free energy of turning on the soft grids" + \
+      " is %f RT"%result['f'])
+
+    # Energies of the uniform sample of placements
+    placements = result['sample']
+    E = {}
+    for term in (['MM','site']+self._scalables):
+      E[term] = np.zeros(len(placements['conf']))
+    for n in range(len(placements['conf'])):
+      conf = np.dot(cool0_confs[placements['conf'][n]], \
+        self._random_rotT[placements['rotation'][n],:,:])
+      conf = conf - np.dot(masses, conf)/masses.sum() + \
+        placements['translation'][n]
+      self.universe.setConfiguration(Configuration(self.universe, conf))
+      eT = self.universe.energyTerms()
+      for (key,value) in eT.iteritems():
+        E[term_map[key]][n] += value
+      E['MM'][n] = cool0_Es_MM[placements['conf'][n]]
+    self._random_dock_placements = placements
+
+    (u_kln,N_k) = self._u_kln([E],\
+      [lambda_o,self._next_dock_state(E=E, lambda_o=lambda_o)])
+    du = u_kln[0,1,:] - u_kln[0,0,:]
+    f_grid0 = -np.log(np.exp(-du+min(du)).mean()) + min(du)
+    self.tee("  %d ligand configurations "%len(cool0_Es_MM) + \
+             "were docked into the binding site using "+ \
+             "%d sampled placements"%len(du))
+    self.tee("  the predicted free energy difference between the" + \
+             " first and second docking states is %f"%f_grid0)
+    return (cool0_confs, E)
 
-    # TODO: Write this function
-    # UNDER CONSTRUCTION
-    # Loop over conformers
-    #   Loop over rotations
-    #     Generate ligand grids
-    #     Compute the cross-correlation with FFT
-    #     Accumulate results into the running BPMF estimator
-    #     Keep the lowest-energy conformers
-    # Estimate the BPMF
+  def _random_dock_conf(self, cool0_confs, ind):
+    """
+    Returns a configuration from the first state of docking
+    for an index into the energies from random_dock
+    """
+    placements = getattr(self, '_random_dock_placements', None)
+    if placements is None:
+      (c,i_rot,i_trans) = np.unravel_index(ind, \
+        (self.params['dock']['seeds_per_state'], self._n_rot, self._n_trans))
+      return np.add(np.dot(cool0_confs[c], self._random_rotT[i_rot,:,:]), \
+        self._random_trans[i_trans].array)
+    # Placements from FFT_dock have their center of mass at the translation
+    conf = np.dot(cool0_confs[placements['conf'][ind]], \
+      self._random_rotT[placements['rotation'][ind],:,:])
+    masses = self.universe.masses().array
+    return conf - np.dot(masses, conf)/masses.sum() + \
+      placements['translation'][ind]
 
   def initial_dock(self, randomOnly=False, undock=True):
     """
@@ -1407,16 +1492,13 @@ last modified {2}
         # Cooling state 0 configurations, randomly oriented
         # Use the lowest energy configuration in the first docking state for replica exchange
         ind = np.argmin(u_n)
-        (c,i_rot,i_trans) = np.unravel_index(ind, (self.params['dock']['seeds_per_state'], self._n_rot, self._n_trans))
-        repX_conf = np.add(np.dot(cool0_confs[c], self._random_rotT[i_rot,:,:]),\
-                           self._random_trans[i_trans].array)
+        repX_conf = self._random_dock_conf(cool0_confs, ind)
         self.confs['dock']['replicas'] = [repX_conf]
         self.confs['dock']['samples'] = [[repX_conf]]
         self.dock_Es = [[dict([(key,np.array([val[ind]])) for (key,val) in E.iteritems()])]]
         seeds = []
         for ind in seedIndicies:
-          (c,i_rot,i_trans) = np.unravel_index(ind, (self.params['dock']['seeds_per_state'], self._n_rot, self._n_trans))
-          seeds.append(np.add(np.dot(cool0_confs[c], self._random_rotT[i_rot,:,:]), self._random_trans[i_trans].array))
+          seeds.append(self._random_dock_conf(cool0_confs, ind))
         confs = None
         E = {}
       else: # Seeds from last state
@@ -1787,6 +1869,28 @@ last modified {2}
   # Internal Functions #
   ######################
 
+  def _grid_max_val(self, scalable):
+    """
+    Returns the maximum value of the points of a scalable grid,
+    or -1 if there is no maximum
+    """
+    if scalable=='sLJr':
+      return 10.0
+    elif scalable=='sELE':
+      # The maximum value is set so that the electrostatic energy
+      # less than or equal to the Lennard-Jones repulsive energy
+      # for every heavy atom at every grid point
+      scaling_factors_ELE = np.array([ \
+        self.molecule.getAtomProperty(a, 'scaling_factor_electrostatic') \
+          for a in self.molecule.atomList()],dtype=float)
+      scaling_factors_LJr = np.array([ \
+        self.molecule.getAtomProperty(a, 'scaling_factor_LJr') \
+          for a in self.molecule.atomList()],dtype=float)
+      scaling_factors_ELE = scaling_factors_ELE[scaling_factors_LJr>10]
+      scaling_factors_LJr = scaling_factors_LJr[scaling_factors_LJr>10]
+      return min(abs(scaling_factors_LJr*10.0/scaling_factors_ELE))
+    return -1
+
   def _set_universe_evaluator(self, lambda_n):
     """
     Sets the universe evaluator to values appropriate for the given lambda_n dictionary.
@@ -1841,28 +1945,10 @@ last modified {2}
               lambda_n[scalable], grid_scaling_factor,
               grid_name=scalable, max_val=-1)
           else:
-            if scalable=='sLJr':
-              max_val = 10.0
-            elif scalable=='sELE':
-              # The maximum value is set so that the electrostatic energy
-              # less than or equal to the Lennard-Jones repulsive energy
-              # for every heavy atom at every grid point
-              scaling_factors_ELE = np.array([ \
-                self.molecule.getAtomProperty(a, 'scaling_factor_electrostatic') \
-                  for a in self.molecule.atomList()],dtype=float)
-              scaling_factors_LJr = np.array([ \
-                self.molecule.getAtomProperty(a, 'scaling_factor_LJr') \
-                  for a in self.molecule.atomList()],dtype=float)
-              scaling_factors_ELE = scaling_factors_ELE[scaling_factors_LJr>10]
-              scaling_factors_LJr = scaling_factors_LJr[scaling_factors_LJr>10]
-              max_val = min(abs(scaling_factors_LJr*10.0/scaling_factors_ELE))
-            else:
-              max_val = -1
-              
             from AlGDock.ForceFields.Grid.TrilinearGrid import TrilinearGridForceField
             self._forceFields[scalable] = TrilinearGridForceField(grid_FN,
               lambda_n[scalable], grid_scaling_factor,
-              grid_name=scalable, max_val=max_val)
+              grid_name=scalable, max_val=self._grid_max_val(scalable))
           self.tee('  %s grid loaded from %s in %s'%(scalable, grid_FN, \
             HMStime(time.time()-loading_start_time)))
 
@@ -57,6 +57,13 @@ arguments = {
   'grid_LJr':{'help':'DX file for Lennard-Jones repulsive grid'},
   'grid_LJa':{'help':'DX file for Lennard-Jones attractive grid'},
   'grid_ELE':{'help':'DX file for electrostatic grid'},
+  'grid_LJr_fine':{'help':'Fine patch of the Lennard-Jones repulsive grid around the binding site (optional)'},
+  'grid_LJa_fine':{'help':'Fine patch of the Lennard-Jones attractive grid around the binding site (optional)'},
+  'grid_ELE_fine':{'help':'Fine patch of the electrostatic grid around the binding site (optional)'},
+  'grid_precision':{'choices':['double','single'], \
+    'help':'Precision in which grid values are stored. Single precision halves the memory used by grids. Interpolation is always in double precision.'},
+  'grid_layout':{'choices':['linear','blocked'], \
+    'help':'Order in which grid values are stored. In the blocked layout, values are stored in overlapping bricks of 5x5x5 points around 4x4x4 cells, which keeps the points around each grid cell close in memory but uses about twice as much memory.'},
   'score':{'help':"Starting configuration(s) for replica exchange. Can be a mol2 file, .pkl.gz file, or 'default'"},
   # Simulation settings and constants
   #   Run-dependent 
@@ -104,6 +111,10 @@ arguments = {
     'help':'Number of replica exchange sweeps per cycle'},
   'attempts_per_sweep':{'type':int,
     'help':'Number of replica exchange attempts per sweep'},
+  'repX_mode':{'choices':['neighbors','Gibbs'],
+    'help':'Replica exchange swaps between neighboring states or ' + \
+      'Gibbs independence sampling of the permutation of states, ' + \
+      'with K^3 swap attempts between any pair of states per sweep'},
   'steps_per_sweep':{'type':int,
     'help':'Number of MD steps per replica exchange sweep'},
   'darts_per_sweep':{'type':int,
@@ -136,13 +147,27 @@ arguments = {
   'site_max_R':{'type':float,
     'help':'Maximum radial position for a spherical or cylindrical binding site'},
   'site_density':{'type':float,
-    'help':'Density of center-of-mass points in the first docking state'}}
+    'help':'Density of center-of-mass points in the first docking state'},
+  'first_state_sampler':{'choices':['Random','FFT'],
+    'help':'Placement of the ligand in the first docking state. ' + \
+      '"Random" evaluates random translations of random rotations. ' + \
+      '"FFT" scores every translation onto a grid point in the site ' + \
+      'by Fast Fourier Transforms and keeps the lowest-energy placements.'},
+  'speculative_states':{'type':int,
+    'help':'Number of candidate states, with successively smaller steps, ' + \
+      'that are simulated at once during initial docking. The largest ' + \
+      'step that meets min_repX_acc is kept. This is useful when there ' + \
+      'are more cores than seeds_per_state.'},
+  'random_dock_streaming':{'action':'store_true',
+    'help':'Evaluate random placements in the first docking state ' + \
+      'without storing all of their energies, ' + \
+      'keeping running sums and a weighted reservoir of seeds'}}
 
 import copy
 for process in ['cool','dock']:
   for key in ['protocol', 'therm_speed', 'sampler',
       'seeds_per_state', 'steps_per_seed', 'darts_per_seed',
-      'sweeps_per_cycle', 'attempts_per_sweep',
+      'sweeps_per_cycle', 'attempts_per_sweep', 'repX_mode',
       'steps_per_sweep', 'darts_per_sweep',
       'snaps_per_independent', 'keep_intermediate']:
     arguments[process+'_'+key] = copy.deepcopy(arguments[key])
@@ -0,0 +1,226 @@
+# Exhaustive translational docking by fast Fourier transforms
+
+"""
+Scores every translation of a rigid ligand on the lattice of a grid
+inside the binding site at once, for a series of conformers and rotations.
+
+The energy of a grid term with trilinear interpolation is linear in the
+grid values. When the ligand is translated by a multiple of the grid
+spacing, every atom keeps its position within its grid cell, so the
+energy at all of the lattice translations is the cross-correlation of
+the receptor grid with a ligand grid, onto which the scaling factor
+of each atom is spread with its trilinear weights. The cross-correlation
+is computed by FFT in O(N log N) for the N points around the site.
+The energies are the same as from the grid terms, apart from rounding.
+
+Translations place the center of mass of the ligand on lattice points
+inside the binding site, so the site energy is zero.
+Translations that place any atom outside of the grid are skipped.
+
+Positions are in nm, as in the grid terms of AlGDock.ForceFields.Grid.
+"""
+
+import numpy as np
+
+from AlGDock.ForceFields.Grid.BatchInterpolation import _index
+
+def inside_site(site, points):
+  """
+  Returns whether points, an array with shape (M,3), are within
+  a SphereForceField or a CylinderForceField
+  """
+  if hasattr(site, 'center'):
+    return np.sum((points - site.center)**2, axis=1) <= site.max_R**2
+  elif hasattr(site, 'max_X'):
+    p = points - site.origin
+    return (p[:,0]>=0) & (p[:,0]<=site.max_X) & \
+      (p[:,1]**2 + p[:,2]**2 <= site.max_R**2)
+  raise Exception('Binding site type not recognized!')
+
+def _site_bounds(site):
+  # Lower and upper corners of a box around the site
+  if hasattr(site, 'center'):
+    return (site.center - site.max_R, site.center + site.max_R)
+  elif hasattr(site, 'max_X'):
+    return (site.origin - np.array([0., site.max_R, site.max_R]), \
+      site.origin + np.array([site.max_X, site.max_R, site.max_R]))
+  raise Exception('Binding site type not recognized!')
+
+def _keep_lowest(kept, candidates, key, n):
+  # Merges two dictionaries of arrays and keeps the n entries
+  # with the lowest values of key
+  merged = dict([(k, np.concatenate((kept[k], candidates[k]))) \
+    for k in kept.keys()])
+  keep = np.argsort(merged[key], kind='mergesort')[:n]
+  return dict([(k, merged[k][keep]) for k in merged.keys()])
+
+class FFTDock:
+  """
+  Scores lattice translations of rigid ligand placements in a binding site
+  """
+  def __init__(self, terms, site, masses, max_R):
+    """
+    @terms: BatchGridTerm objects with trilinear interpolation and
+      no transformation or fine grid, on grids with the same points.
+      The score of a placement is the sum of their energies.
+    @site: a SphereForceField or CylinderForceField
+    @masses: the mass of each atom of the ligand
+    @max_R: the maximum distance of any atom from the center of mass
+      of the ligand, in the conformers that will be docked
+    """
+    if len(terms)==0:
+      raise Exception('FFT docking requires at least one grid term')
+    for term in terms:
+      if (term.interpolate.__name__!='_trilinear') or \
+          (term.inv_power is not None) or (len(term.grids)>1):
+        raise Exception('FFT docking requires trilinear interpolation ' + \
+          'without transformations or fine grids, unlike %s'%term.name)
+    grid = terms[0].grids[0]
+    for term in terms[1:]:
+      if not (np.allclose(term.grids[0]['origin'], grid['origin']) and \
+          np.allclose(term.grids[0]['spacing'], grid['spacing']) and \
+          (term.grids[0]['counts']==grid['counts']).all()):
+        raise Exception('FFT docking requires grids with the same points')
+
+    self.terms = terms
+    self.masses = np.array(masses, dtype=float)
+    self.origin = grid['origin']
+    self.spacing = grid['spacing']
+    self.counts = grid['counts']
+
+    # Lattice points in a box around the site
+    (lower, upper) = _site_bounds(site)
+    self.k_lower = np.maximum(np.ceil(\
+      (lower - self.origin)/self.spacing).astype(int), 0)
+    k_upper = np.minimum(np.floor(\
+      (upper - self.origin)/self.spacing).astype(int), self.counts-1)
+    if (k_upper<self.k_lower).any():
+      raise Exception('The binding site is not on the grid')
+    self.shape = tuple(k_upper - self.k_lower + 1)
+    k = np.indices(self.shape).reshape((3,-1)).T + self.k_lower
+    self.translations = self.origin + k*self.spacing
+    self.in_site = inside_site(site, self.translations).reshape(self.shape)
+
+    # Atoms are spread onto up to m points on either side of the center
+    self.m = int(np.ceil(max_R/self.spacing.min())) + 1
+    # Receptor grids around the site, which are padded with zeros
+    # where they extend beyond the grid, and their transforms
+    self.fft_shape = tuple(np.array(self.shape) + 2*self.m)
+    i = [np.arange(self.fft_shape[d]) + self.k_lower[d] - self.m \
+      for d in range(3)]
+    on_grid = [(i[d]>=0) & (i[d]<self.counts[d]) for d in range(3)]
+    i = [np.clip(i[d], 0, self.counts[d]-1) for d in range(3)]
+    ind = _index(grid, i[0][:,None,None], i[1][None,:,None], \
+      i[2][None,None,:])
+    mask = on_grid[0][:,None,None] & on_grid[1][None,:,None] & \
+      on_grid[2][None,None,:]
+    self.receptor_fft = [np.fft.rfftn(\
+      np.where(mask, np.asarray(term.grids[0]['vals'])[ind], 0.)) \
+      for term in terms]
+
+  def scores(self, conf):
+    """
+    Returns the score of translating conf, an array with shape (natoms,3),
+    so that its center of mass is at each lattice point in the box around
+    the site, as an array with the shape of the box.
+    Translations that are outside of the site or that place any atom
+    outside of the grid have a score of inf.
+    """
+    conf = np.asarray(conf)
+    d = (conf - np.dot(self.masses, conf)/self.masses.sum())/self.spacing
+    n = np.floor(d).astype(int)
+    if (np.abs(n)>self.m-1).any():
+      raise Exception('The ligand is larger than the maximum radius')
+    f = d - n
+
+    # Translations for which all of the atoms are inside the grid,
+    # away from the upper faces as in the grid terms
+    k = np.indices(self.shape) + self.k_lower[:,None,None,None]
+    valid = np.copy(self.in_site)
+    for dim in range(3):
+      valid &= (k[dim] + n[:,dim].min() >= 0) & \
+        (k[dim] + n[:,dim].max() + 1 <= self.counts[dim]-1)
+
+    # Spread each scaling factor onto the corners of its cell.
+    # Corners are in the order mmm, mmp, mpm, mpp, pmm, pmp, ppm, ppp.
+    corner = np.arange(8)
+    c = np.array([corner>>2, (corner>>1)&1, corner&1]).T
+    w = np.prod(np.where(c[None,:,:], f[:,None,:], 1. - f[:,None,:]), axis=2)
+    o = n[:,None,:] + c[None,:,:] + self.m
+    o = np.ravel_multi_index((o[:,:,0].ravel(), o[:,:,1].ravel(), \
+      o[:,:,2].ravel()), self.fft_shape)
+
+    spectrum = 0.
+    for (term, receptor_fft) in zip(self.terms, self.receptor_fft):
+      sf = term.scaling_factor[:,None]*term.strength
+      ligand = np.bincount(o, weights=(sf*w).ravel(), \
+        minlength=int(np.prod(self.fft_shape))).reshape(self.fft_shape)
+      spectrum = spectrum + np.conj(np.fft.rfftn(ligand))*receptor_fft
+    E = np.fft.irfftn(spectrum, s=self.fft_shape)
+    E = E[:self.shape[0],:self.shape[1],:self.shape[2]]
+    return np.where(valid, E, np.inf)
+
+  def dock(self, confs, rotations, n_keep, RT, n_sample=0):
+    """
+    Scores lattice translations of the conformers in confs
+    with all of the rotations, an array of rotation matrices that are
+    applied as np.dot(conf, rotation), as in BPMF.random_dock.
+
+    Returns a dictionary with
+      'f': the free energy, in units of RT, of turning on the score,
+        -ln <exp(-score/RT)>, over all of the scored placements,
+      'n': the number of scored placements,
+      'score', 'conf', 'rotation', 'translation', and 'index': the scores,
+        indices of the conformer and rotation, positions of the
+        center of mass, and unique indices of the n_keep placements
+        with the lowest scores,
+      'sample': a dictionary with the same keys for a uniform random sample,
+        without replacement, of n_sample of the scored placements.
+    """
+    log_sum = -np.inf
+    n = 0
+    empty = {'score':np.zeros(0), 'conf':np.zeros(0, dtype=int), \
+      'rotation':np.zeros(0, dtype=int), 'trans_ind':np.zeros(0, dtype=int)}
+    best = dict(empty)
+    # The sample is the placements with the lowest uniform random keys
+    sample = dict(empty, key=np.zeros(0))
+    for c in range(len(confs)):
+      for r in range(len(rotations)):
+        score = self.scores(np.dot(confs[c], rotations[r])).ravel()
+        trans_ind = np.nonzero(np.isfinite(score))[0]
+        if len(trans_ind)==0:
+          continue
+        score = score[trans_ind]
+        # Running log-sum-exp of the Boltzmann factors
+        u = -score/RT
+        u_max = max(log_sum, u.max())
+        log_sum = u_max + np.log(np.exp(log_sum - u_max) + \
+          np.sum(np.exp(u - u_max)))
+        n += len(score)
+        candidates = {'score':score, \
+          'conf':np.ones(len(score), dtype=int)*c, \
+          'rotation':np.ones(len(score), dtype=int)*r, \
+          'trans_ind':trans_ind}
+        # Keep the placements with the lowest scores
+        keep = np.argsort(score)[:n_keep]
+        best = _keep_lowest(best, \
+          dict([(k, v[keep]) for (k, v) in candidates.items()]), \
+          'score', n_keep)
+        if n_sample>0:
+          sample = _keep_lowest(sample, \
+            dict(candidates, key=np.random.uniform(size=len(score))), \
+            'key', n_sample)
+    if n==0:
+      raise Exception('No placements of the ligand are in the site and grid')
+    result = self._placements(best, len(rotations))
+    result.update({'f':-(log_sum - np.log(n)), 'n':n, \
+      'sample':self._placements(sample, len(rotations))})
+    return result
+
+  def _placements(self, kept, n_rot):
+    # Placements with their positions and unique indices
+    return {'score':kept['score'], 'conf':kept['conf'], \
+      'rotation':kept['rotation'], \
+      'translation':self.translations[kept['trans_ind']], \
+      'index':(kept['conf']*n_rot + kept['rotation'])*len(self.translations) \
+        + kept['trans_ind']}
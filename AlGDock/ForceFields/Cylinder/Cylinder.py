@@ -72,6 +72,18 @@ class CylinderForceField(ForceField):
                   self.origin, self.direction, self.max_X, self.max_R,
                   self.name)]
 
+    def centerOfMassEnergies(self, com):
+      """
+      Returns the energies, as in CylinderTerm, of configurations
+      with centers of mass in the array com, with shape (M,3)
+      """
+      p = N.asarray(com) - self.origin
+      overMax = N.maximum(-p[:,0], 0.) + N.maximum(p[:,0] - self.max_X, 0.)
+      E = overMax*overMax
+      overMax = N.maximum(N.sqrt(p[:,1]**2 + p[:,2]**2) - self.max_R, 0.)
+      E += overMax*overMax
+      return 10000.*E/2. # k in kJ/mol nm**2
+
     def randomPoint(self):
       """
       Returns a random point within the cylinder
@@ -82,12 +94,23 @@ class CylinderForceField(ForceField):
               y*self.max_R + self.origin[1],
               z*self.max_R + self.origin[2])
     
+    def randomPoints(self, n):
+      """
+      Returns n points within the cylinder, as an array with shape (n,3),
+      from a quasi-random sequence that fills the cylinder evenly
+      """
+      from AlGDock.QuasiRandom import ball_points
+      (y,z,x) = ball_points(n, dim=2, extra_dims=1).T
+      return N.array([x*self.max_X + self.origin[0],
+                      y*self.max_R + self.origin[1],
+                      z*self.max_R + self.origin[2]]).T
+
     def _randomPointInCircle(self):
       """
       Returns a random point within a unit circle
       """
       r2 = 2
       while r2 > 1:
-        (x,y) = N.random.uniform(size=2)
+        (x,y) = N.random.uniform(-1., 1., size=2)
         r2 = x*x + y*y
       return (x,y)
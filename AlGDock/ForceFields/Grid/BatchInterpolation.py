@@ -0,0 +1,456 @@
+# Grid-based potential energies for batches of configurations.
+# Unlike the MMTK energy terms, it does not need a universe.
+
+"""
+Interpolates grids at the atoms of many configurations at once,
+with NumPy, giving the same energies and gradients as the MMTK grid terms
+that are used by InterpolationForceField.
+
+Configurations are arrays with shape (N, natoms, 3) in nm.
+Atoms with a scaling factor of zero are skipped, as in the MMTK terms.
+Atoms outside the grid are kept in it by the same harmonic wall.
+As in MMTK_trilinear_multi_grid, the gradient of the wall
+is scaled by the strength of the term.
+
+Trilinear and BSpline interpolation are supported, with or without
+a transformation of the grid values by inv_power, and with a fine patch
+around the binding site, which is blended into the grid near its edges.
+Unlike the MMTK BSpline terms, the 4x4x4 stencil is clipped to the grid,
+so values near its edges are not read from outside of it.
+BatchTransformSweep interpolates a grid with many transformations at once.
+"""
+
+from collections import OrderedDict
+import numpy as np
+
+# Coefficients of the BSpline weights of the four points of a stencil
+# for the powers 0 to 3 of the fraction within it,
+# as in MMTK_BSpline_grid.splineInterpolate.
+_BSpline_coefficients = np.array([ \
+  [  8., -12.,   6., -1.], \
+  [ -5.,  21., -15.,  3.], \
+  [  4., -12.,  12., -3.], \
+  [ -1.,   3.,  -3.,  1.]])/6.
+
+def _index(data, ix, iy, iz):
+  """
+  Returns the indices of grid points in the values of a grid,
+  which are in C order or in bricks of 4x4x4 cells (see grid_values.pxi).
+  """
+  counts = data['counts']
+  if data['layout']=='blocked':
+    bcounts = (counts+3)//4
+    return (((ix>>2)*bcounts[1] + (iy>>2))*bcounts[2] + (iz>>2))*125 + \
+      (ix&3)*25 + (iy&3)*5 + (iz&3)
+  return (ix*counts[1] + iy)*counts[2] + iz
+
+def _trilinear(data, pos, gradients=False):
+  """
+  Trilinearly interpolates a grid at positions inside it,
+  relative to its origin, with shape (M,3).
+  Returns the values and, optionally, their gradients.
+  If the grid has several values per point, with shape (npoints,P),
+  the values have shape (M,P) and the gradients (M,3,P).
+  """
+  counts = data['counts']
+  spacing = data['spacing']
+  vals = np.asarray(data['vals'])
+
+  t = pos/spacing
+  i3 = np.minimum(t.astype(int), counts-2)
+  f = (t - i3).reshape(pos.shape + (1,)*(vals.ndim-1))
+  (fx, fy, fz) = np.moveaxis(f, 1, 0)
+  (ax, ay, az) = (1. - fx, 1. - fy, 1. - fz)
+
+  # Corners in the order mmm, mmp, mpm, mpp, pmm, pmp, ppm, ppp
+  corner = np.arange(8)
+  i = _index(data, i3[:,0,None] + (corner>>2), \
+    i3[:,1,None] + ((corner>>1)&1), i3[:,2,None] + (corner&1))
+  corners = vals[i]
+  (vmmm, vmmp, vmpm, vmpp, vpmm, vpmp, vppm, vppp) = \
+    np.moveaxis(corners, 1, 0)
+
+  vmm = az*vmmm + fz*vmmp
+  vmp = az*vmpm + fz*vmpp
+  vpm = az*vpmm + fz*vpmp
+  vpp = az*vppm + fz*vppp
+
+  vm = ay*vmm + fy*vmp
+  vp = ay*vpm + fy*vpp
+
+  v = ax*vm + fx*vp
+  if not gradients:
+    return v
+
+  dv = np.empty(pos.shape + vals.shape[1:])
+  dv[:,0] = (vp - vm)/spacing[0]
+  dv[:,1] = ((vmp - vmm)*ax + (vpp - vpm)*fx)/spacing[1]
+  dv[:,2] = (((vmmp - vmmm)*ay + (vmpp - vmpm)*fy)*ax + \
+             ((vpmp - vpmm)*ay + (vppp - vppm)*fy)*fx)/spacing[2]
+  return (v, dv)
+
+def _BSpline(data, pos, gradients=False):
+  """
+  Interpolates a grid with BSplines at positions inside it,
+  relative to its origin, with shape (M,3).
+  Returns the values and, optionally, their gradients.
+  If the grid has several values per point, with shape (npoints,P),
+  the values have shape (M,P) and the gradients (M,3,P).
+  """
+  counts = data['counts']
+  spacing = data['spacing']
+
+  # The stencil starts one point before the cell, as in the MMTK terms
+  t = pos/spacing
+  i3 = (t - 1.).astype(int)
+  f = t - i3
+  powers = f[:,:,None]**np.arange(4)
+  # Weights of the stencil points along each axis, with shape (M,3,4)
+  w = np.dot(powers, _BSpline_coefficients.T)
+
+  # Indices of the stencil points, clipped to the grid
+  s = [np.clip(i3[:,d,None] + np.arange(4), 0, counts[d]-1) for d in range(3)]
+  i = _index(data, s[0][:,:,None,None], s[1][:,None,:,None], \
+    s[2][:,None,None,:])
+  stencil = np.asarray(data['vals'])[i]
+
+  vyz = np.einsum('mabc...,mc->mab...', stencil, w[:,2])
+  vx = np.einsum('mab...,mb->ma...', vyz, w[:,1])
+  v = np.einsum('ma...,ma->m...', vx, w[:,0])
+  if not gradients:
+    return v
+
+  dpowers = np.zeros(powers.shape)
+  dpowers[:,:,1:] = powers[:,:,:-1]*np.arange(1,4)
+  dw = np.dot(dpowers, _BSpline_coefficients.T)
+
+  dv = np.empty(pos.shape + stencil.shape[4:])
+  dv[:,0] = np.einsum('ma...,ma->m...', vx, dw[:,0])/spacing[0]
+  dv[:,1] = np.einsum('mab...,ma,mb->m...', vyz, w[:,0], dw[:,1])/spacing[1]
+  dv[:,2] = np.einsum('mabc...,ma,mb,mc->m...', \
+    stencil, w[:,0], w[:,1], dw[:,2])/spacing[2]
+  return (v, dv)
+
+_interpolators = {'Trilinear':_trilinear, 'BSpline':_BSpline}
+
+class BatchGridTerm:
+  """
+  The energy of a grid for batches of configurations
+  """
+  def __init__(self, grid_data, scaling_factor, \
+      interpolation_type='Trilinear', inv_power=None, strength=1.0, \
+      name='grid', fine_grid_data=None, chunk_size=2**18):
+    """
+    @grid_data: a dictionary with the origin, spacing, counts, and vals
+      of the grid, in nm, as returned by Interpolation.load_grid.
+      If inv_power is not None, the values are already transformed.
+    @scaling_factor: the scaling factor of each atom
+    @interpolation_type: 'Trilinear' or 'BSpline'
+    @inv_power: the inverse of the power by which grid points were
+      transformed. Interpolated values are raised to this power.
+    @strength: scaling factor for the energy and its gradients
+    @name: the name of the energy term
+    @fine_grid_data: a fine patch of the grid, which is interpolated
+      instead of the grid for atoms that are inside of it
+    @chunk_size: the maximum number of atom positions
+      that are interpolated at once
+    """
+    if interpolation_type not in _interpolators.keys():
+      raise Exception('%s interpolation is not supported for batches'%\
+        interpolation_type)
+    if (fine_grid_data is not None) and (interpolation_type!='Trilinear'):
+      raise Exception('Fine grids require trilinear interpolation')
+
+    self.name = name
+    self.strength = strength
+    self.inv_power = inv_power
+    self.interpolate = _interpolators[interpolation_type]
+    self.scaling_factor = np.array(scaling_factor, dtype=float)
+    self.indicies = np.nonzero(self.scaling_factor)[0]
+    self.chunk_size = chunk_size
+    self.grids = [self._grid(data) \
+      for data in [fine_grid_data, grid_data] if data is not None]
+    # To keep atoms within the grid
+    self.k = 10000. # kJ/mol nm**2
+
+  def _grid(self, data):
+    grid = dict([(key, np.array(data[key], dtype=float)) \
+      for key in ['origin','spacing']])
+    grid['counts'] = np.array(data['counts'], dtype=int)
+    grid['vals'] = data['vals']
+    grid['layout'] = data.get('layout', 'linear')
+    grid['hCorner'] = grid['spacing']*(grid['counts']-1)
+    return grid
+
+  def energies(self, confs, gradients=False):
+    """
+    Returns the energy of each configuration in confs,
+    an array with shape (N, natoms, 3), and optionally the gradients,
+    an array with the same shape as confs.
+    """
+    confs = np.asarray(confs)
+    if confs.ndim==2:
+      confs = confs[None,:,:]
+    if confs.shape[1]!=len(self.scaling_factor):
+      raise Exception('There are %d atoms in the configurations '%\
+        confs.shape[1] + 'and %d scaling factors'%len(self.scaling_factor))
+
+    E = np.zeros(confs.shape[0])
+    if gradients:
+      G = np.zeros(confs.shape)
+    nconfs_chunk = max(1, self.chunk_size//max(1, len(self.indicies)))
+    for start in range(0, confs.shape[0], nconfs_chunk):
+      chunk = slice(start, start+nconfs_chunk)
+      result = self._energies(confs[chunk][:,self.indicies,:], gradients)
+      if gradients:
+        E[chunk] = result[0]
+        G[chunk,self.indicies,:] = result[1]
+      else:
+        E[chunk] = result
+    return (E, G) if gradients else E
+
+  def _energies(self, x, gradients):
+    (nconfs, natoms) = x.shape[:2]
+    sf = np.tile(self.scaling_factor[self.indicies], nconfs)
+    x = x.reshape((-1,3))
+    e = np.zeros(len(x))
+    if gradients:
+      g = np.zeros(x.shape)
+
+    remaining = np.arange(len(x))
+    for grid in self.grids:
+      pos = x[remaining] - grid['origin']
+      inside = (pos>0).all(axis=1) & (pos<grid['hCorner']).all(axis=1)
+      ind = remaining[inside]
+      remaining = remaining[~inside]
+      if len(ind)==0:
+        continue
+      result = self.interpolate(grid, pos[inside], gradients)
+      (v, dv) = result if gradients else (result, None)
+      if grid is not self.grids[-1]:
+        (v, dv) = self._blend(grid, pos[inside], x[ind], v, dv)
+      if self.inv_power is None:
+        e[ind] = sf[ind]*v
+        if gradients:
+          g[ind] = sf[ind,None]*dv
+      else:
+        # Atoms with an interpolated value of zero are skipped
+        nonzero = (v!=0.)
+        (ind, v) = (ind[nonzero], v[nonzero])
+        e[ind] = sf[ind]*v**self.inv_power
+        if gradients:
+          g[ind] = (sf[ind]*self.inv_power*v**(self.inv_power-1))[:,None]*\
+            dv[nonzero]
+    # The harmonic wall, relative to the coarsest grid
+    if len(remaining)>0:
+      grid = self.grids[-1]
+      pos = x[remaining] - grid['origin']
+      dx = np.minimum(pos, 0.) + np.maximum(pos - grid['hCorner'], 0.)
+      e[remaining] = self.k*np.sum(dx*dx, axis=1)/2.
+      if gradients:
+        g[remaining] = self.k*dx
+
+    E = self.strength*e.reshape((nconfs, natoms)).sum(axis=1)
+    if gradients:
+      return (E, self.strength*g.reshape((nconfs, natoms, 3)))
+    return E
+
+  def _blend(self, fine, pos, x, v, dv):
+    """
+    Blends values interpolated on a fine patch, at positions pos relative
+    to its origin, into the values on the coarse grid within one coarse
+    spacing of the edges of the patch, as in MMTK_trilinear_multires_grid
+    """
+    coarse = self.grids[-1]
+    width = coarse['spacing'].max()
+    # Distances to the lower and upper faces of the patch
+    dist = np.concatenate((pos, fine['hCorner'] - pos), axis=1)
+    nearest = np.argmin(dist, axis=1)
+    t = dist[np.arange(len(pos)), nearest]/width
+    coarse_pos = x - coarse['origin']
+    blend = np.nonzero((t<1.) & (coarse_pos>0).all(axis=1) & \
+      (coarse_pos<coarse['hCorner']).all(axis=1))[0]
+    if len(blend)==0:
+      return (v, dv)
+    (t, nearest) = (t[blend], nearest[blend])
+    result = self.interpolate(coarse, coarse_pos[blend], dv is not None)
+    (vc, dvc) = result if dv is not None else (result, None)
+    # v = vc + w*(v - vc), with the smoothstep weight w
+    w = t*t*(3. - 2.*t)
+    diff = v[blend] - vc
+    if dv is not None:
+      dv[blend] = dvc + w[:,None]*(dv[blend] - dvc)
+      dv[blend, nearest%3] += np.where(nearest<3, 1., -1.)*\
+        6.*t*(1. - t)/width*diff
+    v[blend] = vc + w*diff
+    return (v, dv)
+
+def transform_values(vals, inv_powers):
+  """
+  Returns grid values transformed by several inverse powers at once,
+  as an array with shape (npoints, len(inv_powers)), as in
+  Interpolation.load_grid. The values must have the same sign, and
+  negative values are negated. Zeros are not transformed.
+  """
+  vals = np.asarray(vals, dtype=float)
+  if (vals>0).any():
+    if (vals<0).any():
+      raise Exception('All of the grid points do not have the same sign')
+  else:
+    vals = -vals
+  transformed = np.zeros((len(vals), len(inv_powers)))
+  nonzero = np.nonzero(vals)[0]
+  transformed[nonzero] = \
+    vals[nonzero,None]**(1./np.array(inv_powers, dtype=float))
+  return transformed
+
+class BatchTransformSweep:
+  """
+  The energies of a grid transformed by several inverse powers,
+  for batches of configurations.
+
+  All of the transforms are interpolated together, so each grid is read
+  and each atom is located on it once, rather than once per transform.
+  """
+  def __init__(self, grid_data, scaling_factor, inv_powers, \
+      interpolation_type='Trilinear', strength=1.0, name='grid', \
+      chunk_size=2**18):
+    """
+    @grid_data: a dictionary with the origin, spacing, counts, and vals
+      of the untransformed grid, in nm, as returned by
+      Interpolation.load_grid with inv_power of None and linear layout.
+    @scaling_factor: the scaling factor of each atom.
+      As in InterpolationForceField, it is negated if the grid values
+      are negative.
+    @inv_powers: the inverse powers by which grid points are transformed
+    The other parameters are the same as for BatchGridTerm.
+    Each transform is counted against the chunk_size.
+    """
+    if interpolation_type not in _interpolators.keys():
+      raise Exception('%s interpolation is not supported for batches'%\
+        interpolation_type)
+    if grid_data.get('layout', 'linear')!='linear':
+      raise Exception('Transform sweeps require the linear layout')
+
+    self.name = name
+    self.inv_powers = np.array(inv_powers, dtype=float)
+    neg_vals = not (np.asarray(grid_data['vals'])>0).any()
+    grid_data = dict(grid_data)
+    grid_data['vals'] = transform_values(grid_data['vals'], self.inv_powers)
+    grid_data['layout'] = 'linear'
+    self.term = BatchGridTerm(grid_data, \
+      -np.array(scaling_factor) if neg_vals else scaling_factor, \
+      interpolation_type=interpolation_type, strength=strength, name=name, \
+      chunk_size=max(1, chunk_size//len(self.inv_powers)))
+
+  def energies(self, confs):
+    """
+    Returns the energies of the configurations in confs,
+    an array with shape (N, natoms, 3), as an array with
+    shape (len(inv_powers), N).
+    """
+    confs = np.asarray(confs)
+    if confs.ndim==2:
+      confs = confs[None,:,:]
+    term = self.term
+    if confs.shape[1]!=len(term.scaling_factor):
+      raise Exception('There are %d atoms in the configurations '%\
+        confs.shape[1] + 'and %d scaling factors'%len(term.scaling_factor))
+
+    E = np.zeros((len(self.inv_powers), confs.shape[0]))
+    nconfs_chunk = max(1, term.chunk_size//max(1, len(term.indicies)))
+    for start in range(0, confs.shape[0], nconfs_chunk):
+      chunk = slice(start, start+nconfs_chunk)
+      E[:,chunk] = self._energies(confs[chunk][:,term.indicies,:])
+    return E
+
+  def _energies(self, x):
+    term = self.term
+    grid = term.grids[0]
+    (nconfs, natoms) = x.shape[:2]
+    sf = np.tile(term.scaling_factor[term.indicies], nconfs)
+    x = x.reshape((-1,3))
+    e = np.zeros((len(x), len(self.inv_powers)))
+
+    pos = x - grid['origin']
+    inside = (pos>0).all(axis=1) & (pos<grid['hCorner']).all(axis=1)
+    if inside.any():
+      v = term.interpolate(grid, pos[inside])
+      # Atoms with an interpolated value of zero are skipped
+      nonzero = (v!=0.)
+      powers = np.broadcast_to(self.inv_powers, v.shape)
+      vp = np.zeros(v.shape)
+      vp[nonzero] = v[nonzero]**powers[nonzero]
+      e[inside] = sf[inside,None]*vp
+    # The harmonic wall, which does not depend on the transform
+    outside = ~inside
+    if outside.any():
+      dx = np.minimum(pos[outside], 0.) + \
+        np.maximum(pos[outside] - grid['hCorner'], 0.)
+      e[outside] = self.term.k*np.sum(dx*dx, axis=1)[:,None]/2.
+
+    return term.strength*e.reshape((nconfs, natoms, -1)).sum(axis=1).T
+
+def _scaling_factor(universe, scaling_property, scaling_prefactor):
+  # As in InterpolationForceField.evaluatorTerms
+  from MMTK import ParticleScalar
+  scaling_factor = ParticleScalar(universe)
+  for o in universe:
+    for a in o.atomList():
+      scaling_factor[a] = o.getAtomProperty(a, scaling_property)
+  return scaling_prefactor*scaling_factor.array
+
+def terms_from_force_field(force_field, universe, chunk_size=2**18):
+  """
+  Returns a list of BatchGridTerm objects with the same energies as
+  an InterpolationForceField or a MultiInterpolationForceField,
+  for the atoms of an MMTK universe.
+  """
+  if hasattr(force_field, 'fff'):
+    force_fields = force_field.fff
+  else:
+    force_fields = [force_field]
+
+  terms = []
+  for ff in force_fields:
+    if 'grid_names' in ff.params.keys():
+      # MultiInterpolationForceField
+      for g in range(len(ff.params['grid_names'])):
+        grid_data = dict(ff.grid_data)
+        grid_data['vals'] = ff.grid_data['vals'][:,g]
+        terms.append(BatchGridTerm(grid_data, \
+          _scaling_factor(universe, ff.params['scaling_property'][g], \
+            ff.params['scaling_prefactor'][g]), \
+          interpolation_type='Trilinear', \
+          inv_power=-2 if ff.params['isqrt'][g] else None, \
+          strength=ff.params['strength'][g], \
+          name=ff.params['grid_names'][g], chunk_size=chunk_size))
+    elif 'interpolation_type' in ff.params.keys():
+      if ff.params['energy_thresh']>0:
+        raise Exception('Energy thresholds are not supported for batches')
+      terms.append(BatchGridTerm(ff.grid_data, \
+        _scaling_factor(universe, ff.params['scaling_property'], \
+          ff.params['scaling_prefactor']), \
+        interpolation_type=ff.params['interpolation_type'], \
+        inv_power=ff.params['inv_power'], strength=ff.params['strength'], \
+        name=ff.params['name'], \
+        fine_grid_data=getattr(ff, 'fine_grid_data', None), \
+        chunk_size=chunk_size))
+  return terms
+
+def energy_terms(terms, confs, gradients=False):
+  """
+  Returns an OrderedDict with the energies of each term for
+  the configurations in confs, an array with shape (N, natoms, 3).
+  If gradients is True, an OrderedDict with the gradients of each term
+  is also returned.
+  """
+  E = OrderedDict()
+  G = OrderedDict()
+  for term in terms:
+    result = term.energies(confs, gradients)
+    if gradients:
+      (E[term.name], G[term.name]) = result
+    else:
+      E[term.name] = result
+  return (E, G) if gradients else E
@@ -4,12 +4,253 @@
 from MMTK.ForceFields.ForceField import ForceField, EnergyTerm
 from MMTK import ParticleScalar, ParticleVector, SymmetricPairTensor
 from collections import OrderedDict
+import weakref
+import numpy as np
 
 try:
   from Scientific._vector import Vector
 except:
   from Scientific.Geometry.VectorModule import Vector
 
+# Grids that have been read in this process, keyed by (FN, multiplier)
+_grid_cache = {}
+# Transformed grid values,
+# keyed by (FN, multiplier, inv_power, grid_thresh, precision, layout).
+# The references are weak, so transformed values are shared
+# between force fields but are freed when no force field uses them.
+_transformed_vals_cache = weakref.WeakValueDictionary()
+
+def block_values(vals, counts):
+  """
+  Returns grid values in C order rearranged into bricks of 4x4x4 cells,
+  each with the 5x5x5 points around its cells, the blocked layout that
+  is described in grid_values.pxi. The grid is padded to a whole number
+  of bricks with copies of the values on its upper faces.
+  """
+  counts = np.array(counts, dtype=int)
+  bcounts = (counts+3)//4
+  # Position of each point of each brick along each dimension
+  i = [np.minimum(4*np.arange(bcounts[d])[:,None] + np.arange(5)[None,:], \
+    counts[d]-1) for d in range(3)]
+  vals = np.asarray(vals).reshape(tuple(counts))
+  return vals[i[0][:,None,None,:,None,None], i[1][None,:,None,None,:,None], \
+    i[2][None,None,:,None,None,:]].reshape(-1)
+
+def load_grid(FN, multiplier=0.1, inv_power=None, grid_thresh=-1.0, \
+    precision='double', layout='linear'):
+  """
+  Returns a dictionary of grid data in which the values are transformed.
+
+  Each file is only read once per process. Values are transformed from
+  the grid in memory, and identical transforms share the same array,
+  which must not be modified.
+
+  @FN: the file name.
+  @multiplier: affects the origin and spacing.
+  @inv_power: the inverse of the power by which grid points are transformed.
+  @grid_thresh: the maximum allowed value for a point on the grid.
+    A negative value means that there is no max.
+  @precision: 'double' or 'single'. Single precision values are
+    converted after the transformation, which is done in double precision.
+  @layout: 'linear' for values in C order or 'blocked' for values
+    in bricks of 4x4x4 cells, which keeps the points around each cell
+    closer in memory.
+  The dictionary also contains 'neg_vals', which is True if
+  the values were negated before the transformation, and 'layout'.
+  """
+  raw_key = (FN, multiplier)
+  if not raw_key in _grid_cache.keys():
+    import AlGDock.IO
+    IO_Grid = AlGDock.IO.Grid()
+    # Grids for interpolation are read many times, so they are cached
+    _grid_cache[raw_key] = IO_Grid.read(FN, multiplier=multiplier, \
+      cache=True)
+  raw = _grid_cache[raw_key]
+
+  grid_data = dict([(key,raw[key]) for key in ['origin','spacing','counts']])
+
+  neg_vals = False
+  if inv_power is not None:
+    # Make sure all grid values are positive
+    if (raw['vals']>0).any():
+      if (raw['vals']<0).any():
+        raise Exception('All of the grid points do not have the same sign')
+    else:
+      neg_vals = True
+  grid_data['neg_vals'] = neg_vals
+  grid_data['layout'] = layout
+
+  if (inv_power is None) and not (grid_thresh>0.0) and \
+      (precision=='double') and (layout=='linear'):
+    grid_data['vals'] = raw['vals']
+    return grid_data
+
+  key = (FN, multiplier, inv_power, grid_thresh, precision, layout)
+  vals = _transformed_vals_cache.get(key)
+  if vals is None:
+    vals = -1*raw['vals'] if neg_vals else raw['vals']
+    # Transform all nonzero elements
+    if inv_power is not None:
+      if vals is raw['vals']:
+        vals = np.copy(vals)
+      nonzero = vals!=0
+      vals[nonzero] = vals[nonzero]**(1./inv_power)
+    # "Cap" the grid values
+    if grid_thresh>0.0:
+      vals = grid_thresh*np.tanh(vals/grid_thresh)
+    if precision=='single':
+      vals = np.array(vals, dtype=np.float32)
+    if layout=='blocked':
+      vals = block_values(vals, grid_data['counts'])
+    _transformed_vals_cache[key] = vals
+  grid_data['vals'] = vals
+  return grid_data
+
+def clear_grid_cache():
+  """
+  Removes references to grids that have been read,
+  so that the memory can be freed when no force field uses them.
+  """
+  _grid_cache.clear()
+  _transformed_vals_cache.clear()
+
+def _tricubic_matrix():
+  """
+  Returns the 64x64 matrix of Lekien and Marsden,
+  Int. J. Numer. Meth. Engng. 63, 455-471 (2005),
+  which maps the values and derivatives at the corners of a cell
+  to the coefficients of its tricubic polynomial.
+
+  The values and derivatives are ordered by [f, fx, fy, fz, fxy, fxz,
+  fyz, fxyz] and then by corner n, at (n&1, (n>>1)&1, (n>>2)&1).
+  The coefficient of x**i y**j z**k is at index i + 4*j + 16*k.
+  """
+  powers = [(i, j, k) for k in range(4) for j in range(4) for i in range(4)]
+  derivatives = [(0,0,0), (1,0,0), (0,1,0), (0,0,1), \
+    (1,1,0), (1,0,1), (0,1,1), (1,1,1)]
+  def term(p, d, x):
+    # The d'th derivative of x**p
+    if p<d:
+      return 0.
+    return (p if d else 1)*float(x)**(p-d)
+  B = np.zeros((64,64))
+  for (nd, d) in enumerate(derivatives):
+    for n in range(8):
+      corner = (n&1, (n>>1)&1, (n>>2)&1)
+      for (l, p) in enumerate(powers):
+        B[8*nd+n,l] = np.prod([term(p[m], d[m], corner[m]) for m in range(3)])
+  return np.round(np.linalg.inv(B))
+
+def tricubic_coefficients(vals, counts, out=None, slab=None):
+  """
+  Returns the 64 tricubic polynomial coefficients of every grid cell,
+  as an array with a row per cell in C order.
+
+  Derivatives at grid points are estimated by central differences,
+  and by one-sided differences at the edges of the grid,
+  in units of the grid spacing.
+
+  @vals: grid values in C order.
+  @counts: the number of points in each dimension.
+  @out: an array of shape (ncells, 64) in which to store the coefficients.
+  @slab: the number of cells along x that are computed at once.
+    By default, slabs have about a million cells.
+  """
+  counts = np.array(counts, dtype=int)
+  vals = np.asarray(vals).reshape(tuple(counts))
+  ncells = counts-1
+  if out is None:
+    out = np.zeros((int(np.prod(ncells)),64))
+  if slab is None:
+    slab = max(1, 2**20//(ncells[1]*ncells[2]))
+  C = _tricubic_matrix()
+  cells_per_x = ncells[1]*ncells[2]
+  for start in range(0, ncells[0], slab):
+    end = min(start+slab, ncells[0])
+    # The points of the slab and their neighbors along x
+    lo = max(start-1, 0)
+    hi = min(end+2, counts[0])
+    f = np.array(vals[lo:hi], dtype=float)
+    fx = np.gradient(f, axis=0)
+    fy = np.gradient(f, axis=1)
+    fz = np.gradient(f, axis=2)
+    fxy = np.gradient(fx, axis=1)
+    fxz = np.gradient(fx, axis=2)
+    fyz = np.gradient(fy, axis=2)
+    fxyz = np.gradient(fxy, axis=2)
+    X = np.zeros(((end-start)*cells_per_x,64))
+    for (nd, d) in enumerate([f, fx, fy, fz, fxy, fxz, fyz, fxyz]):
+      for n in range(8):
+        (a, b, c) = (start-lo+(n&1), (n>>1)&1, (n>>2)&1)
+        X[:,8*nd+n] = d[a:a+end-start, b:b+ncells[1], c:c+ncells[2]].ravel()
+    out[start*cells_per_x:end*cells_per_x] = X.dot(C.T)
+  return out
+
+def load_tricubic_coefficients(FN, grid_data, multiplier=0.1, \
+    inv_power=None, grid_thresh=-1.0, precision='double'):
+  """
+  Returns the tricubic polynomial coefficients of a transformed grid.
+
+  The coefficients are stored next to the grid, in a file that is
+  named after FN and the transformation, so that they are only
+  computed once. The file is used if it is at least as new as FN.
+  Coefficients in the file are memory-mapped and shared between processes,
+  and coefficients in memory are shared between force fields
+  in the same way as transformed grid values.
+
+  @FN: the file name of the grid.
+  @grid_data: the grid data from load_grid, with linear layout.
+  The other parameters are the same as in load_grid.
+  """
+  key = (FN, multiplier, inv_power, grid_thresh, precision, 'tricubic')
+  coefficients = _transformed_vals_cache.get(key)
+  if coefficients is not None:
+    return coefficients
+
+  import os
+  dtype = np.float32 if precision=='single' else np.float64
+  shape = (int(np.prod(np.array(grid_data['counts'])-1)),64)
+  cache_FN = FN + '.tricubic'
+  if inv_power is not None:
+    cache_FN += '.inv_power%g'%inv_power
+  if grid_thresh>0.0:
+    cache_FN += '.thresh%g'%grid_thresh
+  if multiplier!=0.1:
+    cache_FN += '.multiplier%g'%multiplier
+  if precision=='single':
+    cache_FN += '.single'
+  cache_FN += '.npy'
+
+  if os.path.isfile(cache_FN) and \
+      (os.path.getmtime(cache_FN)>=os.path.getmtime(FN)):
+    try:
+      coefficients = np.load(cache_FN, mmap_mode='r')
+      if (coefficients.shape!=shape) or (coefficients.dtype!=dtype):
+        coefficients = None
+    except (IOError, ValueError):
+      coefficients = None
+
+  if coefficients is None:
+    # Write to a temporary file and rename it, so other processes
+    # never read a partially written cache
+    tmp_FN = '%s.%d.tmp'%(cache_FN, os.getpid())
+    try:
+      out = np.lib.format.open_memmap(tmp_FN, mode='w+', \
+        dtype=dtype, shape=shape)
+      tricubic_coefficients(grid_data['vals'], grid_data['counts'], out=out)
+      out.flush()
+      del out
+      os.rename(tmp_FN, cache_FN)
+      coefficients = np.load(cache_FN, mmap_mode='r')
+    except (IOError, OSError):
+      if os.path.isfile(tmp_FN):
+        os.remove(tmp_FN)
+      coefficients = np.array(tricubic_coefficients(grid_data['vals'], \
+        grid_data['counts']), dtype=dtype)
+
+  _transformed_vals_cache[key] = coefficients
+  return coefficients
+
 class InterpolationForceField(ForceField):
   """
   Force fields that interpolate between points on the 3D grid
@@ -23,7 +264,10 @@ class InterpolationForceField(ForceField):
     scaling_prefactor=None,
     inv_power=None,
     grid_thresh=-1.0,
-    energy_thresh=-1.0):
+    energy_thresh=-1.0,
+    precision='double',
+    fine_FN=None,
+    layout='linear'):
     """
     @FN: the file name.
     @name: a name for the grid
@@ -40,11 +284,33 @@ class InterpolationForceField(ForceField):
       A negative value means that there is no max.
     @energy_thresh: the maximum allowed value for the energy at any point.
       A negative value means that there is no max.
+    @precision: the precision in which grid values are stored,
+      'double' or 'single'. Interpolation is always in double precision.
+      For tricubic interpolation, this is the precision of the
+      polynomial coefficients of each cell.
+    @fine_FN: the file name of a finer grid that covers part of FN,
+      typically the binding site. Atoms inside it are interpolated on
+      the fine grid and other atoms on the grid in FN. Within one spacing
+      of FN of the edges of the patch, the two are blended smoothly.
+      Only available for trilinear interpolation with
+      inv_power of None or -2 and no energy threshold.
+    @layout: the order in which grid values are stored,
+      'linear' or 'blocked' (in bricks of 4x4x4 cells).
     @type scaling_property: C{str}
     """
     if not interpolation_type in \
         ['Trilinear','BSpline', 'CatmullRom', 'Tricubic']:
       raise Exception('Interpolation type not recognized')
+    if not precision in ['double','single']:
+      raise Exception('Grid precision not recognized')
+    if not layout in ['linear','blocked']:
+      raise Exception('Grid layout not recognized')
+    if (layout=='blocked') and (interpolation_type=='Tricubic'):
+      raise Exception('Tricubic interpolation requires the linear layout')
+    if (fine_FN is not None) and ((interpolation_type!='Trilinear') or \
+        (energy_thresh>0) or (inv_power not in [None,-2])):
+      raise Exception('Fine grids require trilinear interpolation ' + \
+        'with inv_power of None or -2 and no energy threshold')
 
     ForceField.__init__(self, name) # Initialize the ForceField class
 
@@ -52,39 +318,34 @@ class InterpolationForceField(ForceField):
     # universe or from a trajectory.
     self.arguments = (FN, name, interpolation_type, strength, \
       scaling_property, scaling_prefactor, \
-      inv_power, grid_thresh, energy_thresh)
+      inv_power, grid_thresh, energy_thresh, precision, fine_FN, layout)
     
     self.params = OrderedDict()
     for key in ['FN','name','interpolation_type','strength','scaling_property',\
-        'scaling_prefactor','inv_power','grid_thresh','energy_thresh']:
+        'scaling_prefactor','inv_power','grid_thresh','energy_thresh',\
+        'precision','fine_FN','layout']:
       self.params[key] = locals()[key]
     
-    # Load the grid
-    import AlGDock.IO
-    IO_Grid = AlGDock.IO.Grid()
-    self.grid_data = IO_Grid.read(FN, multiplier=0.1)
-    if not (self.grid_data['origin']==0.0).all():
-      raise Exception('Trilinear grid origin in %s not at (0, 0, 0)!'%FN)
-
-    # Transform the grid
-    neg_vals = False
-    if inv_power is not None:
-      # Make sure all grid values are positive
-      if (self.grid_data['vals']>0).any():
-        if (self.grid_data['vals']<0).any():
-          raise Exception('All of the grid points do not have the same sign')
-      else:
-        neg_vals = True
-        self.grid_data['vals'] = -1*self.grid_data['vals']
+    # Load and transform the grid.
+    # Tricubic coefficients are computed from values in double precision
+    # and then stored in the requested precision.
+    self.grid_data = load_grid(FN, multiplier=0.1, \
+      inv_power=inv_power, grid_thresh=grid_thresh, \
+      precision='double' if interpolation_type=='Tricubic' else precision, \
+      layout=layout)
+    if interpolation_type=='Tricubic':
+      self.grid_data['coefficients'] = load_tricubic_coefficients(FN, \
+        self.grid_data, multiplier=0.1, inv_power=inv_power, \
+        grid_thresh=grid_thresh, precision=precision)
+    neg_vals = self.grid_data['neg_vals']
 
-      # Transform all nonzero elements
-      nonzero = self.grid_data['vals']!=0
-      self.grid_data['vals'][nonzero] = self.grid_data['vals'][nonzero]**(1./inv_power)
-
-    import numpy as np
-    # "Cap" the grid values
-    if grid_thresh>0.0:
-      self.grid_data['vals'] = grid_thresh*np.tanh(self.grid_data['vals']/grid_thresh)
+    if fine_FN is not None:
+      self.fine_grid_data = load_grid(fine_FN, multiplier=0.1, \
+        inv_power=inv_power, grid_thresh=grid_thresh, precision=precision, \
+        layout=layout)
+      if self.fine_grid_data['neg_vals']!=neg_vals:
+        raise Exception('The grids in %s and %s have different signs'%(\
+          FN, fine_FN))
 
     if scaling_prefactor is not None:
       self.params['scaling_prefactor'] = scaling_prefactor
@@ -122,7 +383,17 @@ class InterpolationForceField(ForceField):
 
     # Here we pass all the parameters to
     # the energy term code that handles energy calculations.
-    if self.params['interpolation_type']=='Trilinear':
+    if self.params['fine_FN'] is not None:
+      from MMTK_trilinear_multires_grid import TrilinearMultiResGridTerm
+      return [TrilinearMultiResGridTerm(universe, \
+        self.grid_data['spacing'], self.grid_data['counts'], \
+        self.grid_data['vals'], self.grid_data['origin'], \
+        self.fine_grid_data['spacing'], self.fine_grid_data['counts'], \
+        self.fine_grid_data['vals'], self.fine_grid_data['origin'], \
+        self.params['strength'], scaling_factor, \
+        int(self.params['inv_power']==-2), self.params['name'], \
+        layout=self.params['layout'])]
+    elif self.params['interpolation_type']=='Trilinear':
       if self.params['energy_thresh']>0:
         if self.params['inv_power'] is not None:
           raise NotImplementedError
@@ -131,64 +402,172 @@ class InterpolationForceField(ForceField):
           return [TrilinearThreshGridTerm(universe, \
             self.grid_data['spacing'], self.grid_data['counts'], \
             self.grid_data['vals'], self.params['strength'], scaling_factor, \
-            self.params['name'], self.params['energy_thresh'])]
+            self.params['name'], self.params['energy_thresh'], \
+            origin=self.grid_data['origin'], \
+            layout=self.params['layout'])]
       elif self.params['inv_power'] is not None:
         if self.params['inv_power']==-2:
           from MMTK_trilinear_isqrt_grid import TrilinearISqrtGridTerm
           return [TrilinearISqrtGridTerm(universe, \
             self.grid_data['spacing'], self.grid_data['counts'], \
             self.grid_data['vals'], self.params['strength'], scaling_factor, \
-            self.params['name'])]
+            self.params['name'], origin=self.grid_data['origin'], \
+            layout=self.params['layout'])]
         else:
           from MMTK_trilinear_transform_grid import TrilinearTransformGridTerm
           return [TrilinearTransformGridTerm(universe, \
             self.grid_data['spacing'], self.grid_data['counts'], \
             self.grid_data['vals'], self.params['strength'], scaling_factor,
-            self.params['name'], self.params['inv_power'])]
+            self.params['name'], self.params['inv_power'], \
+            origin=self.grid_data['origin'], \
+            layout=self.params['layout'])]
       else:
         from MMTK_trilinear_grid import TrilinearGridTerm
         return [TrilinearGridTerm(universe, \
           self.grid_data['spacing'], self.grid_data['counts'], \
           self.grid_data['vals'], self.params['strength'], scaling_factor, \
-          self.params['name'])]
+          self.params['name'], origin=self.grid_data['origin'], \
+          layout=self.params['layout'])]
     elif self.params['interpolation_type']=='BSpline':
       if self.params['inv_power'] is not None:
         from MMTK_BSpline_transform_grid import BSplineTransformGridTerm
         return [BSplineTransformGridTerm(universe, \
           self.grid_data['spacing'], self.grid_data['counts'], \
           self.grid_data['vals'], self.params['strength'], scaling_factor, \
-          self.params['name'], self.params['inv_power'])]
+          self.params['name'], self.params['inv_power'], \
+          origin=self.grid_data['origin'], \
+          layout=self.params['layout'])]
       else:
         from MMTK_BSpline_grid import BSplineGridTerm
         return [BSplineGridTerm(universe, \
           self.grid_data['spacing'], self.grid_data['counts'], \
           self.grid_data['vals'], self.params['strength'], scaling_factor, \
-          self.params['name'])]
+          self.params['name'], origin=self.grid_data['origin'], \
+          layout=self.params['layout'])]
     elif self.params['interpolation_type']=='CatmullRom':
       if self.params['inv_power'] is not None:
         from MMTK_CatmullRom_transform_grid import CatmullRomTransformGridTerm
         return [CatmullRomTransformGridTerm(universe, \
           self.grid_data['spacing'], self.grid_data['counts'], \
           self.grid_data['vals'], self.params['strength'], scaling_factor, \
-          self.params['name'], self.params['inv_power'])]
+          self.params['name'], self.params['inv_power'], \
+          origin=self.grid_data['origin'], \
+          layout=self.params['layout'])]
       else:
         from MMTK_CatmullRom_grid import CatmullRomGridTerm
         return [CatmullRomGridTerm(universe, \
           self.grid_data['spacing'], self.grid_data['counts'], \
           self.grid_data['vals'], self.params['strength'], scaling_factor, \
-          self.params['name'])]
+          self.params['name'], origin=self.grid_data['origin'], \
+          layout=self.params['layout'])]
     elif self.params['interpolation_type']=='Tricubic':
       if self.params['inv_power'] is not None:
         from MMTK_Tricubic_transform_grid import TricubicTransformGridTerm
         return [TricubicTransformGridTerm(universe, \
           self.grid_data['spacing'], self.grid_data['counts'], \
-          self.grid_data['vals'], self.params['strength'], scaling_factor, \
-          self.params['name'], self.params['inv_power'])]
+          self.grid_data['coefficients'], self.params['strength'], \
+          scaling_factor, self.params['name'], self.params['inv_power'], \
+          origin=self.grid_data['origin'])]
       else:
         from MMTK_Tricubic_grid import TricubicGridTerm
         return [TricubicGridTerm(universe, \
           self.grid_data['spacing'], self.grid_data['counts'], \
-          self.grid_data['vals'], self.params['strength'], scaling_factor, \
-          self.params['name'])]
+          self.grid_data['coefficients'], self.params['strength'], \
+          scaling_factor, self.params['name'], \
+          origin=self.grid_data['origin'])]
     print self.params['interpolation_type'] + ' interpolation is unknown'
     raise NotImplementedError
+
+class MultiInterpolationForceField(ForceField):
+  """
+  A force field that trilinearly interpolates several grids
+  with the same points, reporting one energy term per grid.
+
+  The grid values are interleaved so that the values of all grids
+  at a point are adjacent in memory. The cell and fractional position
+  of each atom are computed once for all of the grids.
+  """
+
+  def __init__(self, force_fields, name='MultiInterpolation'):
+    """
+    @force_fields: a list of InterpolationForceField objects with
+      trilinear interpolation, no energy threshold, no fine grid, and
+      inv_power of None or -2, or a list of their arguments.
+      Their grids are copied, so the objects are not needed afterwards.
+    @name: a name for the force field
+    """
+    ForceField.__init__(self, name) # Initialize the ForceField class
+
+    force_fields = [ff if isinstance(ff, InterpolationForceField) \
+      else InterpolationForceField(*ff) for ff in force_fields]
+
+    for ff in force_fields:
+      if (ff.params['interpolation_type']!='Trilinear') or \
+         (ff.params['energy_thresh']>0) or \
+         (ff.params['fine_FN'] is not None) or \
+         (ff.params['inv_power'] not in [None,-2]):
+        raise Exception('%s grid cannot be combined with others'%\
+          ff.params['name'])
+      for key in ['origin','spacing','counts']:
+        if not (ff.grid_data[key]==force_fields[0].grid_data[key]).all():
+          raise Exception('The %s of the %s and %s grids are different'%(\
+            key, ff.params['name'], force_fields[0].params['name']))
+      if ff.params['layout']!=force_fields[0].params['layout']:
+        raise Exception('The layout of the %s and %s grids are different'%(\
+          ff.params['name'], force_fields[0].params['name']))
+
+    # Store arguments that recreate the force field from a pickled
+    # universe or from a trajectory.
+    self.arguments = ([ff.arguments for ff in force_fields], name)
+
+    self.params = OrderedDict()
+    self.params['name'] = name
+    self.params['grid_names'] = [ff.params['name'] for ff in force_fields]
+    self.params['strength'] = [ff.params['strength'] for ff in force_fields]
+    self.params['scaling_property'] = \
+      [ff.params['scaling_property'] for ff in force_fields]
+    self.params['scaling_prefactor'] = \
+      [ff.params['scaling_prefactor'] for ff in force_fields]
+    self.params['isqrt'] = \
+      [int(ff.params['inv_power']==-2) for ff in force_fields]
+    self.params['layout'] = force_fields[0].params['layout']
+
+    self.grid_data = {}
+    for key in ['origin','spacing','counts','layout']:
+      self.grid_data[key] = force_fields[0].grid_data[key]
+    # Values are stored in single precision only if all grids are
+    single = all([ff.params['precision']=='single' for ff in force_fields])
+    self.params['precision'] = 'single' if single else 'double'
+    self.grid_data['vals'] = np.empty(\
+      (len(force_fields[0].grid_data['vals']), len(force_fields)), \
+      dtype=np.float32 if single else float)
+    for g in range(len(force_fields)):
+      self.grid_data['vals'][:,g] = force_fields[g].grid_data['vals']
+
+  def ready(self, global_data):
+    return True
+
+  def evaluatorParameters(self, universe, subset1, subset2, global_data):
+    return self.params
+
+  def evaluatorTerms(self, universe, subset1, subset2, global_data):
+    if subset1 is not None or subset2 is not None:
+      return []
+    # Collect the scaling_factor for each grid into an array
+    scaling_factors = []
+    for (prop, prefactor) in zip(self.params['scaling_property'], \
+        self.params['scaling_prefactor']):
+      scaling_factor = ParticleScalar(universe)
+      for o in universe:
+        for a in o.atomList():
+          scaling_factor[a] = o.getAtomProperty(a, prop)
+      scaling_factor.scaleBy(prefactor)
+      scaling_factors.append(scaling_factor.array)
+
+    from MMTK_trilinear_multi_grid import TrilinearMultiGridTerm
+    return [TrilinearMultiGridTerm(universe, \
+      self.grid_data['spacing'], self.grid_data['counts'], \
+      self.grid_data['vals'], self.params['strength'], scaling_factors, \
+      self.params['isqrt'], self.params['name'], self.params['grid_names'], \
+      origin=self.grid_data['origin'], \
+      layout=self.params['layout'])]
@@ -1,9868 +0,0 @@
-/* Generated by Cython 0.22 */
-
-#define PY_SSIZE_T_CLEAN
-#ifndef CYTHON_USE_PYLONG_INTERNALS
-#ifdef PYLONG_BITS_IN_DIGIT
-#define CYTHON_USE_PYLONG_INTERNALS 0
-#else
-#include "pyconfig.h"
-#ifdef PYLONG_BITS_IN_DIGIT
-#define CYTHON_USE_PYLONG_INTERNALS 1
-#else
-#define CYTHON_USE_PYLONG_INTERNALS 0
-#endif
-#endif
-#endif
-#include "Python.h"
-#ifndef Py_PYTHON_H
-    #error Python headers needed to compile C extensions, please install development version of Python.
-#elif PY_VERSION_HEX < 0x02060000 || (0x03000000 <= PY_VERSION_HEX && PY_VERSION_HEX < 0x03020000)
-    #error Cython requires Python 2.6+ or Python 3.2+.
-#else
-#define CYTHON_ABI "0_22"
-#include <stddef.h>
-#ifndef offsetof
-#define offsetof(type, member) ( (size_t) & ((type*)0) -> member )
-#endif
-#if !defined(WIN32) && !defined(MS_WINDOWS)
-  #ifndef __stdcall
-    #define __stdcall
-  #endif
-  #ifndef __cdecl
-    #define __cdecl
-  #endif
-  #ifndef __fastcall
-    #define __fastcall
-  #endif
-#endif
-#ifndef DL_IMPORT
-  #define DL_IMPORT(t) t
-#endif
-#ifndef DL_EXPORT
-  #define DL_EXPORT(t) t
-#endif
-#ifndef PY_LONG_LONG
-  #define PY_LONG_LONG LONG_LONG
-#endif
-#ifndef Py_HUGE_VAL
-  #define Py_HUGE_VAL HUGE_VAL
-#endif
-#ifdef PYPY_VERSION
-#define CYTHON_COMPILING_IN_PYPY 1
-#define CYTHON_COMPILING_IN_CPYTHON 0
-#else
-#define CYTHON_COMPILING_IN_PYPY 0
-#define CYTHON_COMPILING_IN_CPYTHON 1
-#endif
-#if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX < 0x02070600 && !defined(Py_OptimizeFlag)
-#define Py_OptimizeFlag 0
-#endif
-#define __PYX_BUILD_PY_SSIZE_T "n"
-#define CYTHON_FORMAT_SSIZE_T "z"
-#if PY_MAJOR_VERSION < 3
-  #define __Pyx_BUILTIN_MODULE_NAME "__builtin__"
-  #define __Pyx_PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos) \
-          PyCode_New(a+k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
-  #define __Pyx_DefaultClassType PyClass_Type
-#else
-  #define __Pyx_BUILTIN_MODULE_NAME "builtins"
-  #define __Pyx_PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos) \
-          PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
-  #define __Pyx_DefaultClassType PyType_Type
-#endif
-#if PY_MAJOR_VERSION >= 3
-  #define Py_TPFLAGS_CHECKTYPES 0
-  #define Py_TPFLAGS_HAVE_INDEX 0
-  #define Py_TPFLAGS_HAVE_NEWBUFFER 0
-#endif
-#if PY_VERSION_HEX < 0x030400a1 && !defined(Py_TPFLAGS_HAVE_FINALIZE)
-  #define Py_TPFLAGS_HAVE_FINALIZE 0
-#endif
-#if PY_VERSION_HEX > 0x03030000 && defined(PyUnicode_KIND)
-  #define CYTHON_PEP393_ENABLED 1
-  #define __Pyx_PyUnicode_READY(op)       (likely(PyUnicode_IS_READY(op)) ? \
-                                              0 : _PyUnicode_Ready((PyObject *)(op)))
-  #define __Pyx_PyUnicode_GET_LENGTH(u)   PyUnicode_GET_LENGTH(u)
-  #define __Pyx_PyUnicode_READ_CHAR(u, i) PyUnicode_READ_CHAR(u, i)
-  #define __Pyx_PyUnicode_KIND(u)         PyUnicode_KIND(u)
-  #define __Pyx_PyUnicode_DATA(u)         PyUnicode_DATA(u)
-  #define __Pyx_PyUnicode_READ(k, d, i)   PyUnicode_READ(k, d, i)
-#else
-  #define CYTHON_PEP393_ENABLED 0
-  #define __Pyx_PyUnicode_READY(op)       (0)
-  #define __Pyx_PyUnicode_GET_LENGTH(u)   PyUnicode_GET_SIZE(u)
-  #define __Pyx_PyUnicode_READ_CHAR(u, i) ((Py_UCS4)(PyUnicode_AS_UNICODE(u)[i]))
-  #define __Pyx_PyUnicode_KIND(u)         (sizeof(Py_UNICODE))
-  #define __Pyx_PyUnicode_DATA(u)         ((void*)PyUnicode_AS_UNICODE(u))
-  #define __Pyx_PyUnicode_READ(k, d, i)   ((void)(k), (Py_UCS4)(((Py_UNICODE*)d)[i]))
-#endif
-#if CYTHON_COMPILING_IN_PYPY
-  #define __Pyx_PyUnicode_Concat(a, b)      PyNumber_Add(a, b)
-  #define __Pyx_PyUnicode_ConcatSafe(a, b)  PyNumber_Add(a, b)
-  #define __Pyx_PyFrozenSet_Size(s)         PyObject_Size(s)
-#else
-  #define __Pyx_PyUnicode_Concat(a, b)      PyUnicode_Concat(a, b)
-  #define __Pyx_PyUnicode_ConcatSafe(a, b)  ((unlikely((a) == Py_None) || unlikely((b) == Py_None)) ? \
-      PyNumber_Add(a, b) : __Pyx_PyUnicode_Concat(a, b))
-  #define __Pyx_PyFrozenSet_Size(s)         PySet_Size(s)
-#endif
-#define __Pyx_PyString_FormatSafe(a, b)   ((unlikely((a) == Py_None)) ? PyNumber_Remainder(a, b) : __Pyx_PyString_Format(a, b))
-#define __Pyx_PyUnicode_FormatSafe(a, b)  ((unlikely((a) == Py_None)) ? PyNumber_Remainder(a, b) : PyUnicode_Format(a, b))
-#if PY_MAJOR_VERSION >= 3
-  #define __Pyx_PyString_Format(a, b)  PyUnicode_Format(a, b)
-#else
-  #define __Pyx_PyString_Format(a, b)  PyString_Format(a, b)
-#endif
-#if PY_MAJOR_VERSION >= 3
-  #define PyBaseString_Type            PyUnicode_Type
-  #define PyStringObject               PyUnicodeObject
-  #define PyString_Type                PyUnicode_Type
-  #define PyString_Check               PyUnicode_Check
-  #define PyString_CheckExact          PyUnicode_CheckExact
-#endif
-#if PY_MAJOR_VERSION >= 3
-  #define __Pyx_PyBaseString_Check(obj) PyUnicode_Check(obj)
-  #define __Pyx_PyBaseString_CheckExact(obj) PyUnicode_CheckExact(obj)
-#else
-  #define __Pyx_PyBaseString_Check(obj) (PyString_Check(obj) || PyUnicode_Check(obj))
-  #define __Pyx_PyBaseString_CheckExact(obj) (PyString_CheckExact(obj) || PyUnicode_CheckExact(obj))
-#endif
-#ifndef PySet_CheckExact
-  #define PySet_CheckExact(obj)        (Py_TYPE(obj) == &PySet_Type)
-#endif
-#define __Pyx_TypeCheck(obj, type) PyObject_TypeCheck(obj, (PyTypeObject *)type)
-#if PY_MAJOR_VERSION >= 3
-  #define PyIntObject                  PyLongObject
-  #define PyInt_Type                   PyLong_Type
-  #define PyInt_Check(op)              PyLong_Check(op)
-  #define PyInt_CheckExact(op)         PyLong_CheckExact(op)
-  #define PyInt_FromString             PyLong_FromString
-  #define PyInt_FromUnicode            PyLong_FromUnicode
-  #define PyInt_FromLong               PyLong_FromLong
-  #define PyInt_FromSize_t             PyLong_FromSize_t
-  #define PyInt_FromSsize_t            PyLong_FromSsize_t
-  #define PyInt_AsLong                 PyLong_AsLong
-  #define PyInt_AS_LONG                PyLong_AS_LONG
-  #define PyInt_AsSsize_t              PyLong_AsSsize_t
-  #define PyInt_AsUnsignedLongMask     PyLong_AsUnsignedLongMask
-  #define PyInt_AsUnsignedLongLongMask PyLong_AsUnsignedLongLongMask
-  #define PyNumber_Int                 PyNumber_Long
-#endif
-#if PY_MAJOR_VERSION >= 3
-  #define PyBoolObject                 PyLongObject
-#endif
-#if PY_MAJOR_VERSION >= 3 && CYTHON_COMPILING_IN_PYPY
-  #ifndef PyUnicode_InternFromString
-    #define PyUnicode_InternFromString(s) PyUnicode_FromString(s)
-  #endif
-#endif
-#if PY_VERSION_HEX < 0x030200A4
-  typedef long Py_hash_t;
-  #define __Pyx_PyInt_FromHash_t PyInt_FromLong
-  #define __Pyx_PyInt_AsHash_t   PyInt_AsLong
-#else
-  #define __Pyx_PyInt_FromHash_t PyInt_FromSsize_t
-  #define __Pyx_PyInt_AsHash_t   PyInt_AsSsize_t
-#endif
-#if PY_MAJOR_VERSION >= 3
-  #define __Pyx_PyMethod_New(func, self, klass) ((self) ? PyMethod_New(func, self) : PyInstanceMethod_New(func))
-#else
-  #define __Pyx_PyMethod_New(func, self, klass) PyMethod_New(func, self, klass)
-#endif
-#ifndef CYTHON_INLINE
-  #if defined(__GNUC__)
-    #define CYTHON_INLINE __inline__
-  #elif defined(_MSC_VER)
-    #define CYTHON_INLINE __inline
-  #elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
-    #define CYTHON_INLINE inline
-  #else
-    #define CYTHON_INLINE
-  #endif
-#endif
-#ifndef CYTHON_RESTRICT
-  #if defined(__GNUC__)
-    #define CYTHON_RESTRICT __restrict__
-  #elif defined(_MSC_VER) && _MSC_VER >= 1400
-    #define CYTHON_RESTRICT __restrict
-  #elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
-    #define CYTHON_RESTRICT restrict
-  #else
-    #define CYTHON_RESTRICT
-  #endif
-#endif
-#ifdef NAN
-#define __PYX_NAN() ((float) NAN)
-#else
-static CYTHON_INLINE float __PYX_NAN() {
-  /* Initialize NaN. The sign is irrelevant, an exponent with all bits 1 and
-   a nonzero mantissa means NaN. If the first bit in the mantissa is 1, it is
-   a quiet NaN. */
-  float value;
-  memset(&value, 0xFF, sizeof(value));
-  return value;
-}
-#endif
-#define __Pyx_void_to_None(void_result) (void_result, Py_INCREF(Py_None), Py_None)
-#ifdef __cplusplus
-template<typename T>
-void __Pyx_call_destructor(T* x) {
-    x->~T();
-}
-template<typename T>
-class __Pyx_FakeReference {
-  public:
-    __Pyx_FakeReference() : ptr(NULL) { }
-    __Pyx_FakeReference(T& ref) : ptr(&ref) { }
-    T *operator->() { return ptr; }
-    operator T&() { return *ptr; }
-  private:
-    T *ptr;
-};
-#endif
-
-
-#if PY_MAJOR_VERSION >= 3
-  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_TrueDivide(x,y)
-  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceTrueDivide(x,y)
-#else
-  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_Divide(x,y)
-  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceDivide(x,y)
-#endif
-
-#ifndef __PYX_EXTERN_C
-  #ifdef __cplusplus
-    #define __PYX_EXTERN_C extern "C"
-  #else
-    #define __PYX_EXTERN_C extern
-  #endif
-#endif
-
-#if defined(WIN32) || defined(MS_WINDOWS)
-#define _USE_MATH_DEFINES
-#endif
-#include <math.h>
-#define __PYX_HAVE__MMTK_BSpline_transform_grid
-#define __PYX_HAVE_API__MMTK_BSpline_transform_grid
-#include "MMTK/arrayobject.h"
-#include "MMTK/core.h"
-#include "MMTK/universe.h"
-#include "MMTK/forcefield.h"
-#include "string.h"
-#include "stdio.h"
-#include "stdlib.h"
-#include "numpy/arrayobject.h"
-#include "numpy/ufuncobject.h"
-#ifdef _OPENMP
-#include <omp.h>
-#endif /* _OPENMP */
-
-#ifdef PYREX_WITHOUT_ASSERTIONS
-#define CYTHON_WITHOUT_ASSERTIONS
-#endif
-
-#ifndef CYTHON_UNUSED
-# if defined(__GNUC__)
-#   if !(defined(__cplusplus)) || (__GNUC__ > 3 || (__GNUC__ == 3 && __GNUC_MINOR__ >= 4))
-#     define CYTHON_UNUSED __attribute__ ((__unused__))
-#   else
-#     define CYTHON_UNUSED
-#   endif
-# elif defined(__ICC) || (defined(__INTEL_COMPILER) && !defined(_MSC_VER))
-#   define CYTHON_UNUSED __attribute__ ((__unused__))
-# else
-#   define CYTHON_UNUSED
-# endif
-#endif
-typedef struct {PyObject **p; char *s; const Py_ssize_t n; const char* encoding;
-                const char is_unicode; const char is_str; const char intern; } __Pyx_StringTabEntry;
-
-#define __PYX_DEFAULT_STRING_ENCODING_IS_ASCII 0
-#define __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT 0
-#define __PYX_DEFAULT_STRING_ENCODING ""
-#define __Pyx_PyObject_FromString __Pyx_PyBytes_FromString
-#define __Pyx_PyObject_FromStringAndSize __Pyx_PyBytes_FromStringAndSize
-#define __Pyx_fits_Py_ssize_t(v, type, is_signed)  (    \
-    (sizeof(type) < sizeof(Py_ssize_t))  ||             \
-    (sizeof(type) > sizeof(Py_ssize_t) &&               \
-          likely(v < (type)PY_SSIZE_T_MAX ||            \
-                 v == (type)PY_SSIZE_T_MAX)  &&         \
-          (!is_signed || likely(v > (type)PY_SSIZE_T_MIN ||       \
-                                v == (type)PY_SSIZE_T_MIN)))  ||  \
-    (sizeof(type) == sizeof(Py_ssize_t) &&              \
-          (is_signed || likely(v < (type)PY_SSIZE_T_MAX ||        \
-                               v == (type)PY_SSIZE_T_MAX)))  )
-static CYTHON_INLINE char* __Pyx_PyObject_AsString(PyObject*);
-static CYTHON_INLINE char* __Pyx_PyObject_AsStringAndSize(PyObject*, Py_ssize_t* length);
-#define __Pyx_PyByteArray_FromString(s) PyByteArray_FromStringAndSize((const char*)s, strlen((const char*)s))
-#define __Pyx_PyByteArray_FromStringAndSize(s, l) PyByteArray_FromStringAndSize((const char*)s, l)
-#define __Pyx_PyBytes_FromString        PyBytes_FromString
-#define __Pyx_PyBytes_FromStringAndSize PyBytes_FromStringAndSize
-static CYTHON_INLINE PyObject* __Pyx_PyUnicode_FromString(const char*);
-#if PY_MAJOR_VERSION < 3
-    #define __Pyx_PyStr_FromString        __Pyx_PyBytes_FromString
-    #define __Pyx_PyStr_FromStringAndSize __Pyx_PyBytes_FromStringAndSize
-#else
-    #define __Pyx_PyStr_FromString        __Pyx_PyUnicode_FromString
-    #define __Pyx_PyStr_FromStringAndSize __Pyx_PyUnicode_FromStringAndSize
-#endif
-#define __Pyx_PyObject_AsSString(s)    ((signed char*) __Pyx_PyObject_AsString(s))
-#define __Pyx_PyObject_AsUString(s)    ((unsigned char*) __Pyx_PyObject_AsString(s))
-#define __Pyx_PyObject_FromCString(s)  __Pyx_PyObject_FromString((const char*)s)
-#define __Pyx_PyBytes_FromCString(s)   __Pyx_PyBytes_FromString((const char*)s)
-#define __Pyx_PyByteArray_FromCString(s)   __Pyx_PyByteArray_FromString((const char*)s)
-#define __Pyx_PyStr_FromCString(s)     __Pyx_PyStr_FromString((const char*)s)
-#define __Pyx_PyUnicode_FromCString(s) __Pyx_PyUnicode_FromString((const char*)s)
-#if PY_MAJOR_VERSION < 3
-static CYTHON_INLINE size_t __Pyx_Py_UNICODE_strlen(const Py_UNICODE *u)
-{
-    const Py_UNICODE *u_end = u;
-    while (*u_end++) ;
-    return (size_t)(u_end - u - 1);
-}
-#else
-#define __Pyx_Py_UNICODE_strlen Py_UNICODE_strlen
-#endif
-#define __Pyx_PyUnicode_FromUnicode(u)       PyUnicode_FromUnicode(u, __Pyx_Py_UNICODE_strlen(u))
-#define __Pyx_PyUnicode_FromUnicodeAndLength PyUnicode_FromUnicode
-#define __Pyx_PyUnicode_AsUnicode            PyUnicode_AsUnicode
-#define __Pyx_Owned_Py_None(b) (Py_INCREF(Py_None), Py_None)
-#define __Pyx_PyBool_FromLong(b) ((b) ? (Py_INCREF(Py_True), Py_True) : (Py_INCREF(Py_False), Py_False))
-static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject*);
-static CYTHON_INLINE PyObject* __Pyx_PyNumber_Int(PyObject* x);
-static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject*);
-static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t);
-#if CYTHON_COMPILING_IN_CPYTHON
-#define __pyx_PyFloat_AsDouble(x) (PyFloat_CheckExact(x) ? PyFloat_AS_DOUBLE(x) : PyFloat_AsDouble(x))
-#else
-#define __pyx_PyFloat_AsDouble(x) PyFloat_AsDouble(x)
-#endif
-#define __pyx_PyFloat_AsFloat(x) ((float) __pyx_PyFloat_AsDouble(x))
-#if PY_MAJOR_VERSION < 3 && __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
-static int __Pyx_sys_getdefaultencoding_not_ascii;
-static int __Pyx_init_sys_getdefaultencoding_params(void) {
-    PyObject* sys;
-    PyObject* default_encoding = NULL;
-    PyObject* ascii_chars_u = NULL;
-    PyObject* ascii_chars_b = NULL;
-    const char* default_encoding_c;
-    sys = PyImport_ImportModule("sys");
-    if (!sys) goto bad;
-    default_encoding = PyObject_CallMethod(sys, (char*) "getdefaultencoding", NULL);
-    Py_DECREF(sys);
-    if (!default_encoding) goto bad;
-    default_encoding_c = PyBytes_AsString(default_encoding);
-    if (!default_encoding_c) goto bad;
-    if (strcmp(default_encoding_c, "ascii") == 0) {
-        __Pyx_sys_getdefaultencoding_not_ascii = 0;
-    } else {
-        char ascii_chars[128];
-        int c;
-        for (c = 0; c < 128; c++) {
-            ascii_chars[c] = c;
-        }
-        __Pyx_sys_getdefaultencoding_not_ascii = 1;
-        ascii_chars_u = PyUnicode_DecodeASCII(ascii_chars, 128, NULL);
-        if (!ascii_chars_u) goto bad;
-        ascii_chars_b = PyUnicode_AsEncodedString(ascii_chars_u, default_encoding_c, NULL);
-        if (!ascii_chars_b || !PyBytes_Check(ascii_chars_b) || memcmp(ascii_chars, PyBytes_AS_STRING(ascii_chars_b), 128) != 0) {
-            PyErr_Format(
-                PyExc_ValueError,
-                "This module compiled with c_string_encoding=ascii, but default encoding '%.200s' is not a superset of ascii.",
-                default_encoding_c);
-            goto bad;
-        }
-        Py_DECREF(ascii_chars_u);
-        Py_DECREF(ascii_chars_b);
-    }
-    Py_DECREF(default_encoding);
-    return 0;
-bad:
-    Py_XDECREF(default_encoding);
-    Py_XDECREF(ascii_chars_u);
-    Py_XDECREF(ascii_chars_b);
-    return -1;
-}
-#endif
-#if __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT && PY_MAJOR_VERSION >= 3
-#define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_DecodeUTF8(c_str, size, NULL)
-#else
-#define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_Decode(c_str, size, __PYX_DEFAULT_STRING_ENCODING, NULL)
-#if __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
-static char* __PYX_DEFAULT_STRING_ENCODING;
-static int __Pyx_init_sys_getdefaultencoding_params(void) {
-    PyObject* sys;
-    PyObject* default_encoding = NULL;
-    char* default_encoding_c;
-    sys = PyImport_ImportModule("sys");
-    if (!sys) goto bad;
-    default_encoding = PyObject_CallMethod(sys, (char*) (const char*) "getdefaultencoding", NULL);
-    Py_DECREF(sys);
-    if (!default_encoding) goto bad;
-    default_encoding_c = PyBytes_AsString(default_encoding);
-    if (!default_encoding_c) goto bad;
-    __PYX_DEFAULT_STRING_ENCODING = (char*) malloc(strlen(default_encoding_c));
-    if (!__PYX_DEFAULT_STRING_ENCODING) goto bad;
-    strcpy(__PYX_DEFAULT_STRING_ENCODING, default_encoding_c);
-    Py_DECREF(default_encoding);
-    return 0;
-bad:
-    Py_XDECREF(default_encoding);
-    return -1;
-}
-#endif
-#endif
-
-
-/* Test for GCC > 2.95 */
-#if defined(__GNUC__)     && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))
-  #define likely(x)   __builtin_expect(!!(x), 1)
-  #define unlikely(x) __builtin_expect(!!(x), 0)
-#else /* !__GNUC__ or GCC < 2.95 */
-  #define likely(x)   (x)
-  #define unlikely(x) (x)
-#endif /* __GNUC__ */
-
-static PyObject *__pyx_m;
-static PyObject *__pyx_d;
-static PyObject *__pyx_b;
-static PyObject *__pyx_empty_tuple;
-static PyObject *__pyx_empty_bytes;
-static int __pyx_lineno;
-static int __pyx_clineno = 0;
-static const char * __pyx_cfilenm= __FILE__;
-static const char *__pyx_filename;
-
-#if !defined(CYTHON_CCOMPLEX)
-  #if defined(__cplusplus)
-    #define CYTHON_CCOMPLEX 1
-  #elif defined(_Complex_I)
-    #define CYTHON_CCOMPLEX 1
-  #else
-    #define CYTHON_CCOMPLEX 0
-  #endif
-#endif
-#if CYTHON_CCOMPLEX
-  #ifdef __cplusplus
-    #include <complex>
-  #else
-    #include <complex.h>
-  #endif
-#endif
-#if CYTHON_CCOMPLEX && !defined(__cplusplus) && defined(__sun__) && defined(__GNUC__)
-  #undef _Complex_I
-  #define _Complex_I 1.0fj
-#endif
-
-
-static const char *__pyx_f[] = {
-  "MMTK_BSpline_transform_grid.pyx",
-  "numpy.pxd",
-  "numeric.pxi",
-  "forcefield.pxi",
-  "type.pxd",
-};
-#define IS_UNSIGNED(type) (((type) -1) > 0)
-struct __Pyx_StructField_;
-#define __PYX_BUF_FLAGS_PACKED_STRUCT (1 << 0)
-typedef struct {
-  const char* name;
-  struct __Pyx_StructField_* fields;
-  size_t size;
-  size_t arraysize[8];
-  int ndim;
-  char typegroup;
-  char is_unsigned;
-  int flags;
-} __Pyx_TypeInfo;
-typedef struct __Pyx_StructField_ {
-  __Pyx_TypeInfo* type;
-  const char* name;
-  size_t offset;
-} __Pyx_StructField;
-typedef struct {
-  __Pyx_StructField* field;
-  size_t parent_offset;
-} __Pyx_BufFmt_StackElem;
-typedef struct {
-  __Pyx_StructField root;
-  __Pyx_BufFmt_StackElem* head;
-  size_t fmt_offset;
-  size_t new_count, enc_count;
-  size_t struct_alignment;
-  int is_complex;
-  char enc_type;
-  char new_packmode;
-  char enc_packmode;
-  char is_valid_array;
-} __Pyx_BufFmt_Context;
-
-
-/* "numpy.pxd":723
- * # in Cython to enable them only on the right systems.
- * 
- * ctypedef npy_int8       int8_t             # <<<<<<<<<<<<<<
- * ctypedef npy_int16      int16_t
- * ctypedef npy_int32      int32_t
- */
-typedef npy_int8 __pyx_t_5numpy_int8_t;
-
-/* "numpy.pxd":724
- * 
- * ctypedef npy_int8       int8_t
- * ctypedef npy_int16      int16_t             # <<<<<<<<<<<<<<
- * ctypedef npy_int32      int32_t
- * ctypedef npy_int64      int64_t
- */
-typedef npy_int16 __pyx_t_5numpy_int16_t;
-
-/* "numpy.pxd":725
- * ctypedef npy_int8       int8_t
- * ctypedef npy_int16      int16_t
- * ctypedef npy_int32      int32_t             # <<<<<<<<<<<<<<
- * ctypedef npy_int64      int64_t
- * #ctypedef npy_int96      int96_t
- */
-typedef npy_int32 __pyx_t_5numpy_int32_t;
-
-/* "numpy.pxd":726
- * ctypedef npy_int16      int16_t
- * ctypedef npy_int32      int32_t
- * ctypedef npy_int64      int64_t             # <<<<<<<<<<<<<<
- * #ctypedef npy_int96      int96_t
- * #ctypedef npy_int128     int128_t
- */
-typedef npy_int64 __pyx_t_5numpy_int64_t;
-
-/* "numpy.pxd":730
- * #ctypedef npy_int128     int128_t
- * 
- * ctypedef npy_uint8      uint8_t             # <<<<<<<<<<<<<<
- * ctypedef npy_uint16     uint16_t
- * ctypedef npy_uint32     uint32_t
- */
-typedef npy_uint8 __pyx_t_5numpy_uint8_t;
-
-/* "numpy.pxd":731
- * 
- * ctypedef npy_uint8      uint8_t
- * ctypedef npy_uint16     uint16_t             # <<<<<<<<<<<<<<
- * ctypedef npy_uint32     uint32_t
- * ctypedef npy_uint64     uint64_t
- */
-typedef npy_uint16 __pyx_t_5numpy_uint16_t;
-
-/* "numpy.pxd":732
- * ctypedef npy_uint8      uint8_t
- * ctypedef npy_uint16     uint16_t
- * ctypedef npy_uint32     uint32_t             # <<<<<<<<<<<<<<
- * ctypedef npy_uint64     uint64_t
- * #ctypedef npy_uint96     uint96_t
- */
-typedef npy_uint32 __pyx_t_5numpy_uint32_t;
-
-/* "numpy.pxd":733
- * ctypedef npy_uint16     uint16_t
- * ctypedef npy_uint32     uint32_t
- * ctypedef npy_uint64     uint64_t             # <<<<<<<<<<<<<<
- * #ctypedef npy_uint96     uint96_t
- * #ctypedef npy_uint128    uint128_t
- */
-typedef npy_uint64 __pyx_t_5numpy_uint64_t;
-
-/* "numpy.pxd":737
- * #ctypedef npy_uint128    uint128_t
- * 
- * ctypedef npy_float32    float32_t             # <<<<<<<<<<<<<<
- * ctypedef npy_float64    float64_t
- * #ctypedef npy_float80    float80_t
- */
-typedef npy_float32 __pyx_t_5numpy_float32_t;
-
-/* "numpy.pxd":738
- * 
- * ctypedef npy_float32    float32_t
- * ctypedef npy_float64    float64_t             # <<<<<<<<<<<<<<
- * #ctypedef npy_float80    float80_t
- * #ctypedef npy_float128   float128_t
- */
-typedef npy_float64 __pyx_t_5numpy_float64_t;
-
-/* "numpy.pxd":747
- * # The int types are mapped a bit surprising --
- * # numpy.int corresponds to 'l' and numpy.long to 'q'
- * ctypedef npy_long       int_t             # <<<<<<<<<<<<<<
- * ctypedef npy_longlong   long_t
- * ctypedef npy_longlong   longlong_t
- */
-typedef npy_long __pyx_t_5numpy_int_t;
-
-/* "numpy.pxd":748
- * # numpy.int corresponds to 'l' and numpy.long to 'q'
- * ctypedef npy_long       int_t
- * ctypedef npy_longlong   long_t             # <<<<<<<<<<<<<<
- * ctypedef npy_longlong   longlong_t
- * 
- */
-typedef npy_longlong __pyx_t_5numpy_long_t;
-
-/* "numpy.pxd":749
- * ctypedef npy_long       int_t
- * ctypedef npy_longlong   long_t
- * ctypedef npy_longlong   longlong_t             # <<<<<<<<<<<<<<
- * 
- * ctypedef npy_ulong      uint_t
- */
-typedef npy_longlong __pyx_t_5numpy_longlong_t;
-
-/* "numpy.pxd":751
- * ctypedef npy_longlong   longlong_t
- * 
- * ctypedef npy_ulong      uint_t             # <<<<<<<<<<<<<<
- * ctypedef npy_ulonglong  ulong_t
- * ctypedef npy_ulonglong  ulonglong_t
- */
-typedef npy_ulong __pyx_t_5numpy_uint_t;
-
-/* "numpy.pxd":752
- * 
- * ctypedef npy_ulong      uint_t
- * ctypedef npy_ulonglong  ulong_t             # <<<<<<<<<<<<<<
- * ctypedef npy_ulonglong  ulonglong_t
- * 
- */
-typedef npy_ulonglong __pyx_t_5numpy_ulong_t;
-
-/* "numpy.pxd":753
- * ctypedef npy_ulong      uint_t
- * ctypedef npy_ulonglong  ulong_t
- * ctypedef npy_ulonglong  ulonglong_t             # <<<<<<<<<<<<<<
- * 
- * ctypedef npy_intp       intp_t
- */
-typedef npy_ulonglong __pyx_t_5numpy_ulonglong_t;
-
-/* "numpy.pxd":755
- * ctypedef npy_ulonglong  ulonglong_t
- * 
- * ctypedef npy_intp       intp_t             # <<<<<<<<<<<<<<
- * ctypedef npy_uintp      uintp_t
- * 
- */
-typedef npy_intp __pyx_t_5numpy_intp_t;
-
-/* "numpy.pxd":756
- * 
- * ctypedef npy_intp       intp_t
- * ctypedef npy_uintp      uintp_t             # <<<<<<<<<<<<<<
- * 
- * ctypedef npy_double     float_t
- */
-typedef npy_uintp __pyx_t_5numpy_uintp_t;
-
-/* "numpy.pxd":758
- * ctypedef npy_uintp      uintp_t
- * 
- * ctypedef npy_double     float_t             # <<<<<<<<<<<<<<
- * ctypedef npy_double     double_t
- * ctypedef npy_longdouble longdouble_t
- */
-typedef npy_double __pyx_t_5numpy_float_t;
-
-/* "numpy.pxd":759
- * 
- * ctypedef npy_double     float_t
- * ctypedef npy_double     double_t             # <<<<<<<<<<<<<<
- * ctypedef npy_longdouble longdouble_t
- * 
- */
-typedef npy_double __pyx_t_5numpy_double_t;
-
-/* "numpy.pxd":760
- * ctypedef npy_double     float_t
- * ctypedef npy_double     double_t
- * ctypedef npy_longdouble longdouble_t             # <<<<<<<<<<<<<<
- * 
- * ctypedef npy_cfloat      cfloat_t
- */
-typedef npy_longdouble __pyx_t_5numpy_longdouble_t;
-
-/* "MMTK_BSpline_transform_grid.pyx":19
- * cimport numpy as np
- * 
- * ctypedef np.float_t float_t             # <<<<<<<<<<<<<<
- * ctypedef np.int_t int_t
- * 
- */
-typedef __pyx_t_5numpy_float_t __pyx_t_27MMTK_BSpline_transform_grid_float_t;
-
-/* "MMTK_BSpline_transform_grid.pyx":20
- * 
- * ctypedef np.float_t float_t
- * ctypedef np.int_t int_t             # <<<<<<<<<<<<<<
- * 
- * #
- */
-typedef __pyx_t_5numpy_int_t __pyx_t_27MMTK_BSpline_transform_grid_int_t;
-#if CYTHON_CCOMPLEX
-  #ifdef __cplusplus
-    typedef ::std::complex< float > __pyx_t_float_complex;
-  #else
-    typedef float _Complex __pyx_t_float_complex;
-  #endif
-#else
-    typedef struct { float real, imag; } __pyx_t_float_complex;
-#endif
-
-#if CYTHON_CCOMPLEX
-  #ifdef __cplusplus
-    typedef ::std::complex< double > __pyx_t_double_complex;
-  #else
-    typedef double _Complex __pyx_t_double_complex;
-  #endif
-#else
-    typedef struct { double real, imag; } __pyx_t_double_complex;
-#endif
-
-
-/*--- Type declarations ---*/
-struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm;
-
-/* "numpy.pxd":762
- * ctypedef npy_longdouble longdouble_t
- * 
- * ctypedef npy_cfloat      cfloat_t             # <<<<<<<<<<<<<<
- * ctypedef npy_cdouble     cdouble_t
- * ctypedef npy_clongdouble clongdouble_t
- */
-typedef npy_cfloat __pyx_t_5numpy_cfloat_t;
-
-/* "numpy.pxd":763
- * 
- * ctypedef npy_cfloat      cfloat_t
- * ctypedef npy_cdouble     cdouble_t             # <<<<<<<<<<<<<<
- * ctypedef npy_clongdouble clongdouble_t
- * 
- */
-typedef npy_cdouble __pyx_t_5numpy_cdouble_t;
-
-/* "numpy.pxd":764
- * ctypedef npy_cfloat      cfloat_t
- * ctypedef npy_cdouble     cdouble_t
- * ctypedef npy_clongdouble clongdouble_t             # <<<<<<<<<<<<<<
- * 
- * ctypedef npy_cdouble     complex_t
- */
-typedef npy_clongdouble __pyx_t_5numpy_clongdouble_t;
-
-/* "numpy.pxd":766
- * ctypedef npy_clongdouble clongdouble_t
- * 
- * ctypedef npy_cdouble     complex_t             # <<<<<<<<<<<<<<
- * 
- * cdef inline object PyArray_MultiIterNew1(a):
- */
-typedef npy_cdouble __pyx_t_5numpy_complex_t;
-
-/* "MMTK_BSpline_transform_grid.pyx":38
- * #   list given in this example.
- * #
- * cdef class BSplineTransformGridTerm(EnergyTerm):             # <<<<<<<<<<<<<<
- *     cdef char* grid_name
- *     cdef np.ndarray scaling_factor, vals, counts, spacing, hCorner
- */
-struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm {
-  PyFFEnergyTermObject __pyx_base;
-  struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *__pyx_vtab;
-  char *grid_name;
-  PyArrayObject *scaling_factor;
-  PyArrayObject *vals;
-  PyArrayObject *counts;
-  PyArrayObject *spacing;
-  PyArrayObject *hCorner;
-  int npts;
-  int nyz;
-  int natoms;
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t strength;
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t inv_power;
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t inv_power_m1;
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t k;
-};
-
-
-
-struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm {
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t (*splineInterpolate)(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *, __pyx_t_27MMTK_BSpline_transform_grid_float_t *, __pyx_t_27MMTK_BSpline_transform_grid_float_t);
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t (*bisplineInterpolate)(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*)[4], __pyx_t_27MMTK_BSpline_transform_grid_float_t, __pyx_t_27MMTK_BSpline_transform_grid_float_t);
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t (*trisplineInterpolate)(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*)[4][4], __pyx_t_27MMTK_BSpline_transform_grid_float_t, __pyx_t_27MMTK_BSpline_transform_grid_float_t, __pyx_t_27MMTK_BSpline_transform_grid_float_t);
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t (*derivateOfIntp)(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *, __pyx_t_27MMTK_BSpline_transform_grid_float_t *, __pyx_t_27MMTK_BSpline_transform_grid_float_t);
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t (*derivateOfIntp_X)(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*)[4][4], __pyx_t_27MMTK_BSpline_transform_grid_float_t, __pyx_t_27MMTK_BSpline_transform_grid_float_t, __pyx_t_27MMTK_BSpline_transform_grid_float_t);
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t (*derivateOfIntp_Y_2)(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*)[4], __pyx_t_27MMTK_BSpline_transform_grid_float_t, __pyx_t_27MMTK_BSpline_transform_grid_float_t);
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t (*derivateOfIntp_Y)(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*)[4][4], __pyx_t_27MMTK_BSpline_transform_grid_float_t, __pyx_t_27MMTK_BSpline_transform_grid_float_t, __pyx_t_27MMTK_BSpline_transform_grid_float_t);
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t (*derivateOfIntp_Z_2)(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*)[4], __pyx_t_27MMTK_BSpline_transform_grid_float_t, __pyx_t_27MMTK_BSpline_transform_grid_float_t);
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t (*derivateOfIntp_Z)(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*)[4][4], __pyx_t_27MMTK_BSpline_transform_grid_float_t, __pyx_t_27MMTK_BSpline_transform_grid_float_t, __pyx_t_27MMTK_BSpline_transform_grid_float_t);
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t (*derivateOfIntp_mm)(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *, __pyx_t_27MMTK_BSpline_transform_grid_float_t *, __pyx_t_27MMTK_BSpline_transform_grid_float_t);
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t (*derivateOfIntp_XX)(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*)[4][4], __pyx_t_27MMTK_BSpline_transform_grid_float_t, __pyx_t_27MMTK_BSpline_transform_grid_float_t, __pyx_t_27MMTK_BSpline_transform_grid_float_t);
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t (*derivateOfIntp_XY_2)(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*)[4], __pyx_t_27MMTK_BSpline_transform_grid_float_t, __pyx_t_27MMTK_BSpline_transform_grid_float_t);
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t (*derivateOfIntp_XY)(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*)[4][4], __pyx_t_27MMTK_BSpline_transform_grid_float_t, __pyx_t_27MMTK_BSpline_transform_grid_float_t, __pyx_t_27MMTK_BSpline_transform_grid_float_t);
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t (*derivateOfIntp_XZ_2)(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*)[4], __pyx_t_27MMTK_BSpline_transform_grid_float_t, __pyx_t_27MMTK_BSpline_transform_grid_float_t);
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t (*derivateOfIntp_XZ)(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*)[4][4], __pyx_t_27MMTK_BSpline_transform_grid_float_t, __pyx_t_27MMTK_BSpline_transform_grid_float_t, __pyx_t_27MMTK_BSpline_transform_grid_float_t);
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t (*derivateOfIntp_YY_2)(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*)[4], __pyx_t_27MMTK_BSpline_transform_grid_float_t, __pyx_t_27MMTK_BSpline_transform_grid_float_t);
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t (*derivateOfIntp_YY)(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*)[4][4], __pyx_t_27MMTK_BSpline_transform_grid_float_t, __pyx_t_27MMTK_BSpline_transform_grid_float_t, __pyx_t_27MMTK_BSpline_transform_grid_float_t);
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t (*derivateOfIntp_YZ_2)(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*)[4], __pyx_t_27MMTK_BSpline_transform_grid_float_t, __pyx_t_27MMTK_BSpline_transform_grid_float_t);
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t (*derivateOfIntp_YZ)(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*)[4][4], __pyx_t_27MMTK_BSpline_transform_grid_float_t, __pyx_t_27MMTK_BSpline_transform_grid_float_t, __pyx_t_27MMTK_BSpline_transform_grid_float_t);
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t (*derivateOfIntp_ZZ_2)(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*)[4], __pyx_t_27MMTK_BSpline_transform_grid_float_t, __pyx_t_27MMTK_BSpline_transform_grid_float_t);
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t (*derivateOfIntp_ZZ)(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*)[4][4], __pyx_t_27MMTK_BSpline_transform_grid_float_t, __pyx_t_27MMTK_BSpline_transform_grid_float_t, __pyx_t_27MMTK_BSpline_transform_grid_float_t);
-  void (*evaluate)(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *, PyFFEvaluatorObject *, energy_spec *, energy_data *);
-};
-static struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *__pyx_vtabptr_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm;
-
-/* --- Runtime support code (head) --- */
-#ifndef CYTHON_REFNANNY
-  #define CYTHON_REFNANNY 0
-#endif
-#if CYTHON_REFNANNY
-  typedef struct {
-    void (*INCREF)(void*, PyObject*, int);
-    void (*DECREF)(void*, PyObject*, int);
-    void (*GOTREF)(void*, PyObject*, int);
-    void (*GIVEREF)(void*, PyObject*, int);
-    void* (*SetupContext)(const char*, int, const char*);
-    void (*FinishContext)(void**);
-  } __Pyx_RefNannyAPIStruct;
-  static __Pyx_RefNannyAPIStruct *__Pyx_RefNanny = NULL;
-  static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname);
-  #define __Pyx_RefNannyDeclarations void *__pyx_refnanny = NULL;
-#ifdef WITH_THREAD
-  #define __Pyx_RefNannySetupContext(name, acquire_gil) \
-          if (acquire_gil) { \
-              PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure(); \
-              __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__); \
-              PyGILState_Release(__pyx_gilstate_save); \
-          } else { \
-              __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__); \
-          }
-#else
-  #define __Pyx_RefNannySetupContext(name, acquire_gil) \
-          __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__)
-#endif
-  #define __Pyx_RefNannyFinishContext() \
-          __Pyx_RefNanny->FinishContext(&__pyx_refnanny)
-  #define __Pyx_INCREF(r)  __Pyx_RefNanny->INCREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
-  #define __Pyx_DECREF(r)  __Pyx_RefNanny->DECREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
-  #define __Pyx_GOTREF(r)  __Pyx_RefNanny->GOTREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
-  #define __Pyx_GIVEREF(r) __Pyx_RefNanny->GIVEREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
-  #define __Pyx_XINCREF(r)  do { if((r) != NULL) {__Pyx_INCREF(r); }} while(0)
-  #define __Pyx_XDECREF(r)  do { if((r) != NULL) {__Pyx_DECREF(r); }} while(0)
-  #define __Pyx_XGOTREF(r)  do { if((r) != NULL) {__Pyx_GOTREF(r); }} while(0)
-  #define __Pyx_XGIVEREF(r) do { if((r) != NULL) {__Pyx_GIVEREF(r);}} while(0)
-#else
-  #define __Pyx_RefNannyDeclarations
-  #define __Pyx_RefNannySetupContext(name, acquire_gil)
-  #define __Pyx_RefNannyFinishContext()
-  #define __Pyx_INCREF(r) Py_INCREF(r)
-  #define __Pyx_DECREF(r) Py_DECREF(r)
-  #define __Pyx_GOTREF(r)
-  #define __Pyx_GIVEREF(r)
-  #define __Pyx_XINCREF(r) Py_XINCREF(r)
-  #define __Pyx_XDECREF(r) Py_XDECREF(r)
-  #define __Pyx_XGOTREF(r)
-  #define __Pyx_XGIVEREF(r)
-#endif
-#define __Pyx_XDECREF_SET(r, v) do {                            \
-        PyObject *tmp = (PyObject *) r;                         \
-        r = v; __Pyx_XDECREF(tmp);                              \
-    } while (0)
-#define __Pyx_DECREF_SET(r, v) do {                             \
-        PyObject *tmp = (PyObject *) r;                         \
-        r = v; __Pyx_DECREF(tmp);                               \
-    } while (0)
-#define __Pyx_CLEAR(r)    do { PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);} while(0)
-#define __Pyx_XCLEAR(r)   do { if((r) != NULL) {PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);}} while(0)
-
-#if CYTHON_COMPILING_IN_CPYTHON
-static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name) {
-    PyTypeObject* tp = Py_TYPE(obj);
-    if (likely(tp->tp_getattro))
-        return tp->tp_getattro(obj, attr_name);
-#if PY_MAJOR_VERSION < 3
-    if (likely(tp->tp_getattr))
-        return tp->tp_getattr(obj, PyString_AS_STRING(attr_name));
-#endif
-    return PyObject_GetAttr(obj, attr_name);
-}
-#else
-#define __Pyx_PyObject_GetAttrStr(o,n) PyObject_GetAttr(o,n)
-#endif
-
-static PyObject *__Pyx_GetBuiltinName(PyObject *name);
-
-static void __Pyx_RaiseArgtupleInvalid(const char* func_name, int exact,
-    Py_ssize_t num_min, Py_ssize_t num_max, Py_ssize_t num_found);
-
-static void __Pyx_RaiseDoubleKeywordsError(const char* func_name, PyObject* kw_name);
-
-static int __Pyx_ParseOptionalKeywords(PyObject *kwds, PyObject **argnames[], \
-    PyObject *kwds2, PyObject *values[], Py_ssize_t num_pos_args, \
-    const char* function_name);
-
-#if CYTHON_COMPILING_IN_CPYTHON
-static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw);
-#else
-#define __Pyx_PyObject_Call(func, arg, kw) PyObject_Call(func, arg, kw)
-#endif
-
-static CYTHON_INLINE PyObject *__Pyx_GetModuleGlobalName(PyObject *name);
-
-static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type);
-
-static double __Pyx__PyObject_AsDouble(PyObject* obj);
-#if CYTHON_COMPILING_IN_PYPY
-#define __Pyx_PyObject_AsDouble(obj) \
-(likely(PyFloat_CheckExact(obj)) ? PyFloat_AS_DOUBLE(obj) : \
- likely(PyInt_CheckExact(obj)) ? \
- PyFloat_AsDouble(obj) : __Pyx__PyObject_AsDouble(obj))
-#else
-#define __Pyx_PyObject_AsDouble(obj) \
-((likely(PyFloat_CheckExact(obj))) ? \
- PyFloat_AS_DOUBLE(obj) : __Pyx__PyObject_AsDouble(obj))
-#endif
-
-#define __Pyx_GetItemInt(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck) \
-    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ? \
-    __Pyx_GetItemInt_Fast(o, (Py_ssize_t)i, is_list, wraparound, boundscheck) : \
-    (is_list ? (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL) : \
-               __Pyx_GetItemInt_Generic(o, to_py_func(i))))
-#define __Pyx_GetItemInt_List(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck) \
-    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ? \
-    __Pyx_GetItemInt_List_Fast(o, (Py_ssize_t)i, wraparound, boundscheck) : \
-    (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL))
-static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i,
-                                                              int wraparound, int boundscheck);
-#define __Pyx_GetItemInt_Tuple(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck) \
-    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ? \
-    __Pyx_GetItemInt_Tuple_Fast(o, (Py_ssize_t)i, wraparound, boundscheck) : \
-    (PyErr_SetString(PyExc_IndexError, "tuple index out of range"), (PyObject*)NULL))
-static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i,
-                                                              int wraparound, int boundscheck);
-static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j);
-static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i,
-                                                     int is_list, int wraparound, int boundscheck);
-
-static CYTHON_INLINE int  __Pyx_GetBufferAndValidate(Py_buffer* buf, PyObject* obj,
-    __Pyx_TypeInfo* dtype, int flags, int nd, int cast, __Pyx_BufFmt_StackElem* stack);
-static CYTHON_INLINE void __Pyx_SafeReleaseBuffer(Py_buffer* info);
-
-static void __Pyx_RaiseBufferFallbackError(void);
-
-#if CYTHON_COMPILING_IN_CPYTHON
-static CYTHON_INLINE int __Pyx_ListComp_Append(PyObject* list, PyObject* x) {
-    PyListObject* L = (PyListObject*) list;
-    Py_ssize_t len = Py_SIZE(list);
-    if (likely(L->allocated > len)) {
-        Py_INCREF(x);
-        PyList_SET_ITEM(list, len, x);
-        Py_SIZE(list) = len+1;
-        return 0;
-    }
-    return PyList_Append(list, x);
-}
-#else
-#define __Pyx_ListComp_Append(L,x) PyList_Append(L,x)
-#endif
-
-#ifndef __PYX_FORCE_INIT_THREADS
-  #define __PYX_FORCE_INIT_THREADS 0
-#endif
-
-#define __Pyx_SetItemInt(o, i, v, type, is_signed, to_py_func, is_list, wraparound, boundscheck) \
-    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ? \
-    __Pyx_SetItemInt_Fast(o, (Py_ssize_t)i, v, is_list, wraparound, boundscheck) : \
-    (is_list ? (PyErr_SetString(PyExc_IndexError, "list assignment index out of range"), -1) : \
-               __Pyx_SetItemInt_Generic(o, to_py_func(i), v)))
-static CYTHON_INLINE int __Pyx_SetItemInt_Generic(PyObject *o, PyObject *j, PyObject *v);
-static CYTHON_INLINE int __Pyx_SetItemInt_Fast(PyObject *o, Py_ssize_t i, PyObject *v,
-                                               int is_list, int wraparound, int boundscheck);
-
-static CYTHON_INLINE void __Pyx_ErrRestore(PyObject *type, PyObject *value, PyObject *tb);
-static CYTHON_INLINE void __Pyx_ErrFetch(PyObject **type, PyObject **value, PyObject **tb);
-
-static void __Pyx_WriteUnraisable(const char *name, int clineno,
-                                  int lineno, const char *filename,
-                                  int full_traceback);
-
-static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause);
-
-static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(Py_ssize_t expected);
-
-static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index);
-
-static CYTHON_INLINE void __Pyx_RaiseNoneNotIterableError(void);
-
-static void __Pyx_call_next_tp_dealloc(PyObject* obj, destructor current_tp_dealloc);
-
-static int __Pyx_call_next_tp_traverse(PyObject* obj, visitproc v, void *a, traverseproc current_tp_traverse);
-
-static void __Pyx_call_next_tp_clear(PyObject* obj, inquiry current_tp_dealloc);
-
-static int __Pyx_SetVtable(PyObject *dict, void *vtable);
-
-static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name);
-
-typedef struct {
-    int code_line;
-    PyCodeObject* code_object;
-} __Pyx_CodeObjectCacheEntry;
-struct __Pyx_CodeObjectCache {
-    int count;
-    int max_count;
-    __Pyx_CodeObjectCacheEntry* entries;
-};
-static struct __Pyx_CodeObjectCache __pyx_code_cache = {0,0,NULL};
-static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line);
-static PyCodeObject *__pyx_find_code_object(int code_line);
-static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object);
-
-static void __Pyx_AddTraceback(const char *funcname, int c_line,
-                               int py_line, const char *filename);
-
-typedef struct {
-  Py_ssize_t shape, strides, suboffsets;
-} __Pyx_Buf_DimInfo;
-typedef struct {
-  size_t refcount;
-  Py_buffer pybuffer;
-} __Pyx_Buffer;
-typedef struct {
-  __Pyx_Buffer *rcbuffer;
-  char *data;
-  __Pyx_Buf_DimInfo diminfo[8];
-} __Pyx_LocalBuf_ND;
-
-#if PY_MAJOR_VERSION < 3
-    static int __Pyx_GetBuffer(PyObject *obj, Py_buffer *view, int flags);
-    static void __Pyx_ReleaseBuffer(Py_buffer *view);
-#else
-    #define __Pyx_GetBuffer PyObject_GetBuffer
-    #define __Pyx_ReleaseBuffer PyBuffer_Release
-#endif
-
-
-static Py_ssize_t __Pyx_zeros[] = {0, 0, 0, 0, 0, 0, 0, 0};
-static Py_ssize_t __Pyx_minusones[] = {-1, -1, -1, -1, -1, -1, -1, -1};
-
-static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level);
-
-static int __Pyx_Print(PyObject*, PyObject *, int);
-#if CYTHON_COMPILING_IN_PYPY || PY_MAJOR_VERSION >= 3
-static PyObject* __pyx_print = 0;
-static PyObject* __pyx_print_kwargs = 0;
-#endif
-
-static int __Pyx_PrintOne(PyObject* stream, PyObject *o);
-
-static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value);
-
-static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *);
-
-static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value);
-
-static CYTHON_INLINE PyObject* __Pyx_PyInt_From_npy_long(npy_long value);
-
-#if CYTHON_CCOMPLEX
-  #ifdef __cplusplus
-    #define __Pyx_CREAL(z) ((z).real())
-    #define __Pyx_CIMAG(z) ((z).imag())
-  #else
-    #define __Pyx_CREAL(z) (__real__(z))
-    #define __Pyx_CIMAG(z) (__imag__(z))
-  #endif
-#else
-    #define __Pyx_CREAL(z) ((z).real)
-    #define __Pyx_CIMAG(z) ((z).imag)
-#endif
-#if (defined(_WIN32) || defined(__clang__)) && defined(__cplusplus) && CYTHON_CCOMPLEX
-    #define __Pyx_SET_CREAL(z,x) ((z).real(x))
-    #define __Pyx_SET_CIMAG(z,y) ((z).imag(y))
-#else
-    #define __Pyx_SET_CREAL(z,x) __Pyx_CREAL(z) = (x)
-    #define __Pyx_SET_CIMAG(z,y) __Pyx_CIMAG(z) = (y)
-#endif
-
-static CYTHON_INLINE __pyx_t_float_complex __pyx_t_float_complex_from_parts(float, float);
-
-#if CYTHON_CCOMPLEX
-    #define __Pyx_c_eqf(a, b)   ((a)==(b))
-    #define __Pyx_c_sumf(a, b)  ((a)+(b))
-    #define __Pyx_c_difff(a, b) ((a)-(b))
-    #define __Pyx_c_prodf(a, b) ((a)*(b))
-    #define __Pyx_c_quotf(a, b) ((a)/(b))
-    #define __Pyx_c_negf(a)     (-(a))
-  #ifdef __cplusplus
-    #define __Pyx_c_is_zerof(z) ((z)==(float)0)
-    #define __Pyx_c_conjf(z)    (::std::conj(z))
-    #if 1
-        #define __Pyx_c_absf(z)     (::std::abs(z))
-        #define __Pyx_c_powf(a, b)  (::std::pow(a, b))
-    #endif
-  #else
-    #define __Pyx_c_is_zerof(z) ((z)==0)
-    #define __Pyx_c_conjf(z)    (conjf(z))
-    #if 1
-        #define __Pyx_c_absf(z)     (cabsf(z))
-        #define __Pyx_c_powf(a, b)  (cpowf(a, b))
-    #endif
- #endif
-#else
-    static CYTHON_INLINE int __Pyx_c_eqf(__pyx_t_float_complex, __pyx_t_float_complex);
-    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_sumf(__pyx_t_float_complex, __pyx_t_float_complex);
-    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_difff(__pyx_t_float_complex, __pyx_t_float_complex);
-    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_prodf(__pyx_t_float_complex, __pyx_t_float_complex);
-    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_quotf(__pyx_t_float_complex, __pyx_t_float_complex);
-    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_negf(__pyx_t_float_complex);
-    static CYTHON_INLINE int __Pyx_c_is_zerof(__pyx_t_float_complex);
-    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_conjf(__pyx_t_float_complex);
-    #if 1
-        static CYTHON_INLINE float __Pyx_c_absf(__pyx_t_float_complex);
-        static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_powf(__pyx_t_float_complex, __pyx_t_float_complex);
-    #endif
-#endif
-
-static CYTHON_INLINE __pyx_t_double_complex __pyx_t_double_complex_from_parts(double, double);
-
-#if CYTHON_CCOMPLEX
-    #define __Pyx_c_eq(a, b)   ((a)==(b))
-    #define __Pyx_c_sum(a, b)  ((a)+(b))
-    #define __Pyx_c_diff(a, b) ((a)-(b))
-    #define __Pyx_c_prod(a, b) ((a)*(b))
-    #define __Pyx_c_quot(a, b) ((a)/(b))
-    #define __Pyx_c_neg(a)     (-(a))
-  #ifdef __cplusplus
-    #define __Pyx_c_is_zero(z) ((z)==(double)0)
-    #define __Pyx_c_conj(z)    (::std::conj(z))
-    #if 1
-        #define __Pyx_c_abs(z)     (::std::abs(z))
-        #define __Pyx_c_pow(a, b)  (::std::pow(a, b))
-    #endif
-  #else
-    #define __Pyx_c_is_zero(z) ((z)==0)
-    #define __Pyx_c_conj(z)    (conj(z))
-    #if 1
-        #define __Pyx_c_abs(z)     (cabs(z))
-        #define __Pyx_c_pow(a, b)  (cpow(a, b))
-    #endif
- #endif
-#else
-    static CYTHON_INLINE int __Pyx_c_eq(__pyx_t_double_complex, __pyx_t_double_complex);
-    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_sum(__pyx_t_double_complex, __pyx_t_double_complex);
-    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_diff(__pyx_t_double_complex, __pyx_t_double_complex);
-    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_prod(__pyx_t_double_complex, __pyx_t_double_complex);
-    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_quot(__pyx_t_double_complex, __pyx_t_double_complex);
-    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_neg(__pyx_t_double_complex);
-    static CYTHON_INLINE int __Pyx_c_is_zero(__pyx_t_double_complex);
-    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_conj(__pyx_t_double_complex);
-    #if 1
-        static CYTHON_INLINE double __Pyx_c_abs(__pyx_t_double_complex);
-        static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_pow(__pyx_t_double_complex, __pyx_t_double_complex);
-    #endif
-#endif
-
-static CYTHON_INLINE PyObject* __Pyx_PyInt_From_ptrdiff_t(ptrdiff_t value);
-
-static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *);
-
-static int __Pyx_check_binary_version(void);
-
-#if !defined(__Pyx_PyIdentifier_FromString)
-#if PY_MAJOR_VERSION < 3
-  #define __Pyx_PyIdentifier_FromString(s) PyString_FromString(s)
-#else
-  #define __Pyx_PyIdentifier_FromString(s) PyUnicode_FromString(s)
-#endif
-#endif
-
-static PyObject *__Pyx_ImportModule(const char *name);
-
-static PyTypeObject *__Pyx_ImportType(const char *module_name, const char *class_name, size_t size, int strict);
-
-static int __Pyx_InitStrings(__Pyx_StringTabEntry *t);
-
-static __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_f_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm_splineInterpolate(CYTHON_UNUSED struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *__pyx_v_self, __pyx_t_27MMTK_BSpline_transform_grid_float_t *__pyx_v_p, __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_x); /* proto*/
-static __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_f_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm_bisplineInterpolate(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *__pyx_v_self, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*__pyx_v_p)[4], __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_x, __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_y); /* proto*/
-static __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_f_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm_trisplineInterpolate(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *__pyx_v_self, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*__pyx_v_p)[4][4], __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_x, __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_y, __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_z); /* proto*/
-static __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_f_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm_derivateOfIntp(CYTHON_UNUSED struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *__pyx_v_self, __pyx_t_27MMTK_BSpline_transform_grid_float_t *__pyx_v_p, __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_x); /* proto*/
-static __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_f_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm_derivateOfIntp_X(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *__pyx_v_self, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*__pyx_v_p)[4][4], __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_x, __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_y, __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_z); /* proto*/
-static __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_f_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm_derivateOfIntp_Y_2(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *__pyx_v_self, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*__pyx_v_p)[4], __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_x, __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_y); /* proto*/
-static __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_f_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm_derivateOfIntp_Y(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *__pyx_v_self, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*__pyx_v_p)[4][4], __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_x, __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_y, __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_z); /* proto*/
-static __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_f_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm_derivateOfIntp_Z_2(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *__pyx_v_self, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*__pyx_v_p)[4], __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_x, __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_y); /* proto*/
-static __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_f_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm_derivateOfIntp_Z(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *__pyx_v_self, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*__pyx_v_p)[4][4], __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_x, __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_y, __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_z); /* proto*/
-static __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_f_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm_derivateOfIntp_mm(CYTHON_UNUSED struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *__pyx_v_self, __pyx_t_27MMTK_BSpline_transform_grid_float_t *__pyx_v_p, __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_x); /* proto*/
-static __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_f_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm_derivateOfIntp_XX(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *__pyx_v_self, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*__pyx_v_p)[4][4], __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_x, __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_y, __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_z); /* proto*/
-static __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_f_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm_derivateOfIntp_XY_2(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *__pyx_v_self, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*__pyx_v_p)[4], __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_x, __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_y); /* proto*/
-static __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_f_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm_derivateOfIntp_XY(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *__pyx_v_self, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*__pyx_v_p)[4][4], __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_x, __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_y, __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_z); /* proto*/
-static __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_f_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm_derivateOfIntp_XZ_2(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *__pyx_v_self, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*__pyx_v_p)[4], __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_x, __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_y); /* proto*/
-static __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_f_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm_derivateOfIntp_XZ(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *__pyx_v_self, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*__pyx_v_p)[4][4], __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_x, __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_y, __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_z); /* proto*/
-static __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_f_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm_derivateOfIntp_YY_2(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *__pyx_v_self, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*__pyx_v_p)[4], __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_x, __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_y); /* proto*/
-static __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_f_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm_derivateOfIntp_YY(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *__pyx_v_self, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*__pyx_v_p)[4][4], __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_x, __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_y, __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_z); /* proto*/
-static __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_f_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm_derivateOfIntp_YZ_2(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *__pyx_v_self, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*__pyx_v_p)[4], __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_x, __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_y); /* proto*/
-static __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_f_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm_derivateOfIntp_YZ(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *__pyx_v_self, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*__pyx_v_p)[4][4], __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_x, __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_y, __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_z); /* proto*/
-static __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_f_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm_derivateOfIntp_ZZ_2(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *__pyx_v_self, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*__pyx_v_p)[4], __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_x, __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_y); /* proto*/
-static __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_f_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm_derivateOfIntp_ZZ(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *__pyx_v_self, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*__pyx_v_p)[4][4], __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_x, __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_y, __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_z); /* proto*/
-static void __pyx_f_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm_evaluate(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *__pyx_v_self, CYTHON_UNUSED PyFFEvaluatorObject *__pyx_v_eval, energy_spec *__pyx_v_input, energy_data *__pyx_v_energy); /* proto*/
-
-/* Module declarations from 'Scientific.N' */
-
-/* Module declarations from 'MMTK_forcefield' */
-
-/* Module declarations from 'cpython.buffer' */
-
-/* Module declarations from 'cpython.ref' */
-
-/* Module declarations from 'libc.string' */
-
-/* Module declarations from 'libc.stdio' */
-
-/* Module declarations from 'cpython.object' */
-
-/* Module declarations from '__builtin__' */
-
-/* Module declarations from 'cpython.type' */
-static PyTypeObject *__pyx_ptype_7cpython_4type_type = 0;
-
-/* Module declarations from 'libc.stdlib' */
-
-/* Module declarations from 'numpy' */
-
-/* Module declarations from 'numpy' */
-static PyTypeObject *__pyx_ptype_5numpy_dtype = 0;
-static PyTypeObject *__pyx_ptype_5numpy_flatiter = 0;
-static PyTypeObject *__pyx_ptype_5numpy_broadcast = 0;
-static PyTypeObject *__pyx_ptype_5numpy_ndarray = 0;
-static PyTypeObject *__pyx_ptype_5numpy_ufunc = 0;
-static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *, char *, char *, int *); /*proto*/
-
-/* Module declarations from 'MMTK_BSpline_transform_grid' */
-static PyTypeObject *__pyx_ptype_27MMTK_BSpline_transform_grid_ArrayType = 0;
-static PyTypeObject *__pyx_ptype_27MMTK_BSpline_transform_grid_EnergyTerm = 0;
-static PyTypeObject *__pyx_ptype_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm = 0;
-static __Pyx_TypeInfo __Pyx_TypeInfo_nn___pyx_t_27MMTK_BSpline_transform_grid_float_t = { "float_t", NULL, sizeof(__pyx_t_27MMTK_BSpline_transform_grid_float_t), { 0 }, 0, 'R', 0, 0 };
-#define __Pyx_MODULE_NAME "MMTK_BSpline_transform_grid"
-int __pyx_module_is_main_MMTK_BSpline_transform_grid = 0;
-
-/* Implementation of 'MMTK_BSpline_transform_grid' */
-static PyObject *__pyx_builtin_range;
-static PyObject *__pyx_builtin_ValueError;
-static PyObject *__pyx_builtin_RuntimeError;
-static int __pyx_pf_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm___init__(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *__pyx_v_self, PyObject *__pyx_v_universe, PyObject *__pyx_v_spacing, PyObject *__pyx_v_counts, PyObject *__pyx_v_vals, PyObject *__pyx_v_strength, PyObject *__pyx_v_scaling_factor, PyObject *__pyx_v_grid_name, PyObject *__pyx_v_inv_power); /* proto */
-static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, Py_buffer *__pyx_v_info, int __pyx_v_flags); /* proto */
-static void __pyx_pf_5numpy_7ndarray_2__releasebuffer__(PyArrayObject *__pyx_v_self, Py_buffer *__pyx_v_info); /* proto */
-static PyObject *__pyx_tp_new_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
-static char __pyx_k_B[] = "B";
-static char __pyx_k_H[] = "H";
-static char __pyx_k_I[] = "I";
-static char __pyx_k_L[] = "L";
-static char __pyx_k_O[] = "O";
-static char __pyx_k_Q[] = "Q";
-static char __pyx_k_b[] = "b";
-static char __pyx_k_d[] = "d";
-static char __pyx_k_f[] = "f";
-static char __pyx_k_g[] = "g";
-static char __pyx_k_h[] = "h";
-static char __pyx_k_i[] = "i";
-static char __pyx_k_l[] = "l";
-static char __pyx_k_q[] = "q";
-static char __pyx_k_Zd[] = "Zd";
-static char __pyx_k_Zf[] = "Zf";
-static char __pyx_k_Zg[] = "Zg";
-static char __pyx_k_ex[] = "ex";
-static char __pyx_k_ey[] = "ey";
-static char __pyx_k_ez[] = "ez";
-static char __pyx_k_np[] = "np";
-static char __pyx_k_end[] = "end";
-static char __pyx_k_file[] = "file";
-static char __pyx_k_gzip[] = "gzip";
-static char __pyx_k_init[] = "__init__";
-static char __pyx_k_main[] = "__main__";
-static char __pyx_k_test[] = "__test__";
-static char __pyx_k_vals[] = "vals";
-static char __pyx_k_array[] = "array";
-static char __pyx_k_dtype[] = "dtype";
-static char __pyx_k_numpy[] = "numpy";
-static char __pyx_k_print[] = "print";
-static char __pyx_k_range[] = "range";
-static char __pyx_k_Vector[] = "Vector";
-static char __pyx_k_counts[] = "counts";
-static char __pyx_k_import[] = "__import__";
-static char __pyx_k_spacing[] = "spacing";
-static char __pyx_k_strength[] = "strength";
-static char __pyx_k_universe[] = "universe";
-static char __pyx_k_grid_name[] = "grid_name";
-static char __pyx_k_inv_power[] = "inv_power";
-static char __pyx_k_ValueError[] = "ValueError";
-static char __pyx_k_pyx_vtable[] = "__pyx_vtable__";
-static char __pyx_k_test_start[] = "------------test start---------------";
-static char __pyx_k_RuntimeError[] = "RuntimeError";
-static char __pyx_k_scaling_factor[] = "scaling_factor";
-static char __pyx_k_Scientific_Geometry[] = "Scientific.Geometry";
-static char __pyx_k_ndarray_is_not_C_contiguous[] = "ndarray is not C contiguous";
-static char __pyx_k_unknown_dtype_code_in_numpy_pxd[] = "unknown dtype code in numpy.pxd (%d)";
-static char __pyx_k_Format_string_allocated_too_shor[] = "Format string allocated too short, see comment in numpy.pxd";
-static char __pyx_k_Non_native_byte_order_not_suppor[] = "Non-native byte order not supported";
-static char __pyx_k_ndarray_is_not_Fortran_contiguou[] = "ndarray is not Fortran contiguous";
-static char __pyx_k_Format_string_allocated_too_shor_2[] = "Format string allocated too short.";
-static PyObject *__pyx_kp_u_Format_string_allocated_too_shor;
-static PyObject *__pyx_kp_u_Format_string_allocated_too_shor_2;
-static PyObject *__pyx_kp_u_Non_native_byte_order_not_suppor;
-static PyObject *__pyx_n_s_RuntimeError;
-static PyObject *__pyx_n_s_Scientific_Geometry;
-static PyObject *__pyx_n_s_ValueError;
-static PyObject *__pyx_n_s_Vector;
-static PyObject *__pyx_n_s_array;
-static PyObject *__pyx_n_s_counts;
-static PyObject *__pyx_n_s_dtype;
-static PyObject *__pyx_n_s_end;
-static PyObject *__pyx_n_s_ex;
-static PyObject *__pyx_n_s_ey;
-static PyObject *__pyx_n_s_ez;
-static PyObject *__pyx_n_s_file;
-static PyObject *__pyx_n_s_grid_name;
-static PyObject *__pyx_n_s_gzip;
-static PyObject *__pyx_n_s_import;
-static PyObject *__pyx_n_s_init;
-static PyObject *__pyx_n_s_inv_power;
-static PyObject *__pyx_n_s_main;
-static PyObject *__pyx_kp_u_ndarray_is_not_C_contiguous;
-static PyObject *__pyx_kp_u_ndarray_is_not_Fortran_contiguou;
-static PyObject *__pyx_n_s_np;
-static PyObject *__pyx_n_s_numpy;
-static PyObject *__pyx_n_s_print;
-static PyObject *__pyx_n_s_pyx_vtable;
-static PyObject *__pyx_n_s_range;
-static PyObject *__pyx_n_s_scaling_factor;
-static PyObject *__pyx_n_s_spacing;
-static PyObject *__pyx_n_s_strength;
-static PyObject *__pyx_n_s_test;
-static PyObject *__pyx_kp_s_test_start;
-static PyObject *__pyx_n_s_universe;
-static PyObject *__pyx_kp_u_unknown_dtype_code_in_numpy_pxd;
-static PyObject *__pyx_n_s_vals;
-static PyObject *__pyx_float_1_;
-static PyObject *__pyx_int_0;
-static PyObject *__pyx_int_1;
-static PyObject *__pyx_int_4;
-static PyObject *__pyx_int_15;
-static PyObject *__pyx_tuple_;
-static PyObject *__pyx_tuple__2;
-static PyObject *__pyx_tuple__3;
-static PyObject *__pyx_tuple__4;
-static PyObject *__pyx_tuple__5;
-static PyObject *__pyx_tuple__6;
-static PyObject *__pyx_tuple__7;
-static PyObject *__pyx_tuple__8;
-static PyObject *__pyx_tuple__9;
-
-/* "MMTK_BSpline_transform_grid.pyx":47
- *     # name and the universe object.
- * 
- *     cdef float_t splineInterpolate(self,float_t p[4],float_t x):             # <<<<<<<<<<<<<<
- *         return (8*p[0]-5*p[1]+4*p[2]-p[3]+x*(-12*p[0]+21*p[1]-12*p[2]+3*p[3]+x*(6*p[0]-15*p[1]+12*p[2]-3*p[3]+x*(-p[0]+3*p[1]-3*p[2]+p[3]))))/6
- *     cdef float_t bisplineInterpolate(self,float_t p[4][4],float_t x,float_t y):
- */
-
-static __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_f_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm_splineInterpolate(CYTHON_UNUSED struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *__pyx_v_self, __pyx_t_27MMTK_BSpline_transform_grid_float_t *__pyx_v_p, __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_x) {
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_r;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("splineInterpolate", 0);
-
-  /* "MMTK_BSpline_transform_grid.pyx":48
- * 
- *     cdef float_t splineInterpolate(self,float_t p[4],float_t x):
- *         return (8*p[0]-5*p[1]+4*p[2]-p[3]+x*(-12*p[0]+21*p[1]-12*p[2]+3*p[3]+x*(6*p[0]-15*p[1]+12*p[2]-3*p[3]+x*(-p[0]+3*p[1]-3*p[2]+p[3]))))/6             # <<<<<<<<<<<<<<
- *     cdef float_t bisplineInterpolate(self,float_t p[4][4],float_t x,float_t y):
- *         cdef float_t arr[4]
- */
-  __pyx_r = ((((((8.0 * (__pyx_v_p[0])) - (5.0 * (__pyx_v_p[1]))) + (4.0 * (__pyx_v_p[2]))) - (__pyx_v_p[3])) + (__pyx_v_x * (((((-12.0 * (__pyx_v_p[0])) + (21.0 * (__pyx_v_p[1]))) - (12.0 * (__pyx_v_p[2]))) + (3.0 * (__pyx_v_p[3]))) + (__pyx_v_x * (((((6.0 * (__pyx_v_p[0])) - (15.0 * (__pyx_v_p[1]))) + (12.0 * (__pyx_v_p[2]))) - (3.0 * (__pyx_v_p[3]))) + (__pyx_v_x * ((((-(__pyx_v_p[0])) + (3.0 * (__pyx_v_p[1]))) - (3.0 * (__pyx_v_p[2]))) + (__pyx_v_p[3])))))))) / 6.0);
-  goto __pyx_L0;
-
-  /* "MMTK_BSpline_transform_grid.pyx":47
- *     # name and the universe object.
- * 
- *     cdef float_t splineInterpolate(self,float_t p[4],float_t x):             # <<<<<<<<<<<<<<
- *         return (8*p[0]-5*p[1]+4*p[2]-p[3]+x*(-12*p[0]+21*p[1]-12*p[2]+3*p[3]+x*(6*p[0]-15*p[1]+12*p[2]-3*p[3]+x*(-p[0]+3*p[1]-3*p[2]+p[3]))))/6
- *     cdef float_t bisplineInterpolate(self,float_t p[4][4],float_t x,float_t y):
- */
-
-  /* function exit code */
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "MMTK_BSpline_transform_grid.pyx":49
- *     cdef float_t splineInterpolate(self,float_t p[4],float_t x):
- *         return (8*p[0]-5*p[1]+4*p[2]-p[3]+x*(-12*p[0]+21*p[1]-12*p[2]+3*p[3]+x*(6*p[0]-15*p[1]+12*p[2]-3*p[3]+x*(-p[0]+3*p[1]-3*p[2]+p[3]))))/6
- *     cdef float_t bisplineInterpolate(self,float_t p[4][4],float_t x,float_t y):             # <<<<<<<<<<<<<<
- *         cdef float_t arr[4]
- *         arr[0] = self.splineInterpolate(p[0], y)
- */
-
-static __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_f_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm_bisplineInterpolate(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *__pyx_v_self, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*__pyx_v_p)[4], __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_x, __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_y) {
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_arr[4];
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_r;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("bisplineInterpolate", 0);
-
-  /* "MMTK_BSpline_transform_grid.pyx":51
- *     cdef float_t bisplineInterpolate(self,float_t p[4][4],float_t x,float_t y):
- *         cdef float_t arr[4]
- *         arr[0] = self.splineInterpolate(p[0], y)             # <<<<<<<<<<<<<<
- *         arr[1] = self.splineInterpolate(p[1], y)
- *         arr[2] = self.splineInterpolate(p[2], y)
- */
-  (__pyx_v_arr[0]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->splineInterpolate(__pyx_v_self, (__pyx_v_p[0]), __pyx_v_y);
-
-  /* "MMTK_BSpline_transform_grid.pyx":52
- *         cdef float_t arr[4]
- *         arr[0] = self.splineInterpolate(p[0], y)
- *         arr[1] = self.splineInterpolate(p[1], y)             # <<<<<<<<<<<<<<
- *         arr[2] = self.splineInterpolate(p[2], y)
- *         arr[3] = self.splineInterpolate(p[3], y)
- */
-  (__pyx_v_arr[1]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->splineInterpolate(__pyx_v_self, (__pyx_v_p[1]), __pyx_v_y);
-
-  /* "MMTK_BSpline_transform_grid.pyx":53
- *         arr[0] = self.splineInterpolate(p[0], y)
- *         arr[1] = self.splineInterpolate(p[1], y)
- *         arr[2] = self.splineInterpolate(p[2], y)             # <<<<<<<<<<<<<<
- *         arr[3] = self.splineInterpolate(p[3], y)
- *         return self.splineInterpolate(arr, x)
- */
-  (__pyx_v_arr[2]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->splineInterpolate(__pyx_v_self, (__pyx_v_p[2]), __pyx_v_y);
-
-  /* "MMTK_BSpline_transform_grid.pyx":54
- *         arr[1] = self.splineInterpolate(p[1], y)
- *         arr[2] = self.splineInterpolate(p[2], y)
- *         arr[3] = self.splineInterpolate(p[3], y)             # <<<<<<<<<<<<<<
- *         return self.splineInterpolate(arr, x)
- *     cdef float_t trisplineInterpolate(self,float_t p[4][4][4],float_t x,float_t y,float_t z):
- */
-  (__pyx_v_arr[3]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->splineInterpolate(__pyx_v_self, (__pyx_v_p[3]), __pyx_v_y);
-
-  /* "MMTK_BSpline_transform_grid.pyx":55
- *         arr[2] = self.splineInterpolate(p[2], y)
- *         arr[3] = self.splineInterpolate(p[3], y)
- *         return self.splineInterpolate(arr, x)             # <<<<<<<<<<<<<<
- *     cdef float_t trisplineInterpolate(self,float_t p[4][4][4],float_t x,float_t y,float_t z):
- *         cdef float_t arr[4]
- */
-  __pyx_r = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->splineInterpolate(__pyx_v_self, __pyx_v_arr, __pyx_v_x);
-  goto __pyx_L0;
-
-  /* "MMTK_BSpline_transform_grid.pyx":49
- *     cdef float_t splineInterpolate(self,float_t p[4],float_t x):
- *         return (8*p[0]-5*p[1]+4*p[2]-p[3]+x*(-12*p[0]+21*p[1]-12*p[2]+3*p[3]+x*(6*p[0]-15*p[1]+12*p[2]-3*p[3]+x*(-p[0]+3*p[1]-3*p[2]+p[3]))))/6
- *     cdef float_t bisplineInterpolate(self,float_t p[4][4],float_t x,float_t y):             # <<<<<<<<<<<<<<
- *         cdef float_t arr[4]
- *         arr[0] = self.splineInterpolate(p[0], y)
- */
-
-  /* function exit code */
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "MMTK_BSpline_transform_grid.pyx":56
- *         arr[3] = self.splineInterpolate(p[3], y)
- *         return self.splineInterpolate(arr, x)
- *     cdef float_t trisplineInterpolate(self,float_t p[4][4][4],float_t x,float_t y,float_t z):             # <<<<<<<<<<<<<<
- *         cdef float_t arr[4]
- *         arr[0] = self.bisplineInterpolate(p[0], y, z)
- */
-
-static __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_f_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm_trisplineInterpolate(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *__pyx_v_self, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*__pyx_v_p)[4][4], __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_x, __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_y, __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_z) {
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_arr[4];
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_r;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("trisplineInterpolate", 0);
-
-  /* "MMTK_BSpline_transform_grid.pyx":58
- *     cdef float_t trisplineInterpolate(self,float_t p[4][4][4],float_t x,float_t y,float_t z):
- *         cdef float_t arr[4]
- *         arr[0] = self.bisplineInterpolate(p[0], y, z)             # <<<<<<<<<<<<<<
- *         arr[1] = self.bisplineInterpolate(p[1], y, z)
- *         arr[2] = self.bisplineInterpolate(p[2], y, z)
- */
-  (__pyx_v_arr[0]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->bisplineInterpolate(__pyx_v_self, (__pyx_v_p[0]), __pyx_v_y, __pyx_v_z);
-
-  /* "MMTK_BSpline_transform_grid.pyx":59
- *         cdef float_t arr[4]
- *         arr[0] = self.bisplineInterpolate(p[0], y, z)
- *         arr[1] = self.bisplineInterpolate(p[1], y, z)             # <<<<<<<<<<<<<<
- *         arr[2] = self.bisplineInterpolate(p[2], y, z)
- *         arr[3] = self.bisplineInterpolate(p[3], y, z)
- */
-  (__pyx_v_arr[1]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->bisplineInterpolate(__pyx_v_self, (__pyx_v_p[1]), __pyx_v_y, __pyx_v_z);
-
-  /* "MMTK_BSpline_transform_grid.pyx":60
- *         arr[0] = self.bisplineInterpolate(p[0], y, z)
- *         arr[1] = self.bisplineInterpolate(p[1], y, z)
- *         arr[2] = self.bisplineInterpolate(p[2], y, z)             # <<<<<<<<<<<<<<
- *         arr[3] = self.bisplineInterpolate(p[3], y, z)
- *         return self.splineInterpolate(arr, x)
- */
-  (__pyx_v_arr[2]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->bisplineInterpolate(__pyx_v_self, (__pyx_v_p[2]), __pyx_v_y, __pyx_v_z);
-
-  /* "MMTK_BSpline_transform_grid.pyx":61
- *         arr[1] = self.bisplineInterpolate(p[1], y, z)
- *         arr[2] = self.bisplineInterpolate(p[2], y, z)
- *         arr[3] = self.bisplineInterpolate(p[3], y, z)             # <<<<<<<<<<<<<<
- *         return self.splineInterpolate(arr, x)
- * 
- */
-  (__pyx_v_arr[3]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->bisplineInterpolate(__pyx_v_self, (__pyx_v_p[3]), __pyx_v_y, __pyx_v_z);
-
-  /* "MMTK_BSpline_transform_grid.pyx":62
- *         arr[2] = self.bisplineInterpolate(p[2], y, z)
- *         arr[3] = self.bisplineInterpolate(p[3], y, z)
- *         return self.splineInterpolate(arr, x)             # <<<<<<<<<<<<<<
- * 
- *     cdef float_t derivateOfIntp(self,float_t p[4],float_t x):
- */
-  __pyx_r = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->splineInterpolate(__pyx_v_self, __pyx_v_arr, __pyx_v_x);
-  goto __pyx_L0;
-
-  /* "MMTK_BSpline_transform_grid.pyx":56
- *         arr[3] = self.splineInterpolate(p[3], y)
- *         return self.splineInterpolate(arr, x)
- *     cdef float_t trisplineInterpolate(self,float_t p[4][4][4],float_t x,float_t y,float_t z):             # <<<<<<<<<<<<<<
- *         cdef float_t arr[4]
- *         arr[0] = self.bisplineInterpolate(p[0], y, z)
- */
-
-  /* function exit code */
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "MMTK_BSpline_transform_grid.pyx":64
- *         return self.splineInterpolate(arr, x)
- * 
- *     cdef float_t derivateOfIntp(self,float_t p[4],float_t x):             # <<<<<<<<<<<<<<
- *         return (-12*p[0]+21*p[1]-12*p[2]+3*p[3]+x*(12*p[0]-30*p[1]+24*p[2]-6*p[3]+x*(-3*p[0]+9*p[1]-9*p[2]+3*p[3])))/6
- * 
- */
-
-static __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_f_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm_derivateOfIntp(CYTHON_UNUSED struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *__pyx_v_self, __pyx_t_27MMTK_BSpline_transform_grid_float_t *__pyx_v_p, __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_x) {
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_r;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("derivateOfIntp", 0);
-
-  /* "MMTK_BSpline_transform_grid.pyx":65
- * 
- *     cdef float_t derivateOfIntp(self,float_t p[4],float_t x):
- *         return (-12*p[0]+21*p[1]-12*p[2]+3*p[3]+x*(12*p[0]-30*p[1]+24*p[2]-6*p[3]+x*(-3*p[0]+9*p[1]-9*p[2]+3*p[3])))/6             # <<<<<<<<<<<<<<
- * 
- *   # the following functions are used to calculate gradients (first derivative)
- */
-  __pyx_r = ((((((-12.0 * (__pyx_v_p[0])) + (21.0 * (__pyx_v_p[1]))) - (12.0 * (__pyx_v_p[2]))) + (3.0 * (__pyx_v_p[3]))) + (__pyx_v_x * (((((12.0 * (__pyx_v_p[0])) - (30.0 * (__pyx_v_p[1]))) + (24.0 * (__pyx_v_p[2]))) - (6.0 * (__pyx_v_p[3]))) + (__pyx_v_x * ((((-3.0 * (__pyx_v_p[0])) + (9.0 * (__pyx_v_p[1]))) - (9.0 * (__pyx_v_p[2]))) + (3.0 * (__pyx_v_p[3]))))))) / 6.0);
-  goto __pyx_L0;
-
-  /* "MMTK_BSpline_transform_grid.pyx":64
- *         return self.splineInterpolate(arr, x)
- * 
- *     cdef float_t derivateOfIntp(self,float_t p[4],float_t x):             # <<<<<<<<<<<<<<
- *         return (-12*p[0]+21*p[1]-12*p[2]+3*p[3]+x*(12*p[0]-30*p[1]+24*p[2]-6*p[3]+x*(-3*p[0]+9*p[1]-9*p[2]+3*p[3])))/6
- * 
- */
-
-  /* function exit code */
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "MMTK_BSpline_transform_grid.pyx":69
- *   # the following functions are used to calculate gradients (first derivative)
- * 
- *     cdef float_t derivateOfIntp_X(self,float_t p[4][4][4],float_t x,float_t y,float_t z):             # <<<<<<<<<<<<<<
- *         cdef float_t arr[4]
- *         arr[0] = self.bisplineInterpolate(p[0], y, z)
- */
-
-static __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_f_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm_derivateOfIntp_X(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *__pyx_v_self, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*__pyx_v_p)[4][4], __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_x, __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_y, __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_z) {
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_arr[4];
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_r;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("derivateOfIntp_X", 0);
-
-  /* "MMTK_BSpline_transform_grid.pyx":71
- *     cdef float_t derivateOfIntp_X(self,float_t p[4][4][4],float_t x,float_t y,float_t z):
- *         cdef float_t arr[4]
- *         arr[0] = self.bisplineInterpolate(p[0], y, z)             # <<<<<<<<<<<<<<
- *         arr[1] = self.bisplineInterpolate(p[1], y, z)
- *         arr[2] = self.bisplineInterpolate(p[2], y, z)
- */
-  (__pyx_v_arr[0]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->bisplineInterpolate(__pyx_v_self, (__pyx_v_p[0]), __pyx_v_y, __pyx_v_z);
-
-  /* "MMTK_BSpline_transform_grid.pyx":72
- *         cdef float_t arr[4]
- *         arr[0] = self.bisplineInterpolate(p[0], y, z)
- *         arr[1] = self.bisplineInterpolate(p[1], y, z)             # <<<<<<<<<<<<<<
- *         arr[2] = self.bisplineInterpolate(p[2], y, z)
- *         arr[3] = self.bisplineInterpolate(p[3], y, z)
- */
-  (__pyx_v_arr[1]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->bisplineInterpolate(__pyx_v_self, (__pyx_v_p[1]), __pyx_v_y, __pyx_v_z);
-
-  /* "MMTK_BSpline_transform_grid.pyx":73
- *         arr[0] = self.bisplineInterpolate(p[0], y, z)
- *         arr[1] = self.bisplineInterpolate(p[1], y, z)
- *         arr[2] = self.bisplineInterpolate(p[2], y, z)             # <<<<<<<<<<<<<<
- *         arr[3] = self.bisplineInterpolate(p[3], y, z)
- *         return self.derivateOfIntp(arr, x)
- */
-  (__pyx_v_arr[2]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->bisplineInterpolate(__pyx_v_self, (__pyx_v_p[2]), __pyx_v_y, __pyx_v_z);
-
-  /* "MMTK_BSpline_transform_grid.pyx":74
- *         arr[1] = self.bisplineInterpolate(p[1], y, z)
- *         arr[2] = self.bisplineInterpolate(p[2], y, z)
- *         arr[3] = self.bisplineInterpolate(p[3], y, z)             # <<<<<<<<<<<<<<
- *         return self.derivateOfIntp(arr, x)
- * 
- */
-  (__pyx_v_arr[3]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->bisplineInterpolate(__pyx_v_self, (__pyx_v_p[3]), __pyx_v_y, __pyx_v_z);
-
-  /* "MMTK_BSpline_transform_grid.pyx":75
- *         arr[2] = self.bisplineInterpolate(p[2], y, z)
- *         arr[3] = self.bisplineInterpolate(p[3], y, z)
- *         return self.derivateOfIntp(arr, x)             # <<<<<<<<<<<<<<
- * 
- *     cdef float_t derivateOfIntp_Y_2(self,float_t p[4][4],float_t x,float_t y):
- */
-  __pyx_r = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->derivateOfIntp(__pyx_v_self, __pyx_v_arr, __pyx_v_x);
-  goto __pyx_L0;
-
-  /* "MMTK_BSpline_transform_grid.pyx":69
- *   # the following functions are used to calculate gradients (first derivative)
- * 
- *     cdef float_t derivateOfIntp_X(self,float_t p[4][4][4],float_t x,float_t y,float_t z):             # <<<<<<<<<<<<<<
- *         cdef float_t arr[4]
- *         arr[0] = self.bisplineInterpolate(p[0], y, z)
- */
-
-  /* function exit code */
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "MMTK_BSpline_transform_grid.pyx":77
- *         return self.derivateOfIntp(arr, x)
- * 
- *     cdef float_t derivateOfIntp_Y_2(self,float_t p[4][4],float_t x,float_t y):             # <<<<<<<<<<<<<<
- *         cdef float_t arr[4]
- *         arr[0] = self.splineInterpolate(p[0], y)
- */
-
-static __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_f_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm_derivateOfIntp_Y_2(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *__pyx_v_self, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*__pyx_v_p)[4], __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_x, __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_y) {
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_arr[4];
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_r;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("derivateOfIntp_Y_2", 0);
-
-  /* "MMTK_BSpline_transform_grid.pyx":79
- *     cdef float_t derivateOfIntp_Y_2(self,float_t p[4][4],float_t x,float_t y):
- *         cdef float_t arr[4]
- *         arr[0] = self.splineInterpolate(p[0], y)             # <<<<<<<<<<<<<<
- *         arr[1] = self.splineInterpolate(p[1], y)
- *         arr[2] = self.splineInterpolate(p[2], y)
- */
-  (__pyx_v_arr[0]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->splineInterpolate(__pyx_v_self, (__pyx_v_p[0]), __pyx_v_y);
-
-  /* "MMTK_BSpline_transform_grid.pyx":80
- *         cdef float_t arr[4]
- *         arr[0] = self.splineInterpolate(p[0], y)
- *         arr[1] = self.splineInterpolate(p[1], y)             # <<<<<<<<<<<<<<
- *         arr[2] = self.splineInterpolate(p[2], y)
- *         arr[3] = self.splineInterpolate(p[3], y)
- */
-  (__pyx_v_arr[1]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->splineInterpolate(__pyx_v_self, (__pyx_v_p[1]), __pyx_v_y);
-
-  /* "MMTK_BSpline_transform_grid.pyx":81
- *         arr[0] = self.splineInterpolate(p[0], y)
- *         arr[1] = self.splineInterpolate(p[1], y)
- *         arr[2] = self.splineInterpolate(p[2], y)             # <<<<<<<<<<<<<<
- *         arr[3] = self.splineInterpolate(p[3], y)
- *         return self.derivateOfIntp(arr, x)
- */
-  (__pyx_v_arr[2]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->splineInterpolate(__pyx_v_self, (__pyx_v_p[2]), __pyx_v_y);
-
-  /* "MMTK_BSpline_transform_grid.pyx":82
- *         arr[1] = self.splineInterpolate(p[1], y)
- *         arr[2] = self.splineInterpolate(p[2], y)
- *         arr[3] = self.splineInterpolate(p[3], y)             # <<<<<<<<<<<<<<
- *         return self.derivateOfIntp(arr, x)
- * 
- */
-  (__pyx_v_arr[3]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->splineInterpolate(__pyx_v_self, (__pyx_v_p[3]), __pyx_v_y);
-
-  /* "MMTK_BSpline_transform_grid.pyx":83
- *         arr[2] = self.splineInterpolate(p[2], y)
- *         arr[3] = self.splineInterpolate(p[3], y)
- *         return self.derivateOfIntp(arr, x)             # <<<<<<<<<<<<<<
- * 
- *     cdef float_t derivateOfIntp_Y(self,float_t p[4][4][4],float_t x,float_t y,float_t z):
- */
-  __pyx_r = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->derivateOfIntp(__pyx_v_self, __pyx_v_arr, __pyx_v_x);
-  goto __pyx_L0;
-
-  /* "MMTK_BSpline_transform_grid.pyx":77
- *         return self.derivateOfIntp(arr, x)
- * 
- *     cdef float_t derivateOfIntp_Y_2(self,float_t p[4][4],float_t x,float_t y):             # <<<<<<<<<<<<<<
- *         cdef float_t arr[4]
- *         arr[0] = self.splineInterpolate(p[0], y)
- */
-
-  /* function exit code */
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "MMTK_BSpline_transform_grid.pyx":85
- *         return self.derivateOfIntp(arr, x)
- * 
- *     cdef float_t derivateOfIntp_Y(self,float_t p[4][4][4],float_t x,float_t y,float_t z):             # <<<<<<<<<<<<<<
- *         cdef float_t arr[4]
- *         arr[0] = self.derivateOfIntp_Y_2(p[0], y, z)
- */
-
-static __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_f_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm_derivateOfIntp_Y(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *__pyx_v_self, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*__pyx_v_p)[4][4], __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_x, __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_y, __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_z) {
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_arr[4];
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_r;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("derivateOfIntp_Y", 0);
-
-  /* "MMTK_BSpline_transform_grid.pyx":87
- *     cdef float_t derivateOfIntp_Y(self,float_t p[4][4][4],float_t x,float_t y,float_t z):
- *         cdef float_t arr[4]
- *         arr[0] = self.derivateOfIntp_Y_2(p[0], y, z)             # <<<<<<<<<<<<<<
- *         arr[1] = self.derivateOfIntp_Y_2(p[1], y, z)
- *         arr[2] = self.derivateOfIntp_Y_2(p[2], y, z)
- */
-  (__pyx_v_arr[0]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->derivateOfIntp_Y_2(__pyx_v_self, (__pyx_v_p[0]), __pyx_v_y, __pyx_v_z);
-
-  /* "MMTK_BSpline_transform_grid.pyx":88
- *         cdef float_t arr[4]
- *         arr[0] = self.derivateOfIntp_Y_2(p[0], y, z)
- *         arr[1] = self.derivateOfIntp_Y_2(p[1], y, z)             # <<<<<<<<<<<<<<
- *         arr[2] = self.derivateOfIntp_Y_2(p[2], y, z)
- *         arr[3] = self.derivateOfIntp_Y_2(p[3], y, z)
- */
-  (__pyx_v_arr[1]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->derivateOfIntp_Y_2(__pyx_v_self, (__pyx_v_p[1]), __pyx_v_y, __pyx_v_z);
-
-  /* "MMTK_BSpline_transform_grid.pyx":89
- *         arr[0] = self.derivateOfIntp_Y_2(p[0], y, z)
- *         arr[1] = self.derivateOfIntp_Y_2(p[1], y, z)
- *         arr[2] = self.derivateOfIntp_Y_2(p[2], y, z)             # <<<<<<<<<<<<<<
- *         arr[3] = self.derivateOfIntp_Y_2(p[3], y, z)
- *         return self.splineInterpolate(arr, x)
- */
-  (__pyx_v_arr[2]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->derivateOfIntp_Y_2(__pyx_v_self, (__pyx_v_p[2]), __pyx_v_y, __pyx_v_z);
-
-  /* "MMTK_BSpline_transform_grid.pyx":90
- *         arr[1] = self.derivateOfIntp_Y_2(p[1], y, z)
- *         arr[2] = self.derivateOfIntp_Y_2(p[2], y, z)
- *         arr[3] = self.derivateOfIntp_Y_2(p[3], y, z)             # <<<<<<<<<<<<<<
- *         return self.splineInterpolate(arr, x)
- *     cdef float_t derivateOfIntp_Z_2(self,float_t p[4][4],float_t x,float_t y):
- */
-  (__pyx_v_arr[3]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->derivateOfIntp_Y_2(__pyx_v_self, (__pyx_v_p[3]), __pyx_v_y, __pyx_v_z);
-
-  /* "MMTK_BSpline_transform_grid.pyx":91
- *         arr[2] = self.derivateOfIntp_Y_2(p[2], y, z)
- *         arr[3] = self.derivateOfIntp_Y_2(p[3], y, z)
- *         return self.splineInterpolate(arr, x)             # <<<<<<<<<<<<<<
- *     cdef float_t derivateOfIntp_Z_2(self,float_t p[4][4],float_t x,float_t y):
- *         cdef float_t arr[4]
- */
-  __pyx_r = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->splineInterpolate(__pyx_v_self, __pyx_v_arr, __pyx_v_x);
-  goto __pyx_L0;
-
-  /* "MMTK_BSpline_transform_grid.pyx":85
- *         return self.derivateOfIntp(arr, x)
- * 
- *     cdef float_t derivateOfIntp_Y(self,float_t p[4][4][4],float_t x,float_t y,float_t z):             # <<<<<<<<<<<<<<
- *         cdef float_t arr[4]
- *         arr[0] = self.derivateOfIntp_Y_2(p[0], y, z)
- */
-
-  /* function exit code */
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "MMTK_BSpline_transform_grid.pyx":92
- *         arr[3] = self.derivateOfIntp_Y_2(p[3], y, z)
- *         return self.splineInterpolate(arr, x)
- *     cdef float_t derivateOfIntp_Z_2(self,float_t p[4][4],float_t x,float_t y):             # <<<<<<<<<<<<<<
- *         cdef float_t arr[4]
- *         arr[0] = self.derivateOfIntp(p[0], y)
- */
-
-static __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_f_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm_derivateOfIntp_Z_2(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *__pyx_v_self, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*__pyx_v_p)[4], __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_x, __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_y) {
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_arr[4];
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_r;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("derivateOfIntp_Z_2", 0);
-
-  /* "MMTK_BSpline_transform_grid.pyx":94
- *     cdef float_t derivateOfIntp_Z_2(self,float_t p[4][4],float_t x,float_t y):
- *         cdef float_t arr[4]
- *         arr[0] = self.derivateOfIntp(p[0], y)             # <<<<<<<<<<<<<<
- *         arr[1] = self.derivateOfIntp(p[1], y)
- *         arr[2] = self.derivateOfIntp(p[2], y)
- */
-  (__pyx_v_arr[0]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->derivateOfIntp(__pyx_v_self, (__pyx_v_p[0]), __pyx_v_y);
-
-  /* "MMTK_BSpline_transform_grid.pyx":95
- *         cdef float_t arr[4]
- *         arr[0] = self.derivateOfIntp(p[0], y)
- *         arr[1] = self.derivateOfIntp(p[1], y)             # <<<<<<<<<<<<<<
- *         arr[2] = self.derivateOfIntp(p[2], y)
- *         arr[3] = self.derivateOfIntp(p[3], y)
- */
-  (__pyx_v_arr[1]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->derivateOfIntp(__pyx_v_self, (__pyx_v_p[1]), __pyx_v_y);
-
-  /* "MMTK_BSpline_transform_grid.pyx":96
- *         arr[0] = self.derivateOfIntp(p[0], y)
- *         arr[1] = self.derivateOfIntp(p[1], y)
- *         arr[2] = self.derivateOfIntp(p[2], y)             # <<<<<<<<<<<<<<
- *         arr[3] = self.derivateOfIntp(p[3], y)
- *         return self.splineInterpolate(arr, x)
- */
-  (__pyx_v_arr[2]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->derivateOfIntp(__pyx_v_self, (__pyx_v_p[2]), __pyx_v_y);
-
-  /* "MMTK_BSpline_transform_grid.pyx":97
- *         arr[1] = self.derivateOfIntp(p[1], y)
- *         arr[2] = self.derivateOfIntp(p[2], y)
- *         arr[3] = self.derivateOfIntp(p[3], y)             # <<<<<<<<<<<<<<
- *         return self.splineInterpolate(arr, x)
- *     cdef float_t derivateOfIntp_Z(self,float_t p[4][4][4],float_t x,float_t y,float_t z):
- */
-  (__pyx_v_arr[3]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->derivateOfIntp(__pyx_v_self, (__pyx_v_p[3]), __pyx_v_y);
-
-  /* "MMTK_BSpline_transform_grid.pyx":98
- *         arr[2] = self.derivateOfIntp(p[2], y)
- *         arr[3] = self.derivateOfIntp(p[3], y)
- *         return self.splineInterpolate(arr, x)             # <<<<<<<<<<<<<<
- *     cdef float_t derivateOfIntp_Z(self,float_t p[4][4][4],float_t x,float_t y,float_t z):
- *         cdef float_t arr[4]
- */
-  __pyx_r = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->splineInterpolate(__pyx_v_self, __pyx_v_arr, __pyx_v_x);
-  goto __pyx_L0;
-
-  /* "MMTK_BSpline_transform_grid.pyx":92
- *         arr[3] = self.derivateOfIntp_Y_2(p[3], y, z)
- *         return self.splineInterpolate(arr, x)
- *     cdef float_t derivateOfIntp_Z_2(self,float_t p[4][4],float_t x,float_t y):             # <<<<<<<<<<<<<<
- *         cdef float_t arr[4]
- *         arr[0] = self.derivateOfIntp(p[0], y)
- */
-
-  /* function exit code */
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "MMTK_BSpline_transform_grid.pyx":99
- *         arr[3] = self.derivateOfIntp(p[3], y)
- *         return self.splineInterpolate(arr, x)
- *     cdef float_t derivateOfIntp_Z(self,float_t p[4][4][4],float_t x,float_t y,float_t z):             # <<<<<<<<<<<<<<
- *         cdef float_t arr[4]
- *         arr[0] = self.derivateOfIntp_Z_2(p[0], y, z)
- */
-
-static __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_f_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm_derivateOfIntp_Z(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *__pyx_v_self, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*__pyx_v_p)[4][4], __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_x, __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_y, __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_z) {
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_arr[4];
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_r;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("derivateOfIntp_Z", 0);
-
-  /* "MMTK_BSpline_transform_grid.pyx":101
- *     cdef float_t derivateOfIntp_Z(self,float_t p[4][4][4],float_t x,float_t y,float_t z):
- *         cdef float_t arr[4]
- *         arr[0] = self.derivateOfIntp_Z_2(p[0], y, z)             # <<<<<<<<<<<<<<
- *         arr[1] = self.derivateOfIntp_Z_2(p[1], y, z)
- *         arr[2] = self.derivateOfIntp_Z_2(p[2], y, z)
- */
-  (__pyx_v_arr[0]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->derivateOfIntp_Z_2(__pyx_v_self, (__pyx_v_p[0]), __pyx_v_y, __pyx_v_z);
-
-  /* "MMTK_BSpline_transform_grid.pyx":102
- *         cdef float_t arr[4]
- *         arr[0] = self.derivateOfIntp_Z_2(p[0], y, z)
- *         arr[1] = self.derivateOfIntp_Z_2(p[1], y, z)             # <<<<<<<<<<<<<<
- *         arr[2] = self.derivateOfIntp_Z_2(p[2], y, z)
- *         arr[3] = self.derivateOfIntp_Z_2(p[3], y, z)
- */
-  (__pyx_v_arr[1]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->derivateOfIntp_Z_2(__pyx_v_self, (__pyx_v_p[1]), __pyx_v_y, __pyx_v_z);
-
-  /* "MMTK_BSpline_transform_grid.pyx":103
- *         arr[0] = self.derivateOfIntp_Z_2(p[0], y, z)
- *         arr[1] = self.derivateOfIntp_Z_2(p[1], y, z)
- *         arr[2] = self.derivateOfIntp_Z_2(p[2], y, z)             # <<<<<<<<<<<<<<
- *         arr[3] = self.derivateOfIntp_Z_2(p[3], y, z)
- *         return self.splineInterpolate(arr, x)
- */
-  (__pyx_v_arr[2]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->derivateOfIntp_Z_2(__pyx_v_self, (__pyx_v_p[2]), __pyx_v_y, __pyx_v_z);
-
-  /* "MMTK_BSpline_transform_grid.pyx":104
- *         arr[1] = self.derivateOfIntp_Z_2(p[1], y, z)
- *         arr[2] = self.derivateOfIntp_Z_2(p[2], y, z)
- *         arr[3] = self.derivateOfIntp_Z_2(p[3], y, z)             # <<<<<<<<<<<<<<
- *         return self.splineInterpolate(arr, x)
- * 
- */
-  (__pyx_v_arr[3]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->derivateOfIntp_Z_2(__pyx_v_self, (__pyx_v_p[3]), __pyx_v_y, __pyx_v_z);
-
-  /* "MMTK_BSpline_transform_grid.pyx":105
- *         arr[2] = self.derivateOfIntp_Z_2(p[2], y, z)
- *         arr[3] = self.derivateOfIntp_Z_2(p[3], y, z)
- *         return self.splineInterpolate(arr, x)             # <<<<<<<<<<<<<<
- * 
- * # the following functions are used to calculate the Hessian (second derivative matrix)
- */
-  __pyx_r = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->splineInterpolate(__pyx_v_self, __pyx_v_arr, __pyx_v_x);
-  goto __pyx_L0;
-
-  /* "MMTK_BSpline_transform_grid.pyx":99
- *         arr[3] = self.derivateOfIntp(p[3], y)
- *         return self.splineInterpolate(arr, x)
- *     cdef float_t derivateOfIntp_Z(self,float_t p[4][4][4],float_t x,float_t y,float_t z):             # <<<<<<<<<<<<<<
- *         cdef float_t arr[4]
- *         arr[0] = self.derivateOfIntp_Z_2(p[0], y, z)
- */
-
-  /* function exit code */
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "MMTK_BSpline_transform_grid.pyx":109
- * # the following functions are used to calculate the Hessian (second derivative matrix)
- * 
- *     cdef float_t derivateOfIntp_mm(self,float_t p[4],float_t x):             # <<<<<<<<<<<<<<
- *         return (12*p[0]-30*p[1]+24*p[2]-6*p[3]+x*(-6*p[0]+18*p[1]-18*p[2]+6*p[3]))/6
- * 
- */
-
-static __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_f_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm_derivateOfIntp_mm(CYTHON_UNUSED struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *__pyx_v_self, __pyx_t_27MMTK_BSpline_transform_grid_float_t *__pyx_v_p, __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_x) {
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_r;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("derivateOfIntp_mm", 0);
-
-  /* "MMTK_BSpline_transform_grid.pyx":110
- * 
- *     cdef float_t derivateOfIntp_mm(self,float_t p[4],float_t x):
- *         return (12*p[0]-30*p[1]+24*p[2]-6*p[3]+x*(-6*p[0]+18*p[1]-18*p[2]+6*p[3]))/6             # <<<<<<<<<<<<<<
- * 
- * # calculate the dvdxdx
- */
-  __pyx_r = ((((((12.0 * (__pyx_v_p[0])) - (30.0 * (__pyx_v_p[1]))) + (24.0 * (__pyx_v_p[2]))) - (6.0 * (__pyx_v_p[3]))) + (__pyx_v_x * ((((-6.0 * (__pyx_v_p[0])) + (18.0 * (__pyx_v_p[1]))) - (18.0 * (__pyx_v_p[2]))) + (6.0 * (__pyx_v_p[3]))))) / 6.0);
-  goto __pyx_L0;
-
-  /* "MMTK_BSpline_transform_grid.pyx":109
- * # the following functions are used to calculate the Hessian (second derivative matrix)
- * 
- *     cdef float_t derivateOfIntp_mm(self,float_t p[4],float_t x):             # <<<<<<<<<<<<<<
- *         return (12*p[0]-30*p[1]+24*p[2]-6*p[3]+x*(-6*p[0]+18*p[1]-18*p[2]+6*p[3]))/6
- * 
- */
-
-  /* function exit code */
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "MMTK_BSpline_transform_grid.pyx":113
- * 
- * # calculate the dvdxdx
- *     cdef float_t derivateOfIntp_XX(self,float_t p[4][4][4],float_t x,float_t y,float_t z):             # <<<<<<<<<<<<<<
- *         cdef float_t arr[4]
- *         arr[0] = self.bisplineInterpolate(p[0], y, z)
- */
-
-static __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_f_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm_derivateOfIntp_XX(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *__pyx_v_self, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*__pyx_v_p)[4][4], __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_x, __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_y, __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_z) {
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_arr[4];
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_r;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("derivateOfIntp_XX", 0);
-
-  /* "MMTK_BSpline_transform_grid.pyx":115
- *     cdef float_t derivateOfIntp_XX(self,float_t p[4][4][4],float_t x,float_t y,float_t z):
- *         cdef float_t arr[4]
- *         arr[0] = self.bisplineInterpolate(p[0], y, z)             # <<<<<<<<<<<<<<
- *         arr[1] = self.bisplineInterpolate(p[1], y, z)
- *         arr[2] = self.bisplineInterpolate(p[2], y, z)
- */
-  (__pyx_v_arr[0]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->bisplineInterpolate(__pyx_v_self, (__pyx_v_p[0]), __pyx_v_y, __pyx_v_z);
-
-  /* "MMTK_BSpline_transform_grid.pyx":116
- *         cdef float_t arr[4]
- *         arr[0] = self.bisplineInterpolate(p[0], y, z)
- *         arr[1] = self.bisplineInterpolate(p[1], y, z)             # <<<<<<<<<<<<<<
- *         arr[2] = self.bisplineInterpolate(p[2], y, z)
- *         arr[3] = self.bisplineInterpolate(p[3], y, z)
- */
-  (__pyx_v_arr[1]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->bisplineInterpolate(__pyx_v_self, (__pyx_v_p[1]), __pyx_v_y, __pyx_v_z);
-
-  /* "MMTK_BSpline_transform_grid.pyx":117
- *         arr[0] = self.bisplineInterpolate(p[0], y, z)
- *         arr[1] = self.bisplineInterpolate(p[1], y, z)
- *         arr[2] = self.bisplineInterpolate(p[2], y, z)             # <<<<<<<<<<<<<<
- *         arr[3] = self.bisplineInterpolate(p[3], y, z)
- *         return self.derivateOfIntp_mm(arr, x)
- */
-  (__pyx_v_arr[2]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->bisplineInterpolate(__pyx_v_self, (__pyx_v_p[2]), __pyx_v_y, __pyx_v_z);
-
-  /* "MMTK_BSpline_transform_grid.pyx":118
- *         arr[1] = self.bisplineInterpolate(p[1], y, z)
- *         arr[2] = self.bisplineInterpolate(p[2], y, z)
- *         arr[3] = self.bisplineInterpolate(p[3], y, z)             # <<<<<<<<<<<<<<
- *         return self.derivateOfIntp_mm(arr, x)
- * 
- */
-  (__pyx_v_arr[3]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->bisplineInterpolate(__pyx_v_self, (__pyx_v_p[3]), __pyx_v_y, __pyx_v_z);
-
-  /* "MMTK_BSpline_transform_grid.pyx":119
- *         arr[2] = self.bisplineInterpolate(p[2], y, z)
- *         arr[3] = self.bisplineInterpolate(p[3], y, z)
- *         return self.derivateOfIntp_mm(arr, x)             # <<<<<<<<<<<<<<
- * 
- * # calculate the dvdxdy
- */
-  __pyx_r = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->derivateOfIntp_mm(__pyx_v_self, __pyx_v_arr, __pyx_v_x);
-  goto __pyx_L0;
-
-  /* "MMTK_BSpline_transform_grid.pyx":113
- * 
- * # calculate the dvdxdx
- *     cdef float_t derivateOfIntp_XX(self,float_t p[4][4][4],float_t x,float_t y,float_t z):             # <<<<<<<<<<<<<<
- *         cdef float_t arr[4]
- *         arr[0] = self.bisplineInterpolate(p[0], y, z)
- */
-
-  /* function exit code */
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "MMTK_BSpline_transform_grid.pyx":122
- * 
- * # calculate the dvdxdy
- *     cdef float_t derivateOfIntp_XY_2(self,float_t p[4][4],float_t x,float_t y):             # <<<<<<<<<<<<<<
- *         cdef float_t arr[4]
- *         arr[0] = self.splineInterpolate(p[0], y)
- */
-
-static __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_f_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm_derivateOfIntp_XY_2(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *__pyx_v_self, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*__pyx_v_p)[4], __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_x, __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_y) {
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_arr[4];
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_r;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("derivateOfIntp_XY_2", 0);
-
-  /* "MMTK_BSpline_transform_grid.pyx":124
- *     cdef float_t derivateOfIntp_XY_2(self,float_t p[4][4],float_t x,float_t y):
- *         cdef float_t arr[4]
- *         arr[0] = self.splineInterpolate(p[0], y)             # <<<<<<<<<<<<<<
- *         arr[1] = self.splineInterpolate(p[1], y)
- *         arr[2] = self.splineInterpolate(p[2], y)
- */
-  (__pyx_v_arr[0]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->splineInterpolate(__pyx_v_self, (__pyx_v_p[0]), __pyx_v_y);
-
-  /* "MMTK_BSpline_transform_grid.pyx":125
- *         cdef float_t arr[4]
- *         arr[0] = self.splineInterpolate(p[0], y)
- *         arr[1] = self.splineInterpolate(p[1], y)             # <<<<<<<<<<<<<<
- *         arr[2] = self.splineInterpolate(p[2], y)
- *         arr[3] = self.splineInterpolate(p[3], y)
- */
-  (__pyx_v_arr[1]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->splineInterpolate(__pyx_v_self, (__pyx_v_p[1]), __pyx_v_y);
-
-  /* "MMTK_BSpline_transform_grid.pyx":126
- *         arr[0] = self.splineInterpolate(p[0], y)
- *         arr[1] = self.splineInterpolate(p[1], y)
- *         arr[2] = self.splineInterpolate(p[2], y)             # <<<<<<<<<<<<<<
- *         arr[3] = self.splineInterpolate(p[3], y)
- *         return self.derivateOfIntp(arr, x)
- */
-  (__pyx_v_arr[2]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->splineInterpolate(__pyx_v_self, (__pyx_v_p[2]), __pyx_v_y);
-
-  /* "MMTK_BSpline_transform_grid.pyx":127
- *         arr[1] = self.splineInterpolate(p[1], y)
- *         arr[2] = self.splineInterpolate(p[2], y)
- *         arr[3] = self.splineInterpolate(p[3], y)             # <<<<<<<<<<<<<<
- *         return self.derivateOfIntp(arr, x)
- * 
- */
-  (__pyx_v_arr[3]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->splineInterpolate(__pyx_v_self, (__pyx_v_p[3]), __pyx_v_y);
-
-  /* "MMTK_BSpline_transform_grid.pyx":128
- *         arr[2] = self.splineInterpolate(p[2], y)
- *         arr[3] = self.splineInterpolate(p[3], y)
- *         return self.derivateOfIntp(arr, x)             # <<<<<<<<<<<<<<
- * 
- *     cdef float_t derivateOfIntp_XY(self,float_t p[4][4][4],float_t x,float_t y,float_t z):
- */
-  __pyx_r = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->derivateOfIntp(__pyx_v_self, __pyx_v_arr, __pyx_v_x);
-  goto __pyx_L0;
-
-  /* "MMTK_BSpline_transform_grid.pyx":122
- * 
- * # calculate the dvdxdy
- *     cdef float_t derivateOfIntp_XY_2(self,float_t p[4][4],float_t x,float_t y):             # <<<<<<<<<<<<<<
- *         cdef float_t arr[4]
- *         arr[0] = self.splineInterpolate(p[0], y)
- */
-
-  /* function exit code */
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "MMTK_BSpline_transform_grid.pyx":130
- *         return self.derivateOfIntp(arr, x)
- * 
- *     cdef float_t derivateOfIntp_XY(self,float_t p[4][4][4],float_t x,float_t y,float_t z):             # <<<<<<<<<<<<<<
- *         cdef float_t arr[4]
- *         arr[0] = self.derivateOfIntp_XY_2(p[0], y, z)
- */
-
-static __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_f_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm_derivateOfIntp_XY(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *__pyx_v_self, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*__pyx_v_p)[4][4], __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_x, __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_y, __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_z) {
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_arr[4];
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_r;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("derivateOfIntp_XY", 0);
-
-  /* "MMTK_BSpline_transform_grid.pyx":132
- *     cdef float_t derivateOfIntp_XY(self,float_t p[4][4][4],float_t x,float_t y,float_t z):
- *         cdef float_t arr[4]
- *         arr[0] = self.derivateOfIntp_XY_2(p[0], y, z)             # <<<<<<<<<<<<<<
- *         arr[1] = self.derivateOfIntp_XY_2(p[1], y, z)
- *         arr[2] = self.derivateOfIntp_XY_2(p[2], y, z)
- */
-  (__pyx_v_arr[0]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->derivateOfIntp_XY_2(__pyx_v_self, (__pyx_v_p[0]), __pyx_v_y, __pyx_v_z);
-
-  /* "MMTK_BSpline_transform_grid.pyx":133
- *         cdef float_t arr[4]
- *         arr[0] = self.derivateOfIntp_XY_2(p[0], y, z)
- *         arr[1] = self.derivateOfIntp_XY_2(p[1], y, z)             # <<<<<<<<<<<<<<
- *         arr[2] = self.derivateOfIntp_XY_2(p[2], y, z)
- *         arr[3] = self.derivateOfIntp_XY_2(p[3], y, z)
- */
-  (__pyx_v_arr[1]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->derivateOfIntp_XY_2(__pyx_v_self, (__pyx_v_p[1]), __pyx_v_y, __pyx_v_z);
-
-  /* "MMTK_BSpline_transform_grid.pyx":134
- *         arr[0] = self.derivateOfIntp_XY_2(p[0], y, z)
- *         arr[1] = self.derivateOfIntp_XY_2(p[1], y, z)
- *         arr[2] = self.derivateOfIntp_XY_2(p[2], y, z)             # <<<<<<<<<<<<<<
- *         arr[3] = self.derivateOfIntp_XY_2(p[3], y, z)
- *         return self.derivateOfIntp(arr, x)
- */
-  (__pyx_v_arr[2]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->derivateOfIntp_XY_2(__pyx_v_self, (__pyx_v_p[2]), __pyx_v_y, __pyx_v_z);
-
-  /* "MMTK_BSpline_transform_grid.pyx":135
- *         arr[1] = self.derivateOfIntp_XY_2(p[1], y, z)
- *         arr[2] = self.derivateOfIntp_XY_2(p[2], y, z)
- *         arr[3] = self.derivateOfIntp_XY_2(p[3], y, z)             # <<<<<<<<<<<<<<
- *         return self.derivateOfIntp(arr, x)
- * 
- */
-  (__pyx_v_arr[3]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->derivateOfIntp_XY_2(__pyx_v_self, (__pyx_v_p[3]), __pyx_v_y, __pyx_v_z);
-
-  /* "MMTK_BSpline_transform_grid.pyx":136
- *         arr[2] = self.derivateOfIntp_XY_2(p[2], y, z)
- *         arr[3] = self.derivateOfIntp_XY_2(p[3], y, z)
- *         return self.derivateOfIntp(arr, x)             # <<<<<<<<<<<<<<
- * 
- * # calculate the dvdxdz
- */
-  __pyx_r = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->derivateOfIntp(__pyx_v_self, __pyx_v_arr, __pyx_v_x);
-  goto __pyx_L0;
-
-  /* "MMTK_BSpline_transform_grid.pyx":130
- *         return self.derivateOfIntp(arr, x)
- * 
- *     cdef float_t derivateOfIntp_XY(self,float_t p[4][4][4],float_t x,float_t y,float_t z):             # <<<<<<<<<<<<<<
- *         cdef float_t arr[4]
- *         arr[0] = self.derivateOfIntp_XY_2(p[0], y, z)
- */
-
-  /* function exit code */
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "MMTK_BSpline_transform_grid.pyx":139
- * 
- * # calculate the dvdxdz
- *     cdef float_t derivateOfIntp_XZ_2(self,float_t p[4][4],float_t x,float_t y):             # <<<<<<<<<<<<<<
- *         cdef float_t arr[4]
- *         arr[0] = self.derivateOfIntp(p[0], y)
- */
-
-static __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_f_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm_derivateOfIntp_XZ_2(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *__pyx_v_self, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*__pyx_v_p)[4], __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_x, __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_y) {
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_arr[4];
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_r;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("derivateOfIntp_XZ_2", 0);
-
-  /* "MMTK_BSpline_transform_grid.pyx":141
- *     cdef float_t derivateOfIntp_XZ_2(self,float_t p[4][4],float_t x,float_t y):
- *         cdef float_t arr[4]
- *         arr[0] = self.derivateOfIntp(p[0], y)             # <<<<<<<<<<<<<<
- *         arr[1] = self.derivateOfIntp(p[1], y)
- *         arr[2] = self.derivateOfIntp(p[2], y)
- */
-  (__pyx_v_arr[0]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->derivateOfIntp(__pyx_v_self, (__pyx_v_p[0]), __pyx_v_y);
-
-  /* "MMTK_BSpline_transform_grid.pyx":142
- *         cdef float_t arr[4]
- *         arr[0] = self.derivateOfIntp(p[0], y)
- *         arr[1] = self.derivateOfIntp(p[1], y)             # <<<<<<<<<<<<<<
- *         arr[2] = self.derivateOfIntp(p[2], y)
- *         arr[3] = self.derivateOfIntp(p[3], y)
- */
-  (__pyx_v_arr[1]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->derivateOfIntp(__pyx_v_self, (__pyx_v_p[1]), __pyx_v_y);
-
-  /* "MMTK_BSpline_transform_grid.pyx":143
- *         arr[0] = self.derivateOfIntp(p[0], y)
- *         arr[1] = self.derivateOfIntp(p[1], y)
- *         arr[2] = self.derivateOfIntp(p[2], y)             # <<<<<<<<<<<<<<
- *         arr[3] = self.derivateOfIntp(p[3], y)
- *         return self.splineInterpolate(arr, x)
- */
-  (__pyx_v_arr[2]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->derivateOfIntp(__pyx_v_self, (__pyx_v_p[2]), __pyx_v_y);
-
-  /* "MMTK_BSpline_transform_grid.pyx":144
- *         arr[1] = self.derivateOfIntp(p[1], y)
- *         arr[2] = self.derivateOfIntp(p[2], y)
- *         arr[3] = self.derivateOfIntp(p[3], y)             # <<<<<<<<<<<<<<
- *         return self.splineInterpolate(arr, x)
- * 
- */
-  (__pyx_v_arr[3]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->derivateOfIntp(__pyx_v_self, (__pyx_v_p[3]), __pyx_v_y);
-
-  /* "MMTK_BSpline_transform_grid.pyx":145
- *         arr[2] = self.derivateOfIntp(p[2], y)
- *         arr[3] = self.derivateOfIntp(p[3], y)
- *         return self.splineInterpolate(arr, x)             # <<<<<<<<<<<<<<
- * 
- *     cdef float_t derivateOfIntp_XZ(self,float_t p[4][4][4],float_t x,float_t y,float_t z):
- */
-  __pyx_r = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->splineInterpolate(__pyx_v_self, __pyx_v_arr, __pyx_v_x);
-  goto __pyx_L0;
-
-  /* "MMTK_BSpline_transform_grid.pyx":139
- * 
- * # calculate the dvdxdz
- *     cdef float_t derivateOfIntp_XZ_2(self,float_t p[4][4],float_t x,float_t y):             # <<<<<<<<<<<<<<
- *         cdef float_t arr[4]
- *         arr[0] = self.derivateOfIntp(p[0], y)
- */
-
-  /* function exit code */
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "MMTK_BSpline_transform_grid.pyx":147
- *         return self.splineInterpolate(arr, x)
- * 
- *     cdef float_t derivateOfIntp_XZ(self,float_t p[4][4][4],float_t x,float_t y,float_t z):             # <<<<<<<<<<<<<<
- *         cdef float_t arr[4]
- *         arr[0] = self.derivateOfIntp_XZ_2(p[0], y, z)
- */
-
-static __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_f_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm_derivateOfIntp_XZ(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *__pyx_v_self, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*__pyx_v_p)[4][4], __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_x, __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_y, __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_z) {
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_arr[4];
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_r;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("derivateOfIntp_XZ", 0);
-
-  /* "MMTK_BSpline_transform_grid.pyx":149
- *     cdef float_t derivateOfIntp_XZ(self,float_t p[4][4][4],float_t x,float_t y,float_t z):
- *         cdef float_t arr[4]
- *         arr[0] = self.derivateOfIntp_XZ_2(p[0], y, z)             # <<<<<<<<<<<<<<
- *         arr[1] = self.derivateOfIntp_XZ_2(p[1], y, z)
- *         arr[2] = self.derivateOfIntp_XZ_2(p[2], y, z)
- */
-  (__pyx_v_arr[0]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->derivateOfIntp_XZ_2(__pyx_v_self, (__pyx_v_p[0]), __pyx_v_y, __pyx_v_z);
-
-  /* "MMTK_BSpline_transform_grid.pyx":150
- *         cdef float_t arr[4]
- *         arr[0] = self.derivateOfIntp_XZ_2(p[0], y, z)
- *         arr[1] = self.derivateOfIntp_XZ_2(p[1], y, z)             # <<<<<<<<<<<<<<
- *         arr[2] = self.derivateOfIntp_XZ_2(p[2], y, z)
- *         arr[3] = self.derivateOfIntp_XZ_2(p[3], y, z)
- */
-  (__pyx_v_arr[1]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->derivateOfIntp_XZ_2(__pyx_v_self, (__pyx_v_p[1]), __pyx_v_y, __pyx_v_z);
-
-  /* "MMTK_BSpline_transform_grid.pyx":151
- *         arr[0] = self.derivateOfIntp_XZ_2(p[0], y, z)
- *         arr[1] = self.derivateOfIntp_XZ_2(p[1], y, z)
- *         arr[2] = self.derivateOfIntp_XZ_2(p[2], y, z)             # <<<<<<<<<<<<<<
- *         arr[3] = self.derivateOfIntp_XZ_2(p[3], y, z)
- *         return self.derivateOfIntp(arr, x)
- */
-  (__pyx_v_arr[2]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->derivateOfIntp_XZ_2(__pyx_v_self, (__pyx_v_p[2]), __pyx_v_y, __pyx_v_z);
-
-  /* "MMTK_BSpline_transform_grid.pyx":152
- *         arr[1] = self.derivateOfIntp_XZ_2(p[1], y, z)
- *         arr[2] = self.derivateOfIntp_XZ_2(p[2], y, z)
- *         arr[3] = self.derivateOfIntp_XZ_2(p[3], y, z)             # <<<<<<<<<<<<<<
- *         return self.derivateOfIntp(arr, x)
- * 
- */
-  (__pyx_v_arr[3]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->derivateOfIntp_XZ_2(__pyx_v_self, (__pyx_v_p[3]), __pyx_v_y, __pyx_v_z);
-
-  /* "MMTK_BSpline_transform_grid.pyx":153
- *         arr[2] = self.derivateOfIntp_XZ_2(p[2], y, z)
- *         arr[3] = self.derivateOfIntp_XZ_2(p[3], y, z)
- *         return self.derivateOfIntp(arr, x)             # <<<<<<<<<<<<<<
- * 
- * # calculate the dvdydy
- */
-  __pyx_r = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->derivateOfIntp(__pyx_v_self, __pyx_v_arr, __pyx_v_x);
-  goto __pyx_L0;
-
-  /* "MMTK_BSpline_transform_grid.pyx":147
- *         return self.splineInterpolate(arr, x)
- * 
- *     cdef float_t derivateOfIntp_XZ(self,float_t p[4][4][4],float_t x,float_t y,float_t z):             # <<<<<<<<<<<<<<
- *         cdef float_t arr[4]
- *         arr[0] = self.derivateOfIntp_XZ_2(p[0], y, z)
- */
-
-  /* function exit code */
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "MMTK_BSpline_transform_grid.pyx":156
- * 
- * # calculate the dvdydy
- *     cdef float_t derivateOfIntp_YY_2(self,float_t p[4][4],float_t x,float_t y):             # <<<<<<<<<<<<<<
- *         cdef float_t arr[4]
- *         arr[0] = self.splineInterpolate(p[0], y)
- */
-
-static __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_f_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm_derivateOfIntp_YY_2(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *__pyx_v_self, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*__pyx_v_p)[4], __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_x, __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_y) {
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_arr[4];
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_r;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("derivateOfIntp_YY_2", 0);
-
-  /* "MMTK_BSpline_transform_grid.pyx":158
- *     cdef float_t derivateOfIntp_YY_2(self,float_t p[4][4],float_t x,float_t y):
- *         cdef float_t arr[4]
- *         arr[0] = self.splineInterpolate(p[0], y)             # <<<<<<<<<<<<<<
- *         arr[1] = self.splineInterpolate(p[1], y)
- *         arr[2] = self.splineInterpolate(p[2], y)
- */
-  (__pyx_v_arr[0]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->splineInterpolate(__pyx_v_self, (__pyx_v_p[0]), __pyx_v_y);
-
-  /* "MMTK_BSpline_transform_grid.pyx":159
- *         cdef float_t arr[4]
- *         arr[0] = self.splineInterpolate(p[0], y)
- *         arr[1] = self.splineInterpolate(p[1], y)             # <<<<<<<<<<<<<<
- *         arr[2] = self.splineInterpolate(p[2], y)
- *         arr[3] = self.splineInterpolate(p[3], y)
- */
-  (__pyx_v_arr[1]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->splineInterpolate(__pyx_v_self, (__pyx_v_p[1]), __pyx_v_y);
-
-  /* "MMTK_BSpline_transform_grid.pyx":160
- *         arr[0] = self.splineInterpolate(p[0], y)
- *         arr[1] = self.splineInterpolate(p[1], y)
- *         arr[2] = self.splineInterpolate(p[2], y)             # <<<<<<<<<<<<<<
- *         arr[3] = self.splineInterpolate(p[3], y)
- *         return self.derivateOfIntp_mm(arr, x)
- */
-  (__pyx_v_arr[2]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->splineInterpolate(__pyx_v_self, (__pyx_v_p[2]), __pyx_v_y);
-
-  /* "MMTK_BSpline_transform_grid.pyx":161
- *         arr[1] = self.splineInterpolate(p[1], y)
- *         arr[2] = self.splineInterpolate(p[2], y)
- *         arr[3] = self.splineInterpolate(p[3], y)             # <<<<<<<<<<<<<<
- *         return self.derivateOfIntp_mm(arr, x)
- * 
- */
-  (__pyx_v_arr[3]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->splineInterpolate(__pyx_v_self, (__pyx_v_p[3]), __pyx_v_y);
-
-  /* "MMTK_BSpline_transform_grid.pyx":162
- *         arr[2] = self.splineInterpolate(p[2], y)
- *         arr[3] = self.splineInterpolate(p[3], y)
- *         return self.derivateOfIntp_mm(arr, x)             # <<<<<<<<<<<<<<
- * 
- *     cdef float_t derivateOfIntp_YY(self,float_t p[4][4][4],float_t x,float_t y,float_t z):
- */
-  __pyx_r = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->derivateOfIntp_mm(__pyx_v_self, __pyx_v_arr, __pyx_v_x);
-  goto __pyx_L0;
-
-  /* "MMTK_BSpline_transform_grid.pyx":156
- * 
- * # calculate the dvdydy
- *     cdef float_t derivateOfIntp_YY_2(self,float_t p[4][4],float_t x,float_t y):             # <<<<<<<<<<<<<<
- *         cdef float_t arr[4]
- *         arr[0] = self.splineInterpolate(p[0], y)
- */
-
-  /* function exit code */
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "MMTK_BSpline_transform_grid.pyx":164
- *         return self.derivateOfIntp_mm(arr, x)
- * 
- *     cdef float_t derivateOfIntp_YY(self,float_t p[4][4][4],float_t x,float_t y,float_t z):             # <<<<<<<<<<<<<<
- *         cdef float_t arr[4]
- *         arr[0] = self.derivateOfIntp_YY_2(p[0], y, z)
- */
-
-static __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_f_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm_derivateOfIntp_YY(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *__pyx_v_self, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*__pyx_v_p)[4][4], __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_x, __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_y, __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_z) {
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_arr[4];
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_r;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("derivateOfIntp_YY", 0);
-
-  /* "MMTK_BSpline_transform_grid.pyx":166
- *     cdef float_t derivateOfIntp_YY(self,float_t p[4][4][4],float_t x,float_t y,float_t z):
- *         cdef float_t arr[4]
- *         arr[0] = self.derivateOfIntp_YY_2(p[0], y, z)             # <<<<<<<<<<<<<<
- *         arr[1] = self.derivateOfIntp_YY_2(p[1], y, z)
- *         arr[2] = self.derivateOfIntp_YY_2(p[2], y, z)
- */
-  (__pyx_v_arr[0]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->derivateOfIntp_YY_2(__pyx_v_self, (__pyx_v_p[0]), __pyx_v_y, __pyx_v_z);
-
-  /* "MMTK_BSpline_transform_grid.pyx":167
- *         cdef float_t arr[4]
- *         arr[0] = self.derivateOfIntp_YY_2(p[0], y, z)
- *         arr[1] = self.derivateOfIntp_YY_2(p[1], y, z)             # <<<<<<<<<<<<<<
- *         arr[2] = self.derivateOfIntp_YY_2(p[2], y, z)
- *         arr[3] = self.derivateOfIntp_YY_2(p[3], y, z)
- */
-  (__pyx_v_arr[1]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->derivateOfIntp_YY_2(__pyx_v_self, (__pyx_v_p[1]), __pyx_v_y, __pyx_v_z);
-
-  /* "MMTK_BSpline_transform_grid.pyx":168
- *         arr[0] = self.derivateOfIntp_YY_2(p[0], y, z)
- *         arr[1] = self.derivateOfIntp_YY_2(p[1], y, z)
- *         arr[2] = self.derivateOfIntp_YY_2(p[2], y, z)             # <<<<<<<<<<<<<<
- *         arr[3] = self.derivateOfIntp_YY_2(p[3], y, z)
- *         return self.splineInterpolate(arr, x)
- */
-  (__pyx_v_arr[2]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->derivateOfIntp_YY_2(__pyx_v_self, (__pyx_v_p[2]), __pyx_v_y, __pyx_v_z);
-
-  /* "MMTK_BSpline_transform_grid.pyx":169
- *         arr[1] = self.derivateOfIntp_YY_2(p[1], y, z)
- *         arr[2] = self.derivateOfIntp_YY_2(p[2], y, z)
- *         arr[3] = self.derivateOfIntp_YY_2(p[3], y, z)             # <<<<<<<<<<<<<<
- *         return self.splineInterpolate(arr, x)
- * 
- */
-  (__pyx_v_arr[3]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->derivateOfIntp_YY_2(__pyx_v_self, (__pyx_v_p[3]), __pyx_v_y, __pyx_v_z);
-
-  /* "MMTK_BSpline_transform_grid.pyx":170
- *         arr[2] = self.derivateOfIntp_YY_2(p[2], y, z)
- *         arr[3] = self.derivateOfIntp_YY_2(p[3], y, z)
- *         return self.splineInterpolate(arr, x)             # <<<<<<<<<<<<<<
- * 
- * # calculate dvdydz
- */
-  __pyx_r = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->splineInterpolate(__pyx_v_self, __pyx_v_arr, __pyx_v_x);
-  goto __pyx_L0;
-
-  /* "MMTK_BSpline_transform_grid.pyx":164
- *         return self.derivateOfIntp_mm(arr, x)
- * 
- *     cdef float_t derivateOfIntp_YY(self,float_t p[4][4][4],float_t x,float_t y,float_t z):             # <<<<<<<<<<<<<<
- *         cdef float_t arr[4]
- *         arr[0] = self.derivateOfIntp_YY_2(p[0], y, z)
- */
-
-  /* function exit code */
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "MMTK_BSpline_transform_grid.pyx":173
- * 
- * # calculate dvdydz
- *     cdef float_t derivateOfIntp_YZ_2(self,float_t p[4][4],float_t x,float_t y):             # <<<<<<<<<<<<<<
- *         cdef float_t arr[4]
- *         arr[0] = self.derivateOfIntp(p[0], y)
- */
-
-static __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_f_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm_derivateOfIntp_YZ_2(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *__pyx_v_self, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*__pyx_v_p)[4], __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_x, __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_y) {
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_arr[4];
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_r;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("derivateOfIntp_YZ_2", 0);
-
-  /* "MMTK_BSpline_transform_grid.pyx":175
- *     cdef float_t derivateOfIntp_YZ_2(self,float_t p[4][4],float_t x,float_t y):
- *         cdef float_t arr[4]
- *         arr[0] = self.derivateOfIntp(p[0], y)             # <<<<<<<<<<<<<<
- *         arr[1] = self.derivateOfIntp(p[1], y)
- *         arr[2] = self.derivateOfIntp(p[2], y)
- */
-  (__pyx_v_arr[0]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->derivateOfIntp(__pyx_v_self, (__pyx_v_p[0]), __pyx_v_y);
-
-  /* "MMTK_BSpline_transform_grid.pyx":176
- *         cdef float_t arr[4]
- *         arr[0] = self.derivateOfIntp(p[0], y)
- *         arr[1] = self.derivateOfIntp(p[1], y)             # <<<<<<<<<<<<<<
- *         arr[2] = self.derivateOfIntp(p[2], y)
- *         arr[3] = self.derivateOfIntp(p[3], y)
- */
-  (__pyx_v_arr[1]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->derivateOfIntp(__pyx_v_self, (__pyx_v_p[1]), __pyx_v_y);
-
-  /* "MMTK_BSpline_transform_grid.pyx":177
- *         arr[0] = self.derivateOfIntp(p[0], y)
- *         arr[1] = self.derivateOfIntp(p[1], y)
- *         arr[2] = self.derivateOfIntp(p[2], y)             # <<<<<<<<<<<<<<
- *         arr[3] = self.derivateOfIntp(p[3], y)
- *         return self.derivateOfIntp(arr, x)
- */
-  (__pyx_v_arr[2]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->derivateOfIntp(__pyx_v_self, (__pyx_v_p[2]), __pyx_v_y);
-
-  /* "MMTK_BSpline_transform_grid.pyx":178
- *         arr[1] = self.derivateOfIntp(p[1], y)
- *         arr[2] = self.derivateOfIntp(p[2], y)
- *         arr[3] = self.derivateOfIntp(p[3], y)             # <<<<<<<<<<<<<<
- *         return self.derivateOfIntp(arr, x)
- * 
- */
-  (__pyx_v_arr[3]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->derivateOfIntp(__pyx_v_self, (__pyx_v_p[3]), __pyx_v_y);
-
-  /* "MMTK_BSpline_transform_grid.pyx":179
- *         arr[2] = self.derivateOfIntp(p[2], y)
- *         arr[3] = self.derivateOfIntp(p[3], y)
- *         return self.derivateOfIntp(arr, x)             # <<<<<<<<<<<<<<
- * 
- *     cdef float_t derivateOfIntp_YZ(self,float_t p[4][4][4],float_t x,float_t y,float_t z):
- */
-  __pyx_r = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->derivateOfIntp(__pyx_v_self, __pyx_v_arr, __pyx_v_x);
-  goto __pyx_L0;
-
-  /* "MMTK_BSpline_transform_grid.pyx":173
- * 
- * # calculate dvdydz
- *     cdef float_t derivateOfIntp_YZ_2(self,float_t p[4][4],float_t x,float_t y):             # <<<<<<<<<<<<<<
- *         cdef float_t arr[4]
- *         arr[0] = self.derivateOfIntp(p[0], y)
- */
-
-  /* function exit code */
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "MMTK_BSpline_transform_grid.pyx":181
- *         return self.derivateOfIntp(arr, x)
- * 
- *     cdef float_t derivateOfIntp_YZ(self,float_t p[4][4][4],float_t x,float_t y,float_t z):             # <<<<<<<<<<<<<<
- *         cdef float_t arr[4]
- *         arr[0] = self.derivateOfIntp_YZ_2(p[0], y, z)
- */
-
-static __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_f_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm_derivateOfIntp_YZ(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *__pyx_v_self, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*__pyx_v_p)[4][4], __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_x, __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_y, __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_z) {
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_arr[4];
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_r;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("derivateOfIntp_YZ", 0);
-
-  /* "MMTK_BSpline_transform_grid.pyx":183
- *     cdef float_t derivateOfIntp_YZ(self,float_t p[4][4][4],float_t x,float_t y,float_t z):
- *         cdef float_t arr[4]
- *         arr[0] = self.derivateOfIntp_YZ_2(p[0], y, z)             # <<<<<<<<<<<<<<
- *         arr[1] = self.derivateOfIntp_YZ_2(p[1], y, z)
- *         arr[2] = self.derivateOfIntp_YZ_2(p[2], y, z)
- */
-  (__pyx_v_arr[0]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->derivateOfIntp_YZ_2(__pyx_v_self, (__pyx_v_p[0]), __pyx_v_y, __pyx_v_z);
-
-  /* "MMTK_BSpline_transform_grid.pyx":184
- *         cdef float_t arr[4]
- *         arr[0] = self.derivateOfIntp_YZ_2(p[0], y, z)
- *         arr[1] = self.derivateOfIntp_YZ_2(p[1], y, z)             # <<<<<<<<<<<<<<
- *         arr[2] = self.derivateOfIntp_YZ_2(p[2], y, z)
- *         arr[3] = self.derivateOfIntp_YZ_2(p[3], y, z)
- */
-  (__pyx_v_arr[1]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->derivateOfIntp_YZ_2(__pyx_v_self, (__pyx_v_p[1]), __pyx_v_y, __pyx_v_z);
-
-  /* "MMTK_BSpline_transform_grid.pyx":185
- *         arr[0] = self.derivateOfIntp_YZ_2(p[0], y, z)
- *         arr[1] = self.derivateOfIntp_YZ_2(p[1], y, z)
- *         arr[2] = self.derivateOfIntp_YZ_2(p[2], y, z)             # <<<<<<<<<<<<<<
- *         arr[3] = self.derivateOfIntp_YZ_2(p[3], y, z)
- *         return self.splineInterpolate(arr, x)
- */
-  (__pyx_v_arr[2]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->derivateOfIntp_YZ_2(__pyx_v_self, (__pyx_v_p[2]), __pyx_v_y, __pyx_v_z);
-
-  /* "MMTK_BSpline_transform_grid.pyx":186
- *         arr[1] = self.derivateOfIntp_YZ_2(p[1], y, z)
- *         arr[2] = self.derivateOfIntp_YZ_2(p[2], y, z)
- *         arr[3] = self.derivateOfIntp_YZ_2(p[3], y, z)             # <<<<<<<<<<<<<<
- *         return self.splineInterpolate(arr, x)
- * 
- */
-  (__pyx_v_arr[3]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->derivateOfIntp_YZ_2(__pyx_v_self, (__pyx_v_p[3]), __pyx_v_y, __pyx_v_z);
-
-  /* "MMTK_BSpline_transform_grid.pyx":187
- *         arr[2] = self.derivateOfIntp_YZ_2(p[2], y, z)
- *         arr[3] = self.derivateOfIntp_YZ_2(p[3], y, z)
- *         return self.splineInterpolate(arr, x)             # <<<<<<<<<<<<<<
- * 
- * # calculate dvdzdz
- */
-  __pyx_r = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->splineInterpolate(__pyx_v_self, __pyx_v_arr, __pyx_v_x);
-  goto __pyx_L0;
-
-  /* "MMTK_BSpline_transform_grid.pyx":181
- *         return self.derivateOfIntp(arr, x)
- * 
- *     cdef float_t derivateOfIntp_YZ(self,float_t p[4][4][4],float_t x,float_t y,float_t z):             # <<<<<<<<<<<<<<
- *         cdef float_t arr[4]
- *         arr[0] = self.derivateOfIntp_YZ_2(p[0], y, z)
- */
-
-  /* function exit code */
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "MMTK_BSpline_transform_grid.pyx":190
- * 
- * # calculate dvdzdz
- *     cdef float_t derivateOfIntp_ZZ_2(self,float_t p[4][4],float_t x,float_t y):             # <<<<<<<<<<<<<<
- *         cdef float_t arr[4]
- *         arr[0] = self.derivateOfIntp_mm(p[0], y)
- */
-
-static __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_f_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm_derivateOfIntp_ZZ_2(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *__pyx_v_self, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*__pyx_v_p)[4], __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_x, __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_y) {
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_arr[4];
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_r;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("derivateOfIntp_ZZ_2", 0);
-
-  /* "MMTK_BSpline_transform_grid.pyx":192
- *     cdef float_t derivateOfIntp_ZZ_2(self,float_t p[4][4],float_t x,float_t y):
- *         cdef float_t arr[4]
- *         arr[0] = self.derivateOfIntp_mm(p[0], y)             # <<<<<<<<<<<<<<
- *         arr[1] = self.derivateOfIntp_mm(p[1], y)
- *         arr[2] = self.derivateOfIntp_mm(p[2], y)
- */
-  (__pyx_v_arr[0]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->derivateOfIntp_mm(__pyx_v_self, (__pyx_v_p[0]), __pyx_v_y);
-
-  /* "MMTK_BSpline_transform_grid.pyx":193
- *         cdef float_t arr[4]
- *         arr[0] = self.derivateOfIntp_mm(p[0], y)
- *         arr[1] = self.derivateOfIntp_mm(p[1], y)             # <<<<<<<<<<<<<<
- *         arr[2] = self.derivateOfIntp_mm(p[2], y)
- *         arr[3] = self.derivateOfIntp_mm(p[3], y)
- */
-  (__pyx_v_arr[1]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->derivateOfIntp_mm(__pyx_v_self, (__pyx_v_p[1]), __pyx_v_y);
-
-  /* "MMTK_BSpline_transform_grid.pyx":194
- *         arr[0] = self.derivateOfIntp_mm(p[0], y)
- *         arr[1] = self.derivateOfIntp_mm(p[1], y)
- *         arr[2] = self.derivateOfIntp_mm(p[2], y)             # <<<<<<<<<<<<<<
- *         arr[3] = self.derivateOfIntp_mm(p[3], y)
- *         return self.splineInterpolate(arr, x)
- */
-  (__pyx_v_arr[2]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->derivateOfIntp_mm(__pyx_v_self, (__pyx_v_p[2]), __pyx_v_y);
-
-  /* "MMTK_BSpline_transform_grid.pyx":195
- *         arr[1] = self.derivateOfIntp_mm(p[1], y)
- *         arr[2] = self.derivateOfIntp_mm(p[2], y)
- *         arr[3] = self.derivateOfIntp_mm(p[3], y)             # <<<<<<<<<<<<<<
- *         return self.splineInterpolate(arr, x)
- * 
- */
-  (__pyx_v_arr[3]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->derivateOfIntp_mm(__pyx_v_self, (__pyx_v_p[3]), __pyx_v_y);
-
-  /* "MMTK_BSpline_transform_grid.pyx":196
- *         arr[2] = self.derivateOfIntp_mm(p[2], y)
- *         arr[3] = self.derivateOfIntp_mm(p[3], y)
- *         return self.splineInterpolate(arr, x)             # <<<<<<<<<<<<<<
- * 
- *     cdef float_t derivateOfIntp_ZZ(self,float_t p[4][4][4],float_t x,float_t y,float_t z):
- */
-  __pyx_r = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->splineInterpolate(__pyx_v_self, __pyx_v_arr, __pyx_v_x);
-  goto __pyx_L0;
-
-  /* "MMTK_BSpline_transform_grid.pyx":190
- * 
- * # calculate dvdzdz
- *     cdef float_t derivateOfIntp_ZZ_2(self,float_t p[4][4],float_t x,float_t y):             # <<<<<<<<<<<<<<
- *         cdef float_t arr[4]
- *         arr[0] = self.derivateOfIntp_mm(p[0], y)
- */
-
-  /* function exit code */
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "MMTK_BSpline_transform_grid.pyx":198
- *         return self.splineInterpolate(arr, x)
- * 
- *     cdef float_t derivateOfIntp_ZZ(self,float_t p[4][4][4],float_t x,float_t y,float_t z):             # <<<<<<<<<<<<<<
- *         cdef float_t arr[4]
- *         arr[0] = self.derivateOfIntp_ZZ_2(p[0], y, z)
- */
-
-static __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_f_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm_derivateOfIntp_ZZ(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *__pyx_v_self, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*__pyx_v_p)[4][4], __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_x, __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_y, __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_z) {
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_arr[4];
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_r;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("derivateOfIntp_ZZ", 0);
-
-  /* "MMTK_BSpline_transform_grid.pyx":200
- *     cdef float_t derivateOfIntp_ZZ(self,float_t p[4][4][4],float_t x,float_t y,float_t z):
- *         cdef float_t arr[4]
- *         arr[0] = self.derivateOfIntp_ZZ_2(p[0], y, z)             # <<<<<<<<<<<<<<
- *         arr[1] = self.derivateOfIntp_ZZ_2(p[1], y, z)
- *         arr[2] = self.derivateOfIntp_ZZ_2(p[2], y, z)
- */
-  (__pyx_v_arr[0]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->derivateOfIntp_ZZ_2(__pyx_v_self, (__pyx_v_p[0]), __pyx_v_y, __pyx_v_z);
-
-  /* "MMTK_BSpline_transform_grid.pyx":201
- *         cdef float_t arr[4]
- *         arr[0] = self.derivateOfIntp_ZZ_2(p[0], y, z)
- *         arr[1] = self.derivateOfIntp_ZZ_2(p[1], y, z)             # <<<<<<<<<<<<<<
- *         arr[2] = self.derivateOfIntp_ZZ_2(p[2], y, z)
- *         arr[3] = self.derivateOfIntp_ZZ_2(p[3], y, z)
- */
-  (__pyx_v_arr[1]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->derivateOfIntp_ZZ_2(__pyx_v_self, (__pyx_v_p[1]), __pyx_v_y, __pyx_v_z);
-
-  /* "MMTK_BSpline_transform_grid.pyx":202
- *         arr[0] = self.derivateOfIntp_ZZ_2(p[0], y, z)
- *         arr[1] = self.derivateOfIntp_ZZ_2(p[1], y, z)
- *         arr[2] = self.derivateOfIntp_ZZ_2(p[2], y, z)             # <<<<<<<<<<<<<<
- *         arr[3] = self.derivateOfIntp_ZZ_2(p[3], y, z)
- *         return self.splineInterpolate(arr, x)
- */
-  (__pyx_v_arr[2]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->derivateOfIntp_ZZ_2(__pyx_v_self, (__pyx_v_p[2]), __pyx_v_y, __pyx_v_z);
-
-  /* "MMTK_BSpline_transform_grid.pyx":203
- *         arr[1] = self.derivateOfIntp_ZZ_2(p[1], y, z)
- *         arr[2] = self.derivateOfIntp_ZZ_2(p[2], y, z)
- *         arr[3] = self.derivateOfIntp_ZZ_2(p[3], y, z)             # <<<<<<<<<<<<<<
- *         return self.splineInterpolate(arr, x)
- * 
- */
-  (__pyx_v_arr[3]) = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->derivateOfIntp_ZZ_2(__pyx_v_self, (__pyx_v_p[3]), __pyx_v_y, __pyx_v_z);
-
-  /* "MMTK_BSpline_transform_grid.pyx":204
- *         arr[2] = self.derivateOfIntp_ZZ_2(p[2], y, z)
- *         arr[3] = self.derivateOfIntp_ZZ_2(p[3], y, z)
- *         return self.splineInterpolate(arr, x)             # <<<<<<<<<<<<<<
- * 
- * 
- */
-  __pyx_r = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->splineInterpolate(__pyx_v_self, __pyx_v_arr, __pyx_v_x);
-  goto __pyx_L0;
-
-  /* "MMTK_BSpline_transform_grid.pyx":198
- *         return self.splineInterpolate(arr, x)
- * 
- *     cdef float_t derivateOfIntp_ZZ(self,float_t p[4][4][4],float_t x,float_t y,float_t z):             # <<<<<<<<<<<<<<
- *         cdef float_t arr[4]
- *         arr[0] = self.derivateOfIntp_ZZ_2(p[0], y, z)
- */
-
-  /* function exit code */
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "MMTK_BSpline_transform_grid.pyx":208
- * 
- * 
- *     def __init__(self, universe, spacing, counts, vals, strength,             # <<<<<<<<<<<<<<
- *                  scaling_factor, grid_name, inv_power):
- *         print "------------test start---------------"
- */
-
-/* Python wrapper */
-static int __pyx_pw_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static int __pyx_pw_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_universe = 0;
-  PyObject *__pyx_v_spacing = 0;
-  PyObject *__pyx_v_counts = 0;
-  PyObject *__pyx_v_vals = 0;
-  PyObject *__pyx_v_strength = 0;
-  PyObject *__pyx_v_scaling_factor = 0;
-  PyObject *__pyx_v_grid_name = 0;
-  PyObject *__pyx_v_inv_power = 0;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  int __pyx_r;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__init__ (wrapper)", 0);
-  {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_universe,&__pyx_n_s_spacing,&__pyx_n_s_counts,&__pyx_n_s_vals,&__pyx_n_s_strength,&__pyx_n_s_scaling_factor,&__pyx_n_s_grid_name,&__pyx_n_s_inv_power,0};
-    PyObject* values[8] = {0,0,0,0,0,0,0,0};
-    if (unlikely(__pyx_kwds)) {
-      Py_ssize_t kw_args;
-      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
-      switch (pos_args) {
-        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
-        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
-        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
-        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
-        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
-        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
-        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = PyDict_Size(__pyx_kwds);
-      switch (pos_args) {
-        case  0:
-        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_universe)) != 0)) kw_args--;
-        else goto __pyx_L5_argtuple_error;
-        case  1:
-        if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_spacing)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("__init__", 1, 8, 8, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 208; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-        }
-        case  2:
-        if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_counts)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("__init__", 1, 8, 8, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 208; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-        }
-        case  3:
-        if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_vals)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("__init__", 1, 8, 8, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 208; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-        }
-        case  4:
-        if (likely((values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_strength)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("__init__", 1, 8, 8, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 208; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-        }
-        case  5:
-        if (likely((values[5] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_scaling_factor)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("__init__", 1, 8, 8, 5); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 208; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-        }
-        case  6:
-        if (likely((values[6] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_grid_name)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("__init__", 1, 8, 8, 6); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 208; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-        }
-        case  7:
-        if (likely((values[7] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_inv_power)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("__init__", 1, 8, 8, 7); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 208; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-        }
-      }
-      if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 208; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      }
-    } else if (PyTuple_GET_SIZE(__pyx_args) != 8) {
-      goto __pyx_L5_argtuple_error;
-    } else {
-      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
-      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
-      values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
-      values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
-      values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
-      values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
-    }
-    __pyx_v_universe = values[0];
-    __pyx_v_spacing = values[1];
-    __pyx_v_counts = values[2];
-    __pyx_v_vals = values[3];
-    __pyx_v_strength = values[4];
-    __pyx_v_scaling_factor = values[5];
-    __pyx_v_grid_name = values[6];
-    __pyx_v_inv_power = values[7];
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__init__", 1, 8, 8, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 208; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("MMTK_BSpline_transform_grid.BSplineTransformGridTerm.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return -1;
-  __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm___init__(((struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self), __pyx_v_universe, __pyx_v_spacing, __pyx_v_counts, __pyx_v_vals, __pyx_v_strength, __pyx_v_scaling_factor, __pyx_v_grid_name, __pyx_v_inv_power);
-
-  /* function exit code */
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static int __pyx_pf_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm___init__(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *__pyx_v_self, PyObject *__pyx_v_universe, PyObject *__pyx_v_spacing, PyObject *__pyx_v_counts, PyObject *__pyx_v_vals, PyObject *__pyx_v_strength, PyObject *__pyx_v_scaling_factor, PyObject *__pyx_v_grid_name, PyObject *__pyx_v_inv_power) {
-  int __pyx_r;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  Py_ssize_t __pyx_t_5;
-  PyObject *__pyx_t_6 = NULL;
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_t_7;
-  char *__pyx_t_8;
-  double __pyx_t_9;
-  int __pyx_t_10;
-  PyObject *__pyx_t_11 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__init__", 0);
-
-  /* "MMTK_BSpline_transform_grid.pyx":210
- *     def __init__(self, universe, spacing, counts, vals, strength,
- *                  scaling_factor, grid_name, inv_power):
- *         print "------------test start---------------"             # <<<<<<<<<<<<<<
- *         EnergyTerm.__init__(self, universe,
- *                             grid_name, (grid_name,))
- */
-  if (__Pyx_PrintOne(0, __pyx_kp_s_test_start) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 210; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-
-  /* "MMTK_BSpline_transform_grid.pyx":211
- *                  scaling_factor, grid_name, inv_power):
- *         print "------------test start---------------"
- *         EnergyTerm.__init__(self, universe,             # <<<<<<<<<<<<<<
- *                             grid_name, (grid_name,))
- *         self.eval_func = <void *>BSplineTransformGridTerm.evaluate
- */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)((PyObject*)__pyx_ptype_27MMTK_BSpline_transform_grid_EnergyTerm)), __pyx_n_s_init); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 211; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-
-  /* "MMTK_BSpline_transform_grid.pyx":212
- *         print "------------test start---------------"
- *         EnergyTerm.__init__(self, universe,
- *                             grid_name, (grid_name,))             # <<<<<<<<<<<<<<
- *         self.eval_func = <void *>BSplineTransformGridTerm.evaluate
- * 
- */
-  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 212; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_INCREF(__pyx_v_grid_name);
-  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v_grid_name);
-  __Pyx_GIVEREF(__pyx_v_grid_name);
-  __pyx_t_4 = NULL;
-  __pyx_t_5 = 0;
-  if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_2))) {
-    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_2);
-    if (likely(__pyx_t_4)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
-      __Pyx_INCREF(__pyx_t_4);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_2, function);
-      __pyx_t_5 = 1;
-    }
-  }
-  __pyx_t_6 = PyTuple_New(4+__pyx_t_5); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 211; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_6);
-  if (__pyx_t_4) {
-    PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_4); __Pyx_GIVEREF(__pyx_t_4); __pyx_t_4 = NULL;
-  }
-  __Pyx_INCREF(((PyObject *)__pyx_v_self));
-  PyTuple_SET_ITEM(__pyx_t_6, 0+__pyx_t_5, ((PyObject *)__pyx_v_self));
-  __Pyx_GIVEREF(((PyObject *)__pyx_v_self));
-  __Pyx_INCREF(__pyx_v_universe);
-  PyTuple_SET_ITEM(__pyx_t_6, 1+__pyx_t_5, __pyx_v_universe);
-  __Pyx_GIVEREF(__pyx_v_universe);
-  __Pyx_INCREF(__pyx_v_grid_name);
-  PyTuple_SET_ITEM(__pyx_t_6, 2+__pyx_t_5, __pyx_v_grid_name);
-  __Pyx_GIVEREF(__pyx_v_grid_name);
-  PyTuple_SET_ITEM(__pyx_t_6, 3+__pyx_t_5, __pyx_t_3);
-  __Pyx_GIVEREF(__pyx_t_3);
-  __pyx_t_3 = 0;
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_6, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 211; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "MMTK_BSpline_transform_grid.pyx":213
- *         EnergyTerm.__init__(self, universe,
- *                             grid_name, (grid_name,))
- *         self.eval_func = <void *>BSplineTransformGridTerm.evaluate             # <<<<<<<<<<<<<<
- * 
- *         self.strength = strength
- */
-  __pyx_v_self->__pyx_base.eval_func = ((void *)__pyx_f_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm_evaluate);
-
-  /* "MMTK_BSpline_transform_grid.pyx":215
- *         self.eval_func = <void *>BSplineTransformGridTerm.evaluate
- * 
- *         self.strength = strength             # <<<<<<<<<<<<<<
- *         self.scaling_factor = np.array(scaling_factor, dtype=float)
- *         self.natoms = len(self.scaling_factor)
- */
-  __pyx_t_7 = __pyx_PyFloat_AsDouble(__pyx_v_strength); if (unlikely((__pyx_t_7 == (npy_double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 215; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_v_self->strength = __pyx_t_7;
-
-  /* "MMTK_BSpline_transform_grid.pyx":216
- * 
- *         self.strength = strength
- *         self.scaling_factor = np.array(scaling_factor, dtype=float)             # <<<<<<<<<<<<<<
- *         self.natoms = len(self.scaling_factor)
- *         self.grid_name = grid_name
- */
-  __pyx_t_1 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 216; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_array); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 216; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 216; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_INCREF(__pyx_v_scaling_factor);
-  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_scaling_factor);
-  __Pyx_GIVEREF(__pyx_v_scaling_factor);
-  __pyx_t_6 = PyDict_New(); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 216; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_6);
-  if (PyDict_SetItem(__pyx_t_6, __pyx_n_s_dtype, ((PyObject *)((PyObject*)(&PyFloat_Type)))) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 216; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_1, __pyx_t_6); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 216; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 216; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GIVEREF(__pyx_t_3);
-  __Pyx_GOTREF(__pyx_v_self->scaling_factor);
-  __Pyx_DECREF(((PyObject *)__pyx_v_self->scaling_factor));
-  __pyx_v_self->scaling_factor = ((PyArrayObject *)__pyx_t_3);
-  __pyx_t_3 = 0;
-
-  /* "MMTK_BSpline_transform_grid.pyx":217
- *         self.strength = strength
- *         self.scaling_factor = np.array(scaling_factor, dtype=float)
- *         self.natoms = len(self.scaling_factor)             # <<<<<<<<<<<<<<
- *         self.grid_name = grid_name
- *         self.inv_power = float(inv_power)
- */
-  __pyx_t_3 = ((PyObject *)__pyx_v_self->scaling_factor);
-  __Pyx_INCREF(__pyx_t_3);
-  __pyx_t_5 = PyObject_Length(__pyx_t_3); if (unlikely(__pyx_t_5 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 217; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_v_self->natoms = __pyx_t_5;
-
-  /* "MMTK_BSpline_transform_grid.pyx":218
- *         self.scaling_factor = np.array(scaling_factor, dtype=float)
- *         self.natoms = len(self.scaling_factor)
- *         self.grid_name = grid_name             # <<<<<<<<<<<<<<
- *         self.inv_power = float(inv_power)
- *         self.inv_power_m1 = inv_power - 1.
- */
-  __pyx_t_8 = __Pyx_PyObject_AsString(__pyx_v_grid_name); if (unlikely((!__pyx_t_8) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 218; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_v_self->grid_name = __pyx_t_8;
-
-  /* "MMTK_BSpline_transform_grid.pyx":219
- *         self.natoms = len(self.scaling_factor)
- *         self.grid_name = grid_name
- *         self.inv_power = float(inv_power)             # <<<<<<<<<<<<<<
- *         self.inv_power_m1 = inv_power - 1.
- * 
- */
-  __pyx_t_9 = __Pyx_PyObject_AsDouble(__pyx_v_inv_power); if (unlikely(__pyx_t_9 == ((double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 219; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_v_self->inv_power = __pyx_t_9;
-
-  /* "MMTK_BSpline_transform_grid.pyx":220
- *         self.grid_name = grid_name
- *         self.inv_power = float(inv_power)
- *         self.inv_power_m1 = inv_power - 1.             # <<<<<<<<<<<<<<
- * 
- *         self.spacing = spacing
- */
-  __pyx_t_3 = PyNumber_Subtract(__pyx_v_inv_power, __pyx_float_1_); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 220; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_7 = __pyx_PyFloat_AsDouble(__pyx_t_3); if (unlikely((__pyx_t_7 == (npy_double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 220; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_v_self->inv_power_m1 = __pyx_t_7;
-
-  /* "MMTK_BSpline_transform_grid.pyx":222
- *         self.inv_power_m1 = inv_power - 1.
- * 
- *         self.spacing = spacing             # <<<<<<<<<<<<<<
- *         self.counts = counts
- *         self.vals = vals
- */
-  if (!(likely(((__pyx_v_spacing) == Py_None) || likely(__Pyx_TypeTest(__pyx_v_spacing, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 222; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_3 = __pyx_v_spacing;
-  __Pyx_INCREF(__pyx_t_3);
-  __Pyx_GIVEREF(__pyx_t_3);
-  __Pyx_GOTREF(__pyx_v_self->spacing);
-  __Pyx_DECREF(((PyObject *)__pyx_v_self->spacing));
-  __pyx_v_self->spacing = ((PyArrayObject *)__pyx_t_3);
-  __pyx_t_3 = 0;
-
-  /* "MMTK_BSpline_transform_grid.pyx":223
- * 
- *         self.spacing = spacing
- *         self.counts = counts             # <<<<<<<<<<<<<<
- *         self.vals = vals
- *         self.nyz = self.counts[1]*self.counts[2]
- */
-  if (!(likely(((__pyx_v_counts) == Py_None) || likely(__Pyx_TypeTest(__pyx_v_counts, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 223; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_3 = __pyx_v_counts;
-  __Pyx_INCREF(__pyx_t_3);
-  __Pyx_GIVEREF(__pyx_t_3);
-  __Pyx_GOTREF(__pyx_v_self->counts);
-  __Pyx_DECREF(((PyObject *)__pyx_v_self->counts));
-  __pyx_v_self->counts = ((PyArrayObject *)__pyx_t_3);
-  __pyx_t_3 = 0;
-
-  /* "MMTK_BSpline_transform_grid.pyx":224
- *         self.spacing = spacing
- *         self.counts = counts
- *         self.vals = vals             # <<<<<<<<<<<<<<
- *         self.nyz = self.counts[1]*self.counts[2]
- *         self.hCorner = np.array((self.spacing[0]*(self.counts[0]-1),
- */
-  if (!(likely(((__pyx_v_vals) == Py_None) || likely(__Pyx_TypeTest(__pyx_v_vals, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 224; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_3 = __pyx_v_vals;
-  __Pyx_INCREF(__pyx_t_3);
-  __Pyx_GIVEREF(__pyx_t_3);
-  __Pyx_GOTREF(__pyx_v_self->vals);
-  __Pyx_DECREF(((PyObject *)__pyx_v_self->vals));
-  __pyx_v_self->vals = ((PyArrayObject *)__pyx_t_3);
-  __pyx_t_3 = 0;
-
-  /* "MMTK_BSpline_transform_grid.pyx":225
- *         self.counts = counts
- *         self.vals = vals
- *         self.nyz = self.counts[1]*self.counts[2]             # <<<<<<<<<<<<<<
- *         self.hCorner = np.array((self.spacing[0]*(self.counts[0]-1),
- *                         self.spacing[1]*(self.counts[1]-1),
- */
-  __pyx_t_3 = __Pyx_GetItemInt(((PyObject *)__pyx_v_self->counts), 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(__pyx_t_3 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 225; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_6 = __Pyx_GetItemInt(((PyObject *)__pyx_v_self->counts), 2, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(__pyx_t_6 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 225; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  __Pyx_GOTREF(__pyx_t_6);
-  __pyx_t_1 = PyNumber_Multiply(__pyx_t_3, __pyx_t_6); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 225; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  __pyx_t_10 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_10 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 225; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_v_self->nyz = __pyx_t_10;
-
-  /* "MMTK_BSpline_transform_grid.pyx":226
- *         self.vals = vals
- *         self.nyz = self.counts[1]*self.counts[2]
- *         self.hCorner = np.array((self.spacing[0]*(self.counts[0]-1),             # <<<<<<<<<<<<<<
- *                         self.spacing[1]*(self.counts[1]-1),
- *                         self.spacing[2]*(self.counts[2]-1)), dtype=float)
- */
-  __pyx_t_1 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 226; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_array); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 226; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_6);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = __Pyx_GetItemInt(((PyObject *)__pyx_v_self->spacing), 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(__pyx_t_1 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 226; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_3 = __Pyx_GetItemInt(((PyObject *)__pyx_v_self->counts), 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(__pyx_t_3 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 226; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_2 = PyNumber_Subtract(__pyx_t_3, __pyx_int_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 226; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_3 = PyNumber_Multiply(__pyx_t_1, __pyx_t_2); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 226; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-  /* "MMTK_BSpline_transform_grid.pyx":227
- *         self.nyz = self.counts[1]*self.counts[2]
- *         self.hCorner = np.array((self.spacing[0]*(self.counts[0]-1),
- *                         self.spacing[1]*(self.counts[1]-1),             # <<<<<<<<<<<<<<
- *                         self.spacing[2]*(self.counts[2]-1)), dtype=float)
- *         # To keep atoms within the grid
- */
-  __pyx_t_2 = __Pyx_GetItemInt(((PyObject *)__pyx_v_self->spacing), 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(__pyx_t_2 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 227; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_1 = __Pyx_GetItemInt(((PyObject *)__pyx_v_self->counts), 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(__pyx_t_1 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 227; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_4 = PyNumber_Subtract(__pyx_t_1, __pyx_int_1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 227; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = PyNumber_Multiply(__pyx_t_2, __pyx_t_4); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 227; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-
-  /* "MMTK_BSpline_transform_grid.pyx":228
- *         self.hCorner = np.array((self.spacing[0]*(self.counts[0]-1),
- *                         self.spacing[1]*(self.counts[1]-1),
- *                         self.spacing[2]*(self.counts[2]-1)), dtype=float)             # <<<<<<<<<<<<<<
- *         # To keep atoms within the grid
- *         self.k = 10000. # kJ/mol nm**2
- */
-  __pyx_t_4 = __Pyx_GetItemInt(((PyObject *)__pyx_v_self->spacing), 2, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(__pyx_t_4 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 228; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_2 = __Pyx_GetItemInt(((PyObject *)__pyx_v_self->counts), 2, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(__pyx_t_2 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 228; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_11 = PyNumber_Subtract(__pyx_t_2, __pyx_int_1); if (unlikely(!__pyx_t_11)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 228; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_11);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = PyNumber_Multiply(__pyx_t_4, __pyx_t_11); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 228; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
-
-  /* "MMTK_BSpline_transform_grid.pyx":226
- *         self.vals = vals
- *         self.nyz = self.counts[1]*self.counts[2]
- *         self.hCorner = np.array((self.spacing[0]*(self.counts[0]-1),             # <<<<<<<<<<<<<<
- *                         self.spacing[1]*(self.counts[1]-1),
- *                         self.spacing[2]*(self.counts[2]-1)), dtype=float)
- */
-  __pyx_t_11 = PyTuple_New(3); if (unlikely(!__pyx_t_11)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 226; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_11);
-  PyTuple_SET_ITEM(__pyx_t_11, 0, __pyx_t_3);
-  __Pyx_GIVEREF(__pyx_t_3);
-  PyTuple_SET_ITEM(__pyx_t_11, 1, __pyx_t_1);
-  __Pyx_GIVEREF(__pyx_t_1);
-  PyTuple_SET_ITEM(__pyx_t_11, 2, __pyx_t_2);
-  __Pyx_GIVEREF(__pyx_t_2);
-  __pyx_t_3 = 0;
-  __pyx_t_1 = 0;
-  __pyx_t_2 = 0;
-  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 226; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_11);
-  __Pyx_GIVEREF(__pyx_t_11);
-  __pyx_t_11 = 0;
-  __pyx_t_11 = PyDict_New(); if (unlikely(!__pyx_t_11)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 226; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_11);
-
-  /* "MMTK_BSpline_transform_grid.pyx":228
- *         self.hCorner = np.array((self.spacing[0]*(self.counts[0]-1),
- *                         self.spacing[1]*(self.counts[1]-1),
- *                         self.spacing[2]*(self.counts[2]-1)), dtype=float)             # <<<<<<<<<<<<<<
- *         # To keep atoms within the grid
- *         self.k = 10000. # kJ/mol nm**2
- */
-  if (PyDict_SetItem(__pyx_t_11, __pyx_n_s_dtype, ((PyObject *)((PyObject*)(&PyFloat_Type)))) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 226; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-
-  /* "MMTK_BSpline_transform_grid.pyx":226
- *         self.vals = vals
- *         self.nyz = self.counts[1]*self.counts[2]
- *         self.hCorner = np.array((self.spacing[0]*(self.counts[0]-1),             # <<<<<<<<<<<<<<
- *                         self.spacing[1]*(self.counts[1]-1),
- *                         self.spacing[2]*(self.counts[2]-1)), dtype=float)
- */
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_6, __pyx_t_2, __pyx_t_11); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 226; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
-  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 226; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GIVEREF(__pyx_t_1);
-  __Pyx_GOTREF(__pyx_v_self->hCorner);
-  __Pyx_DECREF(((PyObject *)__pyx_v_self->hCorner));
-  __pyx_v_self->hCorner = ((PyArrayObject *)__pyx_t_1);
-  __pyx_t_1 = 0;
-
-  /* "MMTK_BSpline_transform_grid.pyx":230
- *                         self.spacing[2]*(self.counts[2]-1)), dtype=float)
- *         # To keep atoms within the grid
- *         self.k = 10000. # kJ/mol nm**2             # <<<<<<<<<<<<<<
- * 
- *     # This method is called for every single energy evaluation, so make
- */
-  __pyx_v_self->k = 10000.;
-
-  /* "MMTK_BSpline_transform_grid.pyx":208
- * 
- * 
- *     def __init__(self, universe, spacing, counts, vals, strength,             # <<<<<<<<<<<<<<
- *                  scaling_factor, grid_name, inv_power):
- *         print "------------test start---------------"
- */
-
-  /* function exit code */
-  __pyx_r = 0;
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_XDECREF(__pyx_t_11);
-  __Pyx_AddTraceback("MMTK_BSpline_transform_grid.BSplineTransformGridTerm.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = -1;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "MMTK_BSpline_transform_grid.pyx":236
- *     # do_force_constants are flags that indicate if gradients and/or
- *     # force constants are requested.
- *     cdef void evaluate(self, PyFFEvaluatorObject *eval,             # <<<<<<<<<<<<<<
- *                        energy_spec *input, energy_data *energy):
- * 
- */
-
-static void __pyx_f_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm_evaluate(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *__pyx_v_self, CYTHON_UNUSED PyFFEvaluatorObject *__pyx_v_eval, energy_spec *__pyx_v_input, energy_data *__pyx_v_energy) {
-  vector3 *__pyx_v_coordinates;
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t *__pyx_v_scaling_factor;
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t *__pyx_v_vals;
-  __pyx_t_27MMTK_BSpline_transform_grid_int_t *__pyx_v_counts;
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t *__pyx_v_spacing;
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t *__pyx_v_hCorner;
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_gridEnergy;
-  vector3 *__pyx_v_gradients;
-  PyArrayObject *__pyx_v_force_constants = 0;
-  int __pyx_v_i;
-  int __pyx_v_ix;
-  int __pyx_v_iy;
-  int __pyx_v_iz;
-  int __pyx_v_atom_index;
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_vertex[4][4][4];
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_dvdx;
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_dvdy;
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_dvdz;
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_dvdxdx;
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_dvdxdy;
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_dvdxdz;
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_dvdydy;
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_dvdydz;
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_v_dvdzdz;
-  double __pyx_v_interpolated;
-  double __pyx_v_prefactor;
-  PyObject *__pyx_v_indicies = NULL;
-  PyObject *__pyx_v_x = NULL;
-  PyObject *__pyx_v_y = NULL;
-  PyObject *__pyx_v_z = NULL;
-  PyObject *__pyx_v_fx = NULL;
-  PyObject *__pyx_v_fy = NULL;
-  PyObject *__pyx_v_fz = NULL;
-  int __pyx_v_ai;
-  __Pyx_LocalBuf_ND __pyx_pybuffernd_force_constants;
-  __Pyx_Buffer __pyx_pybuffer_force_constants;
-  __Pyx_RefNannyDeclarations
-  int __pyx_t_1;
-  PyObject *__pyx_t_2 = NULL;
-  int __pyx_t_3;
-  PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
-  PyObject *__pyx_t_6 = NULL;
-  int __pyx_t_7;
-  PyObject *__pyx_t_8 = NULL;
-  PyObject *__pyx_t_9 = NULL;
-  Py_ssize_t __pyx_t_10;
-  int __pyx_t_11;
-  Py_ssize_t __pyx_t_12;
-  PyObject *(*__pyx_t_13)(PyObject *);
-  PyObject *__pyx_t_14 = NULL;
-  Py_ssize_t __pyx_t_15;
-  PyObject *(*__pyx_t_16)(PyObject *);
-  PyObject *__pyx_t_17 = NULL;
-  Py_ssize_t __pyx_t_18;
-  PyObject *(*__pyx_t_19)(PyObject *);
-  PyObject *__pyx_t_20 = NULL;
-  PyObject *__pyx_t_21 = NULL;
-  Py_ssize_t __pyx_t_22;
-  Py_ssize_t __pyx_t_23;
-  Py_ssize_t __pyx_t_24;
-  Py_ssize_t __pyx_t_25;
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_t_26;
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_t_27;
-  __pyx_t_27MMTK_BSpline_transform_grid_float_t __pyx_t_28;
-  long __pyx_t_29;
-  int __pyx_t_30;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("evaluate", 0);
-  __pyx_pybuffer_force_constants.pybuffer.buf = NULL;
-  __pyx_pybuffer_force_constants.refcount = 0;
-  __pyx_pybuffernd_force_constants.data = NULL;
-  __pyx_pybuffernd_force_constants.rcbuffer = &__pyx_pybuffer_force_constants;
-
-  /* "MMTK_BSpline_transform_grid.pyx":264
- *         cdef double interpolated, prefactor
- * 
- *         gridEnergy = 0             # <<<<<<<<<<<<<<
- *         coordinates = <vector3 *>input.coordinates.data
- * 
- */
-  __pyx_v_gridEnergy = 0.0;
-
-  /* "MMTK_BSpline_transform_grid.pyx":265
- * 
- *         gridEnergy = 0
- *         coordinates = <vector3 *>input.coordinates.data             # <<<<<<<<<<<<<<
- * 
- *         # Pointers to numpy arrays for faster indexing
- */
-  __pyx_v_coordinates = ((vector3 *)__pyx_v_input->coordinates->data);
-
-  /* "MMTK_BSpline_transform_grid.pyx":268
- * 
- *         # Pointers to numpy arrays for faster indexing
- *         scaling_factor = <float_t *>self.scaling_factor.data             # <<<<<<<<<<<<<<
- *         vals = <float_t *>self.vals.data
- *         counts = <int_t *>self.counts.data
- */
-  __pyx_v_scaling_factor = ((__pyx_t_27MMTK_BSpline_transform_grid_float_t *)__pyx_v_self->scaling_factor->data);
-
-  /* "MMTK_BSpline_transform_grid.pyx":269
- *         # Pointers to numpy arrays for faster indexing
- *         scaling_factor = <float_t *>self.scaling_factor.data
- *         vals = <float_t *>self.vals.data             # <<<<<<<<<<<<<<
- *         counts = <int_t *>self.counts.data
- *         spacing = <float_t *>self.spacing.data
- */
-  __pyx_v_vals = ((__pyx_t_27MMTK_BSpline_transform_grid_float_t *)__pyx_v_self->vals->data);
-
-  /* "MMTK_BSpline_transform_grid.pyx":270
- *         scaling_factor = <float_t *>self.scaling_factor.data
- *         vals = <float_t *>self.vals.data
- *         counts = <int_t *>self.counts.data             # <<<<<<<<<<<<<<
- *         spacing = <float_t *>self.spacing.data
- *         hCorner = <float_t *>self.hCorner.data
- */
-  __pyx_v_counts = ((__pyx_t_27MMTK_BSpline_transform_grid_int_t *)__pyx_v_self->counts->data);
-
-  /* "MMTK_BSpline_transform_grid.pyx":271
- *         vals = <float_t *>self.vals.data
- *         counts = <int_t *>self.counts.data
- *         spacing = <float_t *>self.spacing.data             # <<<<<<<<<<<<<<
- *         hCorner = <float_t *>self.hCorner.data
- * 
- */
-  __pyx_v_spacing = ((__pyx_t_27MMTK_BSpline_transform_grid_float_t *)__pyx_v_self->spacing->data);
-
-  /* "MMTK_BSpline_transform_grid.pyx":272
- *         counts = <int_t *>self.counts.data
- *         spacing = <float_t *>self.spacing.data
- *         hCorner = <float_t *>self.hCorner.data             # <<<<<<<<<<<<<<
- * 
- *         # Initialize variables
- */
-  __pyx_v_hCorner = ((__pyx_t_27MMTK_BSpline_transform_grid_float_t *)__pyx_v_self->hCorner->data);
-
-  /* "MMTK_BSpline_transform_grid.pyx":275
- * 
- *         # Initialize variables
- *         if energy.gradients != NULL:             # <<<<<<<<<<<<<<
- *           gradients = <vector3 *>(<PyArrayObject *> energy.gradients).data
- * 
- */
-  __pyx_t_1 = ((__pyx_v_energy->gradients != NULL) != 0);
-  if (__pyx_t_1) {
-
-    /* "MMTK_BSpline_transform_grid.pyx":276
- *         # Initialize variables
- *         if energy.gradients != NULL:
- *           gradients = <vector3 *>(<PyArrayObject *> energy.gradients).data             # <<<<<<<<<<<<<<
- * 
- *         # Initialize variables
- */
-    __pyx_v_gradients = ((vector3 *)((PyArrayObject *)__pyx_v_energy->gradients)->data);
-    goto __pyx_L3;
-  }
-  __pyx_L3:;
-
-  /* "MMTK_BSpline_transform_grid.pyx":279
- * 
- *         # Initialize variables
- *         if energy.force_constants != NULL:             # <<<<<<<<<<<<<<
- *             force_constants = <np.ndarray[float_t, ndim=4] >(<PyArrayObject *> energy.force_constants)
- * 
- */
-  __pyx_t_1 = ((__pyx_v_energy->force_constants != NULL) != 0);
-  if (__pyx_t_1) {
-
-    /* "MMTK_BSpline_transform_grid.pyx":280
- *         # Initialize variables
- *         if energy.force_constants != NULL:
- *             force_constants = <np.ndarray[float_t, ndim=4] >(<PyArrayObject *> energy.force_constants)             # <<<<<<<<<<<<<<
- * 
- *         indicies = [ai for ai in range(self.natoms) if self.scaling_factor[ai]!=0]
- */
-    __pyx_t_2 = ((PyObject *)((PyArrayObject *)__pyx_v_energy->force_constants));
-    __Pyx_INCREF(__pyx_t_2);
-    {
-      __Pyx_BufFmt_StackElem __pyx_stack[1];
-      __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_force_constants.rcbuffer->pybuffer);
-      __pyx_t_3 = __Pyx_GetBufferAndValidate(&__pyx_pybuffernd_force_constants.rcbuffer->pybuffer, (PyObject*)((PyArrayObject *)__pyx_t_2), &__Pyx_TypeInfo_nn___pyx_t_27MMTK_BSpline_transform_grid_float_t, PyBUF_FORMAT| PyBUF_STRIDES, 4, 0, __pyx_stack);
-      if (unlikely(__pyx_t_3 < 0)) {
-        PyErr_Fetch(&__pyx_t_4, &__pyx_t_5, &__pyx_t_6);
-        if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_force_constants.rcbuffer->pybuffer, (PyObject*)__pyx_v_force_constants, &__Pyx_TypeInfo_nn___pyx_t_27MMTK_BSpline_transform_grid_float_t, PyBUF_FORMAT| PyBUF_STRIDES, 4, 0, __pyx_stack) == -1)) {
-          Py_XDECREF(__pyx_t_4); Py_XDECREF(__pyx_t_5); Py_XDECREF(__pyx_t_6);
-          __Pyx_RaiseBufferFallbackError();
-        } else {
-          PyErr_Restore(__pyx_t_4, __pyx_t_5, __pyx_t_6);
-        }
-      }
-      __pyx_pybuffernd_force_constants.diminfo[0].strides = __pyx_pybuffernd_force_constants.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_force_constants.diminfo[0].shape = __pyx_pybuffernd_force_constants.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_force_constants.diminfo[1].strides = __pyx_pybuffernd_force_constants.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_force_constants.diminfo[1].shape = __pyx_pybuffernd_force_constants.rcbuffer->pybuffer.shape[1]; __pyx_pybuffernd_force_constants.diminfo[2].strides = __pyx_pybuffernd_force_constants.rcbuffer->pybuffer.strides[2]; __pyx_pybuffernd_force_constants.diminfo[2].shape = __pyx_pybuffernd_force_constants.rcbuffer->pybuffer.shape[2]; __pyx_pybuffernd_force_constants.diminfo[3].strides = __pyx_pybuffernd_force_constants.rcbuffer->pybuffer.strides[3]; __pyx_pybuffernd_force_constants.diminfo[3].shape = __pyx_pybuffernd_force_constants.rcbuffer->pybuffer.shape[3];
-      if (unlikely(__pyx_t_3 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 280; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    }
-    __pyx_v_force_constants = ((PyArrayObject *)__pyx_t_2);
-    __pyx_t_2 = 0;
-    goto __pyx_L4;
-  }
-  __pyx_L4:;
-
-  /* "MMTK_BSpline_transform_grid.pyx":282
- *             force_constants = <np.ndarray[float_t, ndim=4] >(<PyArrayObject *> energy.force_constants)
- * 
- *         indicies = [ai for ai in range(self.natoms) if self.scaling_factor[ai]!=0]             # <<<<<<<<<<<<<<
- *         for atom_index in indicies:
- *           # Check to make sure coordinate is in grid
- */
-  __pyx_t_2 = PyList_New(0); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 282; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __pyx_v_self->natoms;
-  for (__pyx_t_7 = 0; __pyx_t_7 < __pyx_t_3; __pyx_t_7+=1) {
-    __pyx_v_ai = __pyx_t_7;
-    __pyx_t_8 = __Pyx_GetItemInt(((PyObject *)__pyx_v_self->scaling_factor), __pyx_v_ai, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(__pyx_t_8 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 282; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-    __Pyx_GOTREF(__pyx_t_8);
-    __pyx_t_9 = PyObject_RichCompare(__pyx_t_8, __pyx_int_0, Py_NE); __Pyx_XGOTREF(__pyx_t_9); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 282; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-    __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_9); if (unlikely(__pyx_t_1 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 282; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-    if (__pyx_t_1) {
-      __pyx_t_9 = __Pyx_PyInt_From_int(__pyx_v_ai); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 282; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_9);
-      if (unlikely(__Pyx_ListComp_Append(__pyx_t_2, (PyObject*)__pyx_t_9))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 282; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-      goto __pyx_L7;
-    }
-    __pyx_L7:;
-  }
-  __pyx_v_indicies = ((PyObject*)__pyx_t_2);
-  __pyx_t_2 = 0;
-
-  /* "MMTK_BSpline_transform_grid.pyx":283
- * 
- *         indicies = [ai for ai in range(self.natoms) if self.scaling_factor[ai]!=0]
- *         for atom_index in indicies:             # <<<<<<<<<<<<<<
- *           # Check to make sure coordinate is in grid
- *           if (coordinates[atom_index][0]>0 and
- */
-  __pyx_t_2 = __pyx_v_indicies; __Pyx_INCREF(__pyx_t_2); __pyx_t_10 = 0;
-  for (;;) {
-    if (__pyx_t_10 >= PyList_GET_SIZE(__pyx_t_2)) break;
-    #if CYTHON_COMPILING_IN_CPYTHON
-    __pyx_t_9 = PyList_GET_ITEM(__pyx_t_2, __pyx_t_10); __Pyx_INCREF(__pyx_t_9); __pyx_t_10++; if (unlikely(0 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 283; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    #else
-    __pyx_t_9 = PySequence_ITEM(__pyx_t_2, __pyx_t_10); __pyx_t_10++; if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 283; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    #endif
-    __pyx_t_3 = __Pyx_PyInt_As_int(__pyx_t_9); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 283; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-    __pyx_v_atom_index = __pyx_t_3;
-
-    /* "MMTK_BSpline_transform_grid.pyx":285
- *         for atom_index in indicies:
- *           # Check to make sure coordinate is in grid
- *           if (coordinates[atom_index][0]>0 and             # <<<<<<<<<<<<<<
- *               coordinates[atom_index][1]>0 and
- *               coordinates[atom_index][2]>0 and
- */
-    __pyx_t_11 = ((((__pyx_v_coordinates[__pyx_v_atom_index])[0]) > 0.0) != 0);
-    if (__pyx_t_11) {
-    } else {
-      __pyx_t_1 = __pyx_t_11;
-      goto __pyx_L11_bool_binop_done;
-    }
-
-    /* "MMTK_BSpline_transform_grid.pyx":286
- *           # Check to make sure coordinate is in grid
- *           if (coordinates[atom_index][0]>0 and
- *               coordinates[atom_index][1]>0 and             # <<<<<<<<<<<<<<
- *               coordinates[atom_index][2]>0 and
- *               coordinates[atom_index][0]<hCorner[0] and
- */
-    __pyx_t_11 = ((((__pyx_v_coordinates[__pyx_v_atom_index])[1]) > 0.0) != 0);
-    if (__pyx_t_11) {
-    } else {
-      __pyx_t_1 = __pyx_t_11;
-      goto __pyx_L11_bool_binop_done;
-    }
-
-    /* "MMTK_BSpline_transform_grid.pyx":287
- *           if (coordinates[atom_index][0]>0 and
- *               coordinates[atom_index][1]>0 and
- *               coordinates[atom_index][2]>0 and             # <<<<<<<<<<<<<<
- *               coordinates[atom_index][0]<hCorner[0] and
- *               coordinates[atom_index][1]<hCorner[1] and
- */
-    __pyx_t_11 = ((((__pyx_v_coordinates[__pyx_v_atom_index])[2]) > 0.0) != 0);
-    if (__pyx_t_11) {
-    } else {
-      __pyx_t_1 = __pyx_t_11;
-      goto __pyx_L11_bool_binop_done;
-    }
-
-    /* "MMTK_BSpline_transform_grid.pyx":288
- *               coordinates[atom_index][1]>0 and
- *               coordinates[atom_index][2]>0 and
- *               coordinates[atom_index][0]<hCorner[0] and             # <<<<<<<<<<<<<<
- *               coordinates[atom_index][1]<hCorner[1] and
- *               coordinates[atom_index][2]<hCorner[2]):
- */
-    __pyx_t_11 = ((((__pyx_v_coordinates[__pyx_v_atom_index])[0]) < (__pyx_v_hCorner[0])) != 0);
-    if (__pyx_t_11) {
-    } else {
-      __pyx_t_1 = __pyx_t_11;
-      goto __pyx_L11_bool_binop_done;
-    }
-
-    /* "MMTK_BSpline_transform_grid.pyx":289
- *               coordinates[atom_index][2]>0 and
- *               coordinates[atom_index][0]<hCorner[0] and
- *               coordinates[atom_index][1]<hCorner[1] and             # <<<<<<<<<<<<<<
- *               coordinates[atom_index][2]<hCorner[2]):
- * 
- */
-    __pyx_t_11 = ((((__pyx_v_coordinates[__pyx_v_atom_index])[1]) < (__pyx_v_hCorner[1])) != 0);
-    if (__pyx_t_11) {
-    } else {
-      __pyx_t_1 = __pyx_t_11;
-      goto __pyx_L11_bool_binop_done;
-    }
-
-    /* "MMTK_BSpline_transform_grid.pyx":290
- *               coordinates[atom_index][0]<hCorner[0] and
- *               coordinates[atom_index][1]<hCorner[1] and
- *               coordinates[atom_index][2]<hCorner[2]):             # <<<<<<<<<<<<<<
- * 
- *             # Index within the grid
- */
-    __pyx_t_11 = ((((__pyx_v_coordinates[__pyx_v_atom_index])[2]) < (__pyx_v_hCorner[2])) != 0);
-    __pyx_t_1 = __pyx_t_11;
-    __pyx_L11_bool_binop_done:;
-    if (__pyx_t_1) {
-
-      /* "MMTK_BSpline_transform_grid.pyx":293
- * 
- *             # Index within the grid
- *             ix = int(coordinates[atom_index][0]/spacing[0]-1)             # <<<<<<<<<<<<<<
- *             iy = int(coordinates[atom_index][1]/spacing[1]-1)
- *             iz = int(coordinates[atom_index][2]/spacing[2]-1)
- */
-      if (unlikely((__pyx_v_spacing[0]) == 0)) {
-        #ifdef WITH_THREAD
-        PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();
-        #endif
-        PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-        #ifdef WITH_THREAD
-        PyGILState_Release(__pyx_gilstate_save);
-        #endif
-        {__pyx_filename = __pyx_f[0]; __pyx_lineno = 293; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      }
-      __pyx_v_ix = ((int)((((__pyx_v_coordinates[__pyx_v_atom_index])[0]) / (__pyx_v_spacing[0])) - 1.0));
-
-      /* "MMTK_BSpline_transform_grid.pyx":294
- *             # Index within the grid
- *             ix = int(coordinates[atom_index][0]/spacing[0]-1)
- *             iy = int(coordinates[atom_index][1]/spacing[1]-1)             # <<<<<<<<<<<<<<
- *             iz = int(coordinates[atom_index][2]/spacing[2]-1)
- * 
- */
-      if (unlikely((__pyx_v_spacing[1]) == 0)) {
-        #ifdef WITH_THREAD
-        PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();
-        #endif
-        PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-        #ifdef WITH_THREAD
-        PyGILState_Release(__pyx_gilstate_save);
-        #endif
-        {__pyx_filename = __pyx_f[0]; __pyx_lineno = 294; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      }
-      __pyx_v_iy = ((int)((((__pyx_v_coordinates[__pyx_v_atom_index])[1]) / (__pyx_v_spacing[1])) - 1.0));
-
-      /* "MMTK_BSpline_transform_grid.pyx":295
- *             ix = int(coordinates[atom_index][0]/spacing[0]-1)
- *             iy = int(coordinates[atom_index][1]/spacing[1]-1)
- *             iz = int(coordinates[atom_index][2]/spacing[2]-1)             # <<<<<<<<<<<<<<
- * 
- *             i = ix*self.nyz + iy*counts[2] + iz
- */
-      if (unlikely((__pyx_v_spacing[2]) == 0)) {
-        #ifdef WITH_THREAD
-        PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();
-        #endif
-        PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-        #ifdef WITH_THREAD
-        PyGILState_Release(__pyx_gilstate_save);
-        #endif
-        {__pyx_filename = __pyx_f[0]; __pyx_lineno = 295; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      }
-      __pyx_v_iz = ((int)((((__pyx_v_coordinates[__pyx_v_atom_index])[2]) / (__pyx_v_spacing[2])) - 1.0));
-
-      /* "MMTK_BSpline_transform_grid.pyx":297
- *             iz = int(coordinates[atom_index][2]/spacing[2]-1)
- * 
- *             i = ix*self.nyz + iy*counts[2] + iz             # <<<<<<<<<<<<<<
- * 
- * 
- */
-      __pyx_v_i = (((__pyx_v_ix * __pyx_v_self->nyz) + (__pyx_v_iy * (__pyx_v_counts[2]))) + __pyx_v_iz);
-
-      /* "MMTK_BSpline_transform_grid.pyx":300
- * 
- * 
- *             for x in range(0,4):             # <<<<<<<<<<<<<<
- *                 for y in range(0,4):
- *                     for z in range(0,4):
- */
-      __pyx_t_9 = __Pyx_PyObject_Call(__pyx_builtin_range, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 300; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_9);
-      if (likely(PyList_CheckExact(__pyx_t_9)) || PyTuple_CheckExact(__pyx_t_9)) {
-        __pyx_t_8 = __pyx_t_9; __Pyx_INCREF(__pyx_t_8); __pyx_t_12 = 0;
-        __pyx_t_13 = NULL;
-      } else {
-        __pyx_t_12 = -1; __pyx_t_8 = PyObject_GetIter(__pyx_t_9); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 300; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __Pyx_GOTREF(__pyx_t_8);
-        __pyx_t_13 = Py_TYPE(__pyx_t_8)->tp_iternext; if (unlikely(!__pyx_t_13)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 300; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      }
-      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-      for (;;) {
-        if (likely(!__pyx_t_13)) {
-          if (likely(PyList_CheckExact(__pyx_t_8))) {
-            if (__pyx_t_12 >= PyList_GET_SIZE(__pyx_t_8)) break;
-            #if CYTHON_COMPILING_IN_CPYTHON
-            __pyx_t_9 = PyList_GET_ITEM(__pyx_t_8, __pyx_t_12); __Pyx_INCREF(__pyx_t_9); __pyx_t_12++; if (unlikely(0 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 300; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-            #else
-            __pyx_t_9 = PySequence_ITEM(__pyx_t_8, __pyx_t_12); __pyx_t_12++; if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 300; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-            #endif
-          } else {
-            if (__pyx_t_12 >= PyTuple_GET_SIZE(__pyx_t_8)) break;
-            #if CYTHON_COMPILING_IN_CPYTHON
-            __pyx_t_9 = PyTuple_GET_ITEM(__pyx_t_8, __pyx_t_12); __Pyx_INCREF(__pyx_t_9); __pyx_t_12++; if (unlikely(0 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 300; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-            #else
-            __pyx_t_9 = PySequence_ITEM(__pyx_t_8, __pyx_t_12); __pyx_t_12++; if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 300; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-            #endif
-          }
-        } else {
-          __pyx_t_9 = __pyx_t_13(__pyx_t_8);
-          if (unlikely(!__pyx_t_9)) {
-            PyObject* exc_type = PyErr_Occurred();
-            if (exc_type) {
-              if (likely(exc_type == PyExc_StopIteration || PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-              else {__pyx_filename = __pyx_f[0]; __pyx_lineno = 300; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-            }
-            break;
-          }
-          __Pyx_GOTREF(__pyx_t_9);
-        }
-        __Pyx_XDECREF_SET(__pyx_v_x, __pyx_t_9);
-        __pyx_t_9 = 0;
-
-        /* "MMTK_BSpline_transform_grid.pyx":301
- * 
- *             for x in range(0,4):
- *                 for y in range(0,4):             # <<<<<<<<<<<<<<
- *                     for z in range(0,4):
- *                         vertex[x][y][z]=vals[i+x*self.nyz+y*counts[2]+z]
- */
-        __pyx_t_9 = __Pyx_PyObject_Call(__pyx_builtin_range, __pyx_tuple__2, NULL); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 301; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __Pyx_GOTREF(__pyx_t_9);
-        if (likely(PyList_CheckExact(__pyx_t_9)) || PyTuple_CheckExact(__pyx_t_9)) {
-          __pyx_t_14 = __pyx_t_9; __Pyx_INCREF(__pyx_t_14); __pyx_t_15 = 0;
-          __pyx_t_16 = NULL;
-        } else {
-          __pyx_t_15 = -1; __pyx_t_14 = PyObject_GetIter(__pyx_t_9); if (unlikely(!__pyx_t_14)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 301; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-          __Pyx_GOTREF(__pyx_t_14);
-          __pyx_t_16 = Py_TYPE(__pyx_t_14)->tp_iternext; if (unlikely(!__pyx_t_16)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 301; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        }
-        __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-        for (;;) {
-          if (likely(!__pyx_t_16)) {
-            if (likely(PyList_CheckExact(__pyx_t_14))) {
-              if (__pyx_t_15 >= PyList_GET_SIZE(__pyx_t_14)) break;
-              #if CYTHON_COMPILING_IN_CPYTHON
-              __pyx_t_9 = PyList_GET_ITEM(__pyx_t_14, __pyx_t_15); __Pyx_INCREF(__pyx_t_9); __pyx_t_15++; if (unlikely(0 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 301; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-              #else
-              __pyx_t_9 = PySequence_ITEM(__pyx_t_14, __pyx_t_15); __pyx_t_15++; if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 301; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-              #endif
-            } else {
-              if (__pyx_t_15 >= PyTuple_GET_SIZE(__pyx_t_14)) break;
-              #if CYTHON_COMPILING_IN_CPYTHON
-              __pyx_t_9 = PyTuple_GET_ITEM(__pyx_t_14, __pyx_t_15); __Pyx_INCREF(__pyx_t_9); __pyx_t_15++; if (unlikely(0 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 301; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-              #else
-              __pyx_t_9 = PySequence_ITEM(__pyx_t_14, __pyx_t_15); __pyx_t_15++; if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 301; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-              #endif
-            }
-          } else {
-            __pyx_t_9 = __pyx_t_16(__pyx_t_14);
-            if (unlikely(!__pyx_t_9)) {
-              PyObject* exc_type = PyErr_Occurred();
-              if (exc_type) {
-                if (likely(exc_type == PyExc_StopIteration || PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-                else {__pyx_filename = __pyx_f[0]; __pyx_lineno = 301; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-              }
-              break;
-            }
-            __Pyx_GOTREF(__pyx_t_9);
-          }
-          __Pyx_XDECREF_SET(__pyx_v_y, __pyx_t_9);
-          __pyx_t_9 = 0;
-
-          /* "MMTK_BSpline_transform_grid.pyx":302
- *             for x in range(0,4):
- *                 for y in range(0,4):
- *                     for z in range(0,4):             # <<<<<<<<<<<<<<
- *                         vertex[x][y][z]=vals[i+x*self.nyz+y*counts[2]+z]
- * 
- */
-          __pyx_t_9 = __Pyx_PyObject_Call(__pyx_builtin_range, __pyx_tuple__3, NULL); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 302; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-          __Pyx_GOTREF(__pyx_t_9);
-          if (likely(PyList_CheckExact(__pyx_t_9)) || PyTuple_CheckExact(__pyx_t_9)) {
-            __pyx_t_17 = __pyx_t_9; __Pyx_INCREF(__pyx_t_17); __pyx_t_18 = 0;
-            __pyx_t_19 = NULL;
-          } else {
-            __pyx_t_18 = -1; __pyx_t_17 = PyObject_GetIter(__pyx_t_9); if (unlikely(!__pyx_t_17)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 302; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-            __Pyx_GOTREF(__pyx_t_17);
-            __pyx_t_19 = Py_TYPE(__pyx_t_17)->tp_iternext; if (unlikely(!__pyx_t_19)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 302; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-          }
-          __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-          for (;;) {
-            if (likely(!__pyx_t_19)) {
-              if (likely(PyList_CheckExact(__pyx_t_17))) {
-                if (__pyx_t_18 >= PyList_GET_SIZE(__pyx_t_17)) break;
-                #if CYTHON_COMPILING_IN_CPYTHON
-                __pyx_t_9 = PyList_GET_ITEM(__pyx_t_17, __pyx_t_18); __Pyx_INCREF(__pyx_t_9); __pyx_t_18++; if (unlikely(0 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 302; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-                #else
-                __pyx_t_9 = PySequence_ITEM(__pyx_t_17, __pyx_t_18); __pyx_t_18++; if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 302; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-                #endif
-              } else {
-                if (__pyx_t_18 >= PyTuple_GET_SIZE(__pyx_t_17)) break;
-                #if CYTHON_COMPILING_IN_CPYTHON
-                __pyx_t_9 = PyTuple_GET_ITEM(__pyx_t_17, __pyx_t_18); __Pyx_INCREF(__pyx_t_9); __pyx_t_18++; if (unlikely(0 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 302; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-                #else
-                __pyx_t_9 = PySequence_ITEM(__pyx_t_17, __pyx_t_18); __pyx_t_18++; if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 302; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-                #endif
-              }
-            } else {
-              __pyx_t_9 = __pyx_t_19(__pyx_t_17);
-              if (unlikely(!__pyx_t_9)) {
-                PyObject* exc_type = PyErr_Occurred();
-                if (exc_type) {
-                  if (likely(exc_type == PyExc_StopIteration || PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-                  else {__pyx_filename = __pyx_f[0]; __pyx_lineno = 302; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-                }
-                break;
-              }
-              __Pyx_GOTREF(__pyx_t_9);
-            }
-            __Pyx_XDECREF_SET(__pyx_v_z, __pyx_t_9);
-            __pyx_t_9 = 0;
-
-            /* "MMTK_BSpline_transform_grid.pyx":303
- *                 for y in range(0,4):
- *                     for z in range(0,4):
- *                         vertex[x][y][z]=vals[i+x*self.nyz+y*counts[2]+z]             # <<<<<<<<<<<<<<
- * 
- *            # Fraction within the box
- */
-            __pyx_t_9 = __Pyx_PyInt_From_int(__pyx_v_i); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 303; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-            __Pyx_GOTREF(__pyx_t_9);
-            __pyx_t_20 = __Pyx_PyInt_From_int(__pyx_v_self->nyz); if (unlikely(!__pyx_t_20)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 303; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-            __Pyx_GOTREF(__pyx_t_20);
-            __pyx_t_21 = PyNumber_Multiply(__pyx_v_x, __pyx_t_20); if (unlikely(!__pyx_t_21)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 303; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-            __Pyx_GOTREF(__pyx_t_21);
-            __Pyx_DECREF(__pyx_t_20); __pyx_t_20 = 0;
-            __pyx_t_20 = PyNumber_Add(__pyx_t_9, __pyx_t_21); if (unlikely(!__pyx_t_20)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 303; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-            __Pyx_GOTREF(__pyx_t_20);
-            __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-            __Pyx_DECREF(__pyx_t_21); __pyx_t_21 = 0;
-            __pyx_t_21 = __Pyx_PyInt_From_npy_long((__pyx_v_counts[2])); if (unlikely(!__pyx_t_21)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 303; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-            __Pyx_GOTREF(__pyx_t_21);
-            __pyx_t_9 = PyNumber_Multiply(__pyx_v_y, __pyx_t_21); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 303; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-            __Pyx_GOTREF(__pyx_t_9);
-            __Pyx_DECREF(__pyx_t_21); __pyx_t_21 = 0;
-            __pyx_t_21 = PyNumber_Add(__pyx_t_20, __pyx_t_9); if (unlikely(!__pyx_t_21)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 303; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-            __Pyx_GOTREF(__pyx_t_21);
-            __Pyx_DECREF(__pyx_t_20); __pyx_t_20 = 0;
-            __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-            __pyx_t_9 = PyNumber_Add(__pyx_t_21, __pyx_v_z); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 303; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-            __Pyx_GOTREF(__pyx_t_9);
-            __Pyx_DECREF(__pyx_t_21); __pyx_t_21 = 0;
-            __pyx_t_22 = __Pyx_PyIndex_AsSsize_t(__pyx_t_9); if (unlikely((__pyx_t_22 == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 303; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-            __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-            __pyx_t_23 = __Pyx_PyIndex_AsSsize_t(__pyx_v_x); if (unlikely((__pyx_t_23 == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 303; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-            __pyx_t_24 = __Pyx_PyIndex_AsSsize_t(__pyx_v_y); if (unlikely((__pyx_t_24 == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 303; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-            __pyx_t_25 = __Pyx_PyIndex_AsSsize_t(__pyx_v_z); if (unlikely((__pyx_t_25 == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 303; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-            (((__pyx_v_vertex[__pyx_t_23])[__pyx_t_24])[__pyx_t_25]) = (__pyx_v_vals[__pyx_t_22]);
-
-            /* "MMTK_BSpline_transform_grid.pyx":302
- *             for x in range(0,4):
- *                 for y in range(0,4):
- *                     for z in range(0,4):             # <<<<<<<<<<<<<<
- *                         vertex[x][y][z]=vals[i+x*self.nyz+y*counts[2]+z]
- * 
- */
-          }
-          __Pyx_DECREF(__pyx_t_17); __pyx_t_17 = 0;
-
-          /* "MMTK_BSpline_transform_grid.pyx":301
- * 
- *             for x in range(0,4):
- *                 for y in range(0,4):             # <<<<<<<<<<<<<<
- *                     for z in range(0,4):
- *                         vertex[x][y][z]=vals[i+x*self.nyz+y*counts[2]+z]
- */
-        }
-        __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
-
-        /* "MMTK_BSpline_transform_grid.pyx":300
- * 
- * 
- *             for x in range(0,4):             # <<<<<<<<<<<<<<
- *                 for y in range(0,4):
- *                     for z in range(0,4):
- */
-      }
-      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-
-      /* "MMTK_BSpline_transform_grid.pyx":306
- * 
- *            # Fraction within the box
- *             fx = (coordinates[atom_index][0] - (ix*spacing[0]))/spacing[0]             # <<<<<<<<<<<<<<
- *             fy = (coordinates[atom_index][1] - (iy*spacing[1]))/spacing[1]
- *             fz = (coordinates[atom_index][2] - (iz*spacing[2]))/spacing[2]
- */
-      __pyx_t_26 = (((__pyx_v_coordinates[__pyx_v_atom_index])[0]) - (__pyx_v_ix * (__pyx_v_spacing[0])));
-      if (unlikely((__pyx_v_spacing[0]) == 0)) {
-        #ifdef WITH_THREAD
-        PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();
-        #endif
-        PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-        #ifdef WITH_THREAD
-        PyGILState_Release(__pyx_gilstate_save);
-        #endif
-        {__pyx_filename = __pyx_f[0]; __pyx_lineno = 306; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      }
-      __pyx_t_8 = PyFloat_FromDouble((__pyx_t_26 / (__pyx_v_spacing[0]))); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 306; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_8);
-      __Pyx_XDECREF_SET(__pyx_v_fx, __pyx_t_8);
-      __pyx_t_8 = 0;
-
-      /* "MMTK_BSpline_transform_grid.pyx":307
- *            # Fraction within the box
- *             fx = (coordinates[atom_index][0] - (ix*spacing[0]))/spacing[0]
- *             fy = (coordinates[atom_index][1] - (iy*spacing[1]))/spacing[1]             # <<<<<<<<<<<<<<
- *             fz = (coordinates[atom_index][2] - (iz*spacing[2]))/spacing[2]
- * 
- */
-      __pyx_t_26 = (((__pyx_v_coordinates[__pyx_v_atom_index])[1]) - (__pyx_v_iy * (__pyx_v_spacing[1])));
-      if (unlikely((__pyx_v_spacing[1]) == 0)) {
-        #ifdef WITH_THREAD
-        PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();
-        #endif
-        PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-        #ifdef WITH_THREAD
-        PyGILState_Release(__pyx_gilstate_save);
-        #endif
-        {__pyx_filename = __pyx_f[0]; __pyx_lineno = 307; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      }
-      __pyx_t_8 = PyFloat_FromDouble((__pyx_t_26 / (__pyx_v_spacing[1]))); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 307; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_8);
-      __Pyx_XDECREF_SET(__pyx_v_fy, __pyx_t_8);
-      __pyx_t_8 = 0;
-
-      /* "MMTK_BSpline_transform_grid.pyx":308
- *             fx = (coordinates[atom_index][0] - (ix*spacing[0]))/spacing[0]
- *             fy = (coordinates[atom_index][1] - (iy*spacing[1]))/spacing[1]
- *             fz = (coordinates[atom_index][2] - (iz*spacing[2]))/spacing[2]             # <<<<<<<<<<<<<<
- * 
- *             interpolated=self.trisplineInterpolate(vertex,fx,fy,fz)
- */
-      __pyx_t_26 = (((__pyx_v_coordinates[__pyx_v_atom_index])[2]) - (__pyx_v_iz * (__pyx_v_spacing[2])));
-      if (unlikely((__pyx_v_spacing[2]) == 0)) {
-        #ifdef WITH_THREAD
-        PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();
-        #endif
-        PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-        #ifdef WITH_THREAD
-        PyGILState_Release(__pyx_gilstate_save);
-        #endif
-        {__pyx_filename = __pyx_f[0]; __pyx_lineno = 308; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      }
-      __pyx_t_8 = PyFloat_FromDouble((__pyx_t_26 / (__pyx_v_spacing[2]))); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 308; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_8);
-      __Pyx_XDECREF_SET(__pyx_v_fz, __pyx_t_8);
-      __pyx_t_8 = 0;
-
-      /* "MMTK_BSpline_transform_grid.pyx":310
- *             fz = (coordinates[atom_index][2] - (iz*spacing[2]))/spacing[2]
- * 
- *             interpolated=self.trisplineInterpolate(vertex,fx,fy,fz)             # <<<<<<<<<<<<<<
- *             if interpolated==0.0:
- *                 continue
- */
-      __pyx_t_26 = __pyx_PyFloat_AsDouble(__pyx_v_fx); if (unlikely((__pyx_t_26 == (npy_double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 310; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __pyx_t_27 = __pyx_PyFloat_AsDouble(__pyx_v_fy); if (unlikely((__pyx_t_27 == (npy_double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 310; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __pyx_t_28 = __pyx_PyFloat_AsDouble(__pyx_v_fz); if (unlikely((__pyx_t_28 == (npy_double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 310; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __pyx_v_interpolated = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->trisplineInterpolate(__pyx_v_self, __pyx_v_vertex, __pyx_t_26, __pyx_t_27, __pyx_t_28);
-
-      /* "MMTK_BSpline_transform_grid.pyx":311
- * 
- *             interpolated=self.trisplineInterpolate(vertex,fx,fy,fz)
- *             if interpolated==0.0:             # <<<<<<<<<<<<<<
- *                 continue
- *             gridEnergy += scaling_factor[atom_index]*interpolated**self.inv_power
- */
-      __pyx_t_1 = ((__pyx_v_interpolated == 0.0) != 0);
-      if (__pyx_t_1) {
-
-        /* "MMTK_BSpline_transform_grid.pyx":312
- *             interpolated=self.trisplineInterpolate(vertex,fx,fy,fz)
- *             if interpolated==0.0:
- *                 continue             # <<<<<<<<<<<<<<
- *             gridEnergy += scaling_factor[atom_index]*interpolated**self.inv_power
- *                 # hessian funciton          ************************
- */
-        goto __pyx_L8_continue;
-      }
-
-      /* "MMTK_BSpline_transform_grid.pyx":313
- *             if interpolated==0.0:
- *                 continue
- *             gridEnergy += scaling_factor[atom_index]*interpolated**self.inv_power             # <<<<<<<<<<<<<<
- *                 # hessian funciton          ************************
- *               # TODO: Check whether this is implemented correctly.
- */
-      __pyx_v_gridEnergy = (__pyx_v_gridEnergy + ((__pyx_v_scaling_factor[__pyx_v_atom_index]) * pow(((__pyx_t_27MMTK_BSpline_transform_grid_float_t)__pyx_v_interpolated), __pyx_v_self->inv_power)));
-
-      /* "MMTK_BSpline_transform_grid.pyx":316
- *                 # hessian funciton          ************************
- *               # TODO: Check whether this is implemented correctly.
- *             if energy.force_constants !=NULL:             # <<<<<<<<<<<<<<
- *                # x direction
- *               dvdxdx = self.derivateOfIntp_XX(vertex,fx,fy,fz)
- */
-      __pyx_t_1 = ((__pyx_v_energy->force_constants != NULL) != 0);
-      if (__pyx_t_1) {
-
-        /* "MMTK_BSpline_transform_grid.pyx":318
- *             if energy.force_constants !=NULL:
- *                # x direction
- *               dvdxdx = self.derivateOfIntp_XX(vertex,fx,fy,fz)             # <<<<<<<<<<<<<<
- *               dvdxdy = self.derivateOfIntp_XY(vertex,fx,fy,fz)
- *               dvdxdz = self.derivateOfIntp_XZ(vertex,fx,fy,fz)
- */
-        __pyx_t_28 = __pyx_PyFloat_AsDouble(__pyx_v_fx); if (unlikely((__pyx_t_28 == (npy_double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 318; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_t_27 = __pyx_PyFloat_AsDouble(__pyx_v_fy); if (unlikely((__pyx_t_27 == (npy_double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 318; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_t_26 = __pyx_PyFloat_AsDouble(__pyx_v_fz); if (unlikely((__pyx_t_26 == (npy_double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 318; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_v_dvdxdx = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->derivateOfIntp_XX(__pyx_v_self, __pyx_v_vertex, __pyx_t_28, __pyx_t_27, __pyx_t_26);
-
-        /* "MMTK_BSpline_transform_grid.pyx":319
- *                # x direction
- *               dvdxdx = self.derivateOfIntp_XX(vertex,fx,fy,fz)
- *               dvdxdy = self.derivateOfIntp_XY(vertex,fx,fy,fz)             # <<<<<<<<<<<<<<
- *               dvdxdz = self.derivateOfIntp_XZ(vertex,fx,fy,fz)
- *               # y direction
- */
-        __pyx_t_26 = __pyx_PyFloat_AsDouble(__pyx_v_fx); if (unlikely((__pyx_t_26 == (npy_double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 319; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_t_27 = __pyx_PyFloat_AsDouble(__pyx_v_fy); if (unlikely((__pyx_t_27 == (npy_double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 319; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_t_28 = __pyx_PyFloat_AsDouble(__pyx_v_fz); if (unlikely((__pyx_t_28 == (npy_double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 319; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_v_dvdxdy = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->derivateOfIntp_XY(__pyx_v_self, __pyx_v_vertex, __pyx_t_26, __pyx_t_27, __pyx_t_28);
-
-        /* "MMTK_BSpline_transform_grid.pyx":320
- *               dvdxdx = self.derivateOfIntp_XX(vertex,fx,fy,fz)
- *               dvdxdy = self.derivateOfIntp_XY(vertex,fx,fy,fz)
- *               dvdxdz = self.derivateOfIntp_XZ(vertex,fx,fy,fz)             # <<<<<<<<<<<<<<
- *               # y direction
- *               dvdydy = self.derivateOfIntp_YY(vertex,fx,fy,fz)
- */
-        __pyx_t_28 = __pyx_PyFloat_AsDouble(__pyx_v_fx); if (unlikely((__pyx_t_28 == (npy_double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 320; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_t_27 = __pyx_PyFloat_AsDouble(__pyx_v_fy); if (unlikely((__pyx_t_27 == (npy_double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 320; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_t_26 = __pyx_PyFloat_AsDouble(__pyx_v_fz); if (unlikely((__pyx_t_26 == (npy_double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 320; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_v_dvdxdz = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->derivateOfIntp_XZ(__pyx_v_self, __pyx_v_vertex, __pyx_t_28, __pyx_t_27, __pyx_t_26);
-
-        /* "MMTK_BSpline_transform_grid.pyx":322
- *               dvdxdz = self.derivateOfIntp_XZ(vertex,fx,fy,fz)
- *               # y direction
- *               dvdydy = self.derivateOfIntp_YY(vertex,fx,fy,fz)             # <<<<<<<<<<<<<<
- *               dvdydz = self.derivateOfIntp_YZ(vertex,fx,fy,fz)
- *               # z direction
- */
-        __pyx_t_26 = __pyx_PyFloat_AsDouble(__pyx_v_fx); if (unlikely((__pyx_t_26 == (npy_double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 322; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_t_27 = __pyx_PyFloat_AsDouble(__pyx_v_fy); if (unlikely((__pyx_t_27 == (npy_double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 322; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_t_28 = __pyx_PyFloat_AsDouble(__pyx_v_fz); if (unlikely((__pyx_t_28 == (npy_double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 322; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_v_dvdydy = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->derivateOfIntp_YY(__pyx_v_self, __pyx_v_vertex, __pyx_t_26, __pyx_t_27, __pyx_t_28);
-
-        /* "MMTK_BSpline_transform_grid.pyx":323
- *               # y direction
- *               dvdydy = self.derivateOfIntp_YY(vertex,fx,fy,fz)
- *               dvdydz = self.derivateOfIntp_YZ(vertex,fx,fy,fz)             # <<<<<<<<<<<<<<
- *               # z direction
- *               dvdzdz = self.derivateOfIntp_ZZ(vertex,fx,fy,fz)
- */
-        __pyx_t_28 = __pyx_PyFloat_AsDouble(__pyx_v_fx); if (unlikely((__pyx_t_28 == (npy_double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 323; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_t_27 = __pyx_PyFloat_AsDouble(__pyx_v_fy); if (unlikely((__pyx_t_27 == (npy_double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 323; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_t_26 = __pyx_PyFloat_AsDouble(__pyx_v_fz); if (unlikely((__pyx_t_26 == (npy_double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 323; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_v_dvdydz = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->derivateOfIntp_YZ(__pyx_v_self, __pyx_v_vertex, __pyx_t_28, __pyx_t_27, __pyx_t_26);
-
-        /* "MMTK_BSpline_transform_grid.pyx":325
- *               dvdydz = self.derivateOfIntp_YZ(vertex,fx,fy,fz)
- *               # z direction
- *               dvdzdz = self.derivateOfIntp_ZZ(vertex,fx,fy,fz)             # <<<<<<<<<<<<<<
- *               force_constants[atom_index][0][atom_index][0] +=  self.strength*scaling_factor[atom_index]*dvdxdx/spacing[0]/spacing[0]
- *               force_constants[atom_index][1][atom_index][1] +=  self.strength*scaling_factor[atom_index]*dvdydy/spacing[1]/spacing[1]
- */
-        __pyx_t_26 = __pyx_PyFloat_AsDouble(__pyx_v_fx); if (unlikely((__pyx_t_26 == (npy_double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 325; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_t_27 = __pyx_PyFloat_AsDouble(__pyx_v_fy); if (unlikely((__pyx_t_27 == (npy_double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 325; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_t_28 = __pyx_PyFloat_AsDouble(__pyx_v_fz); if (unlikely((__pyx_t_28 == (npy_double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 325; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_v_dvdzdz = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->derivateOfIntp_ZZ(__pyx_v_self, __pyx_v_vertex, __pyx_t_26, __pyx_t_27, __pyx_t_28);
-
-        /* "MMTK_BSpline_transform_grid.pyx":326
- *               # z direction
- *               dvdzdz = self.derivateOfIntp_ZZ(vertex,fx,fy,fz)
- *               force_constants[atom_index][0][atom_index][0] +=  self.strength*scaling_factor[atom_index]*dvdxdx/spacing[0]/spacing[0]             # <<<<<<<<<<<<<<
- *               force_constants[atom_index][1][atom_index][1] +=  self.strength*scaling_factor[atom_index]*dvdydy/spacing[1]/spacing[1]
- *               force_constants[atom_index][2][atom_index][2] +=  self.strength*scaling_factor[atom_index]*dvdzdz/spacing[2]/spacing[2]
- */
-        __pyx_t_8 = __Pyx_GetItemInt(((PyObject *)__pyx_v_force_constants), __pyx_v_atom_index, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(__pyx_t_8 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 326; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-        __Pyx_GOTREF(__pyx_t_8);
-        __pyx_t_14 = __Pyx_GetItemInt(__pyx_t_8, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(__pyx_t_14 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 326; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-        __Pyx_GOTREF(__pyx_t_14);
-        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-        __pyx_t_8 = __Pyx_GetItemInt(__pyx_t_14, __pyx_v_atom_index, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(__pyx_t_8 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 326; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-        __Pyx_GOTREF(__pyx_t_8);
-        __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
-        __pyx_t_12 = 0;
-        __pyx_t_14 = __Pyx_GetItemInt(__pyx_t_8, __pyx_t_12, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 1, 1); if (unlikely(__pyx_t_14 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 326; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-        __Pyx_GOTREF(__pyx_t_14);
-        __pyx_t_28 = ((__pyx_v_self->strength * (__pyx_v_scaling_factor[__pyx_v_atom_index])) * __pyx_v_dvdxdx);
-        if (unlikely((__pyx_v_spacing[0]) == 0)) {
-          #ifdef WITH_THREAD
-          PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();
-          #endif
-          PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-          #ifdef WITH_THREAD
-          PyGILState_Release(__pyx_gilstate_save);
-          #endif
-          {__pyx_filename = __pyx_f[0]; __pyx_lineno = 326; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        }
-        __pyx_t_27 = (__pyx_t_28 / (__pyx_v_spacing[0]));
-        if (unlikely((__pyx_v_spacing[0]) == 0)) {
-          #ifdef WITH_THREAD
-          PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();
-          #endif
-          PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-          #ifdef WITH_THREAD
-          PyGILState_Release(__pyx_gilstate_save);
-          #endif
-          {__pyx_filename = __pyx_f[0]; __pyx_lineno = 326; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        }
-        __pyx_t_17 = PyFloat_FromDouble((__pyx_t_27 / (__pyx_v_spacing[0]))); if (unlikely(!__pyx_t_17)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 326; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __Pyx_GOTREF(__pyx_t_17);
-        __pyx_t_9 = PyNumber_InPlaceAdd(__pyx_t_14, __pyx_t_17); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 326; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __Pyx_GOTREF(__pyx_t_9);
-        __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
-        __Pyx_DECREF(__pyx_t_17); __pyx_t_17 = 0;
-        if (unlikely(__Pyx_SetItemInt(__pyx_t_8, __pyx_t_12, __pyx_t_9, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 1, 1) < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 326; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-
-        /* "MMTK_BSpline_transform_grid.pyx":327
- *               dvdzdz = self.derivateOfIntp_ZZ(vertex,fx,fy,fz)
- *               force_constants[atom_index][0][atom_index][0] +=  self.strength*scaling_factor[atom_index]*dvdxdx/spacing[0]/spacing[0]
- *               force_constants[atom_index][1][atom_index][1] +=  self.strength*scaling_factor[atom_index]*dvdydy/spacing[1]/spacing[1]             # <<<<<<<<<<<<<<
- *               force_constants[atom_index][2][atom_index][2] +=  self.strength*scaling_factor[atom_index]*dvdzdz/spacing[2]/spacing[2]
- *               force_constants[atom_index][1][atom_index][0] +=  self.strength*scaling_factor[atom_index]*dvdxdy/spacing[0]/spacing[1]
- */
-        __pyx_t_8 = __Pyx_GetItemInt(((PyObject *)__pyx_v_force_constants), __pyx_v_atom_index, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(__pyx_t_8 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 327; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-        __Pyx_GOTREF(__pyx_t_8);
-        __pyx_t_9 = __Pyx_GetItemInt(__pyx_t_8, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(__pyx_t_9 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 327; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-        __Pyx_GOTREF(__pyx_t_9);
-        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-        __pyx_t_8 = __Pyx_GetItemInt(__pyx_t_9, __pyx_v_atom_index, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(__pyx_t_8 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 327; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-        __Pyx_GOTREF(__pyx_t_8);
-        __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-        __pyx_t_12 = 1;
-        __pyx_t_9 = __Pyx_GetItemInt(__pyx_t_8, __pyx_t_12, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 1, 1); if (unlikely(__pyx_t_9 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 327; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-        __Pyx_GOTREF(__pyx_t_9);
-        __pyx_t_27 = ((__pyx_v_self->strength * (__pyx_v_scaling_factor[__pyx_v_atom_index])) * __pyx_v_dvdydy);
-        if (unlikely((__pyx_v_spacing[1]) == 0)) {
-          #ifdef WITH_THREAD
-          PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();
-          #endif
-          PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-          #ifdef WITH_THREAD
-          PyGILState_Release(__pyx_gilstate_save);
-          #endif
-          {__pyx_filename = __pyx_f[0]; __pyx_lineno = 327; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        }
-        __pyx_t_28 = (__pyx_t_27 / (__pyx_v_spacing[1]));
-        if (unlikely((__pyx_v_spacing[1]) == 0)) {
-          #ifdef WITH_THREAD
-          PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();
-          #endif
-          PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-          #ifdef WITH_THREAD
-          PyGILState_Release(__pyx_gilstate_save);
-          #endif
-          {__pyx_filename = __pyx_f[0]; __pyx_lineno = 327; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        }
-        __pyx_t_17 = PyFloat_FromDouble((__pyx_t_28 / (__pyx_v_spacing[1]))); if (unlikely(!__pyx_t_17)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 327; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __Pyx_GOTREF(__pyx_t_17);
-        __pyx_t_14 = PyNumber_InPlaceAdd(__pyx_t_9, __pyx_t_17); if (unlikely(!__pyx_t_14)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 327; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __Pyx_GOTREF(__pyx_t_14);
-        __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-        __Pyx_DECREF(__pyx_t_17); __pyx_t_17 = 0;
-        if (unlikely(__Pyx_SetItemInt(__pyx_t_8, __pyx_t_12, __pyx_t_14, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 1, 1) < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 327; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
-        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-
-        /* "MMTK_BSpline_transform_grid.pyx":328
- *               force_constants[atom_index][0][atom_index][0] +=  self.strength*scaling_factor[atom_index]*dvdxdx/spacing[0]/spacing[0]
- *               force_constants[atom_index][1][atom_index][1] +=  self.strength*scaling_factor[atom_index]*dvdydy/spacing[1]/spacing[1]
- *               force_constants[atom_index][2][atom_index][2] +=  self.strength*scaling_factor[atom_index]*dvdzdz/spacing[2]/spacing[2]             # <<<<<<<<<<<<<<
- *               force_constants[atom_index][1][atom_index][0] +=  self.strength*scaling_factor[atom_index]*dvdxdy/spacing[0]/spacing[1]
- *               force_constants[atom_index][2][atom_index][0] +=  self.strength*scaling_factor[atom_index]*dvdxdz/spacing[0]/spacing[2]
- */
-        __pyx_t_8 = __Pyx_GetItemInt(((PyObject *)__pyx_v_force_constants), __pyx_v_atom_index, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(__pyx_t_8 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 328; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-        __Pyx_GOTREF(__pyx_t_8);
-        __pyx_t_14 = __Pyx_GetItemInt(__pyx_t_8, 2, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(__pyx_t_14 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 328; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-        __Pyx_GOTREF(__pyx_t_14);
-        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-        __pyx_t_8 = __Pyx_GetItemInt(__pyx_t_14, __pyx_v_atom_index, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(__pyx_t_8 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 328; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-        __Pyx_GOTREF(__pyx_t_8);
-        __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
-        __pyx_t_12 = 2;
-        __pyx_t_14 = __Pyx_GetItemInt(__pyx_t_8, __pyx_t_12, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 1, 1); if (unlikely(__pyx_t_14 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 328; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-        __Pyx_GOTREF(__pyx_t_14);
-        __pyx_t_28 = ((__pyx_v_self->strength * (__pyx_v_scaling_factor[__pyx_v_atom_index])) * __pyx_v_dvdzdz);
-        if (unlikely((__pyx_v_spacing[2]) == 0)) {
-          #ifdef WITH_THREAD
-          PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();
-          #endif
-          PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-          #ifdef WITH_THREAD
-          PyGILState_Release(__pyx_gilstate_save);
-          #endif
-          {__pyx_filename = __pyx_f[0]; __pyx_lineno = 328; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        }
-        __pyx_t_27 = (__pyx_t_28 / (__pyx_v_spacing[2]));
-        if (unlikely((__pyx_v_spacing[2]) == 0)) {
-          #ifdef WITH_THREAD
-          PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();
-          #endif
-          PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-          #ifdef WITH_THREAD
-          PyGILState_Release(__pyx_gilstate_save);
-          #endif
-          {__pyx_filename = __pyx_f[0]; __pyx_lineno = 328; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        }
-        __pyx_t_17 = PyFloat_FromDouble((__pyx_t_27 / (__pyx_v_spacing[2]))); if (unlikely(!__pyx_t_17)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 328; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __Pyx_GOTREF(__pyx_t_17);
-        __pyx_t_9 = PyNumber_InPlaceAdd(__pyx_t_14, __pyx_t_17); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 328; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __Pyx_GOTREF(__pyx_t_9);
-        __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
-        __Pyx_DECREF(__pyx_t_17); __pyx_t_17 = 0;
-        if (unlikely(__Pyx_SetItemInt(__pyx_t_8, __pyx_t_12, __pyx_t_9, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 1, 1) < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 328; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-
-        /* "MMTK_BSpline_transform_grid.pyx":329
- *               force_constants[atom_index][1][atom_index][1] +=  self.strength*scaling_factor[atom_index]*dvdydy/spacing[1]/spacing[1]
- *               force_constants[atom_index][2][atom_index][2] +=  self.strength*scaling_factor[atom_index]*dvdzdz/spacing[2]/spacing[2]
- *               force_constants[atom_index][1][atom_index][0] +=  self.strength*scaling_factor[atom_index]*dvdxdy/spacing[0]/spacing[1]             # <<<<<<<<<<<<<<
- *               force_constants[atom_index][2][atom_index][0] +=  self.strength*scaling_factor[atom_index]*dvdxdz/spacing[0]/spacing[2]
- *               force_constants[atom_index][2][atom_index][1] +=  self.strength*scaling_factor[atom_index]*dvdydz/spacing[1]/spacing[2]
- */
-        __pyx_t_8 = __Pyx_GetItemInt(((PyObject *)__pyx_v_force_constants), __pyx_v_atom_index, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(__pyx_t_8 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 329; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-        __Pyx_GOTREF(__pyx_t_8);
-        __pyx_t_9 = __Pyx_GetItemInt(__pyx_t_8, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(__pyx_t_9 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 329; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-        __Pyx_GOTREF(__pyx_t_9);
-        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-        __pyx_t_8 = __Pyx_GetItemInt(__pyx_t_9, __pyx_v_atom_index, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(__pyx_t_8 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 329; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-        __Pyx_GOTREF(__pyx_t_8);
-        __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-        __pyx_t_12 = 0;
-        __pyx_t_9 = __Pyx_GetItemInt(__pyx_t_8, __pyx_t_12, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 1, 1); if (unlikely(__pyx_t_9 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 329; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-        __Pyx_GOTREF(__pyx_t_9);
-        __pyx_t_27 = ((__pyx_v_self->strength * (__pyx_v_scaling_factor[__pyx_v_atom_index])) * __pyx_v_dvdxdy);
-        if (unlikely((__pyx_v_spacing[0]) == 0)) {
-          #ifdef WITH_THREAD
-          PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();
-          #endif
-          PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-          #ifdef WITH_THREAD
-          PyGILState_Release(__pyx_gilstate_save);
-          #endif
-          {__pyx_filename = __pyx_f[0]; __pyx_lineno = 329; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        }
-        __pyx_t_28 = (__pyx_t_27 / (__pyx_v_spacing[0]));
-        if (unlikely((__pyx_v_spacing[1]) == 0)) {
-          #ifdef WITH_THREAD
-          PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();
-          #endif
-          PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-          #ifdef WITH_THREAD
-          PyGILState_Release(__pyx_gilstate_save);
-          #endif
-          {__pyx_filename = __pyx_f[0]; __pyx_lineno = 329; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        }
-        __pyx_t_17 = PyFloat_FromDouble((__pyx_t_28 / (__pyx_v_spacing[1]))); if (unlikely(!__pyx_t_17)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 329; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __Pyx_GOTREF(__pyx_t_17);
-        __pyx_t_14 = PyNumber_InPlaceAdd(__pyx_t_9, __pyx_t_17); if (unlikely(!__pyx_t_14)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 329; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __Pyx_GOTREF(__pyx_t_14);
-        __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-        __Pyx_DECREF(__pyx_t_17); __pyx_t_17 = 0;
-        if (unlikely(__Pyx_SetItemInt(__pyx_t_8, __pyx_t_12, __pyx_t_14, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 1, 1) < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 329; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
-        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-
-        /* "MMTK_BSpline_transform_grid.pyx":330
- *               force_constants[atom_index][2][atom_index][2] +=  self.strength*scaling_factor[atom_index]*dvdzdz/spacing[2]/spacing[2]
- *               force_constants[atom_index][1][atom_index][0] +=  self.strength*scaling_factor[atom_index]*dvdxdy/spacing[0]/spacing[1]
- *               force_constants[atom_index][2][atom_index][0] +=  self.strength*scaling_factor[atom_index]*dvdxdz/spacing[0]/spacing[2]             # <<<<<<<<<<<<<<
- *               force_constants[atom_index][2][atom_index][1] +=  self.strength*scaling_factor[atom_index]*dvdydz/spacing[1]/spacing[2]
- *               force_constants[atom_index][0][atom_index][1] = force_constants[atom_index][1][atom_index][0]
- */
-        __pyx_t_8 = __Pyx_GetItemInt(((PyObject *)__pyx_v_force_constants), __pyx_v_atom_index, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(__pyx_t_8 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 330; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-        __Pyx_GOTREF(__pyx_t_8);
-        __pyx_t_14 = __Pyx_GetItemInt(__pyx_t_8, 2, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(__pyx_t_14 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 330; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-        __Pyx_GOTREF(__pyx_t_14);
-        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-        __pyx_t_8 = __Pyx_GetItemInt(__pyx_t_14, __pyx_v_atom_index, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(__pyx_t_8 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 330; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-        __Pyx_GOTREF(__pyx_t_8);
-        __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
-        __pyx_t_12 = 0;
-        __pyx_t_14 = __Pyx_GetItemInt(__pyx_t_8, __pyx_t_12, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 1, 1); if (unlikely(__pyx_t_14 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 330; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-        __Pyx_GOTREF(__pyx_t_14);
-        __pyx_t_28 = ((__pyx_v_self->strength * (__pyx_v_scaling_factor[__pyx_v_atom_index])) * __pyx_v_dvdxdz);
-        if (unlikely((__pyx_v_spacing[0]) == 0)) {
-          #ifdef WITH_THREAD
-          PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();
-          #endif
-          PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-          #ifdef WITH_THREAD
-          PyGILState_Release(__pyx_gilstate_save);
-          #endif
-          {__pyx_filename = __pyx_f[0]; __pyx_lineno = 330; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        }
-        __pyx_t_27 = (__pyx_t_28 / (__pyx_v_spacing[0]));
-        if (unlikely((__pyx_v_spacing[2]) == 0)) {
-          #ifdef WITH_THREAD
-          PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();
-          #endif
-          PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-          #ifdef WITH_THREAD
-          PyGILState_Release(__pyx_gilstate_save);
-          #endif
-          {__pyx_filename = __pyx_f[0]; __pyx_lineno = 330; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        }
-        __pyx_t_17 = PyFloat_FromDouble((__pyx_t_27 / (__pyx_v_spacing[2]))); if (unlikely(!__pyx_t_17)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 330; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __Pyx_GOTREF(__pyx_t_17);
-        __pyx_t_9 = PyNumber_InPlaceAdd(__pyx_t_14, __pyx_t_17); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 330; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __Pyx_GOTREF(__pyx_t_9);
-        __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
-        __Pyx_DECREF(__pyx_t_17); __pyx_t_17 = 0;
-        if (unlikely(__Pyx_SetItemInt(__pyx_t_8, __pyx_t_12, __pyx_t_9, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 1, 1) < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 330; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-
-        /* "MMTK_BSpline_transform_grid.pyx":331
- *               force_constants[atom_index][1][atom_index][0] +=  self.strength*scaling_factor[atom_index]*dvdxdy/spacing[0]/spacing[1]
- *               force_constants[atom_index][2][atom_index][0] +=  self.strength*scaling_factor[atom_index]*dvdxdz/spacing[0]/spacing[2]
- *               force_constants[atom_index][2][atom_index][1] +=  self.strength*scaling_factor[atom_index]*dvdydz/spacing[1]/spacing[2]             # <<<<<<<<<<<<<<
- *               force_constants[atom_index][0][atom_index][1] = force_constants[atom_index][1][atom_index][0]
- *               force_constants[atom_index][0][atom_index][2] = force_constants[atom_index][2][atom_index][0]
- */
-        __pyx_t_8 = __Pyx_GetItemInt(((PyObject *)__pyx_v_force_constants), __pyx_v_atom_index, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(__pyx_t_8 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 331; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-        __Pyx_GOTREF(__pyx_t_8);
-        __pyx_t_9 = __Pyx_GetItemInt(__pyx_t_8, 2, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(__pyx_t_9 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 331; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-        __Pyx_GOTREF(__pyx_t_9);
-        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-        __pyx_t_8 = __Pyx_GetItemInt(__pyx_t_9, __pyx_v_atom_index, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(__pyx_t_8 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 331; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-        __Pyx_GOTREF(__pyx_t_8);
-        __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-        __pyx_t_12 = 1;
-        __pyx_t_9 = __Pyx_GetItemInt(__pyx_t_8, __pyx_t_12, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 1, 1); if (unlikely(__pyx_t_9 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 331; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-        __Pyx_GOTREF(__pyx_t_9);
-        __pyx_t_27 = ((__pyx_v_self->strength * (__pyx_v_scaling_factor[__pyx_v_atom_index])) * __pyx_v_dvdydz);
-        if (unlikely((__pyx_v_spacing[1]) == 0)) {
-          #ifdef WITH_THREAD
-          PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();
-          #endif
-          PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-          #ifdef WITH_THREAD
-          PyGILState_Release(__pyx_gilstate_save);
-          #endif
-          {__pyx_filename = __pyx_f[0]; __pyx_lineno = 331; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        }
-        __pyx_t_28 = (__pyx_t_27 / (__pyx_v_spacing[1]));
-        if (unlikely((__pyx_v_spacing[2]) == 0)) {
-          #ifdef WITH_THREAD
-          PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();
-          #endif
-          PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-          #ifdef WITH_THREAD
-          PyGILState_Release(__pyx_gilstate_save);
-          #endif
-          {__pyx_filename = __pyx_f[0]; __pyx_lineno = 331; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        }
-        __pyx_t_17 = PyFloat_FromDouble((__pyx_t_28 / (__pyx_v_spacing[2]))); if (unlikely(!__pyx_t_17)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 331; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __Pyx_GOTREF(__pyx_t_17);
-        __pyx_t_14 = PyNumber_InPlaceAdd(__pyx_t_9, __pyx_t_17); if (unlikely(!__pyx_t_14)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 331; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __Pyx_GOTREF(__pyx_t_14);
-        __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-        __Pyx_DECREF(__pyx_t_17); __pyx_t_17 = 0;
-        if (unlikely(__Pyx_SetItemInt(__pyx_t_8, __pyx_t_12, __pyx_t_14, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 1, 1) < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 331; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
-        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-
-        /* "MMTK_BSpline_transform_grid.pyx":332
- *               force_constants[atom_index][2][atom_index][0] +=  self.strength*scaling_factor[atom_index]*dvdxdz/spacing[0]/spacing[2]
- *               force_constants[atom_index][2][atom_index][1] +=  self.strength*scaling_factor[atom_index]*dvdydz/spacing[1]/spacing[2]
- *               force_constants[atom_index][0][atom_index][1] = force_constants[atom_index][1][atom_index][0]             # <<<<<<<<<<<<<<
- *               force_constants[atom_index][0][atom_index][2] = force_constants[atom_index][2][atom_index][0]
- *               force_constants[atom_index][1][atom_index][2] = force_constants[atom_index][2][atom_index][1]
- */
-        __pyx_t_8 = __Pyx_GetItemInt(((PyObject *)__pyx_v_force_constants), __pyx_v_atom_index, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(__pyx_t_8 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 332; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-        __Pyx_GOTREF(__pyx_t_8);
-        __pyx_t_14 = __Pyx_GetItemInt(__pyx_t_8, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(__pyx_t_14 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 332; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-        __Pyx_GOTREF(__pyx_t_14);
-        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-        __pyx_t_8 = __Pyx_GetItemInt(__pyx_t_14, __pyx_v_atom_index, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(__pyx_t_8 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 332; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-        __Pyx_GOTREF(__pyx_t_8);
-        __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
-        __pyx_t_14 = __Pyx_GetItemInt(__pyx_t_8, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(__pyx_t_14 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 332; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-        __Pyx_GOTREF(__pyx_t_14);
-        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-        __pyx_t_8 = __Pyx_GetItemInt(((PyObject *)__pyx_v_force_constants), __pyx_v_atom_index, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(__pyx_t_8 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 332; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-        __Pyx_GOTREF(__pyx_t_8);
-        __pyx_t_17 = __Pyx_GetItemInt(__pyx_t_8, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(__pyx_t_17 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 332; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-        __Pyx_GOTREF(__pyx_t_17);
-        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-        __pyx_t_8 = __Pyx_GetItemInt(__pyx_t_17, __pyx_v_atom_index, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(__pyx_t_8 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 332; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-        __Pyx_GOTREF(__pyx_t_8);
-        __Pyx_DECREF(__pyx_t_17); __pyx_t_17 = 0;
-        if (unlikely(__Pyx_SetItemInt(__pyx_t_8, 1, __pyx_t_14, long, 1, __Pyx_PyInt_From_long, 0, 0, 1) < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 332; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-        __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
-
-        /* "MMTK_BSpline_transform_grid.pyx":333
- *               force_constants[atom_index][2][atom_index][1] +=  self.strength*scaling_factor[atom_index]*dvdydz/spacing[1]/spacing[2]
- *               force_constants[atom_index][0][atom_index][1] = force_constants[atom_index][1][atom_index][0]
- *               force_constants[atom_index][0][atom_index][2] = force_constants[atom_index][2][atom_index][0]             # <<<<<<<<<<<<<<
- *               force_constants[atom_index][1][atom_index][2] = force_constants[atom_index][2][atom_index][1]
- * 
- */
-        __pyx_t_14 = __Pyx_GetItemInt(((PyObject *)__pyx_v_force_constants), __pyx_v_atom_index, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(__pyx_t_14 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 333; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-        __Pyx_GOTREF(__pyx_t_14);
-        __pyx_t_8 = __Pyx_GetItemInt(__pyx_t_14, 2, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(__pyx_t_8 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 333; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-        __Pyx_GOTREF(__pyx_t_8);
-        __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
-        __pyx_t_14 = __Pyx_GetItemInt(__pyx_t_8, __pyx_v_atom_index, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(__pyx_t_14 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 333; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-        __Pyx_GOTREF(__pyx_t_14);
-        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-        __pyx_t_8 = __Pyx_GetItemInt(__pyx_t_14, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(__pyx_t_8 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 333; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-        __Pyx_GOTREF(__pyx_t_8);
-        __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
-        __pyx_t_14 = __Pyx_GetItemInt(((PyObject *)__pyx_v_force_constants), __pyx_v_atom_index, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(__pyx_t_14 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 333; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-        __Pyx_GOTREF(__pyx_t_14);
-        __pyx_t_17 = __Pyx_GetItemInt(__pyx_t_14, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(__pyx_t_17 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 333; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-        __Pyx_GOTREF(__pyx_t_17);
-        __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
-        __pyx_t_14 = __Pyx_GetItemInt(__pyx_t_17, __pyx_v_atom_index, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(__pyx_t_14 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 333; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-        __Pyx_GOTREF(__pyx_t_14);
-        __Pyx_DECREF(__pyx_t_17); __pyx_t_17 = 0;
-        if (unlikely(__Pyx_SetItemInt(__pyx_t_14, 2, __pyx_t_8, long, 1, __Pyx_PyInt_From_long, 0, 0, 1) < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 333; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
-        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-
-        /* "MMTK_BSpline_transform_grid.pyx":334
- *               force_constants[atom_index][0][atom_index][1] = force_constants[atom_index][1][atom_index][0]
- *               force_constants[atom_index][0][atom_index][2] = force_constants[atom_index][2][atom_index][0]
- *               force_constants[atom_index][1][atom_index][2] = force_constants[atom_index][2][atom_index][1]             # <<<<<<<<<<<<<<
- * 
- *               #*****************************************
- */
-        __pyx_t_8 = __Pyx_GetItemInt(((PyObject *)__pyx_v_force_constants), __pyx_v_atom_index, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(__pyx_t_8 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 334; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-        __Pyx_GOTREF(__pyx_t_8);
-        __pyx_t_14 = __Pyx_GetItemInt(__pyx_t_8, 2, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(__pyx_t_14 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 334; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-        __Pyx_GOTREF(__pyx_t_14);
-        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-        __pyx_t_8 = __Pyx_GetItemInt(__pyx_t_14, __pyx_v_atom_index, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(__pyx_t_8 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 334; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-        __Pyx_GOTREF(__pyx_t_8);
-        __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
-        __pyx_t_14 = __Pyx_GetItemInt(__pyx_t_8, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(__pyx_t_14 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 334; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-        __Pyx_GOTREF(__pyx_t_14);
-        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-        __pyx_t_8 = __Pyx_GetItemInt(((PyObject *)__pyx_v_force_constants), __pyx_v_atom_index, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(__pyx_t_8 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 334; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-        __Pyx_GOTREF(__pyx_t_8);
-        __pyx_t_17 = __Pyx_GetItemInt(__pyx_t_8, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(__pyx_t_17 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 334; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-        __Pyx_GOTREF(__pyx_t_17);
-        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-        __pyx_t_8 = __Pyx_GetItemInt(__pyx_t_17, __pyx_v_atom_index, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(__pyx_t_8 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 334; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-        __Pyx_GOTREF(__pyx_t_8);
-        __Pyx_DECREF(__pyx_t_17); __pyx_t_17 = 0;
-        if (unlikely(__Pyx_SetItemInt(__pyx_t_8, 2, __pyx_t_14, long, 1, __Pyx_PyInt_From_long, 0, 0, 1) < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 334; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-        __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
-        goto __pyx_L24;
-      }
-      __pyx_L24:;
-
-      /* "MMTK_BSpline_transform_grid.pyx":337
- * 
- *               #*****************************************
- *             if energy.gradients != NULL:             # <<<<<<<<<<<<<<
- *               # x coordinate
- *               dvdx = self.derivateOfIntp_X(vertex,fx,fy,fz)
- */
-      __pyx_t_1 = ((__pyx_v_energy->gradients != NULL) != 0);
-      if (__pyx_t_1) {
-
-        /* "MMTK_BSpline_transform_grid.pyx":339
- *             if energy.gradients != NULL:
- *               # x coordinate
- *               dvdx = self.derivateOfIntp_X(vertex,fx,fy,fz)             # <<<<<<<<<<<<<<
- *               # y self.coordinate
- *               dvdy = self.derivateOfIntp_Y(vertex,fx,fy,fz)
- */
-        __pyx_t_28 = __pyx_PyFloat_AsDouble(__pyx_v_fx); if (unlikely((__pyx_t_28 == (npy_double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 339; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_t_27 = __pyx_PyFloat_AsDouble(__pyx_v_fy); if (unlikely((__pyx_t_27 == (npy_double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 339; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_t_26 = __pyx_PyFloat_AsDouble(__pyx_v_fz); if (unlikely((__pyx_t_26 == (npy_double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 339; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_v_dvdx = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->derivateOfIntp_X(__pyx_v_self, __pyx_v_vertex, __pyx_t_28, __pyx_t_27, __pyx_t_26);
-
-        /* "MMTK_BSpline_transform_grid.pyx":341
- *               dvdx = self.derivateOfIntp_X(vertex,fx,fy,fz)
- *               # y self.coordinate
- *               dvdy = self.derivateOfIntp_Y(vertex,fx,fy,fz)             # <<<<<<<<<<<<<<
- *               # z coordinate
- *               dvdz = self.derivateOfIntp_Z(vertex,fx,fy,fz)
- */
-        __pyx_t_26 = __pyx_PyFloat_AsDouble(__pyx_v_fx); if (unlikely((__pyx_t_26 == (npy_double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 341; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_t_27 = __pyx_PyFloat_AsDouble(__pyx_v_fy); if (unlikely((__pyx_t_27 == (npy_double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 341; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_t_28 = __pyx_PyFloat_AsDouble(__pyx_v_fz); if (unlikely((__pyx_t_28 == (npy_double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 341; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_v_dvdy = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->derivateOfIntp_Y(__pyx_v_self, __pyx_v_vertex, __pyx_t_26, __pyx_t_27, __pyx_t_28);
-
-        /* "MMTK_BSpline_transform_grid.pyx":343
- *               dvdy = self.derivateOfIntp_Y(vertex,fx,fy,fz)
- *               # z coordinate
- *               dvdz = self.derivateOfIntp_Z(vertex,fx,fy,fz)             # <<<<<<<<<<<<<<
- *               prefactor = self.strength*scaling_factor[atom_index]*self.inv_power*interpolated**self.inv_power_m1
- * 
- */
-        __pyx_t_28 = __pyx_PyFloat_AsDouble(__pyx_v_fx); if (unlikely((__pyx_t_28 == (npy_double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 343; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_t_27 = __pyx_PyFloat_AsDouble(__pyx_v_fy); if (unlikely((__pyx_t_27 == (npy_double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 343; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_t_26 = __pyx_PyFloat_AsDouble(__pyx_v_fz); if (unlikely((__pyx_t_26 == (npy_double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 343; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_v_dvdz = ((struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)__pyx_v_self->__pyx_vtab)->derivateOfIntp_Z(__pyx_v_self, __pyx_v_vertex, __pyx_t_28, __pyx_t_27, __pyx_t_26);
-
-        /* "MMTK_BSpline_transform_grid.pyx":344
- *               # z coordinate
- *               dvdz = self.derivateOfIntp_Z(vertex,fx,fy,fz)
- *               prefactor = self.strength*scaling_factor[atom_index]*self.inv_power*interpolated**self.inv_power_m1             # <<<<<<<<<<<<<<
- * 
- *               gradients[atom_index][0] += prefactor*dvdx/spacing[0]
- */
-        __pyx_v_prefactor = (((__pyx_v_self->strength * (__pyx_v_scaling_factor[__pyx_v_atom_index])) * __pyx_v_self->inv_power) * pow(((__pyx_t_27MMTK_BSpline_transform_grid_float_t)__pyx_v_interpolated), __pyx_v_self->inv_power_m1));
-
-        /* "MMTK_BSpline_transform_grid.pyx":346
- *               prefactor = self.strength*scaling_factor[atom_index]*self.inv_power*interpolated**self.inv_power_m1
- * 
- *               gradients[atom_index][0] += prefactor*dvdx/spacing[0]             # <<<<<<<<<<<<<<
- *               gradients[atom_index][1] += prefactor*dvdy/spacing[1]
- *               gradients[atom_index][2] += prefactor*dvdz/spacing[2]
- */
-        __pyx_t_3 = __pyx_v_atom_index;
-        __pyx_t_29 = 0;
-        __pyx_t_26 = (__pyx_v_prefactor * __pyx_v_dvdx);
-        if (unlikely((__pyx_v_spacing[0]) == 0)) {
-          #ifdef WITH_THREAD
-          PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();
-          #endif
-          PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-          #ifdef WITH_THREAD
-          PyGILState_Release(__pyx_gilstate_save);
-          #endif
-          {__pyx_filename = __pyx_f[0]; __pyx_lineno = 346; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        }
-        ((__pyx_v_gradients[__pyx_t_3])[__pyx_t_29]) = (((__pyx_v_gradients[__pyx_t_3])[__pyx_t_29]) + (__pyx_t_26 / (__pyx_v_spacing[0])));
-
-        /* "MMTK_BSpline_transform_grid.pyx":347
- * 
- *               gradients[atom_index][0] += prefactor*dvdx/spacing[0]
- *               gradients[atom_index][1] += prefactor*dvdy/spacing[1]             # <<<<<<<<<<<<<<
- *               gradients[atom_index][2] += prefactor*dvdz/spacing[2]
- *           else:
- */
-        __pyx_t_3 = __pyx_v_atom_index;
-        __pyx_t_29 = 1;
-        __pyx_t_26 = (__pyx_v_prefactor * __pyx_v_dvdy);
-        if (unlikely((__pyx_v_spacing[1]) == 0)) {
-          #ifdef WITH_THREAD
-          PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();
-          #endif
-          PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-          #ifdef WITH_THREAD
-          PyGILState_Release(__pyx_gilstate_save);
-          #endif
-          {__pyx_filename = __pyx_f[0]; __pyx_lineno = 347; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        }
-        ((__pyx_v_gradients[__pyx_t_3])[__pyx_t_29]) = (((__pyx_v_gradients[__pyx_t_3])[__pyx_t_29]) + (__pyx_t_26 / (__pyx_v_spacing[1])));
-
-        /* "MMTK_BSpline_transform_grid.pyx":348
- *               gradients[atom_index][0] += prefactor*dvdx/spacing[0]
- *               gradients[atom_index][1] += prefactor*dvdy/spacing[1]
- *               gradients[atom_index][2] += prefactor*dvdz/spacing[2]             # <<<<<<<<<<<<<<
- *           else:
- *             for i in range(3):
- */
-        __pyx_t_3 = __pyx_v_atom_index;
-        __pyx_t_29 = 2;
-        __pyx_t_26 = (__pyx_v_prefactor * __pyx_v_dvdz);
-        if (unlikely((__pyx_v_spacing[2]) == 0)) {
-          #ifdef WITH_THREAD
-          PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();
-          #endif
-          PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-          #ifdef WITH_THREAD
-          PyGILState_Release(__pyx_gilstate_save);
-          #endif
-          {__pyx_filename = __pyx_f[0]; __pyx_lineno = 348; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        }
-        ((__pyx_v_gradients[__pyx_t_3])[__pyx_t_29]) = (((__pyx_v_gradients[__pyx_t_3])[__pyx_t_29]) + (__pyx_t_26 / (__pyx_v_spacing[2])));
-        goto __pyx_L25;
-      }
-      __pyx_L25:;
-      goto __pyx_L10;
-    }
-    /*else*/ {
-
-      /* "MMTK_BSpline_transform_grid.pyx":350
- *               gradients[atom_index][2] += prefactor*dvdz/spacing[2]
- *           else:
- *             for i in range(3):             # <<<<<<<<<<<<<<
- *               if (coordinates[atom_index][i]<0):
- *                 gridEnergy += self.k*coordinates[atom_index][i]**2/2.
- */
-      for (__pyx_t_3 = 0; __pyx_t_3 < 3; __pyx_t_3+=1) {
-        __pyx_v_i = __pyx_t_3;
-
-        /* "MMTK_BSpline_transform_grid.pyx":351
- *           else:
- *             for i in range(3):
- *               if (coordinates[atom_index][i]<0):             # <<<<<<<<<<<<<<
- *                 gridEnergy += self.k*coordinates[atom_index][i]**2/2.
- *                 if energy.gradients != NULL:
- */
-        __pyx_t_1 = ((((__pyx_v_coordinates[__pyx_v_atom_index])[__pyx_v_i]) < 0.0) != 0);
-        if (__pyx_t_1) {
-
-          /* "MMTK_BSpline_transform_grid.pyx":352
- *             for i in range(3):
- *               if (coordinates[atom_index][i]<0):
- *                 gridEnergy += self.k*coordinates[atom_index][i]**2/2.             # <<<<<<<<<<<<<<
- *                 if energy.gradients != NULL:
- *                   gradients[atom_index][i] += self.k*coordinates[atom_index][i]
- */
-          __pyx_v_gridEnergy = (__pyx_v_gridEnergy + ((__pyx_v_self->k * pow(((__pyx_v_coordinates[__pyx_v_atom_index])[__pyx_v_i]), 2.0)) / 2.));
-
-          /* "MMTK_BSpline_transform_grid.pyx":353
- *               if (coordinates[atom_index][i]<0):
- *                 gridEnergy += self.k*coordinates[atom_index][i]**2/2.
- *                 if energy.gradients != NULL:             # <<<<<<<<<<<<<<
- *                   gradients[atom_index][i] += self.k*coordinates[atom_index][i]
- *               elif (coordinates[atom_index][i]>hCorner[i]):
- */
-          __pyx_t_1 = ((__pyx_v_energy->gradients != NULL) != 0);
-          if (__pyx_t_1) {
-
-            /* "MMTK_BSpline_transform_grid.pyx":354
- *                 gridEnergy += self.k*coordinates[atom_index][i]**2/2.
- *                 if energy.gradients != NULL:
- *                   gradients[atom_index][i] += self.k*coordinates[atom_index][i]             # <<<<<<<<<<<<<<
- *               elif (coordinates[atom_index][i]>hCorner[i]):
- *                 gridEnergy += self.k*(coordinates[atom_index][i]-hCorner[i])**2/2.
- */
-            __pyx_t_7 = __pyx_v_atom_index;
-            __pyx_t_30 = __pyx_v_i;
-            ((__pyx_v_gradients[__pyx_t_7])[__pyx_t_30]) = (((__pyx_v_gradients[__pyx_t_7])[__pyx_t_30]) + (__pyx_v_self->k * ((__pyx_v_coordinates[__pyx_v_atom_index])[__pyx_v_i])));
-            goto __pyx_L29;
-          }
-          __pyx_L29:;
-          goto __pyx_L28;
-        }
-
-        /* "MMTK_BSpline_transform_grid.pyx":355
- *                 if energy.gradients != NULL:
- *                   gradients[atom_index][i] += self.k*coordinates[atom_index][i]
- *               elif (coordinates[atom_index][i]>hCorner[i]):             # <<<<<<<<<<<<<<
- *                 gridEnergy += self.k*(coordinates[atom_index][i]-hCorner[i])**2/2.
- *                 if energy.gradients != NULL:
- */
-        __pyx_t_1 = ((((__pyx_v_coordinates[__pyx_v_atom_index])[__pyx_v_i]) > (__pyx_v_hCorner[__pyx_v_i])) != 0);
-        if (__pyx_t_1) {
-
-          /* "MMTK_BSpline_transform_grid.pyx":356
- *                   gradients[atom_index][i] += self.k*coordinates[atom_index][i]
- *               elif (coordinates[atom_index][i]>hCorner[i]):
- *                 gridEnergy += self.k*(coordinates[atom_index][i]-hCorner[i])**2/2.             # <<<<<<<<<<<<<<
- *                 if energy.gradients != NULL:
- *                   gradients[atom_index][i] += self.k*(coordinates[atom_index][i]-hCorner[i])
- */
-          __pyx_v_gridEnergy = (__pyx_v_gridEnergy + ((__pyx_v_self->k * pow((((__pyx_v_coordinates[__pyx_v_atom_index])[__pyx_v_i]) - (__pyx_v_hCorner[__pyx_v_i])), 2.0)) / 2.));
-
-          /* "MMTK_BSpline_transform_grid.pyx":357
- *               elif (coordinates[atom_index][i]>hCorner[i]):
- *                 gridEnergy += self.k*(coordinates[atom_index][i]-hCorner[i])**2/2.
- *                 if energy.gradients != NULL:             # <<<<<<<<<<<<<<
- *                   gradients[atom_index][i] += self.k*(coordinates[atom_index][i]-hCorner[i])
- * 
- */
-          __pyx_t_1 = ((__pyx_v_energy->gradients != NULL) != 0);
-          if (__pyx_t_1) {
-
-            /* "MMTK_BSpline_transform_grid.pyx":358
- *                 gridEnergy += self.k*(coordinates[atom_index][i]-hCorner[i])**2/2.
- *                 if energy.gradients != NULL:
- *                   gradients[atom_index][i] += self.k*(coordinates[atom_index][i]-hCorner[i])             # <<<<<<<<<<<<<<
- * 
- *         energy.energy_terms[self.index] = gridEnergy*self.strength
- */
-            __pyx_t_7 = __pyx_v_atom_index;
-            __pyx_t_30 = __pyx_v_i;
-            ((__pyx_v_gradients[__pyx_t_7])[__pyx_t_30]) = (((__pyx_v_gradients[__pyx_t_7])[__pyx_t_30]) + (__pyx_v_self->k * (((__pyx_v_coordinates[__pyx_v_atom_index])[__pyx_v_i]) - (__pyx_v_hCorner[__pyx_v_i]))));
-            goto __pyx_L30;
-          }
-          __pyx_L30:;
-          goto __pyx_L28;
-        }
-        __pyx_L28:;
-      }
-    }
-    __pyx_L10:;
-
-    /* "MMTK_BSpline_transform_grid.pyx":283
- * 
- *         indicies = [ai for ai in range(self.natoms) if self.scaling_factor[ai]!=0]
- *         for atom_index in indicies:             # <<<<<<<<<<<<<<
- *           # Check to make sure coordinate is in grid
- *           if (coordinates[atom_index][0]>0 and
- */
-    __pyx_L8_continue:;
-  }
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-  /* "MMTK_BSpline_transform_grid.pyx":360
- *                   gradients[atom_index][i] += self.k*(coordinates[atom_index][i]-hCorner[i])
- * 
- *         energy.energy_terms[self.index] = gridEnergy*self.strength             # <<<<<<<<<<<<<<
- */
-  (__pyx_v_energy->energy_terms[__pyx_v_self->__pyx_base.index]) = (__pyx_v_gridEnergy * __pyx_v_self->strength);
-
-  /* "MMTK_BSpline_transform_grid.pyx":236
- *     # do_force_constants are flags that indicate if gradients and/or
- *     # force constants are requested.
- *     cdef void evaluate(self, PyFFEvaluatorObject *eval,             # <<<<<<<<<<<<<<
- *                        energy_spec *input, energy_data *energy):
- * 
- */
-
-  /* function exit code */
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_8);
-  __Pyx_XDECREF(__pyx_t_9);
-  __Pyx_XDECREF(__pyx_t_14);
-  __Pyx_XDECREF(__pyx_t_17);
-  __Pyx_XDECREF(__pyx_t_20);
-  __Pyx_XDECREF(__pyx_t_21);
-  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
-    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
-    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_force_constants.rcbuffer->pybuffer);
-  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
-  __Pyx_WriteUnraisable("MMTK_BSpline_transform_grid.BSplineTransformGridTerm.evaluate", __pyx_clineno, __pyx_lineno, __pyx_filename, 0);
-  goto __pyx_L2;
-  __pyx_L0:;
-  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_force_constants.rcbuffer->pybuffer);
-  __pyx_L2:;
-  __Pyx_XDECREF((PyObject *)__pyx_v_force_constants);
-  __Pyx_XDECREF(__pyx_v_indicies);
-  __Pyx_XDECREF(__pyx_v_x);
-  __Pyx_XDECREF(__pyx_v_y);
-  __Pyx_XDECREF(__pyx_v_z);
-  __Pyx_XDECREF(__pyx_v_fx);
-  __Pyx_XDECREF(__pyx_v_fy);
-  __Pyx_XDECREF(__pyx_v_fz);
-  __Pyx_RefNannyFinishContext();
-}
-
-/* "numpy.pxd":194
- *         # experimental exception made for __getbuffer__ and __releasebuffer__
- *         # -- the details of this may change.
- *         def __getbuffer__(ndarray self, Py_buffer* info, int flags):             # <<<<<<<<<<<<<<
- *             # This implementation of getbuffer is geared towards Cython
- *             # requirements, and does not yet fullfill the PEP.
- */
-
-/* Python wrapper */
-static CYTHON_UNUSED int __pyx_pw_5numpy_7ndarray_1__getbuffer__(PyObject *__pyx_v_self, Py_buffer *__pyx_v_info, int __pyx_v_flags); /*proto*/
-static CYTHON_UNUSED int __pyx_pw_5numpy_7ndarray_1__getbuffer__(PyObject *__pyx_v_self, Py_buffer *__pyx_v_info, int __pyx_v_flags) {
-  int __pyx_r;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__getbuffer__ (wrapper)", 0);
-  __pyx_r = __pyx_pf_5numpy_7ndarray___getbuffer__(((PyArrayObject *)__pyx_v_self), ((Py_buffer *)__pyx_v_info), ((int)__pyx_v_flags));
-
-  /* function exit code */
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, Py_buffer *__pyx_v_info, int __pyx_v_flags) {
-  int __pyx_v_copy_shape;
-  int __pyx_v_i;
-  int __pyx_v_ndim;
-  int __pyx_v_endian_detector;
-  int __pyx_v_little_endian;
-  int __pyx_v_t;
-  char *__pyx_v_f;
-  PyArray_Descr *__pyx_v_descr = 0;
-  int __pyx_v_offset;
-  int __pyx_v_hasfields;
-  int __pyx_r;
-  __Pyx_RefNannyDeclarations
-  int __pyx_t_1;
-  int __pyx_t_2;
-  PyObject *__pyx_t_3 = NULL;
-  int __pyx_t_4;
-  int __pyx_t_5;
-  PyObject *__pyx_t_6 = NULL;
-  char *__pyx_t_7;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__getbuffer__", 0);
-  if (__pyx_v_info != NULL) {
-    __pyx_v_info->obj = Py_None; __Pyx_INCREF(Py_None);
-    __Pyx_GIVEREF(__pyx_v_info->obj);
-  }
-
-  /* "numpy.pxd":200
- *             # of flags
- * 
- *             if info == NULL: return             # <<<<<<<<<<<<<<
- * 
- *             cdef int copy_shape, i, ndim
- */
-  __pyx_t_1 = ((__pyx_v_info == NULL) != 0);
-  if (__pyx_t_1) {
-    __pyx_r = 0;
-    goto __pyx_L0;
-  }
-
-  /* "numpy.pxd":203
- * 
- *             cdef int copy_shape, i, ndim
- *             cdef int endian_detector = 1             # <<<<<<<<<<<<<<
- *             cdef bint little_endian = ((<char*>&endian_detector)[0] != 0)
- * 
- */
-  __pyx_v_endian_detector = 1;
-
-  /* "numpy.pxd":204
- *             cdef int copy_shape, i, ndim
- *             cdef int endian_detector = 1
- *             cdef bint little_endian = ((<char*>&endian_detector)[0] != 0)             # <<<<<<<<<<<<<<
- * 
- *             ndim = PyArray_NDIM(self)
- */
-  __pyx_v_little_endian = ((((char *)(&__pyx_v_endian_detector))[0]) != 0);
-
-  /* "numpy.pxd":206
- *             cdef bint little_endian = ((<char*>&endian_detector)[0] != 0)
- * 
- *             ndim = PyArray_NDIM(self)             # <<<<<<<<<<<<<<
- * 
- *             if sizeof(npy_intp) != sizeof(Py_ssize_t):
- */
-  __pyx_v_ndim = PyArray_NDIM(__pyx_v_self);
-
-  /* "numpy.pxd":208
- *             ndim = PyArray_NDIM(self)
- * 
- *             if sizeof(npy_intp) != sizeof(Py_ssize_t):             # <<<<<<<<<<<<<<
- *                 copy_shape = 1
- *             else:
- */
-  __pyx_t_1 = (((sizeof(npy_intp)) != (sizeof(Py_ssize_t))) != 0);
-  if (__pyx_t_1) {
-
-    /* "numpy.pxd":209
- * 
- *             if sizeof(npy_intp) != sizeof(Py_ssize_t):
- *                 copy_shape = 1             # <<<<<<<<<<<<<<
- *             else:
- *                 copy_shape = 0
- */
-    __pyx_v_copy_shape = 1;
-    goto __pyx_L4;
-  }
-  /*else*/ {
-
-    /* "numpy.pxd":211
- *                 copy_shape = 1
- *             else:
- *                 copy_shape = 0             # <<<<<<<<<<<<<<
- * 
- *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)
- */
-    __pyx_v_copy_shape = 0;
-  }
-  __pyx_L4:;
-
-  /* "numpy.pxd":213
- *                 copy_shape = 0
- * 
- *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)             # <<<<<<<<<<<<<<
- *                 and not PyArray_CHKFLAGS(self, NPY_C_CONTIGUOUS)):
- *                 raise ValueError(u"ndarray is not C contiguous")
- */
-  __pyx_t_2 = (((__pyx_v_flags & PyBUF_C_CONTIGUOUS) == PyBUF_C_CONTIGUOUS) != 0);
-  if (__pyx_t_2) {
-  } else {
-    __pyx_t_1 = __pyx_t_2;
-    goto __pyx_L6_bool_binop_done;
-  }
-
-  /* "numpy.pxd":214
- * 
- *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)
- *                 and not PyArray_CHKFLAGS(self, NPY_C_CONTIGUOUS)):             # <<<<<<<<<<<<<<
- *                 raise ValueError(u"ndarray is not C contiguous")
- * 
- */
-  __pyx_t_2 = ((!(PyArray_CHKFLAGS(__pyx_v_self, NPY_C_CONTIGUOUS) != 0)) != 0);
-  __pyx_t_1 = __pyx_t_2;
-  __pyx_L6_bool_binop_done:;
-  if (__pyx_t_1) {
-
-    /* "numpy.pxd":215
- *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)
- *                 and not PyArray_CHKFLAGS(self, NPY_C_CONTIGUOUS)):
- *                 raise ValueError(u"ndarray is not C contiguous")             # <<<<<<<<<<<<<<
- * 
- *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)
- */
-    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__4, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 215; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_Raise(__pyx_t_3, 0, 0, 0);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    {__pyx_filename = __pyx_f[1]; __pyx_lineno = 215; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  }
-
-  /* "numpy.pxd":217
- *                 raise ValueError(u"ndarray is not C contiguous")
- * 
- *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)             # <<<<<<<<<<<<<<
- *                 and not PyArray_CHKFLAGS(self, NPY_F_CONTIGUOUS)):
- *                 raise ValueError(u"ndarray is not Fortran contiguous")
- */
-  __pyx_t_2 = (((__pyx_v_flags & PyBUF_F_CONTIGUOUS) == PyBUF_F_CONTIGUOUS) != 0);
-  if (__pyx_t_2) {
-  } else {
-    __pyx_t_1 = __pyx_t_2;
-    goto __pyx_L9_bool_binop_done;
-  }
-
-  /* "numpy.pxd":218
- * 
- *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)
- *                 and not PyArray_CHKFLAGS(self, NPY_F_CONTIGUOUS)):             # <<<<<<<<<<<<<<
- *                 raise ValueError(u"ndarray is not Fortran contiguous")
- * 
- */
-  __pyx_t_2 = ((!(PyArray_CHKFLAGS(__pyx_v_self, NPY_F_CONTIGUOUS) != 0)) != 0);
-  __pyx_t_1 = __pyx_t_2;
-  __pyx_L9_bool_binop_done:;
-  if (__pyx_t_1) {
-
-    /* "numpy.pxd":219
- *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)
- *                 and not PyArray_CHKFLAGS(self, NPY_F_CONTIGUOUS)):
- *                 raise ValueError(u"ndarray is not Fortran contiguous")             # <<<<<<<<<<<<<<
- * 
- *             info.buf = PyArray_DATA(self)
- */
-    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__5, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 219; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_Raise(__pyx_t_3, 0, 0, 0);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    {__pyx_filename = __pyx_f[1]; __pyx_lineno = 219; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  }
-
-  /* "numpy.pxd":221
- *                 raise ValueError(u"ndarray is not Fortran contiguous")
- * 
- *             info.buf = PyArray_DATA(self)             # <<<<<<<<<<<<<<
- *             info.ndim = ndim
- *             if copy_shape:
- */
-  __pyx_v_info->buf = PyArray_DATA(__pyx_v_self);
-
-  /* "numpy.pxd":222
- * 
- *             info.buf = PyArray_DATA(self)
- *             info.ndim = ndim             # <<<<<<<<<<<<<<
- *             if copy_shape:
- *                 # Allocate new buffer for strides and shape info.
- */
-  __pyx_v_info->ndim = __pyx_v_ndim;
-
-  /* "numpy.pxd":223
- *             info.buf = PyArray_DATA(self)
- *             info.ndim = ndim
- *             if copy_shape:             # <<<<<<<<<<<<<<
- *                 # Allocate new buffer for strides and shape info.
- *                 # This is allocated as one block, strides first.
- */
-  __pyx_t_1 = (__pyx_v_copy_shape != 0);
-  if (__pyx_t_1) {
-
-    /* "numpy.pxd":226
- *                 # Allocate new buffer for strides and shape info.
- *                 # This is allocated as one block, strides first.
- *                 info.strides = <Py_ssize_t*>stdlib.malloc(sizeof(Py_ssize_t) * <size_t>ndim * 2)             # <<<<<<<<<<<<<<
- *                 info.shape = info.strides + ndim
- *                 for i in range(ndim):
- */
-    __pyx_v_info->strides = ((Py_ssize_t *)malloc((((sizeof(Py_ssize_t)) * ((size_t)__pyx_v_ndim)) * 2)));
-
-    /* "numpy.pxd":227
- *                 # This is allocated as one block, strides first.
- *                 info.strides = <Py_ssize_t*>stdlib.malloc(sizeof(Py_ssize_t) * <size_t>ndim * 2)
- *                 info.shape = info.strides + ndim             # <<<<<<<<<<<<<<
- *                 for i in range(ndim):
- *                     info.strides[i] = PyArray_STRIDES(self)[i]
- */
-    __pyx_v_info->shape = (__pyx_v_info->strides + __pyx_v_ndim);
-
-    /* "numpy.pxd":228
- *                 info.strides = <Py_ssize_t*>stdlib.malloc(sizeof(Py_ssize_t) * <size_t>ndim * 2)
- *                 info.shape = info.strides + ndim
- *                 for i in range(ndim):             # <<<<<<<<<<<<<<
- *                     info.strides[i] = PyArray_STRIDES(self)[i]
- *                     info.shape[i] = PyArray_DIMS(self)[i]
- */
-    __pyx_t_4 = __pyx_v_ndim;
-    for (__pyx_t_5 = 0; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
-      __pyx_v_i = __pyx_t_5;
-
-      /* "numpy.pxd":229
- *                 info.shape = info.strides + ndim
- *                 for i in range(ndim):
- *                     info.strides[i] = PyArray_STRIDES(self)[i]             # <<<<<<<<<<<<<<
- *                     info.shape[i] = PyArray_DIMS(self)[i]
- *             else:
- */
-      (__pyx_v_info->strides[__pyx_v_i]) = (PyArray_STRIDES(__pyx_v_self)[__pyx_v_i]);
-
-      /* "numpy.pxd":230
- *                 for i in range(ndim):
- *                     info.strides[i] = PyArray_STRIDES(self)[i]
- *                     info.shape[i] = PyArray_DIMS(self)[i]             # <<<<<<<<<<<<<<
- *             else:
- *                 info.strides = <Py_ssize_t*>PyArray_STRIDES(self)
- */
-      (__pyx_v_info->shape[__pyx_v_i]) = (PyArray_DIMS(__pyx_v_self)[__pyx_v_i]);
-    }
-    goto __pyx_L11;
-  }
-  /*else*/ {
-
-    /* "numpy.pxd":232
- *                     info.shape[i] = PyArray_DIMS(self)[i]
- *             else:
- *                 info.strides = <Py_ssize_t*>PyArray_STRIDES(self)             # <<<<<<<<<<<<<<
- *                 info.shape = <Py_ssize_t*>PyArray_DIMS(self)
- *             info.suboffsets = NULL
- */
-    __pyx_v_info->strides = ((Py_ssize_t *)PyArray_STRIDES(__pyx_v_self));
-
-    /* "numpy.pxd":233
- *             else:
- *                 info.strides = <Py_ssize_t*>PyArray_STRIDES(self)
- *                 info.shape = <Py_ssize_t*>PyArray_DIMS(self)             # <<<<<<<<<<<<<<
- *             info.suboffsets = NULL
- *             info.itemsize = PyArray_ITEMSIZE(self)
- */
-    __pyx_v_info->shape = ((Py_ssize_t *)PyArray_DIMS(__pyx_v_self));
-  }
-  __pyx_L11:;
-
-  /* "numpy.pxd":234
- *                 info.strides = <Py_ssize_t*>PyArray_STRIDES(self)
- *                 info.shape = <Py_ssize_t*>PyArray_DIMS(self)
- *             info.suboffsets = NULL             # <<<<<<<<<<<<<<
- *             info.itemsize = PyArray_ITEMSIZE(self)
- *             info.readonly = not PyArray_ISWRITEABLE(self)
- */
-  __pyx_v_info->suboffsets = NULL;
-
-  /* "numpy.pxd":235
- *                 info.shape = <Py_ssize_t*>PyArray_DIMS(self)
- *             info.suboffsets = NULL
- *             info.itemsize = PyArray_ITEMSIZE(self)             # <<<<<<<<<<<<<<
- *             info.readonly = not PyArray_ISWRITEABLE(self)
- * 
- */
-  __pyx_v_info->itemsize = PyArray_ITEMSIZE(__pyx_v_self);
-
-  /* "numpy.pxd":236
- *             info.suboffsets = NULL
- *             info.itemsize = PyArray_ITEMSIZE(self)
- *             info.readonly = not PyArray_ISWRITEABLE(self)             # <<<<<<<<<<<<<<
- * 
- *             cdef int t
- */
-  __pyx_v_info->readonly = (!(PyArray_ISWRITEABLE(__pyx_v_self) != 0));
-
-  /* "numpy.pxd":239
- * 
- *             cdef int t
- *             cdef char* f = NULL             # <<<<<<<<<<<<<<
- *             cdef dtype descr = self.descr
- *             cdef list stack
- */
-  __pyx_v_f = NULL;
-
-  /* "numpy.pxd":240
- *             cdef int t
- *             cdef char* f = NULL
- *             cdef dtype descr = self.descr             # <<<<<<<<<<<<<<
- *             cdef list stack
- *             cdef int offset
- */
-  __pyx_t_3 = ((PyObject *)__pyx_v_self->descr);
-  __Pyx_INCREF(__pyx_t_3);
-  __pyx_v_descr = ((PyArray_Descr *)__pyx_t_3);
-  __pyx_t_3 = 0;
-
-  /* "numpy.pxd":244
- *             cdef int offset
- * 
- *             cdef bint hasfields = PyDataType_HASFIELDS(descr)             # <<<<<<<<<<<<<<
- * 
- *             if not hasfields and not copy_shape:
- */
-  __pyx_v_hasfields = PyDataType_HASFIELDS(__pyx_v_descr);
-
-  /* "numpy.pxd":246
- *             cdef bint hasfields = PyDataType_HASFIELDS(descr)
- * 
- *             if not hasfields and not copy_shape:             # <<<<<<<<<<<<<<
- *                 # do not call releasebuffer
- *                 info.obj = None
- */
-  __pyx_t_2 = ((!(__pyx_v_hasfields != 0)) != 0);
-  if (__pyx_t_2) {
-  } else {
-    __pyx_t_1 = __pyx_t_2;
-    goto __pyx_L15_bool_binop_done;
-  }
-  __pyx_t_2 = ((!(__pyx_v_copy_shape != 0)) != 0);
-  __pyx_t_1 = __pyx_t_2;
-  __pyx_L15_bool_binop_done:;
-  if (__pyx_t_1) {
-
-    /* "numpy.pxd":248
- *             if not hasfields and not copy_shape:
- *                 # do not call releasebuffer
- *                 info.obj = None             # <<<<<<<<<<<<<<
- *             else:
- *                 # need to call releasebuffer
- */
-    __Pyx_INCREF(Py_None);
-    __Pyx_GIVEREF(Py_None);
-    __Pyx_GOTREF(__pyx_v_info->obj);
-    __Pyx_DECREF(__pyx_v_info->obj);
-    __pyx_v_info->obj = Py_None;
-    goto __pyx_L14;
-  }
-  /*else*/ {
-
-    /* "numpy.pxd":251
- *             else:
- *                 # need to call releasebuffer
- *                 info.obj = self             # <<<<<<<<<<<<<<
- * 
- *             if not hasfields:
- */
-    __Pyx_INCREF(((PyObject *)__pyx_v_self));
-    __Pyx_GIVEREF(((PyObject *)__pyx_v_self));
-    __Pyx_GOTREF(__pyx_v_info->obj);
-    __Pyx_DECREF(__pyx_v_info->obj);
-    __pyx_v_info->obj = ((PyObject *)__pyx_v_self);
-  }
-  __pyx_L14:;
-
-  /* "numpy.pxd":253
- *                 info.obj = self
- * 
- *             if not hasfields:             # <<<<<<<<<<<<<<
- *                 t = descr.type_num
- *                 if ((descr.byteorder == c'>' and little_endian) or
- */
-  __pyx_t_1 = ((!(__pyx_v_hasfields != 0)) != 0);
-  if (__pyx_t_1) {
-
-    /* "numpy.pxd":254
- * 
- *             if not hasfields:
- *                 t = descr.type_num             # <<<<<<<<<<<<<<
- *                 if ((descr.byteorder == c'>' and little_endian) or
- *                     (descr.byteorder == c'<' and not little_endian)):
- */
-    __pyx_t_4 = __pyx_v_descr->type_num;
-    __pyx_v_t = __pyx_t_4;
-
-    /* "numpy.pxd":255
- *             if not hasfields:
- *                 t = descr.type_num
- *                 if ((descr.byteorder == c'>' and little_endian) or             # <<<<<<<<<<<<<<
- *                     (descr.byteorder == c'<' and not little_endian)):
- *                     raise ValueError(u"Non-native byte order not supported")
- */
-    __pyx_t_2 = ((__pyx_v_descr->byteorder == '>') != 0);
-    if (!__pyx_t_2) {
-      goto __pyx_L20_next_or;
-    } else {
-    }
-    __pyx_t_2 = (__pyx_v_little_endian != 0);
-    if (!__pyx_t_2) {
-    } else {
-      __pyx_t_1 = __pyx_t_2;
-      goto __pyx_L19_bool_binop_done;
-    }
-    __pyx_L20_next_or:;
-
-    /* "numpy.pxd":256
- *                 t = descr.type_num
- *                 if ((descr.byteorder == c'>' and little_endian) or
- *                     (descr.byteorder == c'<' and not little_endian)):             # <<<<<<<<<<<<<<
- *                     raise ValueError(u"Non-native byte order not supported")
- *                 if   t == NPY_BYTE:        f = "b"
- */
-    __pyx_t_2 = ((__pyx_v_descr->byteorder == '<') != 0);
-    if (__pyx_t_2) {
-    } else {
-      __pyx_t_1 = __pyx_t_2;
-      goto __pyx_L19_bool_binop_done;
-    }
-    __pyx_t_2 = ((!(__pyx_v_little_endian != 0)) != 0);
-    __pyx_t_1 = __pyx_t_2;
-    __pyx_L19_bool_binop_done:;
-    if (__pyx_t_1) {
-
-      /* "numpy.pxd":257
- *                 if ((descr.byteorder == c'>' and little_endian) or
- *                     (descr.byteorder == c'<' and not little_endian)):
- *                     raise ValueError(u"Non-native byte order not supported")             # <<<<<<<<<<<<<<
- *                 if   t == NPY_BYTE:        f = "b"
- *                 elif t == NPY_UBYTE:       f = "B"
- */
-      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__6, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 257; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      __Pyx_Raise(__pyx_t_3, 0, 0, 0);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      {__pyx_filename = __pyx_f[1]; __pyx_lineno = 257; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    }
-
-    /* "numpy.pxd":274
- *                 elif t == NPY_CDOUBLE:     f = "Zd"
- *                 elif t == NPY_CLONGDOUBLE: f = "Zg"
- *                 elif t == NPY_OBJECT:      f = "O"             # <<<<<<<<<<<<<<
- *                 else:
- *                     raise ValueError(u"unknown dtype code in numpy.pxd (%d)" % t)
- */
-    switch (__pyx_v_t) {
-
-      /* "numpy.pxd":258
- *                     (descr.byteorder == c'<' and not little_endian)):
- *                     raise ValueError(u"Non-native byte order not supported")
- *                 if   t == NPY_BYTE:        f = "b"             # <<<<<<<<<<<<<<
- *                 elif t == NPY_UBYTE:       f = "B"
- *                 elif t == NPY_SHORT:       f = "h"
- */
-      case NPY_BYTE:
-      __pyx_v_f = __pyx_k_b;
-      break;
-
-      /* "numpy.pxd":259
- *                     raise ValueError(u"Non-native byte order not supported")
- *                 if   t == NPY_BYTE:        f = "b"
- *                 elif t == NPY_UBYTE:       f = "B"             # <<<<<<<<<<<<<<
- *                 elif t == NPY_SHORT:       f = "h"
- *                 elif t == NPY_USHORT:      f = "H"
- */
-      case NPY_UBYTE:
-      __pyx_v_f = __pyx_k_B;
-      break;
-
-      /* "numpy.pxd":260
- *                 if   t == NPY_BYTE:        f = "b"
- *                 elif t == NPY_UBYTE:       f = "B"
- *                 elif t == NPY_SHORT:       f = "h"             # <<<<<<<<<<<<<<
- *                 elif t == NPY_USHORT:      f = "H"
- *                 elif t == NPY_INT:         f = "i"
- */
-      case NPY_SHORT:
-      __pyx_v_f = __pyx_k_h;
-      break;
-
-      /* "numpy.pxd":261
- *                 elif t == NPY_UBYTE:       f = "B"
- *                 elif t == NPY_SHORT:       f = "h"
- *                 elif t == NPY_USHORT:      f = "H"             # <<<<<<<<<<<<<<
- *                 elif t == NPY_INT:         f = "i"
- *                 elif t == NPY_UINT:        f = "I"
- */
-      case NPY_USHORT:
-      __pyx_v_f = __pyx_k_H;
-      break;
-
-      /* "numpy.pxd":262
- *                 elif t == NPY_SHORT:       f = "h"
- *                 elif t == NPY_USHORT:      f = "H"
- *                 elif t == NPY_INT:         f = "i"             # <<<<<<<<<<<<<<
- *                 elif t == NPY_UINT:        f = "I"
- *                 elif t == NPY_LONG:        f = "l"
- */
-      case NPY_INT:
-      __pyx_v_f = __pyx_k_i;
-      break;
-
-      /* "numpy.pxd":263
- *                 elif t == NPY_USHORT:      f = "H"
- *                 elif t == NPY_INT:         f = "i"
- *                 elif t == NPY_UINT:        f = "I"             # <<<<<<<<<<<<<<
- *                 elif t == NPY_LONG:        f = "l"
- *                 elif t == NPY_ULONG:       f = "L"
- */
-      case NPY_UINT:
-      __pyx_v_f = __pyx_k_I;
-      break;
-
-      /* "numpy.pxd":264
- *                 elif t == NPY_INT:         f = "i"
- *                 elif t == NPY_UINT:        f = "I"
- *                 elif t == NPY_LONG:        f = "l"             # <<<<<<<<<<<<<<
- *                 elif t == NPY_ULONG:       f = "L"
- *                 elif t == NPY_LONGLONG:    f = "q"
- */
-      case NPY_LONG:
-      __pyx_v_f = __pyx_k_l;
-      break;
-
-      /* "numpy.pxd":265
- *                 elif t == NPY_UINT:        f = "I"
- *                 elif t == NPY_LONG:        f = "l"
- *                 elif t == NPY_ULONG:       f = "L"             # <<<<<<<<<<<<<<
- *                 elif t == NPY_LONGLONG:    f = "q"
- *                 elif t == NPY_ULONGLONG:   f = "Q"
- */
-      case NPY_ULONG:
-      __pyx_v_f = __pyx_k_L;
-      break;
-
-      /* "numpy.pxd":266
- *                 elif t == NPY_LONG:        f = "l"
- *                 elif t == NPY_ULONG:       f = "L"
- *                 elif t == NPY_LONGLONG:    f = "q"             # <<<<<<<<<<<<<<
- *                 elif t == NPY_ULONGLONG:   f = "Q"
- *                 elif t == NPY_FLOAT:       f = "f"
- */
-      case NPY_LONGLONG:
-      __pyx_v_f = __pyx_k_q;
-      break;
-
-      /* "numpy.pxd":267
- *                 elif t == NPY_ULONG:       f = "L"
- *                 elif t == NPY_LONGLONG:    f = "q"
- *                 elif t == NPY_ULONGLONG:   f = "Q"             # <<<<<<<<<<<<<<
- *                 elif t == NPY_FLOAT:       f = "f"
- *                 elif t == NPY_DOUBLE:      f = "d"
- */
-      case NPY_ULONGLONG:
-      __pyx_v_f = __pyx_k_Q;
-      break;
-
-      /* "numpy.pxd":268
- *                 elif t == NPY_LONGLONG:    f = "q"
- *                 elif t == NPY_ULONGLONG:   f = "Q"
- *                 elif t == NPY_FLOAT:       f = "f"             # <<<<<<<<<<<<<<
- *                 elif t == NPY_DOUBLE:      f = "d"
- *                 elif t == NPY_LONGDOUBLE:  f = "g"
- */
-      case NPY_FLOAT:
-      __pyx_v_f = __pyx_k_f;
-      break;
-
-      /* "numpy.pxd":269
- *                 elif t == NPY_ULONGLONG:   f = "Q"
- *                 elif t == NPY_FLOAT:       f = "f"
- *                 elif t == NPY_DOUBLE:      f = "d"             # <<<<<<<<<<<<<<
- *                 elif t == NPY_LONGDOUBLE:  f = "g"
- *                 elif t == NPY_CFLOAT:      f = "Zf"
- */
-      case NPY_DOUBLE:
-      __pyx_v_f = __pyx_k_d;
-      break;
-
-      /* "numpy.pxd":270
- *                 elif t == NPY_FLOAT:       f = "f"
- *                 elif t == NPY_DOUBLE:      f = "d"
- *                 elif t == NPY_LONGDOUBLE:  f = "g"             # <<<<<<<<<<<<<<
- *                 elif t == NPY_CFLOAT:      f = "Zf"
- *                 elif t == NPY_CDOUBLE:     f = "Zd"
- */
-      case NPY_LONGDOUBLE:
-      __pyx_v_f = __pyx_k_g;
-      break;
-
-      /* "numpy.pxd":271
- *                 elif t == NPY_DOUBLE:      f = "d"
- *                 elif t == NPY_LONGDOUBLE:  f = "g"
- *                 elif t == NPY_CFLOAT:      f = "Zf"             # <<<<<<<<<<<<<<
- *                 elif t == NPY_CDOUBLE:     f = "Zd"
- *                 elif t == NPY_CLONGDOUBLE: f = "Zg"
- */
-      case NPY_CFLOAT:
-      __pyx_v_f = __pyx_k_Zf;
-      break;
-
-      /* "numpy.pxd":272
- *                 elif t == NPY_LONGDOUBLE:  f = "g"
- *                 elif t == NPY_CFLOAT:      f = "Zf"
- *                 elif t == NPY_CDOUBLE:     f = "Zd"             # <<<<<<<<<<<<<<
- *                 elif t == NPY_CLONGDOUBLE: f = "Zg"
- *                 elif t == NPY_OBJECT:      f = "O"
- */
-      case NPY_CDOUBLE:
-      __pyx_v_f = __pyx_k_Zd;
-      break;
-
-      /* "numpy.pxd":273
- *                 elif t == NPY_CFLOAT:      f = "Zf"
- *                 elif t == NPY_CDOUBLE:     f = "Zd"
- *                 elif t == NPY_CLONGDOUBLE: f = "Zg"             # <<<<<<<<<<<<<<
- *                 elif t == NPY_OBJECT:      f = "O"
- *                 else:
- */
-      case NPY_CLONGDOUBLE:
-      __pyx_v_f = __pyx_k_Zg;
-      break;
-
-      /* "numpy.pxd":274
- *                 elif t == NPY_CDOUBLE:     f = "Zd"
- *                 elif t == NPY_CLONGDOUBLE: f = "Zg"
- *                 elif t == NPY_OBJECT:      f = "O"             # <<<<<<<<<<<<<<
- *                 else:
- *                     raise ValueError(u"unknown dtype code in numpy.pxd (%d)" % t)
- */
-      case NPY_OBJECT:
-      __pyx_v_f = __pyx_k_O;
-      break;
-      default:
-
-      /* "numpy.pxd":276
- *                 elif t == NPY_OBJECT:      f = "O"
- *                 else:
- *                     raise ValueError(u"unknown dtype code in numpy.pxd (%d)" % t)             # <<<<<<<<<<<<<<
- *                 info.format = f
- *                 return
- */
-      __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_t); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 276; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_6 = PyUnicode_Format(__pyx_kp_u_unknown_dtype_code_in_numpy_pxd, __pyx_t_3); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 276; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_6);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 276; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_6);
-      __Pyx_GIVEREF(__pyx_t_6);
-      __pyx_t_6 = 0;
-      __pyx_t_6 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_t_3, NULL); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 276; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_6);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __Pyx_Raise(__pyx_t_6, 0, 0, 0);
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      {__pyx_filename = __pyx_f[1]; __pyx_lineno = 276; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      break;
-    }
-
-    /* "numpy.pxd":277
- *                 else:
- *                     raise ValueError(u"unknown dtype code in numpy.pxd (%d)" % t)
- *                 info.format = f             # <<<<<<<<<<<<<<
- *                 return
- *             else:
- */
-    __pyx_v_info->format = __pyx_v_f;
-
-    /* "numpy.pxd":278
- *                     raise ValueError(u"unknown dtype code in numpy.pxd (%d)" % t)
- *                 info.format = f
- *                 return             # <<<<<<<<<<<<<<
- *             else:
- *                 info.format = <char*>stdlib.malloc(_buffer_format_string_len)
- */
-    __pyx_r = 0;
-    goto __pyx_L0;
-  }
-  /*else*/ {
-
-    /* "numpy.pxd":280
- *                 return
- *             else:
- *                 info.format = <char*>stdlib.malloc(_buffer_format_string_len)             # <<<<<<<<<<<<<<
- *                 info.format[0] = c'^' # Native data types, manual alignment
- *                 offset = 0
- */
-    __pyx_v_info->format = ((char *)malloc(255));
-
-    /* "numpy.pxd":281
- *             else:
- *                 info.format = <char*>stdlib.malloc(_buffer_format_string_len)
- *                 info.format[0] = c'^' # Native data types, manual alignment             # <<<<<<<<<<<<<<
- *                 offset = 0
- *                 f = _util_dtypestring(descr, info.format + 1,
- */
-    (__pyx_v_info->format[0]) = '^';
-
-    /* "numpy.pxd":282
- *                 info.format = <char*>stdlib.malloc(_buffer_format_string_len)
- *                 info.format[0] = c'^' # Native data types, manual alignment
- *                 offset = 0             # <<<<<<<<<<<<<<
- *                 f = _util_dtypestring(descr, info.format + 1,
- *                                       info.format + _buffer_format_string_len,
- */
-    __pyx_v_offset = 0;
-
-    /* "numpy.pxd":283
- *                 info.format[0] = c'^' # Native data types, manual alignment
- *                 offset = 0
- *                 f = _util_dtypestring(descr, info.format + 1,             # <<<<<<<<<<<<<<
- *                                       info.format + _buffer_format_string_len,
- *                                       &offset)
- */
-    __pyx_t_7 = __pyx_f_5numpy__util_dtypestring(__pyx_v_descr, (__pyx_v_info->format + 1), (__pyx_v_info->format + 255), (&__pyx_v_offset)); if (unlikely(__pyx_t_7 == NULL)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 283; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_v_f = __pyx_t_7;
-
-    /* "numpy.pxd":286
- *                                       info.format + _buffer_format_string_len,
- *                                       &offset)
- *                 f[0] = c'\0' # Terminate format string             # <<<<<<<<<<<<<<
- * 
- *         def __releasebuffer__(ndarray self, Py_buffer* info):
- */
-    (__pyx_v_f[0]) = '\x00';
-  }
-
-  /* "numpy.pxd":194
- *         # experimental exception made for __getbuffer__ and __releasebuffer__
- *         # -- the details of this may change.
- *         def __getbuffer__(ndarray self, Py_buffer* info, int flags):             # <<<<<<<<<<<<<<
- *             # This implementation of getbuffer is geared towards Cython
- *             # requirements, and does not yet fullfill the PEP.
- */
-
-  /* function exit code */
-  __pyx_r = 0;
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_AddTraceback("numpy.ndarray.__getbuffer__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = -1;
-  if (__pyx_v_info != NULL && __pyx_v_info->obj != NULL) {
-    __Pyx_GOTREF(__pyx_v_info->obj);
-    __Pyx_DECREF(__pyx_v_info->obj); __pyx_v_info->obj = NULL;
-  }
-  goto __pyx_L2;
-  __pyx_L0:;
-  if (__pyx_v_info != NULL && __pyx_v_info->obj == Py_None) {
-    __Pyx_GOTREF(Py_None);
-    __Pyx_DECREF(Py_None); __pyx_v_info->obj = NULL;
-  }
-  __pyx_L2:;
-  __Pyx_XDECREF((PyObject *)__pyx_v_descr);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "numpy.pxd":288
- *                 f[0] = c'\0' # Terminate format string
- * 
- *         def __releasebuffer__(ndarray self, Py_buffer* info):             # <<<<<<<<<<<<<<
- *             if PyArray_HASFIELDS(self):
- *                 stdlib.free(info.format)
- */
-
-/* Python wrapper */
-static CYTHON_UNUSED void __pyx_pw_5numpy_7ndarray_3__releasebuffer__(PyObject *__pyx_v_self, Py_buffer *__pyx_v_info); /*proto*/
-static CYTHON_UNUSED void __pyx_pw_5numpy_7ndarray_3__releasebuffer__(PyObject *__pyx_v_self, Py_buffer *__pyx_v_info) {
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__releasebuffer__ (wrapper)", 0);
-  __pyx_pf_5numpy_7ndarray_2__releasebuffer__(((PyArrayObject *)__pyx_v_self), ((Py_buffer *)__pyx_v_info));
-
-  /* function exit code */
-  __Pyx_RefNannyFinishContext();
-}
-
-static void __pyx_pf_5numpy_7ndarray_2__releasebuffer__(PyArrayObject *__pyx_v_self, Py_buffer *__pyx_v_info) {
-  __Pyx_RefNannyDeclarations
-  int __pyx_t_1;
-  __Pyx_RefNannySetupContext("__releasebuffer__", 0);
-
-  /* "numpy.pxd":289
- * 
- *         def __releasebuffer__(ndarray self, Py_buffer* info):
- *             if PyArray_HASFIELDS(self):             # <<<<<<<<<<<<<<
- *                 stdlib.free(info.format)
- *             if sizeof(npy_intp) != sizeof(Py_ssize_t):
- */
-  __pyx_t_1 = (PyArray_HASFIELDS(__pyx_v_self) != 0);
-  if (__pyx_t_1) {
-
-    /* "numpy.pxd":290
- *         def __releasebuffer__(ndarray self, Py_buffer* info):
- *             if PyArray_HASFIELDS(self):
- *                 stdlib.free(info.format)             # <<<<<<<<<<<<<<
- *             if sizeof(npy_intp) != sizeof(Py_ssize_t):
- *                 stdlib.free(info.strides)
- */
-    free(__pyx_v_info->format);
-    goto __pyx_L3;
-  }
-  __pyx_L3:;
-
-  /* "numpy.pxd":291
- *             if PyArray_HASFIELDS(self):
- *                 stdlib.free(info.format)
- *             if sizeof(npy_intp) != sizeof(Py_ssize_t):             # <<<<<<<<<<<<<<
- *                 stdlib.free(info.strides)
- *                 # info.shape was stored after info.strides in the same block
- */
-  __pyx_t_1 = (((sizeof(npy_intp)) != (sizeof(Py_ssize_t))) != 0);
-  if (__pyx_t_1) {
-
-    /* "numpy.pxd":292
- *                 stdlib.free(info.format)
- *             if sizeof(npy_intp) != sizeof(Py_ssize_t):
- *                 stdlib.free(info.strides)             # <<<<<<<<<<<<<<
- *                 # info.shape was stored after info.strides in the same block
- * 
- */
-    free(__pyx_v_info->strides);
-    goto __pyx_L4;
-  }
-  __pyx_L4:;
-
-  /* "numpy.pxd":288
- *                 f[0] = c'\0' # Terminate format string
- * 
- *         def __releasebuffer__(ndarray self, Py_buffer* info):             # <<<<<<<<<<<<<<
- *             if PyArray_HASFIELDS(self):
- *                 stdlib.free(info.format)
- */
-
-  /* function exit code */
-  __Pyx_RefNannyFinishContext();
-}
-
-/* "numpy.pxd":768
- * ctypedef npy_cdouble     complex_t
- * 
- * cdef inline object PyArray_MultiIterNew1(a):             # <<<<<<<<<<<<<<
- *     return PyArray_MultiIterNew(1, <void*>a)
- * 
- */
-
-static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew1(PyObject *__pyx_v_a) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("PyArray_MultiIterNew1", 0);
-
-  /* "numpy.pxd":769
- * 
- * cdef inline object PyArray_MultiIterNew1(a):
- *     return PyArray_MultiIterNew(1, <void*>a)             # <<<<<<<<<<<<<<
- * 
- * cdef inline object PyArray_MultiIterNew2(a, b):
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyArray_MultiIterNew(1, ((void *)__pyx_v_a)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 769; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  /* "numpy.pxd":768
- * ctypedef npy_cdouble     complex_t
- * 
- * cdef inline object PyArray_MultiIterNew1(a):             # <<<<<<<<<<<<<<
- *     return PyArray_MultiIterNew(1, <void*>a)
- * 
- */
-
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("numpy.PyArray_MultiIterNew1", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "numpy.pxd":771
- *     return PyArray_MultiIterNew(1, <void*>a)
- * 
- * cdef inline object PyArray_MultiIterNew2(a, b):             # <<<<<<<<<<<<<<
- *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)
- * 
- */
-
-static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew2(PyObject *__pyx_v_a, PyObject *__pyx_v_b) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("PyArray_MultiIterNew2", 0);
-
-  /* "numpy.pxd":772
- * 
- * cdef inline object PyArray_MultiIterNew2(a, b):
- *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)             # <<<<<<<<<<<<<<
- * 
- * cdef inline object PyArray_MultiIterNew3(a, b, c):
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyArray_MultiIterNew(2, ((void *)__pyx_v_a), ((void *)__pyx_v_b)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 772; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  /* "numpy.pxd":771
- *     return PyArray_MultiIterNew(1, <void*>a)
- * 
- * cdef inline object PyArray_MultiIterNew2(a, b):             # <<<<<<<<<<<<<<
- *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)
- * 
- */
-
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("numpy.PyArray_MultiIterNew2", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "numpy.pxd":774
- *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)
- * 
- * cdef inline object PyArray_MultiIterNew3(a, b, c):             # <<<<<<<<<<<<<<
- *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)
- * 
- */
-
-static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew3(PyObject *__pyx_v_a, PyObject *__pyx_v_b, PyObject *__pyx_v_c) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("PyArray_MultiIterNew3", 0);
-
-  /* "numpy.pxd":775
- * 
- * cdef inline object PyArray_MultiIterNew3(a, b, c):
- *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)             # <<<<<<<<<<<<<<
- * 
- * cdef inline object PyArray_MultiIterNew4(a, b, c, d):
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyArray_MultiIterNew(3, ((void *)__pyx_v_a), ((void *)__pyx_v_b), ((void *)__pyx_v_c)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 775; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  /* "numpy.pxd":774
- *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)
- * 
- * cdef inline object PyArray_MultiIterNew3(a, b, c):             # <<<<<<<<<<<<<<
- *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)
- * 
- */
-
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("numpy.PyArray_MultiIterNew3", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "numpy.pxd":777
- *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)
- * 
- * cdef inline object PyArray_MultiIterNew4(a, b, c, d):             # <<<<<<<<<<<<<<
- *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)
- * 
- */
-
-static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew4(PyObject *__pyx_v_a, PyObject *__pyx_v_b, PyObject *__pyx_v_c, PyObject *__pyx_v_d) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("PyArray_MultiIterNew4", 0);
-
-  /* "numpy.pxd":778
- * 
- * cdef inline object PyArray_MultiIterNew4(a, b, c, d):
- *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)             # <<<<<<<<<<<<<<
- * 
- * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyArray_MultiIterNew(4, ((void *)__pyx_v_a), ((void *)__pyx_v_b), ((void *)__pyx_v_c), ((void *)__pyx_v_d)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 778; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  /* "numpy.pxd":777
- *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)
- * 
- * cdef inline object PyArray_MultiIterNew4(a, b, c, d):             # <<<<<<<<<<<<<<
- *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)
- * 
- */
-
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("numpy.PyArray_MultiIterNew4", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "numpy.pxd":780
- *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)
- * 
- * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):             # <<<<<<<<<<<<<<
- *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)
- * 
- */
-
-static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew5(PyObject *__pyx_v_a, PyObject *__pyx_v_b, PyObject *__pyx_v_c, PyObject *__pyx_v_d, PyObject *__pyx_v_e) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("PyArray_MultiIterNew5", 0);
-
-  /* "numpy.pxd":781
- * 
- * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):
- *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)             # <<<<<<<<<<<<<<
- * 
- * cdef inline char* _util_dtypestring(dtype descr, char* f, char* end, int* offset) except NULL:
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyArray_MultiIterNew(5, ((void *)__pyx_v_a), ((void *)__pyx_v_b), ((void *)__pyx_v_c), ((void *)__pyx_v_d), ((void *)__pyx_v_e)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 781; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  /* "numpy.pxd":780
- *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)
- * 
- * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):             # <<<<<<<<<<<<<<
- *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)
- * 
- */
-
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("numpy.PyArray_MultiIterNew5", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "numpy.pxd":783
- *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)
- * 
- * cdef inline char* _util_dtypestring(dtype descr, char* f, char* end, int* offset) except NULL:             # <<<<<<<<<<<<<<
- *     # Recursive utility function used in __getbuffer__ to get format
- *     # string. The new location in the format string is returned.
- */
-
-static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx_v_descr, char *__pyx_v_f, char *__pyx_v_end, int *__pyx_v_offset) {
-  PyArray_Descr *__pyx_v_child = 0;
-  int __pyx_v_endian_detector;
-  int __pyx_v_little_endian;
-  PyObject *__pyx_v_fields = 0;
-  PyObject *__pyx_v_childname = NULL;
-  PyObject *__pyx_v_new_offset = NULL;
-  PyObject *__pyx_v_t = NULL;
-  char *__pyx_r;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  Py_ssize_t __pyx_t_2;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
-  int __pyx_t_6;
-  int __pyx_t_7;
-  long __pyx_t_8;
-  char *__pyx_t_9;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("_util_dtypestring", 0);
-
-  /* "numpy.pxd":790
- *     cdef int delta_offset
- *     cdef tuple i
- *     cdef int endian_detector = 1             # <<<<<<<<<<<<<<
- *     cdef bint little_endian = ((<char*>&endian_detector)[0] != 0)
- *     cdef tuple fields
- */
-  __pyx_v_endian_detector = 1;
-
-  /* "numpy.pxd":791
- *     cdef tuple i
- *     cdef int endian_detector = 1
- *     cdef bint little_endian = ((<char*>&endian_detector)[0] != 0)             # <<<<<<<<<<<<<<
- *     cdef tuple fields
- * 
- */
-  __pyx_v_little_endian = ((((char *)(&__pyx_v_endian_detector))[0]) != 0);
-
-  /* "numpy.pxd":794
- *     cdef tuple fields
- * 
- *     for childname in descr.names:             # <<<<<<<<<<<<<<
- *         fields = descr.fields[childname]
- *         child, new_offset = fields
- */
-  if (unlikely(__pyx_v_descr->names == Py_None)) {
-    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
-    {__pyx_filename = __pyx_f[1]; __pyx_lineno = 794; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  }
-  __pyx_t_1 = __pyx_v_descr->names; __Pyx_INCREF(__pyx_t_1); __pyx_t_2 = 0;
-  for (;;) {
-    if (__pyx_t_2 >= PyTuple_GET_SIZE(__pyx_t_1)) break;
-    #if CYTHON_COMPILING_IN_CPYTHON
-    __pyx_t_3 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_2); __Pyx_INCREF(__pyx_t_3); __pyx_t_2++; if (unlikely(0 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 794; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    #else
-    __pyx_t_3 = PySequence_ITEM(__pyx_t_1, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 794; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    #endif
-    __Pyx_XDECREF_SET(__pyx_v_childname, __pyx_t_3);
-    __pyx_t_3 = 0;
-
-    /* "numpy.pxd":795
- * 
- *     for childname in descr.names:
- *         fields = descr.fields[childname]             # <<<<<<<<<<<<<<
- *         child, new_offset = fields
- * 
- */
-    __pyx_t_3 = PyObject_GetItem(__pyx_v_descr->fields, __pyx_v_childname); if (unlikely(__pyx_t_3 == NULL)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 795; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-    __Pyx_GOTREF(__pyx_t_3);
-    if (!(likely(PyTuple_CheckExact(__pyx_t_3))||((__pyx_t_3) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "tuple", Py_TYPE(__pyx_t_3)->tp_name), 0))) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 795; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_XDECREF_SET(__pyx_v_fields, ((PyObject*)__pyx_t_3));
-    __pyx_t_3 = 0;
-
-    /* "numpy.pxd":796
- *     for childname in descr.names:
- *         fields = descr.fields[childname]
- *         child, new_offset = fields             # <<<<<<<<<<<<<<
- * 
- *         if (end - f) - (new_offset - offset[0]) < 15:
- */
-    if (likely(__pyx_v_fields != Py_None)) {
-      PyObject* sequence = __pyx_v_fields;
-      #if CYTHON_COMPILING_IN_CPYTHON
-      Py_ssize_t size = Py_SIZE(sequence);
-      #else
-      Py_ssize_t size = PySequence_Size(sequence);
-      #endif
-      if (unlikely(size != 2)) {
-        if (size > 2) __Pyx_RaiseTooManyValuesError(2);
-        else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
-        {__pyx_filename = __pyx_f[1]; __pyx_lineno = 796; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      }
-      #if CYTHON_COMPILING_IN_CPYTHON
-      __pyx_t_3 = PyTuple_GET_ITEM(sequence, 0); 
-      __pyx_t_4 = PyTuple_GET_ITEM(sequence, 1); 
-      __Pyx_INCREF(__pyx_t_3);
-      __Pyx_INCREF(__pyx_t_4);
-      #else
-      __pyx_t_3 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 796; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_4 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 796; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_4);
-      #endif
-    } else {
-      __Pyx_RaiseNoneNotIterableError(); {__pyx_filename = __pyx_f[1]; __pyx_lineno = 796; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    }
-    if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_ptype_5numpy_dtype))))) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 796; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_XDECREF_SET(__pyx_v_child, ((PyArray_Descr *)__pyx_t_3));
-    __pyx_t_3 = 0;
-    __Pyx_XDECREF_SET(__pyx_v_new_offset, __pyx_t_4);
-    __pyx_t_4 = 0;
-
-    /* "numpy.pxd":798
- *         child, new_offset = fields
- * 
- *         if (end - f) - (new_offset - offset[0]) < 15:             # <<<<<<<<<<<<<<
- *             raise RuntimeError(u"Format string allocated too short, see comment in numpy.pxd")
- * 
- */
-    __pyx_t_4 = __Pyx_PyInt_From_ptrdiff_t((__pyx_v_end - __pyx_v_f)); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 798; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_3 = __Pyx_PyInt_From_int((__pyx_v_offset[0])); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 798; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_5 = PyNumber_Subtract(__pyx_v_new_offset, __pyx_t_3); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 798; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_5);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __pyx_t_3 = PyNumber_Subtract(__pyx_t_4, __pyx_t_5); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 798; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __pyx_t_5 = PyObject_RichCompare(__pyx_t_3, __pyx_int_15, Py_LT); __Pyx_XGOTREF(__pyx_t_5); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 798; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 798; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    if (__pyx_t_6) {
-
-      /* "numpy.pxd":799
- * 
- *         if (end - f) - (new_offset - offset[0]) < 15:
- *             raise RuntimeError(u"Format string allocated too short, see comment in numpy.pxd")             # <<<<<<<<<<<<<<
- * 
- *         if ((child.byteorder == c'>' and little_endian) or
- */
-      __pyx_t_5 = __Pyx_PyObject_Call(__pyx_builtin_RuntimeError, __pyx_tuple__7, NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 799; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_5);
-      __Pyx_Raise(__pyx_t_5, 0, 0, 0);
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      {__pyx_filename = __pyx_f[1]; __pyx_lineno = 799; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    }
-
-    /* "numpy.pxd":801
- *             raise RuntimeError(u"Format string allocated too short, see comment in numpy.pxd")
- * 
- *         if ((child.byteorder == c'>' and little_endian) or             # <<<<<<<<<<<<<<
- *             (child.byteorder == c'<' and not little_endian)):
- *             raise ValueError(u"Non-native byte order not supported")
- */
-    __pyx_t_7 = ((__pyx_v_child->byteorder == '>') != 0);
-    if (!__pyx_t_7) {
-      goto __pyx_L8_next_or;
-    } else {
-    }
-    __pyx_t_7 = (__pyx_v_little_endian != 0);
-    if (!__pyx_t_7) {
-    } else {
-      __pyx_t_6 = __pyx_t_7;
-      goto __pyx_L7_bool_binop_done;
-    }
-    __pyx_L8_next_or:;
-
-    /* "numpy.pxd":802
- * 
- *         if ((child.byteorder == c'>' and little_endian) or
- *             (child.byteorder == c'<' and not little_endian)):             # <<<<<<<<<<<<<<
- *             raise ValueError(u"Non-native byte order not supported")
- *             # One could encode it in the format string and have Cython
- */
-    __pyx_t_7 = ((__pyx_v_child->byteorder == '<') != 0);
-    if (__pyx_t_7) {
-    } else {
-      __pyx_t_6 = __pyx_t_7;
-      goto __pyx_L7_bool_binop_done;
-    }
-    __pyx_t_7 = ((!(__pyx_v_little_endian != 0)) != 0);
-    __pyx_t_6 = __pyx_t_7;
-    __pyx_L7_bool_binop_done:;
-    if (__pyx_t_6) {
-
-      /* "numpy.pxd":803
- *         if ((child.byteorder == c'>' and little_endian) or
- *             (child.byteorder == c'<' and not little_endian)):
- *             raise ValueError(u"Non-native byte order not supported")             # <<<<<<<<<<<<<<
- *             # One could encode it in the format string and have Cython
- *             # complain instead, BUT: < and > in format strings also imply
- */
-      __pyx_t_5 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__8, NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 803; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_5);
-      __Pyx_Raise(__pyx_t_5, 0, 0, 0);
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      {__pyx_filename = __pyx_f[1]; __pyx_lineno = 803; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    }
-
-    /* "numpy.pxd":813
- * 
- *         # Output padding bytes
- *         while offset[0] < new_offset:             # <<<<<<<<<<<<<<
- *             f[0] = 120 # "x"; pad byte
- *             f += 1
- */
-    while (1) {
-      __pyx_t_5 = __Pyx_PyInt_From_int((__pyx_v_offset[0])); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 813; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_5);
-      __pyx_t_3 = PyObject_RichCompare(__pyx_t_5, __pyx_v_new_offset, Py_LT); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 813; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 813; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      if (!__pyx_t_6) break;
-
-      /* "numpy.pxd":814
- *         # Output padding bytes
- *         while offset[0] < new_offset:
- *             f[0] = 120 # "x"; pad byte             # <<<<<<<<<<<<<<
- *             f += 1
- *             offset[0] += 1
- */
-      (__pyx_v_f[0]) = 120;
-
-      /* "numpy.pxd":815
- *         while offset[0] < new_offset:
- *             f[0] = 120 # "x"; pad byte
- *             f += 1             # <<<<<<<<<<<<<<
- *             offset[0] += 1
- * 
- */
-      __pyx_v_f = (__pyx_v_f + 1);
-
-      /* "numpy.pxd":816
- *             f[0] = 120 # "x"; pad byte
- *             f += 1
- *             offset[0] += 1             # <<<<<<<<<<<<<<
- * 
- *         offset[0] += child.itemsize
- */
-      __pyx_t_8 = 0;
-      (__pyx_v_offset[__pyx_t_8]) = ((__pyx_v_offset[__pyx_t_8]) + 1);
-    }
-
-    /* "numpy.pxd":818
- *             offset[0] += 1
- * 
- *         offset[0] += child.itemsize             # <<<<<<<<<<<<<<
- * 
- *         if not PyDataType_HASFIELDS(child):
- */
-    __pyx_t_8 = 0;
-    (__pyx_v_offset[__pyx_t_8]) = ((__pyx_v_offset[__pyx_t_8]) + __pyx_v_child->elsize);
-
-    /* "numpy.pxd":820
- *         offset[0] += child.itemsize
- * 
- *         if not PyDataType_HASFIELDS(child):             # <<<<<<<<<<<<<<
- *             t = child.type_num
- *             if end - f < 5:
- */
-    __pyx_t_6 = ((!(PyDataType_HASFIELDS(__pyx_v_child) != 0)) != 0);
-    if (__pyx_t_6) {
-
-      /* "numpy.pxd":821
- * 
- *         if not PyDataType_HASFIELDS(child):
- *             t = child.type_num             # <<<<<<<<<<<<<<
- *             if end - f < 5:
- *                 raise RuntimeError(u"Format string allocated too short.")
- */
-      __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_child->type_num); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 821; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      __Pyx_XDECREF_SET(__pyx_v_t, __pyx_t_3);
-      __pyx_t_3 = 0;
-
-      /* "numpy.pxd":822
- *         if not PyDataType_HASFIELDS(child):
- *             t = child.type_num
- *             if end - f < 5:             # <<<<<<<<<<<<<<
- *                 raise RuntimeError(u"Format string allocated too short.")
- * 
- */
-      __pyx_t_6 = (((__pyx_v_end - __pyx_v_f) < 5) != 0);
-      if (__pyx_t_6) {
-
-        /* "numpy.pxd":823
- *             t = child.type_num
- *             if end - f < 5:
- *                 raise RuntimeError(u"Format string allocated too short.")             # <<<<<<<<<<<<<<
- * 
- *             # Until ticket #99 is fixed, use integers to avoid warnings
- */
-        __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_RuntimeError, __pyx_tuple__9, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 823; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __Pyx_GOTREF(__pyx_t_3);
-        __Pyx_Raise(__pyx_t_3, 0, 0, 0);
-        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-        {__pyx_filename = __pyx_f[1]; __pyx_lineno = 823; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      }
-
-      /* "numpy.pxd":826
- * 
- *             # Until ticket #99 is fixed, use integers to avoid warnings
- *             if   t == NPY_BYTE:        f[0] =  98 #"b"             # <<<<<<<<<<<<<<
- *             elif t == NPY_UBYTE:       f[0] =  66 #"B"
- *             elif t == NPY_SHORT:       f[0] = 104 #"h"
- */
-      __pyx_t_3 = PyInt_FromLong(NPY_BYTE); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 826; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_5 = PyObject_RichCompare(__pyx_v_t, __pyx_t_3, Py_EQ); __Pyx_XGOTREF(__pyx_t_5); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 826; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 826; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      if (__pyx_t_6) {
-        (__pyx_v_f[0]) = 98;
-        goto __pyx_L15;
-      }
-
-      /* "numpy.pxd":827
- *             # Until ticket #99 is fixed, use integers to avoid warnings
- *             if   t == NPY_BYTE:        f[0] =  98 #"b"
- *             elif t == NPY_UBYTE:       f[0] =  66 #"B"             # <<<<<<<<<<<<<<
- *             elif t == NPY_SHORT:       f[0] = 104 #"h"
- *             elif t == NPY_USHORT:      f[0] =  72 #"H"
- */
-      __pyx_t_5 = PyInt_FromLong(NPY_UBYTE); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 827; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_5);
-      __pyx_t_3 = PyObject_RichCompare(__pyx_v_t, __pyx_t_5, Py_EQ); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 827; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 827; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      if (__pyx_t_6) {
-        (__pyx_v_f[0]) = 66;
-        goto __pyx_L15;
-      }
-
-      /* "numpy.pxd":828
- *             if   t == NPY_BYTE:        f[0] =  98 #"b"
- *             elif t == NPY_UBYTE:       f[0] =  66 #"B"
- *             elif t == NPY_SHORT:       f[0] = 104 #"h"             # <<<<<<<<<<<<<<
- *             elif t == NPY_USHORT:      f[0] =  72 #"H"
- *             elif t == NPY_INT:         f[0] = 105 #"i"
- */
-      __pyx_t_3 = PyInt_FromLong(NPY_SHORT); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 828; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_5 = PyObject_RichCompare(__pyx_v_t, __pyx_t_3, Py_EQ); __Pyx_XGOTREF(__pyx_t_5); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 828; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 828; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      if (__pyx_t_6) {
-        (__pyx_v_f[0]) = 104;
-        goto __pyx_L15;
-      }
-
-      /* "numpy.pxd":829
- *             elif t == NPY_UBYTE:       f[0] =  66 #"B"
- *             elif t == NPY_SHORT:       f[0] = 104 #"h"
- *             elif t == NPY_USHORT:      f[0] =  72 #"H"             # <<<<<<<<<<<<<<
- *             elif t == NPY_INT:         f[0] = 105 #"i"
- *             elif t == NPY_UINT:        f[0] =  73 #"I"
- */
-      __pyx_t_5 = PyInt_FromLong(NPY_USHORT); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 829; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_5);
-      __pyx_t_3 = PyObject_RichCompare(__pyx_v_t, __pyx_t_5, Py_EQ); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 829; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 829; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      if (__pyx_t_6) {
-        (__pyx_v_f[0]) = 72;
-        goto __pyx_L15;
-      }
-
-      /* "numpy.pxd":830
- *             elif t == NPY_SHORT:       f[0] = 104 #"h"
- *             elif t == NPY_USHORT:      f[0] =  72 #"H"
- *             elif t == NPY_INT:         f[0] = 105 #"i"             # <<<<<<<<<<<<<<
- *             elif t == NPY_UINT:        f[0] =  73 #"I"
- *             elif t == NPY_LONG:        f[0] = 108 #"l"
- */
-      __pyx_t_3 = PyInt_FromLong(NPY_INT); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 830; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_5 = PyObject_RichCompare(__pyx_v_t, __pyx_t_3, Py_EQ); __Pyx_XGOTREF(__pyx_t_5); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 830; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 830; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      if (__pyx_t_6) {
-        (__pyx_v_f[0]) = 105;
-        goto __pyx_L15;
-      }
-
-      /* "numpy.pxd":831
- *             elif t == NPY_USHORT:      f[0] =  72 #"H"
- *             elif t == NPY_INT:         f[0] = 105 #"i"
- *             elif t == NPY_UINT:        f[0] =  73 #"I"             # <<<<<<<<<<<<<<
- *             elif t == NPY_LONG:        f[0] = 108 #"l"
- *             elif t == NPY_ULONG:       f[0] = 76  #"L"
- */
-      __pyx_t_5 = PyInt_FromLong(NPY_UINT); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 831; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_5);
-      __pyx_t_3 = PyObject_RichCompare(__pyx_v_t, __pyx_t_5, Py_EQ); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 831; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 831; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      if (__pyx_t_6) {
-        (__pyx_v_f[0]) = 73;
-        goto __pyx_L15;
-      }
-
-      /* "numpy.pxd":832
- *             elif t == NPY_INT:         f[0] = 105 #"i"
- *             elif t == NPY_UINT:        f[0] =  73 #"I"
- *             elif t == NPY_LONG:        f[0] = 108 #"l"             # <<<<<<<<<<<<<<
- *             elif t == NPY_ULONG:       f[0] = 76  #"L"
- *             elif t == NPY_LONGLONG:    f[0] = 113 #"q"
- */
-      __pyx_t_3 = PyInt_FromLong(NPY_LONG); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 832; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_5 = PyObject_RichCompare(__pyx_v_t, __pyx_t_3, Py_EQ); __Pyx_XGOTREF(__pyx_t_5); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 832; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 832; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      if (__pyx_t_6) {
-        (__pyx_v_f[0]) = 108;
-        goto __pyx_L15;
-      }
-
-      /* "numpy.pxd":833
- *             elif t == NPY_UINT:        f[0] =  73 #"I"
- *             elif t == NPY_LONG:        f[0] = 108 #"l"
- *             elif t == NPY_ULONG:       f[0] = 76  #"L"             # <<<<<<<<<<<<<<
- *             elif t == NPY_LONGLONG:    f[0] = 113 #"q"
- *             elif t == NPY_ULONGLONG:   f[0] = 81  #"Q"
- */
-      __pyx_t_5 = PyInt_FromLong(NPY_ULONG); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 833; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_5);
-      __pyx_t_3 = PyObject_RichCompare(__pyx_v_t, __pyx_t_5, Py_EQ); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 833; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 833; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      if (__pyx_t_6) {
-        (__pyx_v_f[0]) = 76;
-        goto __pyx_L15;
-      }
-
-      /* "numpy.pxd":834
- *             elif t == NPY_LONG:        f[0] = 108 #"l"
- *             elif t == NPY_ULONG:       f[0] = 76  #"L"
- *             elif t == NPY_LONGLONG:    f[0] = 113 #"q"             # <<<<<<<<<<<<<<
- *             elif t == NPY_ULONGLONG:   f[0] = 81  #"Q"
- *             elif t == NPY_FLOAT:       f[0] = 102 #"f"
- */
-      __pyx_t_3 = PyInt_FromLong(NPY_LONGLONG); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 834; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_5 = PyObject_RichCompare(__pyx_v_t, __pyx_t_3, Py_EQ); __Pyx_XGOTREF(__pyx_t_5); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 834; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 834; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      if (__pyx_t_6) {
-        (__pyx_v_f[0]) = 113;
-        goto __pyx_L15;
-      }
-
-      /* "numpy.pxd":835
- *             elif t == NPY_ULONG:       f[0] = 76  #"L"
- *             elif t == NPY_LONGLONG:    f[0] = 113 #"q"
- *             elif t == NPY_ULONGLONG:   f[0] = 81  #"Q"             # <<<<<<<<<<<<<<
- *             elif t == NPY_FLOAT:       f[0] = 102 #"f"
- *             elif t == NPY_DOUBLE:      f[0] = 100 #"d"
- */
-      __pyx_t_5 = PyInt_FromLong(NPY_ULONGLONG); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 835; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_5);
-      __pyx_t_3 = PyObject_RichCompare(__pyx_v_t, __pyx_t_5, Py_EQ); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 835; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 835; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      if (__pyx_t_6) {
-        (__pyx_v_f[0]) = 81;
-        goto __pyx_L15;
-      }
-
-      /* "numpy.pxd":836
- *             elif t == NPY_LONGLONG:    f[0] = 113 #"q"
- *             elif t == NPY_ULONGLONG:   f[0] = 81  #"Q"
- *             elif t == NPY_FLOAT:       f[0] = 102 #"f"             # <<<<<<<<<<<<<<
- *             elif t == NPY_DOUBLE:      f[0] = 100 #"d"
- *             elif t == NPY_LONGDOUBLE:  f[0] = 103 #"g"
- */
-      __pyx_t_3 = PyInt_FromLong(NPY_FLOAT); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 836; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_5 = PyObject_RichCompare(__pyx_v_t, __pyx_t_3, Py_EQ); __Pyx_XGOTREF(__pyx_t_5); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 836; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 836; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      if (__pyx_t_6) {
-        (__pyx_v_f[0]) = 102;
-        goto __pyx_L15;
-      }
-
-      /* "numpy.pxd":837
- *             elif t == NPY_ULONGLONG:   f[0] = 81  #"Q"
- *             elif t == NPY_FLOAT:       f[0] = 102 #"f"
- *             elif t == NPY_DOUBLE:      f[0] = 100 #"d"             # <<<<<<<<<<<<<<
- *             elif t == NPY_LONGDOUBLE:  f[0] = 103 #"g"
- *             elif t == NPY_CFLOAT:      f[0] = 90; f[1] = 102; f += 1 # Zf
- */
-      __pyx_t_5 = PyInt_FromLong(NPY_DOUBLE); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 837; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_5);
-      __pyx_t_3 = PyObject_RichCompare(__pyx_v_t, __pyx_t_5, Py_EQ); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 837; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 837; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      if (__pyx_t_6) {
-        (__pyx_v_f[0]) = 100;
-        goto __pyx_L15;
-      }
-
-      /* "numpy.pxd":838
- *             elif t == NPY_FLOAT:       f[0] = 102 #"f"
- *             elif t == NPY_DOUBLE:      f[0] = 100 #"d"
- *             elif t == NPY_LONGDOUBLE:  f[0] = 103 #"g"             # <<<<<<<<<<<<<<
- *             elif t == NPY_CFLOAT:      f[0] = 90; f[1] = 102; f += 1 # Zf
- *             elif t == NPY_CDOUBLE:     f[0] = 90; f[1] = 100; f += 1 # Zd
- */
-      __pyx_t_3 = PyInt_FromLong(NPY_LONGDOUBLE); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 838; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_5 = PyObject_RichCompare(__pyx_v_t, __pyx_t_3, Py_EQ); __Pyx_XGOTREF(__pyx_t_5); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 838; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 838; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      if (__pyx_t_6) {
-        (__pyx_v_f[0]) = 103;
-        goto __pyx_L15;
-      }
-
-      /* "numpy.pxd":839
- *             elif t == NPY_DOUBLE:      f[0] = 100 #"d"
- *             elif t == NPY_LONGDOUBLE:  f[0] = 103 #"g"
- *             elif t == NPY_CFLOAT:      f[0] = 90; f[1] = 102; f += 1 # Zf             # <<<<<<<<<<<<<<
- *             elif t == NPY_CDOUBLE:     f[0] = 90; f[1] = 100; f += 1 # Zd
- *             elif t == NPY_CLONGDOUBLE: f[0] = 90; f[1] = 103; f += 1 # Zg
- */
-      __pyx_t_5 = PyInt_FromLong(NPY_CFLOAT); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 839; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_5);
-      __pyx_t_3 = PyObject_RichCompare(__pyx_v_t, __pyx_t_5, Py_EQ); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 839; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 839; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      if (__pyx_t_6) {
-        (__pyx_v_f[0]) = 90;
-        (__pyx_v_f[1]) = 102;
-        __pyx_v_f = (__pyx_v_f + 1);
-        goto __pyx_L15;
-      }
-
-      /* "numpy.pxd":840
- *             elif t == NPY_LONGDOUBLE:  f[0] = 103 #"g"
- *             elif t == NPY_CFLOAT:      f[0] = 90; f[1] = 102; f += 1 # Zf
- *             elif t == NPY_CDOUBLE:     f[0] = 90; f[1] = 100; f += 1 # Zd             # <<<<<<<<<<<<<<
- *             elif t == NPY_CLONGDOUBLE: f[0] = 90; f[1] = 103; f += 1 # Zg
- *             elif t == NPY_OBJECT:      f[0] = 79 #"O"
- */
-      __pyx_t_3 = PyInt_FromLong(NPY_CDOUBLE); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 840; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_5 = PyObject_RichCompare(__pyx_v_t, __pyx_t_3, Py_EQ); __Pyx_XGOTREF(__pyx_t_5); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 840; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 840; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      if (__pyx_t_6) {
-        (__pyx_v_f[0]) = 90;
-        (__pyx_v_f[1]) = 100;
-        __pyx_v_f = (__pyx_v_f + 1);
-        goto __pyx_L15;
-      }
-
-      /* "numpy.pxd":841
- *             elif t == NPY_CFLOAT:      f[0] = 90; f[1] = 102; f += 1 # Zf
- *             elif t == NPY_CDOUBLE:     f[0] = 90; f[1] = 100; f += 1 # Zd
- *             elif t == NPY_CLONGDOUBLE: f[0] = 90; f[1] = 103; f += 1 # Zg             # <<<<<<<<<<<<<<
- *             elif t == NPY_OBJECT:      f[0] = 79 #"O"
- *             else:
- */
-      __pyx_t_5 = PyInt_FromLong(NPY_CLONGDOUBLE); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 841; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_5);
-      __pyx_t_3 = PyObject_RichCompare(__pyx_v_t, __pyx_t_5, Py_EQ); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 841; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 841; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      if (__pyx_t_6) {
-        (__pyx_v_f[0]) = 90;
-        (__pyx_v_f[1]) = 103;
-        __pyx_v_f = (__pyx_v_f + 1);
-        goto __pyx_L15;
-      }
-
-      /* "numpy.pxd":842
- *             elif t == NPY_CDOUBLE:     f[0] = 90; f[1] = 100; f += 1 # Zd
- *             elif t == NPY_CLONGDOUBLE: f[0] = 90; f[1] = 103; f += 1 # Zg
- *             elif t == NPY_OBJECT:      f[0] = 79 #"O"             # <<<<<<<<<<<<<<
- *             else:
- *                 raise ValueError(u"unknown dtype code in numpy.pxd (%d)" % t)
- */
-      __pyx_t_3 = PyInt_FromLong(NPY_OBJECT); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 842; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_5 = PyObject_RichCompare(__pyx_v_t, __pyx_t_3, Py_EQ); __Pyx_XGOTREF(__pyx_t_5); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 842; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 842; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      if (__pyx_t_6) {
-        (__pyx_v_f[0]) = 79;
-        goto __pyx_L15;
-      }
-      /*else*/ {
-
-        /* "numpy.pxd":844
- *             elif t == NPY_OBJECT:      f[0] = 79 #"O"
- *             else:
- *                 raise ValueError(u"unknown dtype code in numpy.pxd (%d)" % t)             # <<<<<<<<<<<<<<
- *             f += 1
- *         else:
- */
-        __pyx_t_5 = PyUnicode_Format(__pyx_kp_u_unknown_dtype_code_in_numpy_pxd, __pyx_v_t); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 844; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __Pyx_GOTREF(__pyx_t_5);
-        __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 844; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __Pyx_GOTREF(__pyx_t_3);
-        PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_5);
-        __Pyx_GIVEREF(__pyx_t_5);
-        __pyx_t_5 = 0;
-        __pyx_t_5 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_t_3, NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 844; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __Pyx_GOTREF(__pyx_t_5);
-        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-        __Pyx_Raise(__pyx_t_5, 0, 0, 0);
-        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-        {__pyx_filename = __pyx_f[1]; __pyx_lineno = 844; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      }
-      __pyx_L15:;
-
-      /* "numpy.pxd":845
- *             else:
- *                 raise ValueError(u"unknown dtype code in numpy.pxd (%d)" % t)
- *             f += 1             # <<<<<<<<<<<<<<
- *         else:
- *             # Cython ignores struct boundary information ("T{...}"),
- */
-      __pyx_v_f = (__pyx_v_f + 1);
-      goto __pyx_L13;
-    }
-    /*else*/ {
-
-      /* "numpy.pxd":849
- *             # Cython ignores struct boundary information ("T{...}"),
- *             # so don't output it
- *             f = _util_dtypestring(child, f, end, offset)             # <<<<<<<<<<<<<<
- *     return f
- * 
- */
-      __pyx_t_9 = __pyx_f_5numpy__util_dtypestring(__pyx_v_child, __pyx_v_f, __pyx_v_end, __pyx_v_offset); if (unlikely(__pyx_t_9 == NULL)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 849; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __pyx_v_f = __pyx_t_9;
-    }
-    __pyx_L13:;
-
-    /* "numpy.pxd":794
- *     cdef tuple fields
- * 
- *     for childname in descr.names:             # <<<<<<<<<<<<<<
- *         fields = descr.fields[childname]
- *         child, new_offset = fields
- */
-  }
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "numpy.pxd":850
- *             # so don't output it
- *             f = _util_dtypestring(child, f, end, offset)
- *     return f             # <<<<<<<<<<<<<<
- * 
- * 
- */
-  __pyx_r = __pyx_v_f;
-  goto __pyx_L0;
-
-  /* "numpy.pxd":783
- *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)
- * 
- * cdef inline char* _util_dtypestring(dtype descr, char* f, char* end, int* offset) except NULL:             # <<<<<<<<<<<<<<
- *     # Recursive utility function used in __getbuffer__ to get format
- *     # string. The new location in the format string is returned.
- */
-
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_AddTraceback("numpy._util_dtypestring", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XDECREF((PyObject *)__pyx_v_child);
-  __Pyx_XDECREF(__pyx_v_fields);
-  __Pyx_XDECREF(__pyx_v_childname);
-  __Pyx_XDECREF(__pyx_v_new_offset);
-  __Pyx_XDECREF(__pyx_v_t);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "numpy.pxd":965
- * 
- * 
- * cdef inline void set_array_base(ndarray arr, object base):             # <<<<<<<<<<<<<<
- *      cdef PyObject* baseptr
- *      if base is None:
- */
-
-static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_arr, PyObject *__pyx_v_base) {
-  PyObject *__pyx_v_baseptr;
-  __Pyx_RefNannyDeclarations
-  int __pyx_t_1;
-  int __pyx_t_2;
-  __Pyx_RefNannySetupContext("set_array_base", 0);
-
-  /* "numpy.pxd":967
- * cdef inline void set_array_base(ndarray arr, object base):
- *      cdef PyObject* baseptr
- *      if base is None:             # <<<<<<<<<<<<<<
- *          baseptr = NULL
- *      else:
- */
-  __pyx_t_1 = (__pyx_v_base == Py_None);
-  __pyx_t_2 = (__pyx_t_1 != 0);
-  if (__pyx_t_2) {
-
-    /* "numpy.pxd":968
- *      cdef PyObject* baseptr
- *      if base is None:
- *          baseptr = NULL             # <<<<<<<<<<<<<<
- *      else:
- *          Py_INCREF(base) # important to do this before decref below!
- */
-    __pyx_v_baseptr = NULL;
-    goto __pyx_L3;
-  }
-  /*else*/ {
-
-    /* "numpy.pxd":970
- *          baseptr = NULL
- *      else:
- *          Py_INCREF(base) # important to do this before decref below!             # <<<<<<<<<<<<<<
- *          baseptr = <PyObject*>base
- *      Py_XDECREF(arr.base)
- */
-    Py_INCREF(__pyx_v_base);
-
-    /* "numpy.pxd":971
- *      else:
- *          Py_INCREF(base) # important to do this before decref below!
- *          baseptr = <PyObject*>base             # <<<<<<<<<<<<<<
- *      Py_XDECREF(arr.base)
- *      arr.base = baseptr
- */
-    __pyx_v_baseptr = ((PyObject *)__pyx_v_base);
-  }
-  __pyx_L3:;
-
-  /* "numpy.pxd":972
- *          Py_INCREF(base) # important to do this before decref below!
- *          baseptr = <PyObject*>base
- *      Py_XDECREF(arr.base)             # <<<<<<<<<<<<<<
- *      arr.base = baseptr
- * 
- */
-  Py_XDECREF(__pyx_v_arr->base);
-
-  /* "numpy.pxd":973
- *          baseptr = <PyObject*>base
- *      Py_XDECREF(arr.base)
- *      arr.base = baseptr             # <<<<<<<<<<<<<<
- * 
- * cdef inline object get_array_base(ndarray arr):
- */
-  __pyx_v_arr->base = __pyx_v_baseptr;
-
-  /* "numpy.pxd":965
- * 
- * 
- * cdef inline void set_array_base(ndarray arr, object base):             # <<<<<<<<<<<<<<
- *      cdef PyObject* baseptr
- *      if base is None:
- */
-
-  /* function exit code */
-  __Pyx_RefNannyFinishContext();
-}
-
-/* "numpy.pxd":975
- *      arr.base = baseptr
- * 
- * cdef inline object get_array_base(ndarray arr):             # <<<<<<<<<<<<<<
- *     if arr.base is NULL:
- *         return None
- */
-
-static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__pyx_v_arr) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  int __pyx_t_1;
-  __Pyx_RefNannySetupContext("get_array_base", 0);
-
-  /* "numpy.pxd":976
- * 
- * cdef inline object get_array_base(ndarray arr):
- *     if arr.base is NULL:             # <<<<<<<<<<<<<<
- *         return None
- *     else:
- */
-  __pyx_t_1 = ((__pyx_v_arr->base == NULL) != 0);
-  if (__pyx_t_1) {
-
-    /* "numpy.pxd":977
- * cdef inline object get_array_base(ndarray arr):
- *     if arr.base is NULL:
- *         return None             # <<<<<<<<<<<<<<
- *     else:
- *         return <object>arr.base
- */
-    __Pyx_XDECREF(__pyx_r);
-    __Pyx_INCREF(Py_None);
-    __pyx_r = Py_None;
-    goto __pyx_L0;
-  }
-  /*else*/ {
-
-    /* "numpy.pxd":979
- *         return None
- *     else:
- *         return <object>arr.base             # <<<<<<<<<<<<<<
- */
-    __Pyx_XDECREF(__pyx_r);
-    __Pyx_INCREF(((PyObject *)__pyx_v_arr->base));
-    __pyx_r = ((PyObject *)__pyx_v_arr->base);
-    goto __pyx_L0;
-  }
-
-  /* "numpy.pxd":975
- *      arr.base = baseptr
- * 
- * cdef inline object get_array_base(ndarray arr):             # <<<<<<<<<<<<<<
- *     if arr.base is NULL:
- *         return None
- */
-
-  /* function exit code */
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-static struct __pyx_vtabstruct_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm __pyx_vtable_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm;
-
-static PyObject *__pyx_tp_new_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm(PyTypeObject *t, PyObject *a, PyObject *k) {
-  struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *p;
-  PyObject *o = __pyx_ptype_27MMTK_BSpline_transform_grid_EnergyTerm->tp_new(t, a, k);
-  if (unlikely(!o)) return 0;
-  p = ((struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)o);
-  p->__pyx_vtab = __pyx_vtabptr_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm;
-  p->scaling_factor = ((PyArrayObject *)Py_None); Py_INCREF(Py_None);
-  p->vals = ((PyArrayObject *)Py_None); Py_INCREF(Py_None);
-  p->counts = ((PyArrayObject *)Py_None); Py_INCREF(Py_None);
-  p->spacing = ((PyArrayObject *)Py_None); Py_INCREF(Py_None);
-  p->hCorner = ((PyArrayObject *)Py_None); Py_INCREF(Py_None);
-  return o;
-}
-
-static void __pyx_tp_dealloc_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm(PyObject *o) {
-  struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *p = (struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)o;
-  #if PY_VERSION_HEX >= 0x030400a1
-  if (unlikely(Py_TYPE(o)->tp_finalize) && !_PyGC_FINALIZED(o)) {
-    if (PyObject_CallFinalizerFromDealloc(o)) return;
-  }
-  #endif
-  PyObject_GC_UnTrack(o);
-  Py_CLEAR(p->scaling_factor);
-  Py_CLEAR(p->vals);
-  Py_CLEAR(p->counts);
-  Py_CLEAR(p->spacing);
-  Py_CLEAR(p->hCorner);
-  #if CYTHON_COMPILING_IN_CPYTHON
-  if (PyType_IS_GC(Py_TYPE(o)->tp_base))
-  #endif
-  PyObject_GC_Track(o);
-  if (likely(__pyx_ptype_27MMTK_BSpline_transform_grid_EnergyTerm)) __pyx_ptype_27MMTK_BSpline_transform_grid_EnergyTerm->tp_dealloc(o); else __Pyx_call_next_tp_dealloc(o, __pyx_tp_dealloc_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm);
-}
-
-static int __pyx_tp_traverse_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm(PyObject *o, visitproc v, void *a) {
-  int e;
-  struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *p = (struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)o;
-  e = ((likely(__pyx_ptype_27MMTK_BSpline_transform_grid_EnergyTerm)) ? ((__pyx_ptype_27MMTK_BSpline_transform_grid_EnergyTerm->tp_traverse) ? __pyx_ptype_27MMTK_BSpline_transform_grid_EnergyTerm->tp_traverse(o, v, a) : 0) : __Pyx_call_next_tp_traverse(o, v, a, __pyx_tp_traverse_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm)); if (e) return e;
-  if (p->scaling_factor) {
-    e = (*v)(((PyObject*)p->scaling_factor), a); if (e) return e;
-  }
-  if (p->vals) {
-    e = (*v)(((PyObject*)p->vals), a); if (e) return e;
-  }
-  if (p->counts) {
-    e = (*v)(((PyObject*)p->counts), a); if (e) return e;
-  }
-  if (p->spacing) {
-    e = (*v)(((PyObject*)p->spacing), a); if (e) return e;
-  }
-  if (p->hCorner) {
-    e = (*v)(((PyObject*)p->hCorner), a); if (e) return e;
-  }
-  return 0;
-}
-
-static int __pyx_tp_clear_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm(PyObject *o) {
-  PyObject* tmp;
-  struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *p = (struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *)o;
-  if (likely(__pyx_ptype_27MMTK_BSpline_transform_grid_EnergyTerm)) { if (__pyx_ptype_27MMTK_BSpline_transform_grid_EnergyTerm->tp_clear) __pyx_ptype_27MMTK_BSpline_transform_grid_EnergyTerm->tp_clear(o); } else __Pyx_call_next_tp_clear(o, __pyx_tp_clear_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm);
-  tmp = ((PyObject*)p->scaling_factor);
-  p->scaling_factor = ((PyArrayObject *)Py_None); Py_INCREF(Py_None);
-  Py_XDECREF(tmp);
-  tmp = ((PyObject*)p->vals);
-  p->vals = ((PyArrayObject *)Py_None); Py_INCREF(Py_None);
-  Py_XDECREF(tmp);
-  tmp = ((PyObject*)p->counts);
-  p->counts = ((PyArrayObject *)Py_None); Py_INCREF(Py_None);
-  Py_XDECREF(tmp);
-  tmp = ((PyObject*)p->spacing);
-  p->spacing = ((PyArrayObject *)Py_None); Py_INCREF(Py_None);
-  Py_XDECREF(tmp);
-  tmp = ((PyObject*)p->hCorner);
-  p->hCorner = ((PyArrayObject *)Py_None); Py_INCREF(Py_None);
-  Py_XDECREF(tmp);
-  return 0;
-}
-
-static PyMethodDef __pyx_methods_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm[] = {
-  {0, 0, 0, 0}
-};
-
-static PyTypeObject __pyx_type_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm = {
-  PyVarObject_HEAD_INIT(0, 0)
-  "MMTK_BSpline_transform_grid.BSplineTransformGridTerm", /*tp_name*/
-  sizeof(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm), /*tp_basicsize*/
-  0, /*tp_itemsize*/
-  __pyx_tp_dealloc_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm, /*tp_dealloc*/
-  0, /*tp_print*/
-  0, /*tp_getattr*/
-  0, /*tp_setattr*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*tp_compare*/
-  #else
-  0, /*reserved*/
-  #endif
-  0, /*tp_repr*/
-  0, /*tp_as_number*/
-  0, /*tp_as_sequence*/
-  0, /*tp_as_mapping*/
-  0, /*tp_hash*/
-  0, /*tp_call*/
-  0, /*tp_str*/
-  0, /*tp_getattro*/
-  0, /*tp_setattro*/
-  0, /*tp_as_buffer*/
-  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
-  0, /*tp_doc*/
-  __pyx_tp_traverse_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm, /*tp_traverse*/
-  __pyx_tp_clear_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm, /*tp_clear*/
-  0, /*tp_richcompare*/
-  0, /*tp_weaklistoffset*/
-  0, /*tp_iter*/
-  0, /*tp_iternext*/
-  __pyx_methods_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm, /*tp_methods*/
-  0, /*tp_members*/
-  0, /*tp_getset*/
-  0, /*tp_base*/
-  0, /*tp_dict*/
-  0, /*tp_descr_get*/
-  0, /*tp_descr_set*/
-  0, /*tp_dictoffset*/
-  __pyx_pw_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm_1__init__, /*tp_init*/
-  0, /*tp_alloc*/
-  __pyx_tp_new_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm, /*tp_new*/
-  0, /*tp_free*/
-  0, /*tp_is_gc*/
-  0, /*tp_bases*/
-  0, /*tp_mro*/
-  0, /*tp_cache*/
-  0, /*tp_subclasses*/
-  0, /*tp_weaklist*/
-  0, /*tp_del*/
-  0, /*tp_version_tag*/
-  #if PY_VERSION_HEX >= 0x030400a1
-  0, /*tp_finalize*/
-  #endif
-};
-
-static PyMethodDef __pyx_methods[] = {
-  {0, 0, 0, 0}
-};
-
-#if PY_MAJOR_VERSION >= 3
-static struct PyModuleDef __pyx_moduledef = {
-  #if PY_VERSION_HEX < 0x03020000
-    { PyObject_HEAD_INIT(NULL) NULL, 0, NULL },
-  #else
-    PyModuleDef_HEAD_INIT,
-  #endif
-    "MMTK_BSpline_transform_grid",
-    0, /* m_doc */
-    -1, /* m_size */
-    __pyx_methods /* m_methods */,
-    NULL, /* m_reload */
-    NULL, /* m_traverse */
-    NULL, /* m_clear */
-    NULL /* m_free */
-};
-#endif
-
-static __Pyx_StringTabEntry __pyx_string_tab[] = {
-  {&__pyx_kp_u_Format_string_allocated_too_shor, __pyx_k_Format_string_allocated_too_shor, sizeof(__pyx_k_Format_string_allocated_too_shor), 0, 1, 0, 0},
-  {&__pyx_kp_u_Format_string_allocated_too_shor_2, __pyx_k_Format_string_allocated_too_shor_2, sizeof(__pyx_k_Format_string_allocated_too_shor_2), 0, 1, 0, 0},
-  {&__pyx_kp_u_Non_native_byte_order_not_suppor, __pyx_k_Non_native_byte_order_not_suppor, sizeof(__pyx_k_Non_native_byte_order_not_suppor), 0, 1, 0, 0},
-  {&__pyx_n_s_RuntimeError, __pyx_k_RuntimeError, sizeof(__pyx_k_RuntimeError), 0, 0, 1, 1},
-  {&__pyx_n_s_Scientific_Geometry, __pyx_k_Scientific_Geometry, sizeof(__pyx_k_Scientific_Geometry), 0, 0, 1, 1},
-  {&__pyx_n_s_ValueError, __pyx_k_ValueError, sizeof(__pyx_k_ValueError), 0, 0, 1, 1},
-  {&__pyx_n_s_Vector, __pyx_k_Vector, sizeof(__pyx_k_Vector), 0, 0, 1, 1},
-  {&__pyx_n_s_array, __pyx_k_array, sizeof(__pyx_k_array), 0, 0, 1, 1},
-  {&__pyx_n_s_counts, __pyx_k_counts, sizeof(__pyx_k_counts), 0, 0, 1, 1},
-  {&__pyx_n_s_dtype, __pyx_k_dtype, sizeof(__pyx_k_dtype), 0, 0, 1, 1},
-  {&__pyx_n_s_end, __pyx_k_end, sizeof(__pyx_k_end), 0, 0, 1, 1},
-  {&__pyx_n_s_ex, __pyx_k_ex, sizeof(__pyx_k_ex), 0, 0, 1, 1},
-  {&__pyx_n_s_ey, __pyx_k_ey, sizeof(__pyx_k_ey), 0, 0, 1, 1},
-  {&__pyx_n_s_ez, __pyx_k_ez, sizeof(__pyx_k_ez), 0, 0, 1, 1},
-  {&__pyx_n_s_file, __pyx_k_file, sizeof(__pyx_k_file), 0, 0, 1, 1},
-  {&__pyx_n_s_grid_name, __pyx_k_grid_name, sizeof(__pyx_k_grid_name), 0, 0, 1, 1},
-  {&__pyx_n_s_gzip, __pyx_k_gzip, sizeof(__pyx_k_gzip), 0, 0, 1, 1},
-  {&__pyx_n_s_import, __pyx_k_import, sizeof(__pyx_k_import), 0, 0, 1, 1},
-  {&__pyx_n_s_init, __pyx_k_init, sizeof(__pyx_k_init), 0, 0, 1, 1},
-  {&__pyx_n_s_inv_power, __pyx_k_inv_power, sizeof(__pyx_k_inv_power), 0, 0, 1, 1},
-  {&__pyx_n_s_main, __pyx_k_main, sizeof(__pyx_k_main), 0, 0, 1, 1},
-  {&__pyx_kp_u_ndarray_is_not_C_contiguous, __pyx_k_ndarray_is_not_C_contiguous, sizeof(__pyx_k_ndarray_is_not_C_contiguous), 0, 1, 0, 0},
-  {&__pyx_kp_u_ndarray_is_not_Fortran_contiguou, __pyx_k_ndarray_is_not_Fortran_contiguou, sizeof(__pyx_k_ndarray_is_not_Fortran_contiguou), 0, 1, 0, 0},
-  {&__pyx_n_s_np, __pyx_k_np, sizeof(__pyx_k_np), 0, 0, 1, 1},
-  {&__pyx_n_s_numpy, __pyx_k_numpy, sizeof(__pyx_k_numpy), 0, 0, 1, 1},
-  {&__pyx_n_s_print, __pyx_k_print, sizeof(__pyx_k_print), 0, 0, 1, 1},
-  {&__pyx_n_s_pyx_vtable, __pyx_k_pyx_vtable, sizeof(__pyx_k_pyx_vtable), 0, 0, 1, 1},
-  {&__pyx_n_s_range, __pyx_k_range, sizeof(__pyx_k_range), 0, 0, 1, 1},
-  {&__pyx_n_s_scaling_factor, __pyx_k_scaling_factor, sizeof(__pyx_k_scaling_factor), 0, 0, 1, 1},
-  {&__pyx_n_s_spacing, __pyx_k_spacing, sizeof(__pyx_k_spacing), 0, 0, 1, 1},
-  {&__pyx_n_s_strength, __pyx_k_strength, sizeof(__pyx_k_strength), 0, 0, 1, 1},
-  {&__pyx_n_s_test, __pyx_k_test, sizeof(__pyx_k_test), 0, 0, 1, 1},
-  {&__pyx_kp_s_test_start, __pyx_k_test_start, sizeof(__pyx_k_test_start), 0, 0, 1, 0},
-  {&__pyx_n_s_universe, __pyx_k_universe, sizeof(__pyx_k_universe), 0, 0, 1, 1},
-  {&__pyx_kp_u_unknown_dtype_code_in_numpy_pxd, __pyx_k_unknown_dtype_code_in_numpy_pxd, sizeof(__pyx_k_unknown_dtype_code_in_numpy_pxd), 0, 1, 0, 0},
-  {&__pyx_n_s_vals, __pyx_k_vals, sizeof(__pyx_k_vals), 0, 0, 1, 1},
-  {0, 0, 0, 0, 0, 0, 0}
-};
-static int __Pyx_InitCachedBuiltins(void) {
-  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 282; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_builtin_ValueError = __Pyx_GetBuiltinName(__pyx_n_s_ValueError); if (!__pyx_builtin_ValueError) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 215; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_builtin_RuntimeError = __Pyx_GetBuiltinName(__pyx_n_s_RuntimeError); if (!__pyx_builtin_RuntimeError) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 799; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  return 0;
-  __pyx_L1_error:;
-  return -1;
-}
-
-static int __Pyx_InitCachedConstants(void) {
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
-
-  /* "MMTK_BSpline_transform_grid.pyx":300
- * 
- * 
- *             for x in range(0,4):             # <<<<<<<<<<<<<<
- *                 for y in range(0,4):
- *                     for z in range(0,4):
- */
-  __pyx_tuple_ = PyTuple_Pack(2, __pyx_int_0, __pyx_int_4); if (unlikely(!__pyx_tuple_)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 300; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_tuple_);
-  __Pyx_GIVEREF(__pyx_tuple_);
-
-  /* "MMTK_BSpline_transform_grid.pyx":301
- * 
- *             for x in range(0,4):
- *                 for y in range(0,4):             # <<<<<<<<<<<<<<
- *                     for z in range(0,4):
- *                         vertex[x][y][z]=vals[i+x*self.nyz+y*counts[2]+z]
- */
-  __pyx_tuple__2 = PyTuple_Pack(2, __pyx_int_0, __pyx_int_4); if (unlikely(!__pyx_tuple__2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 301; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_tuple__2);
-  __Pyx_GIVEREF(__pyx_tuple__2);
-
-  /* "MMTK_BSpline_transform_grid.pyx":302
- *             for x in range(0,4):
- *                 for y in range(0,4):
- *                     for z in range(0,4):             # <<<<<<<<<<<<<<
- *                         vertex[x][y][z]=vals[i+x*self.nyz+y*counts[2]+z]
- * 
- */
-  __pyx_tuple__3 = PyTuple_Pack(2, __pyx_int_0, __pyx_int_4); if (unlikely(!__pyx_tuple__3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 302; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_tuple__3);
-  __Pyx_GIVEREF(__pyx_tuple__3);
-
-  /* "numpy.pxd":215
- *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)
- *                 and not PyArray_CHKFLAGS(self, NPY_C_CONTIGUOUS)):
- *                 raise ValueError(u"ndarray is not C contiguous")             # <<<<<<<<<<<<<<
- * 
- *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)
- */
-  __pyx_tuple__4 = PyTuple_Pack(1, __pyx_kp_u_ndarray_is_not_C_contiguous); if (unlikely(!__pyx_tuple__4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 215; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_tuple__4);
-  __Pyx_GIVEREF(__pyx_tuple__4);
-
-  /* "numpy.pxd":219
- *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)
- *                 and not PyArray_CHKFLAGS(self, NPY_F_CONTIGUOUS)):
- *                 raise ValueError(u"ndarray is not Fortran contiguous")             # <<<<<<<<<<<<<<
- * 
- *             info.buf = PyArray_DATA(self)
- */
-  __pyx_tuple__5 = PyTuple_Pack(1, __pyx_kp_u_ndarray_is_not_Fortran_contiguou); if (unlikely(!__pyx_tuple__5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 219; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_tuple__5);
-  __Pyx_GIVEREF(__pyx_tuple__5);
-
-  /* "numpy.pxd":257
- *                 if ((descr.byteorder == c'>' and little_endian) or
- *                     (descr.byteorder == c'<' and not little_endian)):
- *                     raise ValueError(u"Non-native byte order not supported")             # <<<<<<<<<<<<<<
- *                 if   t == NPY_BYTE:        f = "b"
- *                 elif t == NPY_UBYTE:       f = "B"
- */
-  __pyx_tuple__6 = PyTuple_Pack(1, __pyx_kp_u_Non_native_byte_order_not_suppor); if (unlikely(!__pyx_tuple__6)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 257; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_tuple__6);
-  __Pyx_GIVEREF(__pyx_tuple__6);
-
-  /* "numpy.pxd":799
- * 
- *         if (end - f) - (new_offset - offset[0]) < 15:
- *             raise RuntimeError(u"Format string allocated too short, see comment in numpy.pxd")             # <<<<<<<<<<<<<<
- * 
- *         if ((child.byteorder == c'>' and little_endian) or
- */
-  __pyx_tuple__7 = PyTuple_Pack(1, __pyx_kp_u_Format_string_allocated_too_shor); if (unlikely(!__pyx_tuple__7)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 799; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_tuple__7);
-  __Pyx_GIVEREF(__pyx_tuple__7);
-
-  /* "numpy.pxd":803
- *         if ((child.byteorder == c'>' and little_endian) or
- *             (child.byteorder == c'<' and not little_endian)):
- *             raise ValueError(u"Non-native byte order not supported")             # <<<<<<<<<<<<<<
- *             # One could encode it in the format string and have Cython
- *             # complain instead, BUT: < and > in format strings also imply
- */
-  __pyx_tuple__8 = PyTuple_Pack(1, __pyx_kp_u_Non_native_byte_order_not_suppor); if (unlikely(!__pyx_tuple__8)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 803; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_tuple__8);
-  __Pyx_GIVEREF(__pyx_tuple__8);
-
-  /* "numpy.pxd":823
- *             t = child.type_num
- *             if end - f < 5:
- *                 raise RuntimeError(u"Format string allocated too short.")             # <<<<<<<<<<<<<<
- * 
- *             # Until ticket #99 is fixed, use integers to avoid warnings
- */
-  __pyx_tuple__9 = PyTuple_Pack(1, __pyx_kp_u_Format_string_allocated_too_shor_2); if (unlikely(!__pyx_tuple__9)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 823; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_tuple__9);
-  __Pyx_GIVEREF(__pyx_tuple__9);
-  __Pyx_RefNannyFinishContext();
-  return 0;
-  __pyx_L1_error:;
-  __Pyx_RefNannyFinishContext();
-  return -1;
-}
-
-static int __Pyx_InitGlobals(void) {
-  if (__Pyx_InitStrings(__pyx_string_tab) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  __pyx_float_1_ = PyFloat_FromDouble(1.); if (unlikely(!__pyx_float_1_)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_int_0 = PyInt_FromLong(0); if (unlikely(!__pyx_int_0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_int_1 = PyInt_FromLong(1); if (unlikely(!__pyx_int_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_int_4 = PyInt_FromLong(4); if (unlikely(!__pyx_int_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_int_15 = PyInt_FromLong(15); if (unlikely(!__pyx_int_15)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  return 0;
-  __pyx_L1_error:;
-  return -1;
-}
-
-#if PY_MAJOR_VERSION < 3
-PyMODINIT_FUNC initMMTK_BSpline_transform_grid(void); /*proto*/
-PyMODINIT_FUNC initMMTK_BSpline_transform_grid(void)
-#else
-PyMODINIT_FUNC PyInit_MMTK_BSpline_transform_grid(void); /*proto*/
-PyMODINIT_FUNC PyInit_MMTK_BSpline_transform_grid(void)
-#endif
-{
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannyDeclarations
-  #if CYTHON_REFNANNY
-  __Pyx_RefNanny = __Pyx_RefNannyImportAPI("refnanny");
-  if (!__Pyx_RefNanny) {
-      PyErr_Clear();
-      __Pyx_RefNanny = __Pyx_RefNannyImportAPI("Cython.Runtime.refnanny");
-      if (!__Pyx_RefNanny)
-          Py_FatalError("failed to import 'refnanny' module");
-  }
-  #endif
-  __Pyx_RefNannySetupContext("PyMODINIT_FUNC PyInit_MMTK_BSpline_transform_grid(void)", 0);
-  if ( __Pyx_check_binary_version() < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_empty_tuple = PyTuple_New(0); if (unlikely(!__pyx_empty_tuple)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_empty_bytes = PyBytes_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_bytes)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  #ifdef __Pyx_CyFunction_USED
-  if (__Pyx_CyFunction_init() < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  #endif
-  #ifdef __Pyx_FusedFunction_USED
-  if (__pyx_FusedFunction_init() < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  #endif
-  #ifdef __Pyx_Generator_USED
-  if (__pyx_Generator_init() < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  #endif
-  /*--- Library function declarations ---*/
-  /*--- Threads initialization code ---*/
-  #if defined(__PYX_FORCE_INIT_THREADS) && __PYX_FORCE_INIT_THREADS
-  #ifdef WITH_THREAD /* Python build with threading support? */
-  PyEval_InitThreads();
-  #endif
-  #endif
-  /*--- Module creation code ---*/
-  #if PY_MAJOR_VERSION < 3
-  __pyx_m = Py_InitModule4("MMTK_BSpline_transform_grid", __pyx_methods, 0, 0, PYTHON_API_VERSION); Py_XINCREF(__pyx_m);
-  #else
-  __pyx_m = PyModule_Create(&__pyx_moduledef);
-  #endif
-  if (unlikely(!__pyx_m)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_d = PyModule_GetDict(__pyx_m); if (unlikely(!__pyx_d)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_INCREF(__pyx_d);
-  __pyx_b = PyImport_AddModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_b)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  #if CYTHON_COMPILING_IN_PYPY
-  Py_INCREF(__pyx_b);
-  #endif
-  if (PyObject_SetAttrString(__pyx_m, "__builtins__", __pyx_b) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  /*--- Initialize various global constants etc. ---*/
-  if (unlikely(__Pyx_InitGlobals() < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  #if PY_MAJOR_VERSION < 3 && (__PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT)
-  if (__Pyx_init_sys_getdefaultencoding_params() < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  #endif
-  if (__pyx_module_is_main_MMTK_BSpline_transform_grid) {
-    if (PyObject_SetAttrString(__pyx_m, "__name__", __pyx_n_s_main) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  }
-  #if PY_MAJOR_VERSION >= 3
-  {
-    PyObject *modules = PyImport_GetModuleDict(); if (unlikely(!modules)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    if (!PyDict_GetItemString(modules, "MMTK_BSpline_transform_grid")) {
-      if (unlikely(PyDict_SetItemString(modules, "MMTK_BSpline_transform_grid", __pyx_m) < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    }
-  }
-  #endif
-  /*--- Builtin init code ---*/
-  if (unlikely(__Pyx_InitCachedBuiltins() < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  /*--- Constants init code ---*/
-  if (unlikely(__Pyx_InitCachedConstants() < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  /*--- Global init code ---*/
-  /*--- Variable export code ---*/
-  /*--- Function export code ---*/
-  /*--- Type init code ---*/
-  __pyx_ptype_27MMTK_BSpline_transform_grid_ArrayType = __Pyx_ImportType("Scientific.N", "ArrayType", sizeof(PyArrayObject), 0); if (unlikely(!__pyx_ptype_27MMTK_BSpline_transform_grid_ArrayType)) {__pyx_filename = __pyx_f[2]; __pyx_lineno = 27; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_ptype_27MMTK_BSpline_transform_grid_EnergyTerm = __Pyx_ImportType("MMTK_forcefield", "EnergyTerm", sizeof(PyFFEnergyTermObject), 0); if (unlikely(!__pyx_ptype_27MMTK_BSpline_transform_grid_EnergyTerm)) {__pyx_filename = __pyx_f[3]; __pyx_lineno = 69; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_vtabptr_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm = &__pyx_vtable_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm;
-  __pyx_vtable_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm.splineInterpolate = (__pyx_t_27MMTK_BSpline_transform_grid_float_t (*)(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *, __pyx_t_27MMTK_BSpline_transform_grid_float_t *, __pyx_t_27MMTK_BSpline_transform_grid_float_t))__pyx_f_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm_splineInterpolate;
-  __pyx_vtable_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm.bisplineInterpolate = (__pyx_t_27MMTK_BSpline_transform_grid_float_t (*)(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*)[4], __pyx_t_27MMTK_BSpline_transform_grid_float_t, __pyx_t_27MMTK_BSpline_transform_grid_float_t))__pyx_f_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm_bisplineInterpolate;
-  __pyx_vtable_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm.trisplineInterpolate = (__pyx_t_27MMTK_BSpline_transform_grid_float_t (*)(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*)[4][4], __pyx_t_27MMTK_BSpline_transform_grid_float_t, __pyx_t_27MMTK_BSpline_transform_grid_float_t, __pyx_t_27MMTK_BSpline_transform_grid_float_t))__pyx_f_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm_trisplineInterpolate;
-  __pyx_vtable_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm.derivateOfIntp = (__pyx_t_27MMTK_BSpline_transform_grid_float_t (*)(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *, __pyx_t_27MMTK_BSpline_transform_grid_float_t *, __pyx_t_27MMTK_BSpline_transform_grid_float_t))__pyx_f_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm_derivateOfIntp;
-  __pyx_vtable_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm.derivateOfIntp_X = (__pyx_t_27MMTK_BSpline_transform_grid_float_t (*)(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*)[4][4], __pyx_t_27MMTK_BSpline_transform_grid_float_t, __pyx_t_27MMTK_BSpline_transform_grid_float_t, __pyx_t_27MMTK_BSpline_transform_grid_float_t))__pyx_f_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm_derivateOfIntp_X;
-  __pyx_vtable_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm.derivateOfIntp_Y_2 = (__pyx_t_27MMTK_BSpline_transform_grid_float_t (*)(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*)[4], __pyx_t_27MMTK_BSpline_transform_grid_float_t, __pyx_t_27MMTK_BSpline_transform_grid_float_t))__pyx_f_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm_derivateOfIntp_Y_2;
-  __pyx_vtable_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm.derivateOfIntp_Y = (__pyx_t_27MMTK_BSpline_transform_grid_float_t (*)(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*)[4][4], __pyx_t_27MMTK_BSpline_transform_grid_float_t, __pyx_t_27MMTK_BSpline_transform_grid_float_t, __pyx_t_27MMTK_BSpline_transform_grid_float_t))__pyx_f_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm_derivateOfIntp_Y;
-  __pyx_vtable_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm.derivateOfIntp_Z_2 = (__pyx_t_27MMTK_BSpline_transform_grid_float_t (*)(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*)[4], __pyx_t_27MMTK_BSpline_transform_grid_float_t, __pyx_t_27MMTK_BSpline_transform_grid_float_t))__pyx_f_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm_derivateOfIntp_Z_2;
-  __pyx_vtable_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm.derivateOfIntp_Z = (__pyx_t_27MMTK_BSpline_transform_grid_float_t (*)(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*)[4][4], __pyx_t_27MMTK_BSpline_transform_grid_float_t, __pyx_t_27MMTK_BSpline_transform_grid_float_t, __pyx_t_27MMTK_BSpline_transform_grid_float_t))__pyx_f_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm_derivateOfIntp_Z;
-  __pyx_vtable_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm.derivateOfIntp_mm = (__pyx_t_27MMTK_BSpline_transform_grid_float_t (*)(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *, __pyx_t_27MMTK_BSpline_transform_grid_float_t *, __pyx_t_27MMTK_BSpline_transform_grid_float_t))__pyx_f_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm_derivateOfIntp_mm;
-  __pyx_vtable_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm.derivateOfIntp_XX = (__pyx_t_27MMTK_BSpline_transform_grid_float_t (*)(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*)[4][4], __pyx_t_27MMTK_BSpline_transform_grid_float_t, __pyx_t_27MMTK_BSpline_transform_grid_float_t, __pyx_t_27MMTK_BSpline_transform_grid_float_t))__pyx_f_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm_derivateOfIntp_XX;
-  __pyx_vtable_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm.derivateOfIntp_XY_2 = (__pyx_t_27MMTK_BSpline_transform_grid_float_t (*)(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*)[4], __pyx_t_27MMTK_BSpline_transform_grid_float_t, __pyx_t_27MMTK_BSpline_transform_grid_float_t))__pyx_f_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm_derivateOfIntp_XY_2;
-  __pyx_vtable_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm.derivateOfIntp_XY = (__pyx_t_27MMTK_BSpline_transform_grid_float_t (*)(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*)[4][4], __pyx_t_27MMTK_BSpline_transform_grid_float_t, __pyx_t_27MMTK_BSpline_transform_grid_float_t, __pyx_t_27MMTK_BSpline_transform_grid_float_t))__pyx_f_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm_derivateOfIntp_XY;
-  __pyx_vtable_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm.derivateOfIntp_XZ_2 = (__pyx_t_27MMTK_BSpline_transform_grid_float_t (*)(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*)[4], __pyx_t_27MMTK_BSpline_transform_grid_float_t, __pyx_t_27MMTK_BSpline_transform_grid_float_t))__pyx_f_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm_derivateOfIntp_XZ_2;
-  __pyx_vtable_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm.derivateOfIntp_XZ = (__pyx_t_27MMTK_BSpline_transform_grid_float_t (*)(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*)[4][4], __pyx_t_27MMTK_BSpline_transform_grid_float_t, __pyx_t_27MMTK_BSpline_transform_grid_float_t, __pyx_t_27MMTK_BSpline_transform_grid_float_t))__pyx_f_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm_derivateOfIntp_XZ;
-  __pyx_vtable_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm.derivateOfIntp_YY_2 = (__pyx_t_27MMTK_BSpline_transform_grid_float_t (*)(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*)[4], __pyx_t_27MMTK_BSpline_transform_grid_float_t, __pyx_t_27MMTK_BSpline_transform_grid_float_t))__pyx_f_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm_derivateOfIntp_YY_2;
-  __pyx_vtable_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm.derivateOfIntp_YY = (__pyx_t_27MMTK_BSpline_transform_grid_float_t (*)(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*)[4][4], __pyx_t_27MMTK_BSpline_transform_grid_float_t, __pyx_t_27MMTK_BSpline_transform_grid_float_t, __pyx_t_27MMTK_BSpline_transform_grid_float_t))__pyx_f_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm_derivateOfIntp_YY;
-  __pyx_vtable_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm.derivateOfIntp_YZ_2 = (__pyx_t_27MMTK_BSpline_transform_grid_float_t (*)(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*)[4], __pyx_t_27MMTK_BSpline_transform_grid_float_t, __pyx_t_27MMTK_BSpline_transform_grid_float_t))__pyx_f_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm_derivateOfIntp_YZ_2;
-  __pyx_vtable_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm.derivateOfIntp_YZ = (__pyx_t_27MMTK_BSpline_transform_grid_float_t (*)(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*)[4][4], __pyx_t_27MMTK_BSpline_transform_grid_float_t, __pyx_t_27MMTK_BSpline_transform_grid_float_t, __pyx_t_27MMTK_BSpline_transform_grid_float_t))__pyx_f_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm_derivateOfIntp_YZ;
-  __pyx_vtable_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm.derivateOfIntp_ZZ_2 = (__pyx_t_27MMTK_BSpline_transform_grid_float_t (*)(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*)[4], __pyx_t_27MMTK_BSpline_transform_grid_float_t, __pyx_t_27MMTK_BSpline_transform_grid_float_t))__pyx_f_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm_derivateOfIntp_ZZ_2;
-  __pyx_vtable_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm.derivateOfIntp_ZZ = (__pyx_t_27MMTK_BSpline_transform_grid_float_t (*)(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *, __pyx_t_27MMTK_BSpline_transform_grid_float_t (*)[4][4], __pyx_t_27MMTK_BSpline_transform_grid_float_t, __pyx_t_27MMTK_BSpline_transform_grid_float_t, __pyx_t_27MMTK_BSpline_transform_grid_float_t))__pyx_f_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm_derivateOfIntp_ZZ;
-  __pyx_vtable_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm.evaluate = (void (*)(struct __pyx_obj_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm *, PyFFEvaluatorObject *, energy_spec *, energy_data *))__pyx_f_27MMTK_BSpline_transform_grid_24BSplineTransformGridTerm_evaluate;
-  __pyx_type_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm.tp_base = __pyx_ptype_27MMTK_BSpline_transform_grid_EnergyTerm;
-  if (PyType_Ready(&__pyx_type_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 38; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_type_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm.tp_print = 0;
-  if (__Pyx_SetVtable(__pyx_type_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm.tp_dict, __pyx_vtabptr_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 38; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (PyObject_SetAttrString(__pyx_m, "BSplineTransformGridTerm", (PyObject *)&__pyx_type_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 38; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_ptype_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm = &__pyx_type_27MMTK_BSpline_transform_grid_BSplineTransformGridTerm;
-  /*--- Type import code ---*/
-  __pyx_ptype_7cpython_4type_type = __Pyx_ImportType(__Pyx_BUILTIN_MODULE_NAME, "type", 
-  #if CYTHON_COMPILING_IN_PYPY
-  sizeof(PyTypeObject),
-  #else
-  sizeof(PyHeapTypeObject),
-  #endif
-  0); if (unlikely(!__pyx_ptype_7cpython_4type_type)) {__pyx_filename = __pyx_f[4]; __pyx_lineno = 9; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_ptype_5numpy_dtype = __Pyx_ImportType("numpy", "dtype", sizeof(PyArray_Descr), 0); if (unlikely(!__pyx_ptype_5numpy_dtype)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 155; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_ptype_5numpy_flatiter = __Pyx_ImportType("numpy", "flatiter", sizeof(PyArrayIterObject), 0); if (unlikely(!__pyx_ptype_5numpy_flatiter)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 165; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_ptype_5numpy_broadcast = __Pyx_ImportType("numpy", "broadcast", sizeof(PyArrayMultiIterObject), 0); if (unlikely(!__pyx_ptype_5numpy_broadcast)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 169; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_ptype_5numpy_ndarray = __Pyx_ImportType("numpy", "ndarray", sizeof(PyArrayObject), 0); if (unlikely(!__pyx_ptype_5numpy_ndarray)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 178; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_ptype_5numpy_ufunc = __Pyx_ImportType("numpy", "ufunc", sizeof(PyUFuncObject), 0); if (unlikely(!__pyx_ptype_5numpy_ufunc)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 861; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  /*--- Variable import code ---*/
-  /*--- Function import code ---*/
-  /*--- Execution code ---*/
-
-  /* "../MMTK-2.7.9/Include/MMTK/numeric.pxi":37
- *     object PyArray_FromDims(int n_dimensions, int dimensions[], int item_type)
- * 
- * import_array()             # <<<<<<<<<<<<<<
- */
-  import_array();
-
-  /* "../MMTK-2.7.9/Include/MMTK/universe.pxi":32
- *     cdef void **PyUniverse_API
- * 
- * import_MMTK_universe()             # <<<<<<<<<<<<<<
- */
-  import_MMTK_universe();
-
-  /* "../MMTK-2.7.9/Include/MMTK/forcefield.pxi":91
- *     cdef void **PyFF_API
- * 
- * import_MMTK_forcefield()             # <<<<<<<<<<<<<<
- * 
- */
-  import_MMTK_forcefield();
-
-  /* "MMTK_BSpline_transform_grid.pyx":11
- * include "MMTK/universe.pxi"
- * include 'MMTK/forcefield.pxi'
- * from Scientific.Geometry import Vector, ex, ey, ez             # <<<<<<<<<<<<<<
- * 
- * import gzip
- */
-  __pyx_t_1 = PyList_New(4); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 11; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_INCREF(__pyx_n_s_Vector);
-  PyList_SET_ITEM(__pyx_t_1, 0, __pyx_n_s_Vector);
-  __Pyx_GIVEREF(__pyx_n_s_Vector);
-  __Pyx_INCREF(__pyx_n_s_ex);
-  PyList_SET_ITEM(__pyx_t_1, 1, __pyx_n_s_ex);
-  __Pyx_GIVEREF(__pyx_n_s_ex);
-  __Pyx_INCREF(__pyx_n_s_ey);
-  PyList_SET_ITEM(__pyx_t_1, 2, __pyx_n_s_ey);
-  __Pyx_GIVEREF(__pyx_n_s_ey);
-  __Pyx_INCREF(__pyx_n_s_ez);
-  PyList_SET_ITEM(__pyx_t_1, 3, __pyx_n_s_ez);
-  __Pyx_GIVEREF(__pyx_n_s_ez);
-  __pyx_t_2 = __Pyx_Import(__pyx_n_s_Scientific_Geometry, __pyx_t_1, -1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 11; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_Vector); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 11; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Vector, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 11; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_ex); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 11; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_ex, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 11; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_ey); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 11; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_ey, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 11; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_ez); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 11; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_ez, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 11; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-  /* "MMTK_BSpline_transform_grid.pyx":13
- * from Scientific.Geometry import Vector, ex, ey, ez
- * 
- * import gzip             # <<<<<<<<<<<<<<
- * 
- * 
- */
-  __pyx_t_2 = __Pyx_Import(__pyx_n_s_gzip, 0, -1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 13; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_gzip, __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 13; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-  /* "MMTK_BSpline_transform_grid.pyx":16
- * 
- * 
- * import numpy as np             # <<<<<<<<<<<<<<
- * cimport numpy as np
- * 
- */
-  __pyx_t_2 = __Pyx_Import(__pyx_n_s_numpy, 0, -1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 16; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_np, __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 16; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-  /* "MMTK_BSpline_transform_grid.pyx":1
- * # Cython force field implementation for BSpline grid             # <<<<<<<<<<<<<<
- * 
- * #
- */
-  __pyx_t_2 = PyDict_New(); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_test, __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-  /* "numpy.pxd":975
- *      arr.base = baseptr
- * 
- * cdef inline object get_array_base(ndarray arr):             # <<<<<<<<<<<<<<
- *     if arr.base is NULL:
- *         return None
- */
-
-  /*--- Wrapped vars code ---*/
-
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  if (__pyx_m) {
-    if (__pyx_d) {
-      __Pyx_AddTraceback("init MMTK_BSpline_transform_grid", __pyx_clineno, __pyx_lineno, __pyx_filename);
-    }
-    Py_DECREF(__pyx_m); __pyx_m = 0;
-  } else if (!PyErr_Occurred()) {
-    PyErr_SetString(PyExc_ImportError, "init MMTK_BSpline_transform_grid");
-  }
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  #if PY_MAJOR_VERSION < 3
-  return;
-  #else
-  return __pyx_m;
-  #endif
-}
-
-/* --- Runtime support code --- */
-#if CYTHON_REFNANNY
-static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname) {
-    PyObject *m = NULL, *p = NULL;
-    void *r = NULL;
-    m = PyImport_ImportModule((char *)modname);
-    if (!m) goto end;
-    p = PyObject_GetAttrString(m, (char *)"RefNannyAPI");
-    if (!p) goto end;
-    r = PyLong_AsVoidPtr(p);
-end:
-    Py_XDECREF(p);
-    Py_XDECREF(m);
-    return (__Pyx_RefNannyAPIStruct *)r;
-}
-#endif
-
-static PyObject *__Pyx_GetBuiltinName(PyObject *name) {
-    PyObject* result = __Pyx_PyObject_GetAttrStr(__pyx_b, name);
-    if (unlikely(!result)) {
-        PyErr_Format(PyExc_NameError,
-#if PY_MAJOR_VERSION >= 3
-            "name '%U' is not defined", name);
-#else
-            "name '%.200s' is not defined", PyString_AS_STRING(name));
-#endif
-    }
-    return result;
-}
-
-static void __Pyx_RaiseArgtupleInvalid(
-    const char* func_name,
-    int exact,
-    Py_ssize_t num_min,
-    Py_ssize_t num_max,
-    Py_ssize_t num_found)
-{
-    Py_ssize_t num_expected;
-    const char *more_or_less;
-    if (num_found < num_min) {
-        num_expected = num_min;
-        more_or_less = "at least";
-    } else {
-        num_expected = num_max;
-        more_or_less = "at most";
-    }
-    if (exact) {
-        more_or_less = "exactly";
-    }
-    PyErr_Format(PyExc_TypeError,
-                 "%.200s() takes %.8s %" CYTHON_FORMAT_SSIZE_T "d positional argument%.1s (%" CYTHON_FORMAT_SSIZE_T "d given)",
-                 func_name, more_or_less, num_expected,
-                 (num_expected == 1) ? "" : "s", num_found);
-}
-
-static void __Pyx_RaiseDoubleKeywordsError(
-    const char* func_name,
-    PyObject* kw_name)
-{
-    PyErr_Format(PyExc_TypeError,
-        #if PY_MAJOR_VERSION >= 3
-        "%s() got multiple values for keyword argument '%U'", func_name, kw_name);
-        #else
-        "%s() got multiple values for keyword argument '%s'", func_name,
-        PyString_AsString(kw_name));
-        #endif
-}
-
-static int __Pyx_ParseOptionalKeywords(
-    PyObject *kwds,
-    PyObject **argnames[],
-    PyObject *kwds2,
-    PyObject *values[],
-    Py_ssize_t num_pos_args,
-    const char* function_name)
-{
-    PyObject *key = 0, *value = 0;
-    Py_ssize_t pos = 0;
-    PyObject*** name;
-    PyObject*** first_kw_arg = argnames + num_pos_args;
-    while (PyDict_Next(kwds, &pos, &key, &value)) {
-        name = first_kw_arg;
-        while (*name && (**name != key)) name++;
-        if (*name) {
-            values[name-argnames] = value;
-            continue;
-        }
-        name = first_kw_arg;
-        #if PY_MAJOR_VERSION < 3
-        if (likely(PyString_CheckExact(key)) || likely(PyString_Check(key))) {
-            while (*name) {
-                if ((CYTHON_COMPILING_IN_PYPY || PyString_GET_SIZE(**name) == PyString_GET_SIZE(key))
-                        && _PyString_Eq(**name, key)) {
-                    values[name-argnames] = value;
-                    break;
-                }
-                name++;
-            }
-            if (*name) continue;
-            else {
-                PyObject*** argname = argnames;
-                while (argname != first_kw_arg) {
-                    if ((**argname == key) || (
-                            (CYTHON_COMPILING_IN_PYPY || PyString_GET_SIZE(**argname) == PyString_GET_SIZE(key))
-                             && _PyString_Eq(**argname, key))) {
-                        goto arg_passed_twice;
-                    }
-                    argname++;
-                }
-            }
-        } else
-        #endif
-        if (likely(PyUnicode_Check(key))) {
-            while (*name) {
-                int cmp = (**name == key) ? 0 :
-                #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
-                    (PyUnicode_GET_SIZE(**name) != PyUnicode_GET_SIZE(key)) ? 1 :
-                #endif
-                    PyUnicode_Compare(**name, key);
-                if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
-                if (cmp == 0) {
-                    values[name-argnames] = value;
-                    break;
-                }
-                name++;
-            }
-            if (*name) continue;
-            else {
-                PyObject*** argname = argnames;
-                while (argname != first_kw_arg) {
-                    int cmp = (**argname == key) ? 0 :
-                    #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
-                        (PyUnicode_GET_SIZE(**argname) != PyUnicode_GET_SIZE(key)) ? 1 :
-                    #endif
-                        PyUnicode_Compare(**argname, key);
-                    if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
-                    if (cmp == 0) goto arg_passed_twice;
-                    argname++;
-                }
-            }
-        } else
-            goto invalid_keyword_type;
-        if (kwds2) {
-            if (unlikely(PyDict_SetItem(kwds2, key, value))) goto bad;
-        } else {
-            goto invalid_keyword;
-        }
-    }
-    return 0;
-arg_passed_twice:
-    __Pyx_RaiseDoubleKeywordsError(function_name, key);
-    goto bad;
-invalid_keyword_type:
-    PyErr_Format(PyExc_TypeError,
-        "%.200s() keywords must be strings", function_name);
-    goto bad;
-invalid_keyword:
-    PyErr_Format(PyExc_TypeError,
-    #if PY_MAJOR_VERSION < 3
-        "%.200s() got an unexpected keyword argument '%.200s'",
-        function_name, PyString_AsString(key));
-    #else
-        "%s() got an unexpected keyword argument '%U'",
-        function_name, key);
-    #endif
-bad:
-    return -1;
-}
-
-#if CYTHON_COMPILING_IN_CPYTHON
-static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw) {
-    PyObject *result;
-    ternaryfunc call = func->ob_type->tp_call;
-    if (unlikely(!call))
-        return PyObject_Call(func, arg, kw);
-    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
-        return NULL;
-    result = (*call)(func, arg, kw);
-    Py_LeaveRecursiveCall();
-    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
-        PyErr_SetString(
-            PyExc_SystemError,
-            "NULL result without error in PyObject_Call");
-    }
-    return result;
-}
-#endif
-
-static CYTHON_INLINE PyObject *__Pyx_GetModuleGlobalName(PyObject *name) {
-    PyObject *result;
-#if CYTHON_COMPILING_IN_CPYTHON
-    result = PyDict_GetItem(__pyx_d, name);
-    if (likely(result)) {
-        Py_INCREF(result);
-    } else {
-#else
-    result = PyObject_GetItem(__pyx_d, name);
-    if (!result) {
-        PyErr_Clear();
-#endif
-        result = __Pyx_GetBuiltinName(name);
-    }
-    return result;
-}
-
-static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type) {
-    if (unlikely(!type)) {
-        PyErr_SetString(PyExc_SystemError, "Missing type object");
-        return 0;
-    }
-    if (likely(PyObject_TypeCheck(obj, type)))
-        return 1;
-    PyErr_Format(PyExc_TypeError, "Cannot convert %.200s to %.200s",
-                 Py_TYPE(obj)->tp_name, type->tp_name);
-    return 0;
-}
-
-static double __Pyx__PyObject_AsDouble(PyObject* obj) {
-    PyObject* float_value;
-#if CYTHON_COMPILING_IN_PYPY
-    float_value = PyNumber_Float(obj);
-#else
-    PyNumberMethods *nb = Py_TYPE(obj)->tp_as_number;
-    if (likely(nb) && likely(nb->nb_float)) {
-        float_value = nb->nb_float(obj);
-        if (likely(float_value) && unlikely(!PyFloat_Check(float_value))) {
-            PyErr_Format(PyExc_TypeError,
-                "__float__ returned non-float (type %.200s)",
-                Py_TYPE(float_value)->tp_name);
-            Py_DECREF(float_value);
-            goto bad;
-        }
-    } else if (PyUnicode_CheckExact(obj) || PyBytes_CheckExact(obj)) {
-#if PY_MAJOR_VERSION >= 3
-        float_value = PyFloat_FromString(obj);
-#else
-        float_value = PyFloat_FromString(obj, 0);
-#endif
-    } else {
-        PyObject* args = PyTuple_New(1);
-        if (unlikely(!args)) goto bad;
-        PyTuple_SET_ITEM(args, 0, obj);
-        float_value = PyObject_Call((PyObject*)&PyFloat_Type, args, 0);
-        PyTuple_SET_ITEM(args, 0, 0);
-        Py_DECREF(args);
-    }
-#endif
-    if (likely(float_value)) {
-        double value = PyFloat_AS_DOUBLE(float_value);
-        Py_DECREF(float_value);
-        return value;
-    }
-bad:
-    return (double)-1;
-}
-
-static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j) {
-    PyObject *r;
-    if (!j) return NULL;
-    r = PyObject_GetItem(o, j);
-    Py_DECREF(j);
-    return r;
-}
-static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i,
-                                                              int wraparound, int boundscheck) {
-#if CYTHON_COMPILING_IN_CPYTHON
-    if (wraparound & unlikely(i < 0)) i += PyList_GET_SIZE(o);
-    if ((!boundscheck) || likely((0 <= i) & (i < PyList_GET_SIZE(o)))) {
-        PyObject *r = PyList_GET_ITEM(o, i);
-        Py_INCREF(r);
-        return r;
-    }
-    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
-#else
-    return PySequence_GetItem(o, i);
-#endif
-}
-static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i,
-                                                              int wraparound, int boundscheck) {
-#if CYTHON_COMPILING_IN_CPYTHON
-    if (wraparound & unlikely(i < 0)) i += PyTuple_GET_SIZE(o);
-    if ((!boundscheck) || likely((0 <= i) & (i < PyTuple_GET_SIZE(o)))) {
-        PyObject *r = PyTuple_GET_ITEM(o, i);
-        Py_INCREF(r);
-        return r;
-    }
-    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
-#else
-    return PySequence_GetItem(o, i);
-#endif
-}
-static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i,
-                                                     int is_list, int wraparound, int boundscheck) {
-#if CYTHON_COMPILING_IN_CPYTHON
-    if (is_list || PyList_CheckExact(o)) {
-        Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyList_GET_SIZE(o);
-        if ((!boundscheck) || (likely((n >= 0) & (n < PyList_GET_SIZE(o))))) {
-            PyObject *r = PyList_GET_ITEM(o, n);
-            Py_INCREF(r);
-            return r;
-        }
-    }
-    else if (PyTuple_CheckExact(o)) {
-        Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyTuple_GET_SIZE(o);
-        if ((!boundscheck) || likely((n >= 0) & (n < PyTuple_GET_SIZE(o)))) {
-            PyObject *r = PyTuple_GET_ITEM(o, n);
-            Py_INCREF(r);
-            return r;
-        }
-    } else {
-        PySequenceMethods *m = Py_TYPE(o)->tp_as_sequence;
-        if (likely(m && m->sq_item)) {
-            if (wraparound && unlikely(i < 0) && likely(m->sq_length)) {
-                Py_ssize_t l = m->sq_length(o);
-                if (likely(l >= 0)) {
-                    i += l;
-                } else {
-                    if (PyErr_ExceptionMatches(PyExc_OverflowError))
-                        PyErr_Clear();
-                    else
-                        return NULL;
-                }
-            }
-            return m->sq_item(o, i);
-        }
-    }
-#else
-    if (is_list || PySequence_Check(o)) {
-        return PySequence_GetItem(o, i);
-    }
-#endif
-    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
-}
-
-static CYTHON_INLINE int __Pyx_IsLittleEndian(void) {
-  unsigned int n = 1;
-  return *(unsigned char*)(&n) != 0;
-}
-static void __Pyx_BufFmt_Init(__Pyx_BufFmt_Context* ctx,
-                              __Pyx_BufFmt_StackElem* stack,
-                              __Pyx_TypeInfo* type) {
-  stack[0].field = &ctx->root;
-  stack[0].parent_offset = 0;
-  ctx->root.type = type;
-  ctx->root.name = "buffer dtype";
-  ctx->root.offset = 0;
-  ctx->head = stack;
-  ctx->head->field = &ctx->root;
-  ctx->fmt_offset = 0;
-  ctx->head->parent_offset = 0;
-  ctx->new_packmode = '@';
-  ctx->enc_packmode = '@';
-  ctx->new_count = 1;
-  ctx->enc_count = 0;
-  ctx->enc_type = 0;
-  ctx->is_complex = 0;
-  ctx->is_valid_array = 0;
-  ctx->struct_alignment = 0;
-  while (type->typegroup == 'S') {
-    ++ctx->head;
-    ctx->head->field = type->fields;
-    ctx->head->parent_offset = 0;
-    type = type->fields->type;
-  }
-}
-static int __Pyx_BufFmt_ParseNumber(const char** ts) {
-    int count;
-    const char* t = *ts;
-    if (*t < '0' || *t > '9') {
-      return -1;
-    } else {
-        count = *t++ - '0';
-        while (*t >= '0' && *t < '9') {
-            count *= 10;
-            count += *t++ - '0';
-        }
-    }
-    *ts = t;
-    return count;
-}
-static int __Pyx_BufFmt_ExpectNumber(const char **ts) {
-    int number = __Pyx_BufFmt_ParseNumber(ts);
-    if (number == -1)
-        PyErr_Format(PyExc_ValueError,\
-                     "Does not understand character buffer dtype format string ('%c')", **ts);
-    return number;
-}
-static void __Pyx_BufFmt_RaiseUnexpectedChar(char ch) {
-  PyErr_Format(PyExc_ValueError,
-               "Unexpected format string character: '%c'", ch);
-}
-static const char* __Pyx_BufFmt_DescribeTypeChar(char ch, int is_complex) {
-  switch (ch) {
-    case 'c': return "'char'";
-    case 'b': return "'signed char'";
-    case 'B': return "'unsigned char'";
-    case 'h': return "'short'";
-    case 'H': return "'unsigned short'";
-    case 'i': return "'int'";
-    case 'I': return "'unsigned int'";
-    case 'l': return "'long'";
-    case 'L': return "'unsigned long'";
-    case 'q': return "'long long'";
-    case 'Q': return "'unsigned long long'";
-    case 'f': return (is_complex ? "'complex float'" : "'float'");
-    case 'd': return (is_complex ? "'complex double'" : "'double'");
-    case 'g': return (is_complex ? "'complex long double'" : "'long double'");
-    case 'T': return "a struct";
-    case 'O': return "Python object";
-    case 'P': return "a pointer";
-    case 's': case 'p': return "a string";
-    case 0: return "end";
-    default: return "unparseable format string";
-  }
-}
-static size_t __Pyx_BufFmt_TypeCharToStandardSize(char ch, int is_complex) {
-  switch (ch) {
-    case '?': case 'c': case 'b': case 'B': case 's': case 'p': return 1;
-    case 'h': case 'H': return 2;
-    case 'i': case 'I': case 'l': case 'L': return 4;
-    case 'q': case 'Q': return 8;
-    case 'f': return (is_complex ? 8 : 4);
-    case 'd': return (is_complex ? 16 : 8);
-    case 'g': {
-      PyErr_SetString(PyExc_ValueError, "Python does not define a standard format string size for long double ('g')..");
-      return 0;
-    }
-    case 'O': case 'P': return sizeof(void*);
-    default:
-      __Pyx_BufFmt_RaiseUnexpectedChar(ch);
-      return 0;
-    }
-}
-static size_t __Pyx_BufFmt_TypeCharToNativeSize(char ch, int is_complex) {
-  switch (ch) {
-    case 'c': case 'b': case 'B': case 's': case 'p': return 1;
-    case 'h': case 'H': return sizeof(short);
-    case 'i': case 'I': return sizeof(int);
-    case 'l': case 'L': return sizeof(long);
-    #ifdef HAVE_LONG_LONG
-    case 'q': case 'Q': return sizeof(PY_LONG_LONG);
-    #endif
-    case 'f': return sizeof(float) * (is_complex ? 2 : 1);
-    case 'd': return sizeof(double) * (is_complex ? 2 : 1);
-    case 'g': return sizeof(long double) * (is_complex ? 2 : 1);
-    case 'O': case 'P': return sizeof(void*);
-    default: {
-      __Pyx_BufFmt_RaiseUnexpectedChar(ch);
-      return 0;
-    }
-  }
-}
-typedef struct { char c; short x; } __Pyx_st_short;
-typedef struct { char c; int x; } __Pyx_st_int;
-typedef struct { char c; long x; } __Pyx_st_long;
-typedef struct { char c; float x; } __Pyx_st_float;
-typedef struct { char c; double x; } __Pyx_st_double;
-typedef struct { char c; long double x; } __Pyx_st_longdouble;
-typedef struct { char c; void *x; } __Pyx_st_void_p;
-#ifdef HAVE_LONG_LONG
-typedef struct { char c; PY_LONG_LONG x; } __Pyx_st_longlong;
-#endif
-static size_t __Pyx_BufFmt_TypeCharToAlignment(char ch, CYTHON_UNUSED int is_complex) {
-  switch (ch) {
-    case '?': case 'c': case 'b': case 'B': case 's': case 'p': return 1;
-    case 'h': case 'H': return sizeof(__Pyx_st_short) - sizeof(short);
-    case 'i': case 'I': return sizeof(__Pyx_st_int) - sizeof(int);
-    case 'l': case 'L': return sizeof(__Pyx_st_long) - sizeof(long);
-#ifdef HAVE_LONG_LONG
-    case 'q': case 'Q': return sizeof(__Pyx_st_longlong) - sizeof(PY_LONG_LONG);
-#endif
-    case 'f': return sizeof(__Pyx_st_float) - sizeof(float);
-    case 'd': return sizeof(__Pyx_st_double) - sizeof(double);
-    case 'g': return sizeof(__Pyx_st_longdouble) - sizeof(long double);
-    case 'P': case 'O': return sizeof(__Pyx_st_void_p) - sizeof(void*);
-    default:
-      __Pyx_BufFmt_RaiseUnexpectedChar(ch);
-      return 0;
-    }
-}
-/* These are for computing the padding at the end of the struct to align
-   on the first member of the struct. This will probably the same as above,
-   but we don't have any guarantees.
- */
-typedef struct { short x; char c; } __Pyx_pad_short;
-typedef struct { int x; char c; } __Pyx_pad_int;
-typedef struct { long x; char c; } __Pyx_pad_long;
-typedef struct { float x; char c; } __Pyx_pad_float;
-typedef struct { double x; char c; } __Pyx_pad_double;
-typedef struct { long double x; char c; } __Pyx_pad_longdouble;
-typedef struct { void *x; char c; } __Pyx_pad_void_p;
-#ifdef HAVE_LONG_LONG
-typedef struct { PY_LONG_LONG x; char c; } __Pyx_pad_longlong;
-#endif
-static size_t __Pyx_BufFmt_TypeCharToPadding(char ch, CYTHON_UNUSED int is_complex) {
-  switch (ch) {
-    case '?': case 'c': case 'b': case 'B': case 's': case 'p': return 1;
-    case 'h': case 'H': return sizeof(__Pyx_pad_short) - sizeof(short);
-    case 'i': case 'I': return sizeof(__Pyx_pad_int) - sizeof(int);
-    case 'l': case 'L': return sizeof(__Pyx_pad_long) - sizeof(long);
-#ifdef HAVE_LONG_LONG
-    case 'q': case 'Q': return sizeof(__Pyx_pad_longlong) - sizeof(PY_LONG_LONG);
-#endif
-    case 'f': return sizeof(__Pyx_pad_float) - sizeof(float);
-    case 'd': return sizeof(__Pyx_pad_double) - sizeof(double);
-    case 'g': return sizeof(__Pyx_pad_longdouble) - sizeof(long double);
-    case 'P': case 'O': return sizeof(__Pyx_pad_void_p) - sizeof(void*);
-    default:
-      __Pyx_BufFmt_RaiseUnexpectedChar(ch);
-      return 0;
-    }
-}
-static char __Pyx_BufFmt_TypeCharToGroup(char ch, int is_complex) {
-  switch (ch) {
-    case 'c':
-        return 'H';
-    case 'b': case 'h': case 'i':
-    case 'l': case 'q': case 's': case 'p':
-        return 'I';
-    case 'B': case 'H': case 'I': case 'L': case 'Q':
-        return 'U';
-    case 'f': case 'd': case 'g':
-        return (is_complex ? 'C' : 'R');
-    case 'O':
-        return 'O';
-    case 'P':
-        return 'P';
-    default: {
-      __Pyx_BufFmt_RaiseUnexpectedChar(ch);
-      return 0;
-    }
-  }
-}
-static void __Pyx_BufFmt_RaiseExpected(__Pyx_BufFmt_Context* ctx) {
-  if (ctx->head == NULL || ctx->head->field == &ctx->root) {
-    const char* expected;
-    const char* quote;
-    if (ctx->head == NULL) {
-      expected = "end";
-      quote = "";
-    } else {
-      expected = ctx->head->field->type->name;
-      quote = "'";
-    }
-    PyErr_Format(PyExc_ValueError,
-                 "Buffer dtype mismatch, expected %s%s%s but got %s",
-                 quote, expected, quote,
-                 __Pyx_BufFmt_DescribeTypeChar(ctx->enc_type, ctx->is_complex));
-  } else {
-    __Pyx_StructField* field = ctx->head->field;
-    __Pyx_StructField* parent = (ctx->head - 1)->field;
-    PyErr_Format(PyExc_ValueError,
-                 "Buffer dtype mismatch, expected '%s' but got %s in '%s.%s'",
-                 field->type->name, __Pyx_BufFmt_DescribeTypeChar(ctx->enc_type, ctx->is_complex),
-                 parent->type->name, field->name);
-  }
-}
-static int __Pyx_BufFmt_ProcessTypeChunk(__Pyx_BufFmt_Context* ctx) {
-  char group;
-  size_t size, offset, arraysize = 1;
-  if (ctx->enc_type == 0) return 0;
-  if (ctx->head->field->type->arraysize[0]) {
-    int i, ndim = 0;
-    if (ctx->enc_type == 's' || ctx->enc_type == 'p') {
-        ctx->is_valid_array = ctx->head->field->type->ndim == 1;
-        ndim = 1;
-        if (ctx->enc_count != ctx->head->field->type->arraysize[0]) {
-            PyErr_Format(PyExc_ValueError,
-                         "Expected a dimension of size %zu, got %zu",
-                         ctx->head->field->type->arraysize[0], ctx->enc_count);
-            return -1;
-        }
-    }
-    if (!ctx->is_valid_array) {
-      PyErr_Format(PyExc_ValueError, "Expected %d dimensions, got %d",
-                   ctx->head->field->type->ndim, ndim);
-      return -1;
-    }
-    for (i = 0; i < ctx->head->field->type->ndim; i++) {
-      arraysize *= ctx->head->field->type->arraysize[i];
-    }
-    ctx->is_valid_array = 0;
-    ctx->enc_count = 1;
-  }
-  group = __Pyx_BufFmt_TypeCharToGroup(ctx->enc_type, ctx->is_complex);
-  do {
-    __Pyx_StructField* field = ctx->head->field;
-    __Pyx_TypeInfo* type = field->type;
-    if (ctx->enc_packmode == '@' || ctx->enc_packmode == '^') {
-      size = __Pyx_BufFmt_TypeCharToNativeSize(ctx->enc_type, ctx->is_complex);
-    } else {
-      size = __Pyx_BufFmt_TypeCharToStandardSize(ctx->enc_type, ctx->is_complex);
-    }
-    if (ctx->enc_packmode == '@') {
-      size_t align_at = __Pyx_BufFmt_TypeCharToAlignment(ctx->enc_type, ctx->is_complex);
-      size_t align_mod_offset;
-      if (align_at == 0) return -1;
-      align_mod_offset = ctx->fmt_offset % align_at;
-      if (align_mod_offset > 0) ctx->fmt_offset += align_at - align_mod_offset;
-      if (ctx->struct_alignment == 0)
-          ctx->struct_alignment = __Pyx_BufFmt_TypeCharToPadding(ctx->enc_type,
-                                                                 ctx->is_complex);
-    }
-    if (type->size != size || type->typegroup != group) {
-      if (type->typegroup == 'C' && type->fields != NULL) {
-        size_t parent_offset = ctx->head->parent_offset + field->offset;
-        ++ctx->head;
-        ctx->head->field = type->fields;
-        ctx->head->parent_offset = parent_offset;
-        continue;
-      }
-      if ((type->typegroup == 'H' || group == 'H') && type->size == size) {
-      } else {
-          __Pyx_BufFmt_RaiseExpected(ctx);
-          return -1;
-      }
-    }
-    offset = ctx->head->parent_offset + field->offset;
-    if (ctx->fmt_offset != offset) {
-      PyErr_Format(PyExc_ValueError,
-                   "Buffer dtype mismatch; next field is at offset %" CYTHON_FORMAT_SSIZE_T "d but %" CYTHON_FORMAT_SSIZE_T "d expected",
-                   (Py_ssize_t)ctx->fmt_offset, (Py_ssize_t)offset);
-      return -1;
-    }
-    ctx->fmt_offset += size;
-    if (arraysize)
-      ctx->fmt_offset += (arraysize - 1) * size;
-    --ctx->enc_count;
-    while (1) {
-      if (field == &ctx->root) {
-        ctx->head = NULL;
-        if (ctx->enc_count != 0) {
-          __Pyx_BufFmt_RaiseExpected(ctx);
-          return -1;
-        }
-        break;
-      }
-      ctx->head->field = ++field;
-      if (field->type == NULL) {
-        --ctx->head;
-        field = ctx->head->field;
-        continue;
-      } else if (field->type->typegroup == 'S') {
-        size_t parent_offset = ctx->head->parent_offset + field->offset;
-        if (field->type->fields->type == NULL) continue;
-        field = field->type->fields;
-        ++ctx->head;
-        ctx->head->field = field;
-        ctx->head->parent_offset = parent_offset;
-        break;
-      } else {
-        break;
-      }
-    }
-  } while (ctx->enc_count);
-  ctx->enc_type = 0;
-  ctx->is_complex = 0;
-  return 0;
-}
-static CYTHON_INLINE PyObject *
-__pyx_buffmt_parse_array(__Pyx_BufFmt_Context* ctx, const char** tsp)
-{
-    const char *ts = *tsp;
-    int i = 0, number;
-    int ndim = ctx->head->field->type->ndim;
-;
-    ++ts;
-    if (ctx->new_count != 1) {
-        PyErr_SetString(PyExc_ValueError,
-                        "Cannot handle repeated arrays in format string");
-        return NULL;
-    }
-    if (__Pyx_BufFmt_ProcessTypeChunk(ctx) == -1) return NULL;
-    while (*ts && *ts != ')') {
-        switch (*ts) {
-            case ' ': case '\f': case '\r': case '\n': case '\t': case '\v':  continue;
-            default:  break;
-        }
-        number = __Pyx_BufFmt_ExpectNumber(&ts);
-        if (number == -1) return NULL;
-        if (i < ndim && (size_t) number != ctx->head->field->type->arraysize[i])
-            return PyErr_Format(PyExc_ValueError,
-                        "Expected a dimension of size %zu, got %d",
-                        ctx->head->field->type->arraysize[i], number);
-        if (*ts != ',' && *ts != ')')
-            return PyErr_Format(PyExc_ValueError,
-                                "Expected a comma in format string, got '%c'", *ts);
-        if (*ts == ',') ts++;
-        i++;
-    }
-    if (i != ndim)
-        return PyErr_Format(PyExc_ValueError, "Expected %d dimension(s), got %d",
-                            ctx->head->field->type->ndim, i);
-    if (!*ts) {
-        PyErr_SetString(PyExc_ValueError,
-                        "Unexpected end of format string, expected ')'");
-        return NULL;
-    }
-    ctx->is_valid_array = 1;
-    ctx->new_count = 1;
-    *tsp = ++ts;
-    return Py_None;
-}
-static const char* __Pyx_BufFmt_CheckString(__Pyx_BufFmt_Context* ctx, const char* ts) {
-  int got_Z = 0;
-  while (1) {
-    switch(*ts) {
-      case 0:
-        if (ctx->enc_type != 0 && ctx->head == NULL) {
-          __Pyx_BufFmt_RaiseExpected(ctx);
-          return NULL;
-        }
-        if (__Pyx_BufFmt_ProcessTypeChunk(ctx) == -1) return NULL;
-        if (ctx->head != NULL) {
-          __Pyx_BufFmt_RaiseExpected(ctx);
-          return NULL;
-        }
-        return ts;
-      case ' ':
-      case '\r':
-      case '\n':
-        ++ts;
-        break;
-      case '<':
-        if (!__Pyx_IsLittleEndian()) {
-          PyErr_SetString(PyExc_ValueError, "Little-endian buffer not supported on big-endian compiler");
-          return NULL;
-        }
-        ctx->new_packmode = '=';
-        ++ts;
-        break;
-      case '>':
-      case '!':
-        if (__Pyx_IsLittleEndian()) {
-          PyErr_SetString(PyExc_ValueError, "Big-endian buffer not supported on little-endian compiler");
-          return NULL;
-        }
-        ctx->new_packmode = '=';
-        ++ts;
-        break;
-      case '=':
-      case '@':
-      case '^':
-        ctx->new_packmode = *ts++;
-        break;
-      case 'T':
-        {
-          const char* ts_after_sub;
-          size_t i, struct_count = ctx->new_count;
-          size_t struct_alignment = ctx->struct_alignment;
-          ctx->new_count = 1;
-          ++ts;
-          if (*ts != '{') {
-            PyErr_SetString(PyExc_ValueError, "Buffer acquisition: Expected '{' after 'T'");
-            return NULL;
-          }
-          if (__Pyx_BufFmt_ProcessTypeChunk(ctx) == -1) return NULL;
-          ctx->enc_type = 0;
-          ctx->enc_count = 0;
-          ctx->struct_alignment = 0;
-          ++ts;
-          ts_after_sub = ts;
-          for (i = 0; i != struct_count; ++i) {
-            ts_after_sub = __Pyx_BufFmt_CheckString(ctx, ts);
-            if (!ts_after_sub) return NULL;
-          }
-          ts = ts_after_sub;
-          if (struct_alignment) ctx->struct_alignment = struct_alignment;
-        }
-        break;
-      case '}':
-        {
-          size_t alignment = ctx->struct_alignment;
-          ++ts;
-          if (__Pyx_BufFmt_ProcessTypeChunk(ctx) == -1) return NULL;
-          ctx->enc_type = 0;
-          if (alignment && ctx->fmt_offset % alignment) {
-            ctx->fmt_offset += alignment - (ctx->fmt_offset % alignment);
-          }
-        }
-        return ts;
-      case 'x':
-        if (__Pyx_BufFmt_ProcessTypeChunk(ctx) == -1) return NULL;
-        ctx->fmt_offset += ctx->new_count;
-        ctx->new_count = 1;
-        ctx->enc_count = 0;
-        ctx->enc_type = 0;
-        ctx->enc_packmode = ctx->new_packmode;
-        ++ts;
-        break;
-      case 'Z':
-        got_Z = 1;
-        ++ts;
-        if (*ts != 'f' && *ts != 'd' && *ts != 'g') {
-          __Pyx_BufFmt_RaiseUnexpectedChar('Z');
-          return NULL;
-        }
-      case 'c': case 'b': case 'B': case 'h': case 'H': case 'i': case 'I':
-      case 'l': case 'L': case 'q': case 'Q':
-      case 'f': case 'd': case 'g':
-      case 'O': case 'p':
-        if (ctx->enc_type == *ts && got_Z == ctx->is_complex &&
-            ctx->enc_packmode == ctx->new_packmode) {
-          ctx->enc_count += ctx->new_count;
-          ctx->new_count = 1;
-          got_Z = 0;
-          ++ts;
-          break;
-        }
-      case 's':
-        if (__Pyx_BufFmt_ProcessTypeChunk(ctx) == -1) return NULL;
-        ctx->enc_count = ctx->new_count;
-        ctx->enc_packmode = ctx->new_packmode;
-        ctx->enc_type = *ts;
-        ctx->is_complex = got_Z;
-        ++ts;
-        ctx->new_count = 1;
-        got_Z = 0;
-        break;
-      case ':':
-        ++ts;
-        while(*ts != ':') ++ts;
-        ++ts;
-        break;
-      case '(':
-        if (!__pyx_buffmt_parse_array(ctx, &ts)) return NULL;
-        break;
-      default:
-        {
-          int number = __Pyx_BufFmt_ExpectNumber(&ts);
-          if (number == -1) return NULL;
-          ctx->new_count = (size_t)number;
-        }
-    }
-  }
-}
-static CYTHON_INLINE void __Pyx_ZeroBuffer(Py_buffer* buf) {
-  buf->buf = NULL;
-  buf->obj = NULL;
-  buf->strides = __Pyx_zeros;
-  buf->shape = __Pyx_zeros;
-  buf->suboffsets = __Pyx_minusones;
-}
-static CYTHON_INLINE int __Pyx_GetBufferAndValidate(
-        Py_buffer* buf, PyObject* obj,  __Pyx_TypeInfo* dtype, int flags,
-        int nd, int cast, __Pyx_BufFmt_StackElem* stack)
-{
-  if (obj == Py_None || obj == NULL) {
-    __Pyx_ZeroBuffer(buf);
-    return 0;
-  }
-  buf->buf = NULL;
-  if (__Pyx_GetBuffer(obj, buf, flags) == -1) goto fail;
-  if (buf->ndim != nd) {
-    PyErr_Format(PyExc_ValueError,
-                 "Buffer has wrong number of dimensions (expected %d, got %d)",
-                 nd, buf->ndim);
-    goto fail;
-  }
-  if (!cast) {
-    __Pyx_BufFmt_Context ctx;
-    __Pyx_BufFmt_Init(&ctx, stack, dtype);
-    if (!__Pyx_BufFmt_CheckString(&ctx, buf->format)) goto fail;
-  }
-  if ((unsigned)buf->itemsize != dtype->size) {
-    PyErr_Format(PyExc_ValueError,
-      "Item size of buffer (%" CYTHON_FORMAT_SSIZE_T "d byte%s) does not match size of '%s' (%" CYTHON_FORMAT_SSIZE_T "d byte%s)",
-      buf->itemsize, (buf->itemsize > 1) ? "s" : "",
-      dtype->name, (Py_ssize_t)dtype->size, (dtype->size > 1) ? "s" : "");
-    goto fail;
-  }
-  if (buf->suboffsets == NULL) buf->suboffsets = __Pyx_minusones;
-  return 0;
-fail:;
-  __Pyx_ZeroBuffer(buf);
-  return -1;
-}
-static CYTHON_INLINE void __Pyx_SafeReleaseBuffer(Py_buffer* info) {
-  if (info->buf == NULL) return;
-  if (info->suboffsets == __Pyx_minusones) info->suboffsets = NULL;
-  __Pyx_ReleaseBuffer(info);
-}
-
-static void __Pyx_RaiseBufferFallbackError(void) {
-  PyErr_SetString(PyExc_ValueError,
-     "Buffer acquisition failed on assignment; and then reacquiring the old buffer failed too!");
-}
-
-static CYTHON_INLINE int __Pyx_SetItemInt_Generic(PyObject *o, PyObject *j, PyObject *v) {
-    int r;
-    if (!j) return -1;
-    r = PyObject_SetItem(o, j, v);
-    Py_DECREF(j);
-    return r;
-}
-static CYTHON_INLINE int __Pyx_SetItemInt_Fast(PyObject *o, Py_ssize_t i, PyObject *v,
-                                               int is_list, int wraparound, int boundscheck) {
-#if CYTHON_COMPILING_IN_CPYTHON
-    if (is_list || PyList_CheckExact(o)) {
-        Py_ssize_t n = (!wraparound) ? i : ((likely(i >= 0)) ? i : i + PyList_GET_SIZE(o));
-        if ((!boundscheck) || likely((n >= 0) & (n < PyList_GET_SIZE(o)))) {
-            PyObject* old = PyList_GET_ITEM(o, n);
-            Py_INCREF(v);
-            PyList_SET_ITEM(o, n, v);
-            Py_DECREF(old);
-            return 1;
-        }
-    } else {
-        PySequenceMethods *m = Py_TYPE(o)->tp_as_sequence;
-        if (likely(m && m->sq_ass_item)) {
-            if (wraparound && unlikely(i < 0) && likely(m->sq_length)) {
-                Py_ssize_t l = m->sq_length(o);
-                if (likely(l >= 0)) {
-                    i += l;
-                } else {
-                    if (PyErr_ExceptionMatches(PyExc_OverflowError))
-                        PyErr_Clear();
-                    else
-                        return -1;
-                }
-            }
-            return m->sq_ass_item(o, i, v);
-        }
-    }
-#else
-#if CYTHON_COMPILING_IN_PYPY
-    if (is_list || (PySequence_Check(o) && !PyDict_Check(o))) {
-#else
-    if (is_list || PySequence_Check(o)) {
-#endif
-        return PySequence_SetItem(o, i, v);
-    }
-#endif
-    return __Pyx_SetItemInt_Generic(o, PyInt_FromSsize_t(i), v);
-}
-
-static CYTHON_INLINE void __Pyx_ErrRestore(PyObject *type, PyObject *value, PyObject *tb) {
-#if CYTHON_COMPILING_IN_CPYTHON
-    PyObject *tmp_type, *tmp_value, *tmp_tb;
-    PyThreadState *tstate = PyThreadState_GET();
-    tmp_type = tstate->curexc_type;
-    tmp_value = tstate->curexc_value;
-    tmp_tb = tstate->curexc_traceback;
-    tstate->curexc_type = type;
-    tstate->curexc_value = value;
-    tstate->curexc_traceback = tb;
-    Py_XDECREF(tmp_type);
-    Py_XDECREF(tmp_value);
-    Py_XDECREF(tmp_tb);
-#else
-    PyErr_Restore(type, value, tb);
-#endif
-}
-static CYTHON_INLINE void __Pyx_ErrFetch(PyObject **type, PyObject **value, PyObject **tb) {
-#if CYTHON_COMPILING_IN_CPYTHON
-    PyThreadState *tstate = PyThreadState_GET();
-    *type = tstate->curexc_type;
-    *value = tstate->curexc_value;
-    *tb = tstate->curexc_traceback;
-    tstate->curexc_type = 0;
-    tstate->curexc_value = 0;
-    tstate->curexc_traceback = 0;
-#else
-    PyErr_Fetch(type, value, tb);
-#endif
-}
-
-static void __Pyx_WriteUnraisable(const char *name, CYTHON_UNUSED int clineno,
-                                  CYTHON_UNUSED int lineno, CYTHON_UNUSED const char *filename,
-                                  int full_traceback) {
-    PyObject *old_exc, *old_val, *old_tb;
-    PyObject *ctx;
-    __Pyx_ErrFetch(&old_exc, &old_val, &old_tb);
-    if (full_traceback) {
-        Py_XINCREF(old_exc);
-        Py_XINCREF(old_val);
-        Py_XINCREF(old_tb);
-        __Pyx_ErrRestore(old_exc, old_val, old_tb);
-        PyErr_PrintEx(1);
-    }
-    #if PY_MAJOR_VERSION < 3
-    ctx = PyString_FromString(name);
-    #else
-    ctx = PyUnicode_FromString(name);
-    #endif
-    __Pyx_ErrRestore(old_exc, old_val, old_tb);
-    if (!ctx) {
-        PyErr_WriteUnraisable(Py_None);
-    } else {
-        PyErr_WriteUnraisable(ctx);
-        Py_DECREF(ctx);
-    }
-}
-
-#if PY_MAJOR_VERSION < 3
-static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb,
-                        CYTHON_UNUSED PyObject *cause) {
-    Py_XINCREF(type);
-    if (!value || value == Py_None)
-        value = NULL;
-    else
-        Py_INCREF(value);
-    if (!tb || tb == Py_None)
-        tb = NULL;
-    else {
-        Py_INCREF(tb);
-        if (!PyTraceBack_Check(tb)) {
-            PyErr_SetString(PyExc_TypeError,
-                "raise: arg 3 must be a traceback or None");
-            goto raise_error;
-        }
-    }
-    if (PyType_Check(type)) {
-#if CYTHON_COMPILING_IN_PYPY
-        if (!value) {
-            Py_INCREF(Py_None);
-            value = Py_None;
-        }
-#endif
-        PyErr_NormalizeException(&type, &value, &tb);
-    } else {
-        if (value) {
-            PyErr_SetString(PyExc_TypeError,
-                "instance exception may not have a separate value");
-            goto raise_error;
-        }
-        value = type;
-        type = (PyObject*) Py_TYPE(type);
-        Py_INCREF(type);
-        if (!PyType_IsSubtype((PyTypeObject *)type, (PyTypeObject *)PyExc_BaseException)) {
-            PyErr_SetString(PyExc_TypeError,
-                "raise: exception class must be a subclass of BaseException");
-            goto raise_error;
-        }
-    }
-    __Pyx_ErrRestore(type, value, tb);
-    return;
-raise_error:
-    Py_XDECREF(value);
-    Py_XDECREF(type);
-    Py_XDECREF(tb);
-    return;
-}
-#else
-static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause) {
-    PyObject* owned_instance = NULL;
-    if (tb == Py_None) {
-        tb = 0;
-    } else if (tb && !PyTraceBack_Check(tb)) {
-        PyErr_SetString(PyExc_TypeError,
-            "raise: arg 3 must be a traceback or None");
-        goto bad;
-    }
-    if (value == Py_None)
-        value = 0;
-    if (PyExceptionInstance_Check(type)) {
-        if (value) {
-            PyErr_SetString(PyExc_TypeError,
-                "instance exception may not have a separate value");
-            goto bad;
-        }
-        value = type;
-        type = (PyObject*) Py_TYPE(value);
-    } else if (PyExceptionClass_Check(type)) {
-        PyObject *instance_class = NULL;
-        if (value && PyExceptionInstance_Check(value)) {
-            instance_class = (PyObject*) Py_TYPE(value);
-            if (instance_class != type) {
-                if (PyObject_IsSubclass(instance_class, type)) {
-                    type = instance_class;
-                } else {
-                    instance_class = NULL;
-                }
-            }
-        }
-        if (!instance_class) {
-            PyObject *args;
-            if (!value)
-                args = PyTuple_New(0);
-            else if (PyTuple_Check(value)) {
-                Py_INCREF(value);
-                args = value;
-            } else
-                args = PyTuple_Pack(1, value);
-            if (!args)
-                goto bad;
-            owned_instance = PyObject_Call(type, args, NULL);
-            Py_DECREF(args);
-            if (!owned_instance)
-                goto bad;
-            value = owned_instance;
-            if (!PyExceptionInstance_Check(value)) {
-                PyErr_Format(PyExc_TypeError,
-                             "calling %R should have returned an instance of "
-                             "BaseException, not %R",
-                             type, Py_TYPE(value));
-                goto bad;
-            }
-        }
-    } else {
-        PyErr_SetString(PyExc_TypeError,
-            "raise: exception class must be a subclass of BaseException");
-        goto bad;
-    }
-#if PY_VERSION_HEX >= 0x03030000
-    if (cause) {
-#else
-    if (cause && cause != Py_None) {
-#endif
-        PyObject *fixed_cause;
-        if (cause == Py_None) {
-            fixed_cause = NULL;
-        } else if (PyExceptionClass_Check(cause)) {
-            fixed_cause = PyObject_CallObject(cause, NULL);
-            if (fixed_cause == NULL)
-                goto bad;
-        } else if (PyExceptionInstance_Check(cause)) {
-            fixed_cause = cause;
-            Py_INCREF(fixed_cause);
-        } else {
-            PyErr_SetString(PyExc_TypeError,
-                            "exception causes must derive from "
-                            "BaseException");
-            goto bad;
-        }
-        PyException_SetCause(value, fixed_cause);
-    }
-    PyErr_SetObject(type, value);
-    if (tb) {
-#if CYTHON_COMPILING_IN_PYPY
-        PyObject *tmp_type, *tmp_value, *tmp_tb;
-        PyErr_Fetch(tmp_type, tmp_value, tmp_tb);
-        Py_INCREF(tb);
-        PyErr_Restore(tmp_type, tmp_value, tb);
-        Py_XDECREF(tmp_tb);
-#else
-        PyThreadState *tstate = PyThreadState_GET();
-        PyObject* tmp_tb = tstate->curexc_traceback;
-        if (tb != tmp_tb) {
-            Py_INCREF(tb);
-            tstate->curexc_traceback = tb;
-            Py_XDECREF(tmp_tb);
-        }
-#endif
-    }
-bad:
-    Py_XDECREF(owned_instance);
-    return;
-}
-#endif
-
-static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(Py_ssize_t expected) {
-    PyErr_Format(PyExc_ValueError,
-                 "too many values to unpack (expected %" CYTHON_FORMAT_SSIZE_T "d)", expected);
-}
-
-static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index) {
-    PyErr_Format(PyExc_ValueError,
-                 "need more than %" CYTHON_FORMAT_SSIZE_T "d value%.1s to unpack",
-                 index, (index == 1) ? "" : "s");
-}
-
-static CYTHON_INLINE void __Pyx_RaiseNoneNotIterableError(void) {
-    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
-}
-
-static void __Pyx_call_next_tp_dealloc(PyObject* obj, destructor current_tp_dealloc) {
-    PyTypeObject* type = Py_TYPE(obj);
-    while (type && type->tp_dealloc != current_tp_dealloc)
-        type = type->tp_base;
-    while (type && type->tp_dealloc == current_tp_dealloc)
-        type = type->tp_base;
-    if (type)
-        type->tp_dealloc(obj);
-}
-
-static int __Pyx_call_next_tp_traverse(PyObject* obj, visitproc v, void *a, traverseproc current_tp_traverse) {
-    PyTypeObject* type = Py_TYPE(obj);
-    while (type && type->tp_traverse != current_tp_traverse)
-        type = type->tp_base;
-    while (type && type->tp_traverse == current_tp_traverse)
-        type = type->tp_base;
-    if (type && type->tp_traverse)
-        return type->tp_traverse(obj, v, a);
-    return 0;
-}
-
-static void __Pyx_call_next_tp_clear(PyObject* obj, inquiry current_tp_clear) {
-    PyTypeObject* type = Py_TYPE(obj);
-    while (type && type->tp_clear != current_tp_clear)
-        type = type->tp_base;
-    while (type && type->tp_clear == current_tp_clear)
-        type = type->tp_base;
-    if (type && type->tp_clear)
-        type->tp_clear(obj);
-}
-
-static int __Pyx_SetVtable(PyObject *dict, void *vtable) {
-#if PY_VERSION_HEX >= 0x02070000
-    PyObject *ob = PyCapsule_New(vtable, 0, 0);
-#else
-    PyObject *ob = PyCObject_FromVoidPtr(vtable, 0);
-#endif
-    if (!ob)
-        goto bad;
-    if (PyDict_SetItem(dict, __pyx_n_s_pyx_vtable, ob) < 0)
-        goto bad;
-    Py_DECREF(ob);
-    return 0;
-bad:
-    Py_XDECREF(ob);
-    return -1;
-}
-
-static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name) {
-    PyObject* value = __Pyx_PyObject_GetAttrStr(module, name);
-    if (unlikely(!value) && PyErr_ExceptionMatches(PyExc_AttributeError)) {
-        PyErr_Format(PyExc_ImportError,
-        #if PY_MAJOR_VERSION < 3
-            "cannot import name %.230s", PyString_AS_STRING(name));
-        #else
-            "cannot import name %S", name);
-        #endif
-    }
-    return value;
-}
-
-static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line) {
-    int start = 0, mid = 0, end = count - 1;
-    if (end >= 0 && code_line > entries[end].code_line) {
-        return count;
-    }
-    while (start < end) {
-        mid = (start + end) / 2;
-        if (code_line < entries[mid].code_line) {
-            end = mid;
-        } else if (code_line > entries[mid].code_line) {
-             start = mid + 1;
-        } else {
-            return mid;
-        }
-    }
-    if (code_line <= entries[mid].code_line) {
-        return mid;
-    } else {
-        return mid + 1;
-    }
-}
-static PyCodeObject *__pyx_find_code_object(int code_line) {
-    PyCodeObject* code_object;
-    int pos;
-    if (unlikely(!code_line) || unlikely(!__pyx_code_cache.entries)) {
-        return NULL;
-    }
-    pos = __pyx_bisect_code_objects(__pyx_code_cache.entries, __pyx_code_cache.count, code_line);
-    if (unlikely(pos >= __pyx_code_cache.count) || unlikely(__pyx_code_cache.entries[pos].code_line != code_line)) {
-        return NULL;
-    }
-    code_object = __pyx_code_cache.entries[pos].code_object;
-    Py_INCREF(code_object);
-    return code_object;
-}
-static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object) {
-    int pos, i;
-    __Pyx_CodeObjectCacheEntry* entries = __pyx_code_cache.entries;
-    if (unlikely(!code_line)) {
-        return;
-    }
-    if (unlikely(!entries)) {
-        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Malloc(64*sizeof(__Pyx_CodeObjectCacheEntry));
-        if (likely(entries)) {
-            __pyx_code_cache.entries = entries;
-            __pyx_code_cache.max_count = 64;
-            __pyx_code_cache.count = 1;
-            entries[0].code_line = code_line;
-            entries[0].code_object = code_object;
-            Py_INCREF(code_object);
-        }
-        return;
-    }
-    pos = __pyx_bisect_code_objects(__pyx_code_cache.entries, __pyx_code_cache.count, code_line);
-    if ((pos < __pyx_code_cache.count) && unlikely(__pyx_code_cache.entries[pos].code_line == code_line)) {
-        PyCodeObject* tmp = entries[pos].code_object;
-        entries[pos].code_object = code_object;
-        Py_DECREF(tmp);
-        return;
-    }
-    if (__pyx_code_cache.count == __pyx_code_cache.max_count) {
-        int new_max = __pyx_code_cache.max_count + 64;
-        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Realloc(
-            __pyx_code_cache.entries, (size_t)new_max*sizeof(__Pyx_CodeObjectCacheEntry));
-        if (unlikely(!entries)) {
-            return;
-        }
-        __pyx_code_cache.entries = entries;
-        __pyx_code_cache.max_count = new_max;
-    }
-    for (i=__pyx_code_cache.count; i>pos; i--) {
-        entries[i] = entries[i-1];
-    }
-    entries[pos].code_line = code_line;
-    entries[pos].code_object = code_object;
-    __pyx_code_cache.count++;
-    Py_INCREF(code_object);
-}
-
-#include "compile.h"
-#include "frameobject.h"
-#include "traceback.h"
-static PyCodeObject* __Pyx_CreateCodeObjectForTraceback(
-            const char *funcname, int c_line,
-            int py_line, const char *filename) {
-    PyCodeObject *py_code = 0;
-    PyObject *py_srcfile = 0;
-    PyObject *py_funcname = 0;
-    #if PY_MAJOR_VERSION < 3
-    py_srcfile = PyString_FromString(filename);
-    #else
-    py_srcfile = PyUnicode_FromString(filename);
-    #endif
-    if (!py_srcfile) goto bad;
-    if (c_line) {
-        #if PY_MAJOR_VERSION < 3
-        py_funcname = PyString_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
-        #else
-        py_funcname = PyUnicode_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
-        #endif
-    }
-    else {
-        #if PY_MAJOR_VERSION < 3
-        py_funcname = PyString_FromString(funcname);
-        #else
-        py_funcname = PyUnicode_FromString(funcname);
-        #endif
-    }
-    if (!py_funcname) goto bad;
-    py_code = __Pyx_PyCode_New(
-        0,
-        0,
-        0,
-        0,
-        0,
-        __pyx_empty_bytes, /*PyObject *code,*/
-        __pyx_empty_tuple, /*PyObject *consts,*/
-        __pyx_empty_tuple, /*PyObject *names,*/
-        __pyx_empty_tuple, /*PyObject *varnames,*/
-        __pyx_empty_tuple, /*PyObject *freevars,*/
-        __pyx_empty_tuple, /*PyObject *cellvars,*/
-        py_srcfile,   /*PyObject *filename,*/
-        py_funcname,  /*PyObject *name,*/
-        py_line,
-        __pyx_empty_bytes  /*PyObject *lnotab*/
-    );
-    Py_DECREF(py_srcfile);
-    Py_DECREF(py_funcname);
-    return py_code;
-bad:
-    Py_XDECREF(py_srcfile);
-    Py_XDECREF(py_funcname);
-    return NULL;
-}
-static void __Pyx_AddTraceback(const char *funcname, int c_line,
-                               int py_line, const char *filename) {
-    PyCodeObject *py_code = 0;
-    PyFrameObject *py_frame = 0;
-    py_code = __pyx_find_code_object(c_line ? c_line : py_line);
-    if (!py_code) {
-        py_code = __Pyx_CreateCodeObjectForTraceback(
-            funcname, c_line, py_line, filename);
-        if (!py_code) goto bad;
-        __pyx_insert_code_object(c_line ? c_line : py_line, py_code);
-    }
-    py_frame = PyFrame_New(
-        PyThreadState_GET(), /*PyThreadState *tstate,*/
-        py_code,             /*PyCodeObject *code,*/
-        __pyx_d,      /*PyObject *globals,*/
-        0                    /*PyObject *locals*/
-    );
-    if (!py_frame) goto bad;
-    py_frame->f_lineno = py_line;
-    PyTraceBack_Here(py_frame);
-bad:
-    Py_XDECREF(py_code);
-    Py_XDECREF(py_frame);
-}
-
-#if PY_MAJOR_VERSION < 3
-static int __Pyx_GetBuffer(PyObject *obj, Py_buffer *view, int flags) {
-    if (PyObject_CheckBuffer(obj)) return PyObject_GetBuffer(obj, view, flags);
-        if (PyObject_TypeCheck(obj, __pyx_ptype_5numpy_ndarray)) return __pyx_pw_5numpy_7ndarray_1__getbuffer__(obj, view, flags);
-    PyErr_Format(PyExc_TypeError, "'%.200s' does not have the buffer interface", Py_TYPE(obj)->tp_name);
-    return -1;
-}
-static void __Pyx_ReleaseBuffer(Py_buffer *view) {
-    PyObject *obj = view->obj;
-    if (!obj) return;
-    if (PyObject_CheckBuffer(obj)) {
-        PyBuffer_Release(view);
-        return;
-    }
-        if (PyObject_TypeCheck(obj, __pyx_ptype_5numpy_ndarray)) { __pyx_pw_5numpy_7ndarray_3__releasebuffer__(obj, view); return; }
-    Py_DECREF(obj);
-    view->obj = NULL;
-}
-#endif
-
-
-        static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level) {
-    PyObject *empty_list = 0;
-    PyObject *module = 0;
-    PyObject *global_dict = 0;
-    PyObject *empty_dict = 0;
-    PyObject *list;
-    #if PY_VERSION_HEX < 0x03030000
-    PyObject *py_import;
-    py_import = __Pyx_PyObject_GetAttrStr(__pyx_b, __pyx_n_s_import);
-    if (!py_import)
-        goto bad;
-    #endif
-    if (from_list)
-        list = from_list;
-    else {
-        empty_list = PyList_New(0);
-        if (!empty_list)
-            goto bad;
-        list = empty_list;
-    }
-    global_dict = PyModule_GetDict(__pyx_m);
-    if (!global_dict)
-        goto bad;
-    empty_dict = PyDict_New();
-    if (!empty_dict)
-        goto bad;
-    {
-        #if PY_MAJOR_VERSION >= 3
-        if (level == -1) {
-            if (strchr(__Pyx_MODULE_NAME, '.')) {
-                #if PY_VERSION_HEX < 0x03030000
-                PyObject *py_level = PyInt_FromLong(1);
-                if (!py_level)
-                    goto bad;
-                module = PyObject_CallFunctionObjArgs(py_import,
-                    name, global_dict, empty_dict, list, py_level, NULL);
-                Py_DECREF(py_level);
-                #else
-                module = PyImport_ImportModuleLevelObject(
-                    name, global_dict, empty_dict, list, 1);
-                #endif
-                if (!module) {
-                    if (!PyErr_ExceptionMatches(PyExc_ImportError))
-                        goto bad;
-                    PyErr_Clear();
-                }
-            }
-            level = 0;
-        }
-        #endif
-        if (!module) {
-            #if PY_VERSION_HEX < 0x03030000
-            PyObject *py_level = PyInt_FromLong(level);
-            if (!py_level)
-                goto bad;
-            module = PyObject_CallFunctionObjArgs(py_import,
-                name, global_dict, empty_dict, list, py_level, NULL);
-            Py_DECREF(py_level);
-            #else
-            module = PyImport_ImportModuleLevelObject(
-                name, global_dict, empty_dict, list, level);
-            #endif
-        }
-    }
-bad:
-    #if PY_VERSION_HEX < 0x03030000
-    Py_XDECREF(py_import);
-    #endif
-    Py_XDECREF(empty_list);
-    Py_XDECREF(empty_dict);
-    return module;
-}
-
-#if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION < 3
-static PyObject *__Pyx_GetStdout(void) {
-    PyObject *f = PySys_GetObject((char *)"stdout");
-    if (!f) {
-        PyErr_SetString(PyExc_RuntimeError, "lost sys.stdout");
-    }
-    return f;
-}
-static int __Pyx_Print(PyObject* f, PyObject *arg_tuple, int newline) {
-    int i;
-    if (!f) {
-        if (!(f = __Pyx_GetStdout()))
-            return -1;
-    }
-    Py_INCREF(f);
-    for (i=0; i < PyTuple_GET_SIZE(arg_tuple); i++) {
-        PyObject* v;
-        if (PyFile_SoftSpace(f, 1)) {
-            if (PyFile_WriteString(" ", f) < 0)
-                goto error;
-        }
-        v = PyTuple_GET_ITEM(arg_tuple, i);
-        if (PyFile_WriteObject(v, f, Py_PRINT_RAW) < 0)
-            goto error;
-        if (PyString_Check(v)) {
-            char *s = PyString_AsString(v);
-            Py_ssize_t len = PyString_Size(v);
-            if (len > 0) {
-                switch (s[len-1]) {
-                    case ' ': break;
-                    case '\f': case '\r': case '\n': case '\t': case '\v':
-                        PyFile_SoftSpace(f, 0);
-                        break;
-                    default:  break;
-                }
-            }
-        }
-    }
-    if (newline) {
-        if (PyFile_WriteString("\n", f) < 0)
-            goto error;
-        PyFile_SoftSpace(f, 0);
-    }
-    Py_DECREF(f);
-    return 0;
-error:
-    Py_DECREF(f);
-    return -1;
-}
-#else
-static int __Pyx_Print(PyObject* stream, PyObject *arg_tuple, int newline) {
-    PyObject* kwargs = 0;
-    PyObject* result = 0;
-    PyObject* end_string;
-    if (unlikely(!__pyx_print)) {
-        __pyx_print = PyObject_GetAttr(__pyx_b, __pyx_n_s_print);
-        if (!__pyx_print)
-            return -1;
-    }
-    if (stream) {
-        kwargs = PyDict_New();
-        if (unlikely(!kwargs))
-            return -1;
-        if (unlikely(PyDict_SetItem(kwargs, __pyx_n_s_file, stream) < 0))
-            goto bad;
-        if (!newline) {
-            end_string = PyUnicode_FromStringAndSize(" ", 1);
-            if (unlikely(!end_string))
-                goto bad;
-            if (PyDict_SetItem(kwargs, __pyx_n_s_end, end_string) < 0) {
-                Py_DECREF(end_string);
-                goto bad;
-            }
-            Py_DECREF(end_string);
-        }
-    } else if (!newline) {
-        if (unlikely(!__pyx_print_kwargs)) {
-            __pyx_print_kwargs = PyDict_New();
-            if (unlikely(!__pyx_print_kwargs))
-                return -1;
-            end_string = PyUnicode_FromStringAndSize(" ", 1);
-            if (unlikely(!end_string))
-                return -1;
-            if (PyDict_SetItem(__pyx_print_kwargs, __pyx_n_s_end, end_string) < 0) {
-                Py_DECREF(end_string);
-                return -1;
-            }
-            Py_DECREF(end_string);
-        }
-        kwargs = __pyx_print_kwargs;
-    }
-    result = PyObject_Call(__pyx_print, arg_tuple, kwargs);
-    if (unlikely(kwargs) && (kwargs != __pyx_print_kwargs))
-        Py_DECREF(kwargs);
-    if (!result)
-        return -1;
-    Py_DECREF(result);
-    return 0;
-bad:
-    if (kwargs != __pyx_print_kwargs)
-        Py_XDECREF(kwargs);
-    return -1;
-}
-#endif
-
-#if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION < 3
-static int __Pyx_PrintOne(PyObject* f, PyObject *o) {
-    if (!f) {
-        if (!(f = __Pyx_GetStdout()))
-            return -1;
-    }
-    Py_INCREF(f);
-    if (PyFile_SoftSpace(f, 0)) {
-        if (PyFile_WriteString(" ", f) < 0)
-            goto error;
-    }
-    if (PyFile_WriteObject(o, f, Py_PRINT_RAW) < 0)
-        goto error;
-    if (PyFile_WriteString("\n", f) < 0)
-        goto error;
-    Py_DECREF(f);
-    return 0;
-error:
-    Py_DECREF(f);
-    return -1;
-    /* the line below is just to avoid C compiler
-     * warnings about unused functions */
-    return __Pyx_Print(f, NULL, 0);
-}
-#else
-static int __Pyx_PrintOne(PyObject* stream, PyObject *o) {
-    int res;
-    PyObject* arg_tuple = PyTuple_Pack(1, o);
-    if (unlikely(!arg_tuple))
-        return -1;
-    res = __Pyx_Print(stream, arg_tuple, 1);
-    Py_DECREF(arg_tuple);
-    return res;
-}
-#endif
-
-static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
-    const long neg_one = (long) -1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (is_unsigned) {
-        if (sizeof(long) < sizeof(long)) {
-            return PyInt_FromLong((long) value);
-        } else if (sizeof(long) <= sizeof(unsigned long)) {
-            return PyLong_FromUnsignedLong((unsigned long) value);
-        } else if (sizeof(long) <= sizeof(unsigned long long)) {
-            return PyLong_FromUnsignedLongLong((unsigned long long) value);
-        }
-    } else {
-        if (sizeof(long) <= sizeof(long)) {
-            return PyInt_FromLong((long) value);
-        } else if (sizeof(long) <= sizeof(long long)) {
-            return PyLong_FromLongLong((long long) value);
-        }
-    }
-    {
-        int one = 1; int little = (int)*(unsigned char *)&one;
-        unsigned char *bytes = (unsigned char *)&value;
-        return _PyLong_FromByteArray(bytes, sizeof(long),
-                                     little, !is_unsigned);
-    }
-}
-
-#define __PYX_VERIFY_RETURN_INT(target_type, func_type, func_value)       \
-    {                                                                     \
-        func_type value = func_value;                                     \
-        if (sizeof(target_type) < sizeof(func_type)) {                    \
-            if (unlikely(value != (func_type) (target_type) value)) {     \
-                func_type zero = 0;                                       \
-                if (is_unsigned && unlikely(value < zero))                \
-                    goto raise_neg_overflow;                              \
-                else                                                      \
-                    goto raise_overflow;                                  \
-            }                                                             \
-        }                                                                 \
-        return (target_type) value;                                       \
-    }
-
-#if CYTHON_COMPILING_IN_CPYTHON && PY_MAJOR_VERSION >= 3
- #if CYTHON_USE_PYLONG_INTERNALS
-  #include "longintrepr.h"
- #endif
-#endif
-
-static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
-    const int neg_one = (int) -1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-#if PY_MAJOR_VERSION < 3
-    if (likely(PyInt_Check(x))) {
-        if (sizeof(int) < sizeof(long)) {
-            __PYX_VERIFY_RETURN_INT(int, long, PyInt_AS_LONG(x))
-        } else {
-            long val = PyInt_AS_LONG(x);
-            if (is_unsigned && unlikely(val < 0)) {
-                goto raise_neg_overflow;
-            }
-            return (int) val;
-        }
-    } else
-#endif
-    if (likely(PyLong_Check(x))) {
-        if (is_unsigned) {
-#if CYTHON_COMPILING_IN_CPYTHON && PY_MAJOR_VERSION >= 3
- #if CYTHON_USE_PYLONG_INTERNALS
-            switch (Py_SIZE(x)) {
-                case  0: return 0;
-                case  1: __PYX_VERIFY_RETURN_INT(int, digit, ((PyLongObject*)x)->ob_digit[0]);
-            }
- #endif
-#endif
-            if (unlikely(Py_SIZE(x) < 0)) {
-                goto raise_neg_overflow;
-            }
-            if (sizeof(int) <= sizeof(unsigned long)) {
-                __PYX_VERIFY_RETURN_INT(int, unsigned long, PyLong_AsUnsignedLong(x))
-            } else if (sizeof(int) <= sizeof(unsigned long long)) {
-                __PYX_VERIFY_RETURN_INT(int, unsigned long long, PyLong_AsUnsignedLongLong(x))
-            }
-        } else {
-#if CYTHON_COMPILING_IN_CPYTHON && PY_MAJOR_VERSION >= 3
- #if CYTHON_USE_PYLONG_INTERNALS
-            switch (Py_SIZE(x)) {
-                case  0: return 0;
-                case  1: __PYX_VERIFY_RETURN_INT(int,  digit, +(((PyLongObject*)x)->ob_digit[0]));
-                case -1: __PYX_VERIFY_RETURN_INT(int, sdigit, -(sdigit) ((PyLongObject*)x)->ob_digit[0]);
-            }
- #endif
-#endif
-            if (sizeof(int) <= sizeof(long)) {
-                __PYX_VERIFY_RETURN_INT(int, long, PyLong_AsLong(x))
-            } else if (sizeof(int) <= sizeof(long long)) {
-                __PYX_VERIFY_RETURN_INT(int, long long, PyLong_AsLongLong(x))
-            }
-        }
-        {
-#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
-            PyErr_SetString(PyExc_RuntimeError,
-                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
-#else
-            int val;
-            PyObject *v = __Pyx_PyNumber_Int(x);
- #if PY_MAJOR_VERSION < 3
-            if (likely(v) && !PyLong_Check(v)) {
-                PyObject *tmp = v;
-                v = PyNumber_Long(tmp);
-                Py_DECREF(tmp);
-            }
- #endif
-            if (likely(v)) {
-                int one = 1; int is_little = (int)*(unsigned char *)&one;
-                unsigned char *bytes = (unsigned char *)&val;
-                int ret = _PyLong_AsByteArray((PyLongObject *)v,
-                                              bytes, sizeof(val),
-                                              is_little, !is_unsigned);
-                Py_DECREF(v);
-                if (likely(!ret))
-                    return val;
-            }
-#endif
-            return (int) -1;
-        }
-    } else {
-        int val;
-        PyObject *tmp = __Pyx_PyNumber_Int(x);
-        if (!tmp) return (int) -1;
-        val = __Pyx_PyInt_As_int(tmp);
-        Py_DECREF(tmp);
-        return val;
-    }
-raise_overflow:
-    PyErr_SetString(PyExc_OverflowError,
-        "value too large to convert to int");
-    return (int) -1;
-raise_neg_overflow:
-    PyErr_SetString(PyExc_OverflowError,
-        "can't convert negative value to int");
-    return (int) -1;
-}
-
-static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value) {
-    const int neg_one = (int) -1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (is_unsigned) {
-        if (sizeof(int) < sizeof(long)) {
-            return PyInt_FromLong((long) value);
-        } else if (sizeof(int) <= sizeof(unsigned long)) {
-            return PyLong_FromUnsignedLong((unsigned long) value);
-        } else if (sizeof(int) <= sizeof(unsigned long long)) {
-            return PyLong_FromUnsignedLongLong((unsigned long long) value);
-        }
-    } else {
-        if (sizeof(int) <= sizeof(long)) {
-            return PyInt_FromLong((long) value);
-        } else if (sizeof(int) <= sizeof(long long)) {
-            return PyLong_FromLongLong((long long) value);
-        }
-    }
-    {
-        int one = 1; int little = (int)*(unsigned char *)&one;
-        unsigned char *bytes = (unsigned char *)&value;
-        return _PyLong_FromByteArray(bytes, sizeof(int),
-                                     little, !is_unsigned);
-    }
-}
-
-static CYTHON_INLINE PyObject* __Pyx_PyInt_From_npy_long(npy_long value) {
-    const npy_long neg_one = (npy_long) -1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (is_unsigned) {
-        if (sizeof(npy_long) < sizeof(long)) {
-            return PyInt_FromLong((long) value);
-        } else if (sizeof(npy_long) <= sizeof(unsigned long)) {
-            return PyLong_FromUnsignedLong((unsigned long) value);
-        } else if (sizeof(npy_long) <= sizeof(unsigned long long)) {
-            return PyLong_FromUnsignedLongLong((unsigned long long) value);
-        }
-    } else {
-        if (sizeof(npy_long) <= sizeof(long)) {
-            return PyInt_FromLong((long) value);
-        } else if (sizeof(npy_long) <= sizeof(long long)) {
-            return PyLong_FromLongLong((long long) value);
-        }
-    }
-    {
-        int one = 1; int little = (int)*(unsigned char *)&one;
-        unsigned char *bytes = (unsigned char *)&value;
-        return _PyLong_FromByteArray(bytes, sizeof(npy_long),
-                                     little, !is_unsigned);
-    }
-}
-
-#if CYTHON_CCOMPLEX
-  #ifdef __cplusplus
-    static CYTHON_INLINE __pyx_t_float_complex __pyx_t_float_complex_from_parts(float x, float y) {
-      return ::std::complex< float >(x, y);
-    }
-  #else
-    static CYTHON_INLINE __pyx_t_float_complex __pyx_t_float_complex_from_parts(float x, float y) {
-      return x + y*(__pyx_t_float_complex)_Complex_I;
-    }
-  #endif
-#else
-    static CYTHON_INLINE __pyx_t_float_complex __pyx_t_float_complex_from_parts(float x, float y) {
-      __pyx_t_float_complex z;
-      z.real = x;
-      z.imag = y;
-      return z;
-    }
-#endif
-
-#if CYTHON_CCOMPLEX
-#else
-    static CYTHON_INLINE int __Pyx_c_eqf(__pyx_t_float_complex a, __pyx_t_float_complex b) {
-       return (a.real == b.real) && (a.imag == b.imag);
-    }
-    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_sumf(__pyx_t_float_complex a, __pyx_t_float_complex b) {
-        __pyx_t_float_complex z;
-        z.real = a.real + b.real;
-        z.imag = a.imag + b.imag;
-        return z;
-    }
-    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_difff(__pyx_t_float_complex a, __pyx_t_float_complex b) {
-        __pyx_t_float_complex z;
-        z.real = a.real - b.real;
-        z.imag = a.imag - b.imag;
-        return z;
-    }
-    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_prodf(__pyx_t_float_complex a, __pyx_t_float_complex b) {
-        __pyx_t_float_complex z;
-        z.real = a.real * b.real - a.imag * b.imag;
-        z.imag = a.real * b.imag + a.imag * b.real;
-        return z;
-    }
-    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_quotf(__pyx_t_float_complex a, __pyx_t_float_complex b) {
-        __pyx_t_float_complex z;
-        float denom = b.real * b.real + b.imag * b.imag;
-        z.real = (a.real * b.real + a.imag * b.imag) / denom;
-        z.imag = (a.imag * b.real - a.real * b.imag) / denom;
-        return z;
-    }
-    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_negf(__pyx_t_float_complex a) {
-        __pyx_t_float_complex z;
-        z.real = -a.real;
-        z.imag = -a.imag;
-        return z;
-    }
-    static CYTHON_INLINE int __Pyx_c_is_zerof(__pyx_t_float_complex a) {
-       return (a.real == 0) && (a.imag == 0);
-    }
-    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_conjf(__pyx_t_float_complex a) {
-        __pyx_t_float_complex z;
-        z.real =  a.real;
-        z.imag = -a.imag;
-        return z;
-    }
-    #if 1
-        static CYTHON_INLINE float __Pyx_c_absf(__pyx_t_float_complex z) {
-          #if !defined(HAVE_HYPOT) || defined(_MSC_VER)
-            return sqrtf(z.real*z.real + z.imag*z.imag);
-          #else
-            return hypotf(z.real, z.imag);
-          #endif
-        }
-        static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_powf(__pyx_t_float_complex a, __pyx_t_float_complex b) {
-            __pyx_t_float_complex z;
-            float r, lnr, theta, z_r, z_theta;
-            if (b.imag == 0 && b.real == (int)b.real) {
-                if (b.real < 0) {
-                    float denom = a.real * a.real + a.imag * a.imag;
-                    a.real = a.real / denom;
-                    a.imag = -a.imag / denom;
-                    b.real = -b.real;
-                }
-                switch ((int)b.real) {
-                    case 0:
-                        z.real = 1;
-                        z.imag = 0;
-                        return z;
-                    case 1:
-                        return a;
-                    case 2:
-                        z = __Pyx_c_prodf(a, a);
-                        return __Pyx_c_prodf(a, a);
-                    case 3:
-                        z = __Pyx_c_prodf(a, a);
-                        return __Pyx_c_prodf(z, a);
-                    case 4:
-                        z = __Pyx_c_prodf(a, a);
-                        return __Pyx_c_prodf(z, z);
-                }
-            }
-            if (a.imag == 0) {
-                if (a.real == 0) {
-                    return a;
-                }
-                r = a.real;
-                theta = 0;
-            } else {
-                r = __Pyx_c_absf(a);
-                theta = atan2f(a.imag, a.real);
-            }
-            lnr = logf(r);
-            z_r = expf(lnr * b.real - theta * b.imag);
-            z_theta = theta * b.real + lnr * b.imag;
-            z.real = z_r * cosf(z_theta);
-            z.imag = z_r * sinf(z_theta);
-            return z;
-        }
-    #endif
-#endif
-
-#if CYTHON_CCOMPLEX
-  #ifdef __cplusplus
-    static CYTHON_INLINE __pyx_t_double_complex __pyx_t_double_complex_from_parts(double x, double y) {
-      return ::std::complex< double >(x, y);
-    }
-  #else
-    static CYTHON_INLINE __pyx_t_double_complex __pyx_t_double_complex_from_parts(double x, double y) {
-      return x + y*(__pyx_t_double_complex)_Complex_I;
-    }
-  #endif
-#else
-    static CYTHON_INLINE __pyx_t_double_complex __pyx_t_double_complex_from_parts(double x, double y) {
-      __pyx_t_double_complex z;
-      z.real = x;
-      z.imag = y;
-      return z;
-    }
-#endif
-
-#if CYTHON_CCOMPLEX
-#else
-    static CYTHON_INLINE int __Pyx_c_eq(__pyx_t_double_complex a, __pyx_t_double_complex b) {
-       return (a.real == b.real) && (a.imag == b.imag);
-    }
-    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_sum(__pyx_t_double_complex a, __pyx_t_double_complex b) {
-        __pyx_t_double_complex z;
-        z.real = a.real + b.real;
-        z.imag = a.imag + b.imag;
-        return z;
-    }
-    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_diff(__pyx_t_double_complex a, __pyx_t_double_complex b) {
-        __pyx_t_double_complex z;
-        z.real = a.real - b.real;
-        z.imag = a.imag - b.imag;
-        return z;
-    }
-    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_prod(__pyx_t_double_complex a, __pyx_t_double_complex b) {
-        __pyx_t_double_complex z;
-        z.real = a.real * b.real - a.imag * b.imag;
-        z.imag = a.real * b.imag + a.imag * b.real;
-        return z;
-    }
-    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_quot(__pyx_t_double_complex a, __pyx_t_double_complex b) {
-        __pyx_t_double_complex z;
-        double denom = b.real * b.real + b.imag * b.imag;
-        z.real = (a.real * b.real + a.imag * b.imag) / denom;
-        z.imag = (a.imag * b.real - a.real * b.imag) / denom;
-        return z;
-    }
-    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_neg(__pyx_t_double_complex a) {
-        __pyx_t_double_complex z;
-        z.real = -a.real;
-        z.imag = -a.imag;
-        return z;
-    }
-    static CYTHON_INLINE int __Pyx_c_is_zero(__pyx_t_double_complex a) {
-       return (a.real == 0) && (a.imag == 0);
-    }
-    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_conj(__pyx_t_double_complex a) {
-        __pyx_t_double_complex z;
-        z.real =  a.real;
-        z.imag = -a.imag;
-        return z;
-    }
-    #if 1
-        static CYTHON_INLINE double __Pyx_c_abs(__pyx_t_double_complex z) {
-          #if !defined(HAVE_HYPOT) || defined(_MSC_VER)
-            return sqrt(z.real*z.real + z.imag*z.imag);
-          #else
-            return hypot(z.real, z.imag);
-          #endif
-        }
-        static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_pow(__pyx_t_double_complex a, __pyx_t_double_complex b) {
-            __pyx_t_double_complex z;
-            double r, lnr, theta, z_r, z_theta;
-            if (b.imag == 0 && b.real == (int)b.real) {
-                if (b.real < 0) {
-                    double denom = a.real * a.real + a.imag * a.imag;
-                    a.real = a.real / denom;
-                    a.imag = -a.imag / denom;
-                    b.real = -b.real;
-                }
-                switch ((int)b.real) {
-                    case 0:
-                        z.real = 1;
-                        z.imag = 0;
-                        return z;
-                    case 1:
-                        return a;
-                    case 2:
-                        z = __Pyx_c_prod(a, a);
-                        return __Pyx_c_prod(a, a);
-                    case 3:
-                        z = __Pyx_c_prod(a, a);
-                        return __Pyx_c_prod(z, a);
-                    case 4:
-                        z = __Pyx_c_prod(a, a);
-                        return __Pyx_c_prod(z, z);
-                }
-            }
-            if (a.imag == 0) {
-                if (a.real == 0) {
-                    return a;
-                }
-                r = a.real;
-                theta = 0;
-            } else {
-                r = __Pyx_c_abs(a);
-                theta = atan2(a.imag, a.real);
-            }
-            lnr = log(r);
-            z_r = exp(lnr * b.real - theta * b.imag);
-            z_theta = theta * b.real + lnr * b.imag;
-            z.real = z_r * cos(z_theta);
-            z.imag = z_r * sin(z_theta);
-            return z;
-        }
-    #endif
-#endif
-
-static CYTHON_INLINE PyObject* __Pyx_PyInt_From_ptrdiff_t(ptrdiff_t value) {
-    const ptrdiff_t neg_one = (ptrdiff_t) -1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (is_unsigned) {
-        if (sizeof(ptrdiff_t) < sizeof(long)) {
-            return PyInt_FromLong((long) value);
-        } else if (sizeof(ptrdiff_t) <= sizeof(unsigned long)) {
-            return PyLong_FromUnsignedLong((unsigned long) value);
-        } else if (sizeof(ptrdiff_t) <= sizeof(unsigned long long)) {
-            return PyLong_FromUnsignedLongLong((unsigned long long) value);
-        }
-    } else {
-        if (sizeof(ptrdiff_t) <= sizeof(long)) {
-            return PyInt_FromLong((long) value);
-        } else if (sizeof(ptrdiff_t) <= sizeof(long long)) {
-            return PyLong_FromLongLong((long long) value);
-        }
-    }
-    {
-        int one = 1; int little = (int)*(unsigned char *)&one;
-        unsigned char *bytes = (unsigned char *)&value;
-        return _PyLong_FromByteArray(bytes, sizeof(ptrdiff_t),
-                                     little, !is_unsigned);
-    }
-}
-
-static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
-    const long neg_one = (long) -1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-#if PY_MAJOR_VERSION < 3
-    if (likely(PyInt_Check(x))) {
-        if (sizeof(long) < sizeof(long)) {
-            __PYX_VERIFY_RETURN_INT(long, long, PyInt_AS_LONG(x))
-        } else {
-            long val = PyInt_AS_LONG(x);
-            if (is_unsigned && unlikely(val < 0)) {
-                goto raise_neg_overflow;
-            }
-            return (long) val;
-        }
-    } else
-#endif
-    if (likely(PyLong_Check(x))) {
-        if (is_unsigned) {
-#if CYTHON_COMPILING_IN_CPYTHON && PY_MAJOR_VERSION >= 3
- #if CYTHON_USE_PYLONG_INTERNALS
-            switch (Py_SIZE(x)) {
-                case  0: return 0;
-                case  1: __PYX_VERIFY_RETURN_INT(long, digit, ((PyLongObject*)x)->ob_digit[0]);
-            }
- #endif
-#endif
-            if (unlikely(Py_SIZE(x) < 0)) {
-                goto raise_neg_overflow;
-            }
-            if (sizeof(long) <= sizeof(unsigned long)) {
-                __PYX_VERIFY_RETURN_INT(long, unsigned long, PyLong_AsUnsignedLong(x))
-            } else if (sizeof(long) <= sizeof(unsigned long long)) {
-                __PYX_VERIFY_RETURN_INT(long, unsigned long long, PyLong_AsUnsignedLongLong(x))
-            }
-        } else {
-#if CYTHON_COMPILING_IN_CPYTHON && PY_MAJOR_VERSION >= 3
- #if CYTHON_USE_PYLONG_INTERNALS
-            switch (Py_SIZE(x)) {
-                case  0: return 0;
-                case  1: __PYX_VERIFY_RETURN_INT(long,  digit, +(((PyLongObject*)x)->ob_digit[0]));
-                case -1: __PYX_VERIFY_RETURN_INT(long, sdigit, -(sdigit) ((PyLongObject*)x)->ob_digit[0]);
-            }
- #endif
-#endif
-            if (sizeof(long) <= sizeof(long)) {
-                __PYX_VERIFY_RETURN_INT(long, long, PyLong_AsLong(x))
-            } else if (sizeof(long) <= sizeof(long long)) {
-                __PYX_VERIFY_RETURN_INT(long, long long, PyLong_AsLongLong(x))
-            }
-        }
-        {
-#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
-            PyErr_SetString(PyExc_RuntimeError,
-                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
-#else
-            long val;
-            PyObject *v = __Pyx_PyNumber_Int(x);
- #if PY_MAJOR_VERSION < 3
-            if (likely(v) && !PyLong_Check(v)) {
-                PyObject *tmp = v;
-                v = PyNumber_Long(tmp);
-                Py_DECREF(tmp);
-            }
- #endif
-            if (likely(v)) {
-                int one = 1; int is_little = (int)*(unsigned char *)&one;
-                unsigned char *bytes = (unsigned char *)&val;
-                int ret = _PyLong_AsByteArray((PyLongObject *)v,
-                                              bytes, sizeof(val),
-                                              is_little, !is_unsigned);
-                Py_DECREF(v);
-                if (likely(!ret))
-                    return val;
-            }
-#endif
-            return (long) -1;
-        }
-    } else {
-        long val;
-        PyObject *tmp = __Pyx_PyNumber_Int(x);
-        if (!tmp) return (long) -1;
-        val = __Pyx_PyInt_As_long(tmp);
-        Py_DECREF(tmp);
-        return val;
-    }
-raise_overflow:
-    PyErr_SetString(PyExc_OverflowError,
-        "value too large to convert to long");
-    return (long) -1;
-raise_neg_overflow:
-    PyErr_SetString(PyExc_OverflowError,
-        "can't convert negative value to long");
-    return (long) -1;
-}
-
-static int __Pyx_check_binary_version(void) {
-    char ctversion[4], rtversion[4];
-    PyOS_snprintf(ctversion, 4, "%d.%d", PY_MAJOR_VERSION, PY_MINOR_VERSION);
-    PyOS_snprintf(rtversion, 4, "%s", Py_GetVersion());
-    if (ctversion[0] != rtversion[0] || ctversion[2] != rtversion[2]) {
-        char message[200];
-        PyOS_snprintf(message, sizeof(message),
-                      "compiletime version %s of module '%.100s' "
-                      "does not match runtime version %s",
-                      ctversion, __Pyx_MODULE_NAME, rtversion);
-        return PyErr_WarnEx(NULL, message, 1);
-    }
-    return 0;
-}
-
-#ifndef __PYX_HAVE_RT_ImportModule
-#define __PYX_HAVE_RT_ImportModule
-static PyObject *__Pyx_ImportModule(const char *name) {
-    PyObject *py_name = 0;
-    PyObject *py_module = 0;
-    py_name = __Pyx_PyIdentifier_FromString(name);
-    if (!py_name)
-        goto bad;
-    py_module = PyImport_Import(py_name);
-    Py_DECREF(py_name);
-    return py_module;
-bad:
-    Py_XDECREF(py_name);
-    return 0;
-}
-#endif
-
-#ifndef __PYX_HAVE_RT_ImportType
-#define __PYX_HAVE_RT_ImportType
-static PyTypeObject *__Pyx_ImportType(const char *module_name, const char *class_name,
-    size_t size, int strict)
-{
-    PyObject *py_module = 0;
-    PyObject *result = 0;
-    PyObject *py_name = 0;
-    char warning[200];
-    Py_ssize_t basicsize;
-#ifdef Py_LIMITED_API
-    PyObject *py_basicsize;
-#endif
-    py_module = __Pyx_ImportModule(module_name);
-    if (!py_module)
-        goto bad;
-    py_name = __Pyx_PyIdentifier_FromString(class_name);
-    if (!py_name)
-        goto bad;
-    result = PyObject_GetAttr(py_module, py_name);
-    Py_DECREF(py_name);
-    py_name = 0;
-    Py_DECREF(py_module);
-    py_module = 0;
-    if (!result)
-        goto bad;
-    if (!PyType_Check(result)) {
-        PyErr_Format(PyExc_TypeError,
-            "%.200s.%.200s is not a type object",
-            module_name, class_name);
-        goto bad;
-    }
-#ifndef Py_LIMITED_API
-    basicsize = ((PyTypeObject *)result)->tp_basicsize;
-#else
-    py_basicsize = PyObject_GetAttrString(result, "__basicsize__");
-    if (!py_basicsize)
-        goto bad;
-    basicsize = PyLong_AsSsize_t(py_basicsize);
-    Py_DECREF(py_basicsize);
-    py_basicsize = 0;
-    if (basicsize == (Py_ssize_t)-1 && PyErr_Occurred())
-        goto bad;
-#endif
-    if (!strict && (size_t)basicsize > size) {
-        PyOS_snprintf(warning, sizeof(warning),
-            "%s.%s size changed, may indicate binary incompatibility",
-            module_name, class_name);
-        if (PyErr_WarnEx(NULL, warning, 0) < 0) goto bad;
-    }
-    else if ((size_t)basicsize != size) {
-        PyErr_Format(PyExc_ValueError,
-            "%.200s.%.200s has the wrong size, try recompiling",
-            module_name, class_name);
-        goto bad;
-    }
-    return (PyTypeObject *)result;
-bad:
-    Py_XDECREF(py_module);
-    Py_XDECREF(result);
-    return NULL;
-}
-#endif
-
-static int __Pyx_InitStrings(__Pyx_StringTabEntry *t) {
-    while (t->p) {
-        #if PY_MAJOR_VERSION < 3
-        if (t->is_unicode) {
-            *t->p = PyUnicode_DecodeUTF8(t->s, t->n - 1, NULL);
-        } else if (t->intern) {
-            *t->p = PyString_InternFromString(t->s);
-        } else {
-            *t->p = PyString_FromStringAndSize(t->s, t->n - 1);
-        }
-        #else
-        if (t->is_unicode | t->is_str) {
-            if (t->intern) {
-                *t->p = PyUnicode_InternFromString(t->s);
-            } else if (t->encoding) {
-                *t->p = PyUnicode_Decode(t->s, t->n - 1, t->encoding, NULL);
-            } else {
-                *t->p = PyUnicode_FromStringAndSize(t->s, t->n - 1);
-            }
-        } else {
-            *t->p = PyBytes_FromStringAndSize(t->s, t->n - 1);
-        }
-        #endif
-        if (!*t->p)
-            return -1;
-        ++t;
-    }
-    return 0;
-}
-
-static CYTHON_INLINE PyObject* __Pyx_PyUnicode_FromString(const char* c_str) {
-    return __Pyx_PyUnicode_FromStringAndSize(c_str, (Py_ssize_t)strlen(c_str));
-}
-static CYTHON_INLINE char* __Pyx_PyObject_AsString(PyObject* o) {
-    Py_ssize_t ignore;
-    return __Pyx_PyObject_AsStringAndSize(o, &ignore);
-}
-static CYTHON_INLINE char* __Pyx_PyObject_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
-#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
-    if (
-#if PY_MAJOR_VERSION < 3 && __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
-            __Pyx_sys_getdefaultencoding_not_ascii &&
-#endif
-            PyUnicode_Check(o)) {
-#if PY_VERSION_HEX < 0x03030000
-        char* defenc_c;
-        PyObject* defenc = _PyUnicode_AsDefaultEncodedString(o, NULL);
-        if (!defenc) return NULL;
-        defenc_c = PyBytes_AS_STRING(defenc);
-#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
-        {
-            char* end = defenc_c + PyBytes_GET_SIZE(defenc);
-            char* c;
-            for (c = defenc_c; c < end; c++) {
-                if ((unsigned char) (*c) >= 128) {
-                    PyUnicode_AsASCIIString(o);
-                    return NULL;
-                }
-            }
-        }
-#endif
-        *length = PyBytes_GET_SIZE(defenc);
-        return defenc_c;
-#else
-        if (__Pyx_PyUnicode_READY(o) == -1) return NULL;
-#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
-        if (PyUnicode_IS_ASCII(o)) {
-            *length = PyUnicode_GET_LENGTH(o);
-            return PyUnicode_AsUTF8(o);
-        } else {
-            PyUnicode_AsASCIIString(o);
-            return NULL;
-        }
-#else
-        return PyUnicode_AsUTF8AndSize(o, length);
-#endif
-#endif
-    } else
-#endif
-#if !CYTHON_COMPILING_IN_PYPY
-    if (PyByteArray_Check(o)) {
-        *length = PyByteArray_GET_SIZE(o);
-        return PyByteArray_AS_STRING(o);
-    } else
-#endif
-    {
-        char* result;
-        int r = PyBytes_AsStringAndSize(o, &result, length);
-        if (unlikely(r < 0)) {
-            return NULL;
-        } else {
-            return result;
-        }
-    }
-}
-static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject* x) {
-   int is_true = x == Py_True;
-   if (is_true | (x == Py_False) | (x == Py_None)) return is_true;
-   else return PyObject_IsTrue(x);
-}
-static CYTHON_INLINE PyObject* __Pyx_PyNumber_Int(PyObject* x) {
-  PyNumberMethods *m;
-  const char *name = NULL;
-  PyObject *res = NULL;
-#if PY_MAJOR_VERSION < 3
-  if (PyInt_Check(x) || PyLong_Check(x))
-#else
-  if (PyLong_Check(x))
-#endif
-    return Py_INCREF(x), x;
-  m = Py_TYPE(x)->tp_as_number;
-#if PY_MAJOR_VERSION < 3
-  if (m && m->nb_int) {
-    name = "int";
-    res = PyNumber_Int(x);
-  }
-  else if (m && m->nb_long) {
-    name = "long";
-    res = PyNumber_Long(x);
-  }
-#else
-  if (m && m->nb_int) {
-    name = "int";
-    res = PyNumber_Long(x);
-  }
-#endif
-  if (res) {
-#if PY_MAJOR_VERSION < 3
-    if (!PyInt_Check(res) && !PyLong_Check(res)) {
-#else
-    if (!PyLong_Check(res)) {
-#endif
-      PyErr_Format(PyExc_TypeError,
-                   "__%.4s__ returned non-%.4s (type %.200s)",
-                   name, name, Py_TYPE(res)->tp_name);
-      Py_DECREF(res);
-      return NULL;
-    }
-  }
-  else if (!PyErr_Occurred()) {
-    PyErr_SetString(PyExc_TypeError,
-                    "an integer is required");
-  }
-  return res;
-}
-static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject* b) {
-  Py_ssize_t ival;
-  PyObject *x;
-#if PY_MAJOR_VERSION < 3
-  if (likely(PyInt_CheckExact(b)))
-      return PyInt_AS_LONG(b);
-#endif
-  if (likely(PyLong_CheckExact(b))) {
-    #if CYTHON_COMPILING_IN_CPYTHON && PY_MAJOR_VERSION >= 3
-     #if CYTHON_USE_PYLONG_INTERNALS
-       switch (Py_SIZE(b)) {
-       case -1: return -(sdigit)((PyLongObject*)b)->ob_digit[0];
-       case  0: return 0;
-       case  1: return ((PyLongObject*)b)->ob_digit[0];
-       }
-     #endif
-    #endif
-    return PyLong_AsSsize_t(b);
-  }
-  x = PyNumber_Index(b);
-  if (!x) return -1;
-  ival = PyInt_AsSsize_t(x);
-  Py_DECREF(x);
-  return ival;
-}
-static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t ival) {
-    return PyInt_FromSize_t(ival);
-}
-
-
-#endif /* Py_PYTHON_H */
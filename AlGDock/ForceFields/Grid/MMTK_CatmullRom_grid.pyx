@@ -10,6 +10,7 @@ include "MMTK/numeric.pxi"
 include "MMTK/core.pxi"
 include "MMTK/universe.pxi"
 include 'MMTK/forcefield.pxi'
+include "grid_values.pxi"
 from Scientific.Geometry import Vector, ex, ey, ez
 
 import gzip
@@ -39,8 +40,8 @@ ctypedef np.int_t int_t
 #
 cdef class CatmullRomGridTerm(EnergyTerm):
     cdef char* grid_name
-    cdef np.ndarray scaling_factor, vals, counts, spacing, hCorner
-    cdef int npts, nyz, natoms
+    cdef np.ndarray scaling_factor, vals, counts, spacing, hCorner, origin
+    cdef int npts, nyz, natoms, single, blocked
     cdef float_t strength, k
     # The __init__ method remembers parameters and loads the potential
     # file. Note that EnergyTerm.__init__ takes care of storing the
@@ -209,7 +210,7 @@ cdef class CatmullRomGridTerm(EnergyTerm):
 
 
     def __init__(self, universe, spacing, counts, vals, strength,
-                 scaling_factor, grid_name):
+                 scaling_factor, grid_name, origin=None, layout='linear'):
         print "------------test start---------------"
         EnergyTerm.__init__(self, universe,
                             grid_name, (grid_name,))
@@ -221,8 +222,16 @@ cdef class CatmullRomGridTerm(EnergyTerm):
         self.grid_name = grid_name
 
         self.spacing = spacing
+        # The grid origin may be anywhere
+        if origin is None:
+            origin = np.zeros(3)
+        self.origin = np.array(origin, dtype=float)
         self.counts = counts
         self.vals = vals
+        # Values may be stored in single precision
+        self.single = (self.vals.dtype==np.float32)
+        # Values may be stored in bricks of 4x4x4 points
+        self.blocked = (layout=='blocked')
         self.nyz = self.counts[1]*self.counts[2]
         self.hCorner = np.array((self.spacing[0]*(self.counts[0]-1),
                         self.spacing[1]*(self.counts[1]-1),
@@ -239,8 +248,9 @@ cdef class CatmullRomGridTerm(EnergyTerm):
 
         # Input
         cdef vector3 *coordinates
+        cdef float_t *origin
         cdef float_t *scaling_factor
-        cdef float_t *vals
+        cdef char *vals
         cdef int_t *counts
         cdef float_t *spacing
         cdef float_t *hCorner
@@ -249,6 +259,7 @@ cdef class CatmullRomGridTerm(EnergyTerm):
         cdef vector3 *gradients
         cdef np.ndarray[float_t, ndim=4] force_constants
         # Processing
+        cdef vector3 pos
 
         cdef int i, ix, iy, iz, atom_index
 
@@ -266,9 +277,10 @@ cdef class CatmullRomGridTerm(EnergyTerm):
 
         # Pointers to numpy arrays for faster indexing
         scaling_factor = <float_t *>self.scaling_factor.data
-        vals = <float_t *>self.vals.data
+        vals = self.vals.data
         counts = <int_t *>self.counts.data
         spacing = <float_t *>self.spacing.data
+        origin = <float_t *>self.origin.data
         hCorner = <float_t *>self.hCorner.data
 
         # Initialize variables
@@ -281,31 +293,34 @@ cdef class CatmullRomGridTerm(EnergyTerm):
 
         indicies = [ai for ai in range(self.natoms) if self.scaling_factor[ai]!=0]
         for atom_index in indicies:
+          # Position relative to the grid origin
+          pos[0] = coordinates[atom_index][0] - origin[0]
+          pos[1] = coordinates[atom_index][1] - origin[1]
+          pos[2] = coordinates[atom_index][2] - origin[2]
           # Check to make sure coordinate is in grid
-          if (coordinates[atom_index][0]>0 and 
-              coordinates[atom_index][1]>0 and 
-              coordinates[atom_index][2]>0 and
-              coordinates[atom_index][0]<hCorner[0] and
-              coordinates[atom_index][1]<hCorner[1] and
-              coordinates[atom_index][2]<hCorner[2]):
+          if (pos[0]>0 and 
+              pos[1]>0 and 
+              pos[2]>0 and
+              pos[0]<hCorner[0] and
+              pos[1]<hCorner[1] and
+              pos[2]<hCorner[2]):
 
             # Index within the grid
-            ix = int(coordinates[atom_index][0]/spacing[0]-1)
-            iy = int(coordinates[atom_index][1]/spacing[1]-1)
-            iz = int(coordinates[atom_index][2]/spacing[2]-1)
+            ix = int(pos[0]/spacing[0]-1)
+            iy = int(pos[1]/spacing[1]-1)
+            iz = int(pos[2]/spacing[2]-1)
             
-            i = ix*self.nyz + iy*counts[2] + iz
-
 
             for x in range(0,4):
                 for y in range(0,4):
                     for z in range(0,4):
-                        vertex[x][y][z]=vals[i+x*self.nyz+y*counts[2]+z]
+                        vertex[x][y][z]=grid_value(vals, self.single,
+                          grid_index(self.blocked, counts, ix+x, iy+y, iz+z))
 
            # Fraction within the box
-            fx = (coordinates[atom_index][0] - (ix*spacing[0]))/spacing[0]
-            fy = (coordinates[atom_index][1] - (iy*spacing[1]))/spacing[1]
-            fz = (coordinates[atom_index][2] - (iz*spacing[2]))/spacing[2]
+            fx = (pos[0] - (ix*spacing[0]))/spacing[0]
+            fy = (pos[1] - (iy*spacing[1]))/spacing[1]
+            fz = (pos[2] - (iz*spacing[2]))/spacing[2]
 
             gridEnergy += scaling_factor[atom_index]*self.trisplineInterpolate(vertex,fx,fy,fz)
                 # hessian funciton          ************************
@@ -343,13 +358,13 @@ cdef class CatmullRomGridTerm(EnergyTerm):
               gradients[atom_index][2] += self.strength*scaling_factor[atom_index]*dvdz/spacing[2]
           else:
             for i in range(3):
-              if (coordinates[atom_index][i]<0):
-                gridEnergy += self.k*coordinates[atom_index][i]**2/2.
+              if (pos[i]<0):
+                gridEnergy += self.k*pos[i]**2/2.
                 if energy.gradients != NULL:
-                  gradients[atom_index][i] += self.k*coordinates[atom_index][i]
-              elif (coordinates[atom_index][i]>hCorner[i]):
-                gridEnergy += self.k*(coordinates[atom_index][i]-hCorner[i])**2/2.
+                  gradients[atom_index][i] += self.k*pos[i]
+              elif (pos[i]>hCorner[i]):
+                gridEnergy += self.k*(pos[i]-hCorner[i])**2/2.
                 if energy.gradients != NULL:
-                  gradients[atom_index][i] += self.k*(coordinates[atom_index][i]-hCorner[i])
+                  gradients[atom_index][i] += self.k*(pos[i]-hCorner[i])
 
         energy.energy_terms[self.index] = gridEnergy*self.strength
@@ -8,6 +8,7 @@ include "MMTK/numeric.pxi"
 include "MMTK/core.pxi"
 include "MMTK/universe.pxi"
 include 'MMTK/forcefield.pxi'
+include "grid_values.pxi"
 
 import gzip
 
@@ -35,15 +36,15 @@ ctypedef np.int_t int_t
 #
 cdef class TrilinearGridTerm(EnergyTerm):
     cdef char* grid_name
-    cdef np.ndarray scaling_factor, vals, counts, spacing, hCorner
-    cdef int npts, nyz, natoms
+    cdef np.ndarray scaling_factor, vals, counts, spacing, hCorner, origin
+    cdef int npts, nyz, natoms, single, blocked
     cdef float_t strength, k
 
     # The __init__ method remembers parameters and loads the potential
     # file. Note that EnergyTerm.__init__ takes care of storing the
     # name and the universe object.
     def __init__(self, universe, spacing, counts, vals, strength,
-                 scaling_factor, grid_name):
+                 scaling_factor, grid_name, origin=None, layout='linear'):
 
         EnergyTerm.__init__(self, universe,
                             grid_name, (grid_name,))
@@ -55,8 +56,16 @@ cdef class TrilinearGridTerm(EnergyTerm):
         self.grid_name = grid_name
 
         self.spacing = spacing
+        # The grid origin may be anywhere
+        if origin is None:
+            origin = np.zeros(3)
+        self.origin = np.array(origin, dtype=float)
         self.counts = counts
         self.vals = vals
+        # Values may be stored in single precision
+        self.single = (self.vals.dtype==np.float32)
+        # Values may be stored in bricks of 4x4x4 points
+        self.blocked = (layout=='blocked')
         self.nyz = self.counts[1]*self.counts[2]
         self.hCorner = np.array((self.spacing[0]*(self.counts[0]-1),
                         self.spacing[1]*(self.counts[1]-1),
@@ -73,8 +82,9 @@ cdef class TrilinearGridTerm(EnergyTerm):
 
         # Input
         cdef vector3 *coordinates
+        cdef float_t *origin
         cdef float_t *scaling_factor
-        cdef float_t *vals
+        cdef char *vals
         cdef int_t *counts
         cdef float_t *spacing
         cdef float_t *hCorner
@@ -82,7 +92,9 @@ cdef class TrilinearGridTerm(EnergyTerm):
         cdef float_t gridEnergy
         cdef vector3 *gradients
         # Processing
+        cdef vector3 pos
         cdef int i, ix, iy, iz, atom_index
+        cdef Py_ssize_t c[8]
         cdef float_t vmmm, vmmp, vmpm, vmpp, vpmm, vpmp, vppm, vppp
         cdef float_t vmm, vmp, vpm, vpp, vm, vp
         cdef float_t fx, fy, fz, ax, ay, az
@@ -93,9 +105,10 @@ cdef class TrilinearGridTerm(EnergyTerm):
 
         # Pointers to numpy arrays for faster indexing
         scaling_factor = <float_t *>self.scaling_factor.data
-        vals = <float_t *>self.vals.data
+        vals = self.vals.data
         counts = <int_t *>self.counts.data
         spacing = <float_t *>self.spacing.data
+        origin = <float_t *>self.origin.data
         hCorner = <float_t *>self.hCorner.data
 
         # Initialize variables
@@ -104,36 +117,40 @@ cdef class TrilinearGridTerm(EnergyTerm):
       
         indicies = [ai for ai in range(self.natoms) if self.scaling_factor[ai]!=0]
         for atom_index in indicies:
+          # Position relative to the grid origin
+          pos[0] = coordinates[atom_index][0] - origin[0]
+          pos[1] = coordinates[atom_index][1] - origin[1]
+          pos[2] = coordinates[atom_index][2] - origin[2]
           # Check to make sure coordinate is in grid
-          if (coordinates[atom_index][0]>0 and 
-              coordinates[atom_index][1]>0 and 
-              coordinates[atom_index][2]>0 and
-              coordinates[atom_index][0]<hCorner[0] and
-              coordinates[atom_index][1]<hCorner[1] and
-              coordinates[atom_index][2]<hCorner[2]):
+          if (pos[0]>0 and 
+              pos[1]>0 and 
+              pos[2]>0 and
+              pos[0]<hCorner[0] and
+              pos[1]<hCorner[1] and
+              pos[2]<hCorner[2]):
 
             # Index within the grid
-            ix = int(coordinates[atom_index][0]/spacing[0])
-            iy = int(coordinates[atom_index][1]/spacing[1])
-            iz = int(coordinates[atom_index][2]/spacing[2])
+            ix = int(pos[0]/spacing[0])
+            iy = int(pos[1]/spacing[1])
+            iz = int(pos[2]/spacing[2])
             
-            i = ix*self.nyz + iy*counts[2] + iz
+            grid_corners(self.blocked, counts, ix, iy, iz, c)
 
             # Corners of the box surrounding the point
-            vmmm = vals[i]
-            vmmp = vals[i+1]
-            vmpm = vals[i+counts[2]]
-            vmpp = vals[i+counts[2]+1]
-
-            vpmm = vals[i+self.nyz]
-            vpmp = vals[i+self.nyz+1]
-            vppm = vals[i+self.nyz+counts[2]]
-            vppp = vals[i+self.nyz+counts[2]+1]
+            vmmm = grid_value(vals, self.single, c[0])
+            vmmp = grid_value(vals, self.single, c[1])
+            vmpm = grid_value(vals, self.single, c[2])
+            vmpp = grid_value(vals, self.single, c[3])
+
+            vpmm = grid_value(vals, self.single, c[4])
+            vpmp = grid_value(vals, self.single, c[5])
+            vppm = grid_value(vals, self.single, c[6])
+            vppp = grid_value(vals, self.single, c[7])
             
             # Fraction within the box
-            fx = (coordinates[atom_index][0] - (ix*spacing[0]))/spacing[0]
-            fy = (coordinates[atom_index][1] - (iy*spacing[1]))/spacing[1]
-            fz = (coordinates[atom_index][2] - (iz*spacing[2]))/spacing[2]
+            fx = (pos[0] - (ix*spacing[0]))/spacing[0]
+            fy = (pos[1] - (iy*spacing[1]))/spacing[1]
+            fz = (pos[2] - (iz*spacing[2]))/spacing[2]
             
             # Fraction ahead
             ax = 1 - fx
@@ -164,13 +181,13 @@ cdef class TrilinearGridTerm(EnergyTerm):
               gradients[atom_index][2] += self.strength*scaling_factor[atom_index]*dvdz/spacing[2]
           else:
             for i in range(3):
-              if (coordinates[atom_index][i]<0):
-                gridEnergy += self.k*coordinates[atom_index][i]**2/2.
+              if (pos[i]<0):
+                gridEnergy += self.k*pos[i]**2/2.
                 if energy.gradients != NULL:
-                  gradients[atom_index][i] += self.k*coordinates[atom_index][i]
-              elif (coordinates[atom_index][i]>hCorner[i]):
-                gridEnergy += self.k*(coordinates[atom_index][i]-hCorner[i])**2/2.
+                  gradients[atom_index][i] += self.k*pos[i]
+              elif (pos[i]>hCorner[i]):
+                gridEnergy += self.k*(pos[i]-hCorner[i])**2/2.
                 if energy.gradients != NULL:
-                  gradients[atom_index][i] += self.k*(coordinates[atom_index][i]-hCorner[i])
+                  gradients[atom_index][i] += self.k*(pos[i]-hCorner[i])
 
         energy.energy_terms[self.index] = gridEnergy*self.strength
@@ -0,0 +1,247 @@
+# Cython force field implementation for several trilinear grids
+# that share the same points
+
+#
+# Get all the required declarations
+#
+include "MMTK/python.pxi"
+include "MMTK/numeric.pxi"
+include "MMTK/core.pxi"
+include "MMTK/universe.pxi"
+include 'MMTK/forcefield.pxi'
+include "grid_values.pxi"
+
+import numpy as np
+cimport numpy as np
+
+ctypedef np.float_t float_t
+ctypedef np.int_t int_t
+
+#
+# The force field term implementation.
+# The rules:
+#
+# - The class must inherit from EnergyTerm.
+#
+# - EnergyTerm.__init__() must be called with the arguments
+#   shown here. The third argument is the name of the EnergyTerm
+#   object, the fourth a tuple of the names of all the terms it
+#   implements (one object can implement several terms).
+#   The assignment to self.eval_func is essential, without it
+#   any energy evaluation will crash.
+#
+# - The function "evaluate" must have exactly the parameter
+#   list given in this example.
+#
+# The values of all the grids are interleaved, so the value of grid g
+# at point i is grid_value(vals, self.single, i*ngrids + g). The cell and fractional position
+# of an atom are computed once and used to interpolate every grid.
+# The points may be stored in bricks of 4x4x4 points (see grid_values.pxi).
+# A grid with isqrt set contains the inverse square root of the
+# energy, which is recovered after interpolation.
+#
+cdef class TrilinearMultiGridTerm(EnergyTerm):
+    cdef np.ndarray scaling_factors, vals, counts, spacing, hCorner, origin
+    cdef np.ndarray strengths, isqrt, indicies, grid_energies
+    cdef int nyz, natoms, ngrids, nindicies, single, blocked
+    cdef float_t k
+
+    # The __init__ method remembers parameters and loads the potential
+    # file. Note that EnergyTerm.__init__ takes care of storing the
+    # name and the universe object.
+    def __init__(self, universe, spacing, counts, vals, strengths,
+                 scaling_factors, isqrt, name, grid_names, origin=None,
+                 layout='linear'):
+
+        EnergyTerm.__init__(self, universe,
+                            name, tuple(grid_names))
+        self.eval_func = <void *>TrilinearMultiGridTerm.evaluate
+
+        self.strengths = np.array(strengths, dtype=float)
+        self.ngrids = len(self.strengths)
+        # The scaling factors are stored as (natoms, ngrids)
+        self.scaling_factors = np.ascontiguousarray(\
+          np.transpose(scaling_factors), dtype=float)
+        self.natoms = self.scaling_factors.shape[0]
+        self.isqrt = np.array(isqrt, dtype=int)
+
+        # Atoms that interact with at least one grid
+        active = (self.scaling_factors!=0) & (self.strengths!=0)
+        self.indicies = np.array(np.nonzero(active.any(axis=1))[0], dtype=int)
+        self.nindicies = len(self.indicies)
+        self.grid_energies = np.zeros(self.ngrids, dtype=float)
+
+        self.spacing = spacing
+        # The grid origin may be anywhere
+        if origin is None:
+            origin = np.zeros(3)
+        self.origin = np.array(origin, dtype=float)
+        self.counts = counts
+        self.vals = vals
+        # Values may be stored in single precision
+        self.single = (self.vals.dtype==np.float32)
+        # Values may be stored in bricks of 4x4x4 points
+        self.blocked = (layout=='blocked')
+        self.nyz = self.counts[1]*self.counts[2]
+        self.hCorner = np.array((self.spacing[0]*(self.counts[0]-1),
+                        self.spacing[1]*(self.counts[1]-1),
+                        self.spacing[2]*(self.counts[2]-1)), dtype=float)
+        # To keep atoms within the grid
+        self.k = 10000. # kJ/mol nm**2
+
+    # This method is called for every single energy evaluation, so make
+    # it as efficient as possible. The parameters do_gradients and
+    # do_force_constants are flags that indicate if gradients and/or
+    # force constants are requested.
+    cdef void evaluate(self, PyFFEvaluatorObject *eval,
+                       energy_spec *input, energy_data *energy):
+
+        # Input
+        cdef vector3 *coordinates
+        cdef float_t *origin
+        cdef float_t *scaling_factors
+        cdef char *vals
+        cdef int_t *counts
+        cdef float_t *spacing
+        cdef float_t *hCorner
+        cdef float_t *strengths
+        cdef int_t *isqrt
+        cdef int_t *indicies
+        # Output
+        cdef float_t *grid_energies
+        cdef vector3 *gradients
+        # Processing
+        cdef vector3 pos
+        cdef int n, g, d, ix, iy, iz, atom_index
+        cdef Py_ssize_t c[8]
+        cdef float_t vmmm, vmmp, vmpm, vmpp, vpmm, vpmp, vppm, vppp
+        cdef float_t vmm, vmp, vpm, vpp, vm, vp
+        cdef float_t fx, fy, fz, ax, ay, az
+        cdef float_t dvdx, dvdy, dvdz
+        cdef float_t sf, wall
+        cdef float_t wall_grad[3]
+        cdef double interpolated, prefactor
+
+        coordinates = <vector3 *>input.coordinates.data
+
+        # Pointers to numpy arrays for faster indexing
+        scaling_factors = <float_t *>self.scaling_factors.data
+        vals = self.vals.data
+        counts = <int_t *>self.counts.data
+        spacing = <float_t *>self.spacing.data
+        origin = <float_t *>self.origin.data
+        hCorner = <float_t *>self.hCorner.data
+        strengths = <float_t *>self.strengths.data
+        isqrt = <int_t *>self.isqrt.data
+        indicies = <int_t *>self.indicies.data
+        grid_energies = <float_t *>self.grid_energies.data
+
+        # Initialize variables
+        for g in range(self.ngrids):
+          grid_energies[g] = 0
+        if energy.gradients != NULL:
+          gradients = <vector3 *>(<PyArrayObject *> energy.gradients).data
+
+        for n in range(self.nindicies):
+          atom_index = indicies[n]
+          # Position relative to the grid origin
+          pos[0] = coordinates[atom_index][0] - origin[0]
+          pos[1] = coordinates[atom_index][1] - origin[1]
+          pos[2] = coordinates[atom_index][2] - origin[2]
+          # Check to make sure coordinate is in grid
+          if (pos[0]>0 and
+              pos[1]>0 and
+              pos[2]>0 and
+              pos[0]<hCorner[0] and
+              pos[1]<hCorner[1] and
+              pos[2]<hCorner[2]):
+
+            # Index within the grid
+            ix = int(pos[0]/spacing[0])
+            iy = int(pos[1]/spacing[1])
+            iz = int(pos[2]/spacing[2])
+
+            # Corners of the cell in the interleaved array
+            grid_corners(self.blocked, counts, ix, iy, iz, c)
+            for d in range(8):
+              c[d] = c[d]*self.ngrids
+
+            # Fraction within the box
+            fx = (pos[0] - (ix*spacing[0]))/spacing[0]
+            fy = (pos[1] - (iy*spacing[1]))/spacing[1]
+            fz = (pos[2] - (iz*spacing[2]))/spacing[2]
+
+            # Fraction ahead
+            ax = 1 - fx
+            ay = 1 - fy
+            az = 1 - fz
+
+            for g in range(self.ngrids):
+              sf = scaling_factors[atom_index*self.ngrids + g]
+              if sf==0 or strengths[g]==0:
+                continue
+
+              # Corners of the box surrounding the point
+              vmmm = grid_value(vals, self.single, c[0]+g)
+              vmmp = grid_value(vals, self.single, c[1]+g)
+              vmpm = grid_value(vals, self.single, c[2]+g)
+              vmpp = grid_value(vals, self.single, c[3]+g)
+
+              vpmm = grid_value(vals, self.single, c[4]+g)
+              vpmp = grid_value(vals, self.single, c[5]+g)
+              vppm = grid_value(vals, self.single, c[6]+g)
+              vppp = grid_value(vals, self.single, c[7]+g)
+
+              # Trilinear interpolation for energy
+              vmm = az*vmmm + fz*vmmp
+              vmp = az*vmpm + fz*vmpp
+              vpm = az*vpmm + fz*vpmp
+              vpp = az*vppm + fz*vppp
+
+              vm = ay*vmm + fy*vmp
+              vp = ay*vpm + fy*vpp
+
+              interpolated = (ax*vm + fx*vp)
+              if isqrt[g]:
+                if interpolated==0.0:
+                  continue
+                grid_energies[g] += sf/(interpolated*interpolated)
+              else:
+                grid_energies[g] += sf*interpolated
+
+              if energy.gradients != NULL:
+                # x coordinate
+                dvdx = -vm + vp
+                # y coordinate
+                dvdy = (-vmm + vmp)*ax + (-vpm + vpp)*fx
+                # z coordinate
+                dvdz = ((-vmmm + vmmp)*ay + (-vmpm + vmpp)*fy)*ax + ((-vpmm + vpmp)*ay + (-vppm + vppp)*fy)*fx
+                if isqrt[g]:
+                  prefactor = -2.*strengths[g]*sf/(interpolated*interpolated*interpolated)
+                else:
+                  prefactor = strengths[g]*sf
+                gradients[atom_index][0] += prefactor*dvdx/spacing[0]
+                gradients[atom_index][1] += prefactor*dvdy/spacing[1]
+                gradients[atom_index][2] += prefactor*dvdz/spacing[2]
+          else:
+            # Harmonic wall, which is applied for every grid
+            # in which the atom has a nonzero scaling factor
+            wall = 0
+            for d in range(3):
+              wall_grad[d] = 0
+              if (pos[d]<0):
+                wall += self.k*pos[d]**2/2.
+                wall_grad[d] = self.k*pos[d]
+              elif (pos[d]>hCorner[d]):
+                wall += self.k*(pos[d]-hCorner[d])**2/2.
+                wall_grad[d] = self.k*(pos[d]-hCorner[d])
+            for g in range(self.ngrids):
+              if scaling_factors[atom_index*self.ngrids + g]==0 or strengths[g]==0:
+                continue
+              grid_energies[g] += wall
+              if energy.gradients != NULL:
+                for d in range(3):
+                  gradients[atom_index][d] += strengths[g]*wall_grad[d]
+
+        for g in range(self.ngrids):
+          energy.energy_terms[self.index+g] = grid_energies[g]*strengths[g]
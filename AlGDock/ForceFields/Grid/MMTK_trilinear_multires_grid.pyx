@@ -0,0 +1,266 @@
+# Cython force field implementation for a trilinear grid
+# with a fine patch inside a coarse parent grid
+
+#
+# Get all the required declarations
+#
+include "MMTK/python.pxi"
+include "MMTK/numeric.pxi"
+include "MMTK/core.pxi"
+include "MMTK/universe.pxi"
+include 'MMTK/forcefield.pxi'
+include "grid_values.pxi"
+
+import numpy as np
+cimport numpy as np
+
+ctypedef np.float_t float_t
+ctypedef np.int_t int_t
+
+# Trilinearly interpolates a grid at a position relative to its origin.
+# If the position is inside the grid, the value and its gradient
+# are stored in v and dv and 1 is returned. Otherwise 0 is returned.
+cdef inline int interpolate(char *vals, int single, int blocked,
+                            int_t *counts, float_t *spacing, float_t *hCorner,
+                            vector3 pos, double *v, double *dv):
+    cdef int ix, iy, iz
+    cdef Py_ssize_t c[8]
+    cdef float_t vmmm, vmmp, vmpm, vmpp, vpmm, vpmp, vppm, vppp
+    cdef float_t vmm, vmp, vpm, vpp, vm, vp
+    cdef float_t fx, fy, fz, ax, ay, az
+
+    if not (pos[0]>0 and pos[1]>0 and pos[2]>0 and
+            pos[0]<hCorner[0] and pos[1]<hCorner[1] and pos[2]<hCorner[2]):
+        return 0
+
+    # Index within the grid
+    ix = int(pos[0]/spacing[0])
+    iy = int(pos[1]/spacing[1])
+    iz = int(pos[2]/spacing[2])
+
+    # Corners of the box surrounding the point
+    grid_corners(blocked, counts, ix, iy, iz, c)
+    vmmm = grid_value(vals, single, c[0])
+    vmmp = grid_value(vals, single, c[1])
+    vmpm = grid_value(vals, single, c[2])
+    vmpp = grid_value(vals, single, c[3])
+
+    vpmm = grid_value(vals, single, c[4])
+    vpmp = grid_value(vals, single, c[5])
+    vppm = grid_value(vals, single, c[6])
+    vppp = grid_value(vals, single, c[7])
+
+    # Fraction within the box
+    fx = (pos[0] - (ix*spacing[0]))/spacing[0]
+    fy = (pos[1] - (iy*spacing[1]))/spacing[1]
+    fz = (pos[2] - (iz*spacing[2]))/spacing[2]
+
+    # Fraction ahead
+    ax = 1 - fx
+    ay = 1 - fy
+    az = 1 - fz
+
+    # Trilinear interpolation for energy
+    vmm = az*vmmm + fz*vmmp
+    vmp = az*vmpm + fz*vmpp
+    vpm = az*vpmm + fz*vpmp
+    vpp = az*vppm + fz*vppp
+
+    vm = ay*vmm + fy*vmp
+    vp = ay*vpm + fy*vpp
+
+    v[0] = ax*vm + fx*vp
+
+    # Gradient
+    dv[0] = (-vm + vp)/spacing[0]
+    dv[1] = ((-vmm + vmp)*ax + (-vpm + vpp)*fx)/spacing[1]
+    dv[2] = (((-vmmm + vmmp)*ay + (-vmpm + vmpp)*fy)*ax + \
+             ((-vpmm + vpmp)*ay + (-vppm + vppp)*fy)*fx)/spacing[2]
+    return 1
+
+#
+# The force field term implementation.
+# The rules:
+#
+# - The class must inherit from EnergyTerm.
+#
+# - EnergyTerm.__init__() must be called with the arguments
+#   shown here. The third argument is the name of the EnergyTerm
+#   object, the fourth a tuple of the names of all the terms it
+#   implements (one object can implement several terms).
+#   The assignment to self.eval_func is essential, without it
+#   any energy evaluation will crash.
+#
+# - The function "evaluate" must have exactly the parameter
+#   list given in this example.
+#
+# Atoms inside the fine patch are interpolated on the patch and other
+# atoms are interpolated on the coarse grid. Within one coarse spacing
+# of the edges of the patch, the fine value is blended into the coarse
+# value with a smoothstep weight, so the energy is continuous across the
+# edges. Atoms outside the coarse grid are kept in it by a harmonic wall.
+# A grid with isqrt set contains the inverse square root of the energy,
+# which is recovered after interpolation.
+#
+cdef class TrilinearMultiResGridTerm(EnergyTerm):
+    cdef char* grid_name
+    cdef np.ndarray scaling_factor, indicies
+    cdef np.ndarray vals, counts, spacing, hCorner, origin
+    cdef np.ndarray fine_vals, fine_counts, fine_spacing, fine_hCorner
+    cdef np.ndarray fine_origin
+    cdef int natoms, nindicies, isqrt, single, fine_single, blocked
+    cdef float_t strength, k, blend_width
+
+    # The __init__ method remembers parameters and loads the potential
+    # file. Note that EnergyTerm.__init__ takes care of storing the
+    # name and the universe object.
+    def __init__(self, universe, spacing, counts, vals, origin,
+                 fine_spacing, fine_counts, fine_vals, fine_origin,
+                 strength, scaling_factor, isqrt, grid_name,
+                 layout='linear'):
+
+        EnergyTerm.__init__(self, universe,
+                            grid_name, (grid_name,))
+        self.eval_func = <void *>TrilinearMultiResGridTerm.evaluate
+
+        self.grid_name = grid_name
+        self.strength = strength
+        self.scaling_factor = np.array(scaling_factor, dtype=float)
+        self.natoms = len(self.scaling_factor)
+        self.indicies = np.array(np.nonzero(self.scaling_factor)[0], dtype=int)
+        self.nindicies = len(self.indicies)
+        self.isqrt = isqrt
+
+        self.spacing = np.array(spacing, dtype=float)
+        self.counts = np.array(counts, dtype=int)
+        self.origin = np.array(origin, dtype=float)
+        self.vals = vals
+        # Values may be stored in single precision
+        self.single = (self.vals.dtype==np.float32)
+        self.hCorner = self.spacing*(self.counts-1)
+
+        self.fine_spacing = np.array(fine_spacing, dtype=float)
+        self.fine_counts = np.array(fine_counts, dtype=int)
+        self.fine_origin = np.array(fine_origin, dtype=float)
+        self.fine_vals = fine_vals
+        self.fine_single = (self.fine_vals.dtype==np.float32)
+        self.fine_hCorner = self.fine_spacing*(self.fine_counts-1)
+        # Width of the layer in which the patch is blended into the grid
+        self.blend_width = max(self.spacing)
+
+        # Values of both grids may be stored in bricks of 4x4x4 points
+        self.blocked = (layout=='blocked')
+
+        # To keep atoms within the grid
+        self.k = 10000. # kJ/mol nm**2
+
+    # This method is called for every single energy evaluation, so make
+    # it as efficient as possible. The parameters do_gradients and
+    # do_force_constants are flags that indicate if gradients and/or
+    # force constants are requested.
+    cdef void evaluate(self, PyFFEvaluatorObject *eval,
+                       energy_spec *input, energy_data *energy):
+
+        # Input
+        cdef vector3 *coordinates
+        cdef float_t *scaling_factor
+        cdef int_t *indicies
+        cdef float_t *origin
+        cdef float_t *hCorner
+        cdef float_t *fine_origin
+        cdef float_t *fine_hCorner
+        # Output
+        cdef float_t gridEnergy
+        cdef vector3 *gradients
+        # Processing
+        cdef vector3 pos, coarse_pos
+        cdef int n, d, atom_index, inside, nearest
+        cdef double v, prefactor, t, w, dw, vc
+        cdef double dv[3]
+        cdef double dvc[3]
+
+        gridEnergy = 0
+        coordinates = <vector3 *>input.coordinates.data
+
+        # Pointers to numpy arrays for faster indexing
+        scaling_factor = <float_t *>self.scaling_factor.data
+        indicies = <int_t *>self.indicies.data
+        origin = <float_t *>self.origin.data
+        hCorner = <float_t *>self.hCorner.data
+        fine_origin = <float_t *>self.fine_origin.data
+        fine_hCorner = <float_t *>self.fine_hCorner.data
+
+        # Initialize variables
+        if energy.gradients != NULL:
+          gradients = <vector3 *>(<PyArrayObject *> energy.gradients).data
+
+        for n in range(self.nindicies):
+          atom_index = indicies[n]
+
+          # Try the fine patch, then the coarse grid
+          for d in range(3):
+            pos[d] = coordinates[atom_index][d] - fine_origin[d]
+          inside = interpolate(self.fine_vals.data, self.fine_single, self.blocked,
+            <int_t *>self.fine_counts.data, <float_t *>self.fine_spacing.data,
+            fine_hCorner, pos, &v, dv)
+          if inside:
+            # Distance to the nearest edge of the patch,
+            # as a fraction of the width of the blending layer
+            t = 1.
+            nearest = -1
+            for d in range(3):
+              if pos[d] < t*self.blend_width:
+                t = pos[d]/self.blend_width
+                nearest = d
+              if fine_hCorner[d] - pos[d] < t*self.blend_width:
+                t = (fine_hCorner[d] - pos[d])/self.blend_width
+                nearest = d + 3
+            if nearest>=0:
+              for d in range(3):
+                coarse_pos[d] = coordinates[atom_index][d] - origin[d]
+              if interpolate(self.vals.data, self.single, self.blocked,
+                  <int_t *>self.counts.data, <float_t *>self.spacing.data,
+                  hCorner, coarse_pos, &vc, dvc):
+                # v = vc + w*(v - vc), with the smoothstep weight w
+                w = t*t*(3. - 2.*t)
+                dw = 6.*t*(1. - t)/self.blend_width
+                for d in range(3):
+                  dv[d] = dvc[d] + w*(dv[d] - dvc[d])
+                if nearest<3:
+                  dv[nearest] += dw*(v - vc)
+                else:
+                  dv[nearest-3] -= dw*(v - vc)
+                v = vc + w*(v - vc)
+          else:
+            for d in range(3):
+              pos[d] = coordinates[atom_index][d] - origin[d]
+            inside = interpolate(self.vals.data, self.single, self.blocked,
+              <int_t *>self.counts.data, <float_t *>self.spacing.data,
+              hCorner, pos, &v, dv)
+
+          if inside:
+            if self.isqrt:
+              if v==0.0:
+                continue
+              gridEnergy += scaling_factor[atom_index]/(v*v)
+              prefactor = -2.*self.strength*scaling_factor[atom_index]/(v*v*v)
+            else:
+              gridEnergy += scaling_factor[atom_index]*v
+              prefactor = self.strength*scaling_factor[atom_index]
+            if energy.gradients != NULL:
+              for d in range(3):
+                gradients[atom_index][d] += prefactor*dv[d]
+          else:
+            # pos is relative to the origin of the coarse grid
+            for d in range(3):
+              if (pos[d]<0):
+                gridEnergy += self.k*pos[d]**2/2.
+                if energy.gradients != NULL:
+                  gradients[atom_index][d] += self.strength*self.k*pos[d]
+              elif (pos[d]>hCorner[d]):
+                gridEnergy += self.k*(pos[d]-hCorner[d])**2/2.
+                if energy.gradients != NULL:
+                  gradients[atom_index][d] += \
+                    self.strength*self.k*(pos[d]-hCorner[d])
+
+        energy.energy_terms[self.index] = gridEnergy*self.strength
@@ -0,0 +1,55 @@
+# Access to grid values that are stored in single or double precision.
+#
+# The values of a grid may be stored as float32 to halve the memory
+# and cache footprint of large grids. Each value is converted to
+# double precision as it is read, so interpolation and accumulation
+# of energies and gradients are always done in double precision.
+
+cimport numpy as np
+
+cdef inline double grid_value(char *vals, int single, Py_ssize_t i):
+    if single:
+        return (<float *>vals)[i]
+    return (<double *>vals)[i]
+
+# Index of a grid point in a grid that is stored in C order or,
+# if blocked, in bricks of 4x4x4 cells.
+#
+# In the blocked layout, each brick holds the 5x5x5 points around its
+# cells, so neighboring bricks share a plane of points and the eight
+# corners of every cell are in the brick of its lowest corner.
+# The bricks are in C order and the points within each brick are in
+# C order, so the corners of a cell are at most 25+5+1 values apart.
+# The grid is padded to a whole number of bricks in each dimension.
+# A point on a shared plane is indexed in the brick in which it has
+# the lowest position.
+
+cdef inline Py_ssize_t grid_index(int blocked, np.int_t *counts,
+                                  int ix, int iy, int iz):
+    if blocked:
+        return ((((<Py_ssize_t>(ix>>2)*((counts[1]+3)>>2) + (iy>>2))
+                  *((counts[2]+3)>>2) + (iz>>2))*125)
+                + (ix&3)*25 + (iy&3)*5 + (iz&3))
+    return (<Py_ssize_t>ix*counts[1] + iy)*counts[2] + iz
+
+# Indices of the corners of the cell with its lowest corner at
+# (ix, iy, iz), in the order mmm, mmp, mpm, mpp, pmm, pmp, ppm, ppp.
+
+cdef inline void grid_corners(int blocked, np.int_t *counts,
+                              int ix, int iy, int iz, Py_ssize_t *c):
+    cdef Py_ssize_t i, dx, dy
+    if blocked:
+        dx = 25
+        dy = 5
+    else:
+        dx = <Py_ssize_t>counts[1]*counts[2]
+        dy = counts[2]
+    i = grid_index(blocked, counts, ix, iy, iz)
+    c[0] = i
+    c[1] = i+1
+    c[2] = i+dy
+    c[3] = i+dy+1
+    c[4] = i+dx
+    c[5] = i+dx+1
+    c[6] = i+dx+dy
+    c[7] = i+dx+dy+1
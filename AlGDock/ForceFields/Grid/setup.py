@@ -3,5 +3,6 @@ from Cython.Build import cythonize
 
 setup(
   name = 'Tricubic grid',
-  ext_modules = cythonize("MMTK_Tricubic_grid.pyx"),
+  ext_modules = cythonize(["MMTK_Tricubic_grid.pyx", \
+    "MMTK_Tricubic_transform_grid.pyx"]),
 )
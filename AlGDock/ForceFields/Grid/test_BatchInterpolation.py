@@ -0,0 +1,117 @@
+import AlGDock
+
+from MMTK import *
+import Interpolation
+import BatchInterpolation
+
+import numpy as np
+import time
+
+universe = InfiniteUniverse()
+
+universe.atom1 = Atom('C', position=Vector(1.1, 0.5, 1.5))
+universe.atom1.test_charge = 1.
+universe.atom2 = Atom('C', position=Vector(1.553, 1.724, 1.464))
+universe.atom2.test_charge = -0.2
+
+# Random placements of the two atoms near the center of the grid,
+# including a few that are outside of it
+steps = 2000
+np.random.seed(0)
+confs = np.array([universe.atom1.position(), universe.atom2.position()])
+confs = confs[None,:,:] + np.random.normal(0, 0.3, size=(steps,2,3))
+
+grid_params = [\
+  ('Trilinear', None, {}),
+  ('Trilinear', -2, {}),
+  ('Trilinear', -4, {}),
+  ('BSpline', None, {}),
+  ('BSpline', -3, {}),
+  ('Trilinear', None, {'grid_thresh':10.0})]
+
+for (interpolation_type, inv_power, kwargs) in grid_params:
+  print
+  print '%s interpolation with inv_power of %s'%(interpolation_type, inv_power)
+  print
+
+  FF = Interpolation.InterpolationForceField(\
+    '../../../Example/grids/LJr.nc', name='LJr', \
+    interpolation_type=interpolation_type, strength=1.0, \
+    scaling_property='test_charge', inv_power=inv_power, **kwargs)
+  universe.setForceField(FF)
+
+  start_time = time.time()
+  Es_MMTK = np.zeros(steps)
+  Gs_MMTK = np.zeros((steps,2,3))
+  for n in range(steps):
+    universe.setConfiguration(Configuration(universe, confs[n]))
+    e, g = universe.energyAndGradients()
+    Es_MMTK[n] = e
+    Gs_MMTK[n] = g.array
+  print 'Time to do %d evaluations with MMTK: %f s'%(\
+    steps, time.time()-start_time)
+
+  start_time = time.time()
+  terms = BatchInterpolation.terms_from_force_field(FF, universe)
+  (Es, Gs) = BatchInterpolation.energy_terms(terms, confs, gradients=True)
+  print 'Time to do %d evaluations in a batch: %f s'%(\
+    steps, time.time()-start_time)
+
+  # The MMTK BSpline terms read values from outside of the grid
+  # near its edges, so only placements away from the edges are compared
+  counts = FF.grid_data['counts']
+  spacing = FF.grid_data['spacing']
+  pos = confs - FF.grid_data['origin']
+  compare = ((pos>2*spacing) & (pos<spacing*(counts-3))).all(axis=2).all(axis=1)
+  if interpolation_type=='Trilinear':
+    compare[:] = True
+  print 'Comparing %d placements'%np.sum(compare)
+  print 'Maximum difference in energy: %e'%\
+    np.max(np.abs(Es['LJr'][compare]-Es_MMTK[compare]))
+  print 'Maximum difference in gradient: %e'%\
+    np.max(np.abs(Gs['LJr'][compare]-Gs_MMTK[compare]))
+
+print
+print 'MultiInterpolationForceField'
+print
+
+FFs = [Interpolation.InterpolationForceField(FN, name=name, \
+    interpolation_type='Trilinear', strength=strength, \
+    scaling_property='test_charge', inv_power=inv_power) \
+  for (name, FN, inv_power, strength) in [\
+    ('LJr', '../../../Example/grids/LJr.nc', -2, 0.3),
+    ('LJa', '../../../Example/grids/LJa.nc', None, 0.7)]]
+multiFF = Interpolation.MultiInterpolationForceField(FFs, name='grids')
+universe.setForceField(multiFF)
+
+terms = BatchInterpolation.terms_from_force_field(multiFF, universe)
+Es = BatchInterpolation.energy_terms(terms, confs)
+for n in range(10):
+  universe.setConfiguration(Configuration(universe, confs[n]))
+  Es_MMTK = universe.energyTerms()
+  print 'MMTK: %12.6f %12.6f, batch: %12.6f %12.6f'%(\
+    Es_MMTK['LJr'], Es_MMTK['LJa'], Es['LJr'][n], Es['LJa'][n])
+
+print
+print 'Transform sweep'
+print
+
+inv_powers = [-1., -2., -6., -12.]
+grid_data = Interpolation.load_grid('../../../Example/grids/LJr.nc')
+scaling_factor = BatchInterpolation._scaling_factor(universe, 'test_charge', 1.)
+for interpolation_type in ['Trilinear', 'BSpline']:
+  start_time = time.time()
+  sweep = BatchInterpolation.BatchTransformSweep(grid_data, scaling_factor, \
+    inv_powers, interpolation_type=interpolation_type)
+  Es_sweep = sweep.energies(confs)
+  print 'Time to do %d evaluations with %d transforms: %f s'%(\
+    steps, len(inv_powers), time.time()-start_time)
+  for (p, inv_power) in enumerate(inv_powers):
+    FF = Interpolation.InterpolationForceField(\
+      '../../../Example/grids/LJr.nc', name='LJr', \
+      interpolation_type=interpolation_type, strength=1.0, \
+      scaling_property='test_charge', inv_power=inv_power)
+    terms = BatchInterpolation.terms_from_force_field(FF, universe)
+    Es = BatchInterpolation.energy_terms(terms, confs)
+    print '%s, inv_power of %d, maximum difference in energy: %e'%(\
+      interpolation_type, inv_power, np.max(np.abs(Es['LJr']-Es_sweep[p])))
@@ -0,0 +1,70 @@
+import AlGDock
+
+from MMTK import *
+import Interpolation
+from MMTK.ForceFields.ForceFieldTest import gradientTest
+
+import numpy as np
+import time
+
+universe = InfiniteUniverse()
+
+universe.atom1 = Atom('C', position=Vector(1.1, 0.5, 1.5))
+universe.atom1.test_charge = 1.
+universe.atom2 = Atom('C', position=Vector(1.553, 1.724, 1.464))
+universe.atom2.test_charge = -0.2
+
+grid_params = [\
+  ('LJr', '../../../Example/grids/LJr.nc', -2, -1.0, 0.3),
+  ('LJa', '../../../Example/grids/LJa.nc', None, -1.0, 0.7),
+  ('sLJr', '../../../Example/grids/LJr.nc', None, 10.0, 0.5)]
+
+FFs = [Interpolation.InterpolationForceField(FN, name=name, \
+    interpolation_type='Trilinear', strength=strength, \
+    scaling_property='test_charge', inv_power=inv_power, \
+    grid_thresh=grid_thresh) \
+  for (name, FN, inv_power, grid_thresh, strength) in grid_params]
+multiFF = Interpolation.MultiInterpolationForceField(FFs, name='grids')
+
+separateFF = FFs[0]
+for FF in FFs[1:]:
+  separateFF += FF
+
+steps = 50000
+x = np.linspace(1.35,1.6,steps)
+
+Es = {}
+for (key, FF) in [('separate', separateFF), ('combined', multiFF)]:
+  print
+  print key
+  print
+
+  universe.setForceField(FF)
+  universe.atom1.setPosition(Vector(x[0],0.5,1.5))
+
+  print 'Energy Terms:'
+  print universe.energyTerms()
+  e, g = universe.energyAndGradients()
+  print 'Gradient on Atom 1'
+  print g[universe.atom1]
+  print 'Gradient on Atom 2'
+  print g[universe.atom2]
+
+  print 'Gradient Test'
+  gradientTest(universe)
+
+  start_time = time.time()
+  Es[key] = np.zeros((steps,4))
+  for n in range(steps):
+    universe.atom1.setPosition(Vector(x[n],0.5,1.5))
+    e, g = universe.energyAndGradients()
+    Es[key][n,0] = e
+    Es[key][n,1:] = g[universe.atom1].array
+  print 'Time to do %d energy and gradient evaluations: %f s'%(\
+    steps, time.time()-start_time)
+
+print
+print 'Maximum difference in energy: %e'%\
+  np.max(np.abs(Es['separate'][:,0]-Es['combined'][:,0]))
+print 'Maximum difference in gradient: %e'%\
+  np.max(np.abs(Es['separate'][:,1:]-Es['combined'][:,1:]))
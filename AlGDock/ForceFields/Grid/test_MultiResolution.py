@@ -0,0 +1,94 @@
+import AlGDock
+
+from MMTK import *
+import Interpolation
+from MMTK.ForceFields.ForceFieldTest import gradientTest
+import AlGDock.GridTools
+import AlGDock.IO
+
+import numpy as np
+import os
+
+universe = InfiniteUniverse()
+
+universe.atom1 = Atom('C', position=Vector(1.1, 0.5, 1.5))
+universe.atom1.test_charge = 1.
+universe.atom2 = Atom('C', position=Vector(1.553, 1.724, 1.464))
+universe.atom2.test_charge = -0.2
+
+# A fine patch that is cropped from the coarse grid without resampling
+# should give the same energies as the coarse grid alone.
+# The site is in Angstroms, like the grid files.
+FN = '../../../Example/grids/LJr.nc'
+AlGDock.GridTools.multiresolution(FN, 'coarse.bin', 'fine.bin', \
+  site_center=[13.,10.,15.], site_max_R=3.0)
+(coarse, fine) = [AlGDock.IO.Grid().read(grid_FN) \
+  for grid_FN in ['coarse.bin','fine.bin']]
+print 'Coarse grid has %d points'%len(coarse['vals'])
+print 'Fine patch has %d points, with origin at '%len(fine['vals']), \
+  fine['origin']
+
+steps = 500
+x = np.linspace(1.0,1.6,steps)
+
+Es = {}
+for (key, fine_FN) in [('coarse', None), ('cropped', 'fine.bin')]:
+  print
+  print key
+  print
+
+  FF = Interpolation.InterpolationForceField('coarse.bin', \
+    interpolation_type='Trilinear', strength=1.0, \
+    scaling_property='test_charge', inv_power=-2, fine_FN=fine_FN)
+  universe.setForceField(FF)
+  universe.atom1.setPosition(Vector(x[0],0.5,1.5))
+
+  print 'Energy Terms:'
+  print universe.energyTerms()
+  print 'Gradient Test'
+  gradientTest(universe)
+
+  Es[key] = np.zeros((steps,4))
+  for n in range(steps):
+    universe.atom1.setPosition(Vector(x[n],1.0,1.5))
+    e, g = universe.energyAndGradients()
+    Es[key][n,0] = e
+    Es[key][n,1:] = g[universe.atom1].array
+
+print
+print 'Maximum difference in energy: %e'%\
+  np.max(np.abs(Es['coarse'][:,0]-Es['cropped'][:,0]))
+print 'Maximum difference in gradient: %e'%\
+  np.max(np.abs(Es['coarse'][:,1:]-Es['cropped'][:,1:]))
+
+# A resampled fine patch
+AlGDock.GridTools.multiresolution(FN, 'coarse.bin', 'fine.bin', \
+  site_center=[13.,10.,15.], site_max_R=3.0, fine_spacing=0.15)
+Interpolation.clear_grid_cache()
+FF = Interpolation.InterpolationForceField('coarse.bin', \
+  interpolation_type='Trilinear', strength=1.0, \
+  scaling_property='test_charge', inv_power=-2, fine_FN='fine.bin')
+universe.setForceField(FF)
+universe.atom1.setPosition(Vector(1.3,1.0,1.5))
+print
+print 'resampled'
+print
+print 'Energy Terms:'
+print universe.energyTerms()
+print 'Gradient Test'
+gradientTest(universe)
+
+# The fine patch is blended into the coarse grid near its edges,
+# so the energy is continuous across them
+fine = AlGDock.IO.Grid().read('fine.bin', multiplier=0.1)
+center = fine['origin'] + fine['spacing']*(fine['counts']-1)/2.
+Es_edge = []
+for dx in [-1.0E-7, 1.0E-7]:
+  universe.atom1.setPosition(Vector(fine['origin'][0]+dx, \
+    center[1], center[2]))
+  Es_edge.append(universe.energy())
+print 'Change in energy across the edge of the patch: %e'%\
+  abs(Es_edge[1]-Es_edge[0])
+
+for grid_FN in ['coarse.bin','fine.bin']:
+  os.remove(grid_FN)
@@ -0,0 +1,71 @@
+import AlGDock
+
+from MMTK import *
+import Interpolation
+from MMTK.ForceFields.ForceFieldTest import gradientTest
+
+import numpy as np
+import os, time
+
+universe = InfiniteUniverse()
+
+universe.atom1 = Atom('C', position=Vector(1.1, 0.5, 1.5))
+universe.atom1.test_charge = 1.
+
+FN = '../../../Example/grids/LJr.nc'
+for inv_power in [None, -3]:
+  print
+  print 'Tricubic interpolation with inv_power of %s'%inv_power
+  print
+
+  Interpolation.clear_grid_cache()
+  start_time = time.time()
+  FF = Interpolation.InterpolationForceField(FN, name='LJr', \
+    interpolation_type='Tricubic', strength=1.0, \
+    scaling_property='test_charge', inv_power=inv_power)
+  print 'Time to load the grid and coefficients: %f s'%(\
+    time.time()-start_time)
+  universe.setForceField(FF)
+
+  # Interpolated values at grid points should be the grid values
+  spacing = FF.grid_data['spacing']
+  origin = FF.grid_data['origin']
+  vals = FF.grid_data['vals'].reshape(tuple(FF.grid_data['counts']))
+  base = np.array((np.array([1.1, 0.5, 1.5])-origin)/spacing, dtype=int)
+  max_diff = 0.
+  for offset in [(0,0,0), (1,0,0), (1,1,0), (1,1,1)]:
+    point = tuple(base+offset)
+    universe.atom1.setPosition(Vector(*(origin+spacing*np.array(point))))
+    val = vals[point] if inv_power is None else vals[point]**inv_power
+    max_diff = max(max_diff, abs(universe.energy()-val))
+  print 'Maximum difference from grid points: %e'%max_diff
+
+  # The energy and gradient should be continuous across cell faces
+  face = origin[0]+spacing[0]*(base[0]+1)
+  Es = []
+  for x in [face-1E-7, face+1E-7]:
+    universe.atom1.setPosition(Vector(x, 0.5, 1.5))
+    e, g = universe.energyAndGradients()
+    Es.append(np.concatenate([[e], g[universe.atom1].array]))
+  print 'Difference across a cell face: ', Es[1]-Es[0]
+
+  universe.atom1.setPosition(Vector(1.1, 0.5, 1.5))
+  print 'Energy Terms:'
+  print universe.energyTerms()
+  print 'Gradient Test'
+  gradientTest(universe)
+
+  # The coefficients should be read from the file next to the grid
+  Interpolation.clear_grid_cache()
+  start_time = time.time()
+  FF = Interpolation.InterpolationForceField(FN, name='LJr', \
+    interpolation_type='Tricubic', strength=1.0, \
+    scaling_property='test_charge', inv_power=inv_power)
+  print 'Time to load the grid and cached coefficients: %f s'%(\
+    time.time()-start_time)
+  print 'Coefficients are memory-mapped: ', \
+    isinstance(FF.grid_data['coefficients'], np.memmap)
+
+for cache_FN in os.listdir(os.path.dirname(FN)):
+  if cache_FN.startswith(os.path.basename(FN)+'.tricubic'):
+    os.remove(os.path.join(os.path.dirname(FN), cache_FN))
@@ -0,0 +1,62 @@
+# Evaluation of the tricubic polynomial of a grid cell.
+#
+# Each cell has the 64 coefficients of Lekien and Marsden,
+#   Int. J. Numer. Meth. Engng. 63, 455-471 (2005),
+# with the coefficient of x**i y**j z**k at index i + 4*j + 16*k,
+# where x, y, and z are the fractional positions within the cell.
+# The coefficients are computed by Interpolation.tricubic_coefficients
+# and may be stored in single or double precision (see grid_values.pxi).
+#
+# The coefficients of the cell start at index n, which is 64 times the
+# index of the cell and may exceed the range of an int for large grids.
+# Returns the value of the polynomial and stores its gradient,
+# with respect to the fractional positions, in dv.
+
+cdef inline double tricubic_value(char *coefficients, int single, Py_ssize_t n,
+                                  double x, double y, double z, double *dv):
+    cdef int j, k
+    cdef double a0, a1, a2, a3, s, ds, v, w
+    cdef double yp[4]
+    cdef double dyp[4]
+    cdef double zp[4]
+    cdef double dzp[4]
+
+    yp[0] = 1.
+    yp[1] = y
+    yp[2] = y*y
+    yp[3] = y*y*y
+    dyp[0] = 0.
+    dyp[1] = 1.
+    dyp[2] = 2.*y
+    dyp[3] = 3.*y*y
+
+    zp[0] = 1.
+    zp[1] = z
+    zp[2] = z*z
+    zp[3] = z*z*z
+    dzp[0] = 0.
+    dzp[1] = 1.
+    dzp[2] = 2.*z
+    dzp[3] = 3.*z*z
+
+    v = 0.
+    dv[0] = 0.
+    dv[1] = 0.
+    dv[2] = 0.
+    for k in range(4):
+        for j in range(4):
+            # The cubic polynomial in x
+            a0 = grid_value(coefficients, single, n)
+            a1 = grid_value(coefficients, single, n+1)
+            a2 = grid_value(coefficients, single, n+2)
+            a3 = grid_value(coefficients, single, n+3)
+            n += 4
+            s = a0 + x*(a1 + x*(a2 + x*a3))
+            ds = a1 + x*(2.*a2 + 3.*x*a3)
+
+            w = yp[j]*zp[k]
+            v += w*s
+            dv[0] += w*ds
+            dv[1] += dyp[j]*zp[k]*s
+            dv[2] += yp[j]*dzp[k]*s
+    return v
@@ -58,6 +58,15 @@ class SphereForceField(ForceField):
         # that handles energy calculations.
         return [SphereTerm(universe, self.center, self.max_R, self.name)]
   
+    def centerOfMassEnergies(self, com):
+      """
+      Returns the energies, as in SphereTerm, of configurations
+      with centers of mass in the array com, with shape (M,3)
+      """
+      r = N.sqrt(N.sum((N.asarray(com) - self.center)**2, axis=1))
+      overMax = N.maximum(r - self.max_R, 0.)
+      return 10000.*overMax*overMax/2. # k in kJ/mol nm**2
+
     def randomPoint(self):
       """
       Returns a random point within the sphere
@@ -67,13 +76,21 @@ class SphereForceField(ForceField):
               y*self.max_R + self.center[1],
               z*self.max_R + self.center[2])
 
+    def randomPoints(self, n):
+      """
+      Returns n points within the sphere, as an array with shape (n,3),
+      from a quasi-random sequence that fills the sphere evenly
+      """
+      from AlGDock.QuasiRandom import ball_points
+      return ball_points(n)*self.max_R + self.center
+
     def _randomPointInSphere(self):
       """
-      Returns a random point within a unit circle
+      Returns a random point within a unit sphere
       """
       r2 = 2
       while r2 > 1:
-        (x,y,z) = N.random.uniform(size=3)
+        (x,y,z) = N.random.uniform(-1., 1., size=3)
         r2 = x*x + y*y + z*z
       return (x,y,z)
 
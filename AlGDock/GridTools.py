@@ -0,0 +1,183 @@
+# site_box, crop, resample, convert, and multiresolution grids
+
+"""
+Tools to shrink grids to the binding site, change their spacing,
+convert between dx, netcdf, and binary formats, and split grids into
+a fine patch around the binding site and a coarse parent grid.
+
+Grids are dictionaries in the format of AlGDock.IO.Grid, with positions
+in the units of the grid file (Angstroms). Values are sliced from the
+grid in memory, which is memory-mapped when the grid is read from its
+binary cache, so only the cropped or resampled values are copied.
+"""
+
+import numpy as np
+
+def site_box(site_center, site_max_R, margin=0.0):
+  """
+  Returns the lower and upper corners of a box that contains
+  a spherical binding site with a margin.
+  All arguments and the corners are in the same units.
+  """
+  site_center = np.array(site_center, dtype=float)
+  half_width = site_max_R + margin
+  return (site_center - half_width, site_center + half_width)
+
+def crop(data, lower, upper):
+  """
+  Returns a grid with the points of data that are needed to interpolate
+  within the box between the lower and upper corners.
+
+  The points are not moved, so the origin of the cropped grid is
+  the first grid point at or below the lower corner.
+  """
+  counts = np.array(data['counts'], dtype=int)
+  lower_i = np.floor((np.array(lower) - data['origin'])/data['spacing'])
+  upper_i = np.ceil((np.array(upper) - data['origin'])/data['spacing'])
+  lower_i = np.clip(lower_i.astype(int), 0, counts-1)
+  upper_i = np.clip(upper_i.astype(int), 0, counts-1)
+  if (upper_i<=lower_i).any():
+    raise Exception('The box does not overlap the grid')
+
+  vals = np.asarray(data['vals']).reshape(tuple(counts))
+  vals = vals[lower_i[0]:upper_i[0]+1, \
+              lower_i[1]:upper_i[1]+1, \
+              lower_i[2]:upper_i[2]+1]
+  return {'origin':data['origin'] + lower_i*data['spacing'], \
+    'spacing':np.array(data['spacing']), \
+    'counts':np.array(vals.shape), \
+    'vals':np.ascontiguousarray(vals, dtype=float).reshape(-1)}
+
+def _linear_weights(n, spacing, x):
+  """
+  Returns the index of the lower grid point and the fraction
+  towards the next point for the positions x,
+  relative to the origin, on an axis with n points
+  """
+  t = x/spacing
+  i = np.clip(np.floor(t).astype(int), 0, n-2)
+  return (i, t - i)
+
+def resample(data, spacing, slab_size=16):
+  """
+  Returns a grid covering the same box as data with a new spacing.
+  Values at the new points are trilinearly interpolated.
+
+  The new grid is computed in slabs along the first axis,
+  which only require slabs of the original grid.
+  """
+  spacing = np.array(spacing, dtype=float)*np.ones(3)
+  counts_o = np.array(data['counts'], dtype=int)
+  length = (counts_o-1)*data['spacing']
+  counts = np.floor(length/spacing + 1E-8).astype(int) + 1
+
+  weights = [_linear_weights(counts_o[d], data['spacing'][d], \
+    np.arange(counts[d])*spacing[d]) for d in range(3)]
+  vals_o = np.asarray(data['vals']).reshape(tuple(counts_o))
+  vals = np.empty(tuple(counts), dtype=float)
+  for start in range(0, counts[0], slab_size):
+    (i, f) = [w[start:start+slab_size] for w in weights[0]]
+    # Slab of the original grid needed for this slab of the new grid
+    slab_o = np.asarray(vals_o[i[0]:i[-1]+2], dtype=float)
+    i = i - i[0]
+    slab = slab_o[i]*(1-f)[:,None,None] + slab_o[i+1]*f[:,None,None]
+    (j, g) = weights[1]
+    slab = slab[:,j,:]*(1-g)[None,:,None] + slab[:,j+1,:]*g[None,:,None]
+    (k, h) = weights[2]
+    slab = slab[:,:,k]*(1-h)[None,None,:] + slab[:,:,k+1]*h[None,None,:]
+    vals[start:start+slab_size] = slab
+  return {'origin':np.array(data['origin']), 'spacing':spacing, \
+    'counts':counts, 'vals':vals.reshape(-1)}
+
+def convert(in_FN, out_FN, site_center=None, site_max_R=None, margin=0.0, \
+    spacing=None):
+  """
+  Reads a grid, optionally crops it to the binding site and
+  resamples it, and writes it in the format given by the extension
+  of out_FN ('.dx', '.dx.gz', '.nc', or '.bin').
+
+  @site_center, site_max_R, margin, spacing: in the units of the grid file.
+  """
+  import AlGDock.IO
+  IO_Grid = AlGDock.IO.Grid()
+  data = IO_Grid.read(in_FN)
+  if site_center is not None:
+    if site_max_R is None:
+      raise Exception('The binding site radius is needed to crop a grid')
+    data = crop(data, *site_box(site_center, site_max_R, margin))
+  if spacing is not None:
+    data = resample(data, spacing)
+  IO_Grid.write(out_FN, data)
+  return data
+
+def multiresolution(in_FN, coarse_FN, fine_FN, site_center, site_max_R, \
+    margin=0.0, fine_spacing=None, coarse_spacing=None):
+  """
+  Reads a grid and writes a coarse grid covering the same box and
+  a fine patch covering the binding site, which may be used together
+  through the fine_FN argument of InterpolationForceField.
+
+  @site_center, site_max_R, margin: define the box of the fine patch.
+  @fine_spacing: the spacing of the fine patch.
+    By default, it is the spacing of the input grid.
+  @coarse_spacing: the spacing of the coarse grid.
+    By default, it is the spacing of the input grid.
+  All lengths are in the units of the grid file.
+  """
+  import AlGDock.IO
+  IO_Grid = AlGDock.IO.Grid()
+  data = IO_Grid.read(in_FN)
+
+  fine = crop(data, *site_box(site_center, site_max_R, margin))
+  if fine_spacing is not None:
+    fine = resample(fine, fine_spacing)
+  IO_Grid.write(fine_FN, fine)
+
+  coarse = data if coarse_spacing is None else resample(data, coarse_spacing)
+  IO_Grid.write(coarse_FN, coarse)
+  return (coarse, fine)
+
+if __name__ == '__main__':
+  import argparse
+  from MMTK.Units import Ang
+  parser = argparse.ArgumentParser(\
+    description='Crop, resample, and convert grids. ' + \
+      'Lengths are in nm, like the arguments of AlGDock.')
+  parser.add_argument('in_FN', help='Input grid (dx, dx.gz, nc, or bin)')
+  parser.add_argument('out_FN', help='Output grid (dx, dx.gz, nc, or bin)')
+  parser.add_argument('--site_center', nargs=3, type=float, \
+    help='Position of binding site center')
+  parser.add_argument('--site_max_R', type=float, \
+    help='Maximum radial position for a spherical binding site')
+  parser.add_argument('--margin', type=float, default=0.0, \
+    help='Distance beyond the binding site that is kept')
+  parser.add_argument('--spacing', nargs='+', type=float, \
+    help='New grid spacing, either one value or one per dimension')
+  parser.add_argument('--fine_FN', \
+    help='Output for a fine patch around the binding site. ' + \
+      'If it is given, out_FN is the coarse grid for the whole box.')
+  parser.add_argument('--fine_spacing', nargs='+', type=float, \
+    help='Spacing of the fine patch, either one value or one per dimension')
+  args = parser.parse_args()
+
+  site_center = None if args.site_center is None \
+    else np.array(args.site_center)/Ang
+  site_max_R = None if args.site_max_R is None else args.site_max_R/Ang
+  spacing = None if args.spacing is None else np.array(args.spacing)/Ang
+
+  if args.fine_FN is not None:
+    if (site_center is None) or (site_max_R is None):
+      raise Exception('The binding site is needed for a fine patch')
+    (data, fine) = multiresolution(args.in_FN, args.out_FN, args.fine_FN, \
+      site_center, site_max_R, margin=args.margin/Ang, \
+      fine_spacing=None if args.fine_spacing is None \
+        else np.array(args.fine_spacing)/Ang, \
+      coarse_spacing=spacing)
+    print 'Wrote %s with %d x %d x %d points'%(\
+      (args.fine_FN,) + tuple(fine['counts']))
+  else:
+    data = convert(args.in_FN, args.out_FN, \
+      site_center=site_center, site_max_R=site_max_R, \
+      margin=args.margin/Ang, spacing=spacing)
+  print 'Wrote %s with %d x %d x %d points'%(\
+    (args.out_FN,) + tuple(data['counts']))
@@ -11,23 +11,52 @@ class Grid:
   counts - the number of points in each dimension.
   vals - the values.
   All are numpy arrays.
+
+  In the binary format, a header with the origin, spacing, counts,
+  and the modification time and size of the source file
+  is followed by the values as contiguous doubles.
+  The values are memory-mapped, so processes on a node
+  that read the same file share its pages.
   """
+  bin_magic = 'AlGDock grid'
+  # Number of bytes of text that are parsed at once in dx files
+  dx_chunk_size = 2**22
+  # Number of lines that are formatted at once in dx files
+  dx_chunk_lines = 2**16
+  # Keywords that may follow the data block in dx files
+  dx_keywords = ['attribute','object','component']
+  bin_header = np.dtype([('magic','S16'), \
+    ('origin','<f8',3), ('spacing','<f8',3), ('counts','<i8',3), \
+    ('source_mtime','<f8'), ('source_size','<i8')])
+
   def __init__(self):
     pass
 
-  def read(self, FN, multiplier=None):
+  def read(self, FN, multiplier=None, cache=False):
     """
-    Reads a grid in dx or netcdf format
+    Reads a grid in dx, netcdf, or binary format
     The multiplier affects the origin and spacing.
+
+    If cache is True, a grid in dx or netcdf format is stored in
+    binary format, in FN+'.bin', the first time it is read. If the
+    source file has not been modified, the binary file is read instead.
+    If the binary file cannot be written, the grid is read as usual.
     """
     if FN is None:
       raise Exception('File is not defined')
+    elif FN.endswith('.bin'):
+      data = self._read_bin(FN)
+    elif cache and self._cache_is_current(FN):
+      data = self._read_bin(FN+'.bin')
     elif FN.endswith('.dx') or FN.endswith('.dx.gz'):
       data = self._read_dx(FN)
     elif FN.endswith('.nc'):
       data = self._read_nc(FN)
     else:
       raise Exception('File type not supported')
+    if cache and not FN.endswith('.bin') and \
+        not isinstance(data['vals'], np.memmap):
+      data = self._write_cache(FN, data)
     if multiplier is not None:
       data['origin'] = multiplier*data['origin']
       data['spacing'] = multiplier*data['spacing']
@@ -64,15 +93,32 @@ class Grid:
     if not (header['d0'][0]>0 and header['d1'][1]>0 and header['d2'][2]>0):
       raise Exception('Trilinear grid must have positive coordinates')
 
-    # Read the data
+    # Read the data, parsing chunks of complete lines
     vals = np.ndarray(shape=header['npts'], dtype=float)
     index = 0
+    remainder = ''
     while index<header['npts']:
-      line = F.readline()[:-1]
-      items = [float(item) for item in line.split()]
+      chunk = F.read(self.dx_chunk_size)
+      if chunk=='':
+        text = remainder
+        remainder = ''
+      else:
+        text = remainder + chunk
+        last_line = text.rfind('\n')+1
+        (text, remainder) = (text[:last_line], text[last_line:])
+      # The data block is followed by keywords
+      ends = [text.find(keyword) for keyword in self.dx_keywords]
+      end = min([e for e in ends if e>-1] + [len(text)])
+      items = np.fromstring(text[:end], dtype=float, sep=' ')
+      if index+len(items)>header['npts']:
+        raise Exception('%s has more than %d values'%(FN, header['npts']))
       vals[index:index+len(items)] = items
       index = index + len(items)
+      if (chunk=='') or (end<len(text)):
+        break
     F.close()
+    if index<header['npts']:
+      raise Exception('%s has %d of %d values'%(FN, index, header['npts']))
 
     data = {
       'origin':np.array(header['origin']), \
@@ -93,9 +139,62 @@ class Grid:
     grid_nc.close()
     return data
 
+  def _read_bin(self, FN):
+    """
+    Reads a grid in binary format, memory-mapping the values read-only
+    """
+    header = np.fromfile(FN, dtype=self.bin_header, count=1)[0]
+    if header['magic']!=self.bin_magic:
+      raise Exception('%s is not a binary grid'%FN)
+    counts = np.array(header['counts'], dtype=int)
+    return {'origin':np.array(header['origin']), \
+      'spacing':np.array(header['spacing']), 'counts':counts, \
+      'vals':np.memmap(FN, dtype='<f8', mode='r', \
+        offset=self.bin_header.itemsize, shape=(int(np.prod(counts)),))}
+
+  def _cache_is_current(self, FN):
+    """
+    Checks whether the binary cache of a grid file exists and
+    is from the current version of the source file
+    """
+    cache_FN = FN+'.bin'
+    if not (os.path.isfile(FN) and os.path.isfile(cache_FN)):
+      return False
+    try:
+      header = np.fromfile(cache_FN, dtype=self.bin_header, count=1)
+    except (IOError, ValueError):
+      return False
+    if len(header)==0:
+      return False
+    header = header[0]
+    return (header['magic']==self.bin_magic) and \
+      (header['source_mtime']==os.path.getmtime(FN)) and \
+      (header['source_size']==os.path.getsize(FN)) and \
+      (os.path.getsize(cache_FN)==self.bin_header.itemsize + \
+        8*int(np.prod(header['counts'])))
+
+  def _write_cache(self, FN, data):
+    """
+    Stores a grid in binary format in FN+'.bin'
+    and returns the grid with memory-mapped values.
+    If the cache cannot be written, data is returned.
+    """
+    cache_FN = FN+'.bin'
+    # Write to a temporary file and rename it, so other processes
+    # never read a partially written cache
+    tmp_FN = '%s.%d.tmp'%(cache_FN, os.getpid())
+    try:
+      self._write_bin(tmp_FN, data, source_FN=FN)
+      os.rename(tmp_FN, cache_FN)
+    except (IOError, OSError):
+      if os.path.isfile(tmp_FN):
+        os.remove(tmp_FN)
+      return data
+    return self._read_bin(cache_FN)
+
   def write(self, FN, data, multiplier=None):
     """
-    Writes a grid in dx or netcdf format.
+    Writes a grid in dx, netcdf, or binary format.
     The multiplier affects the origin and spacing.
 
     """
@@ -110,6 +209,8 @@ class Grid:
       self._write_nc(FN, data_n)
     elif FN.endswith('.dx') or FN.endswith('.dx.gz'):
       self._write_dx(FN, data_n)
+    elif FN.endswith('.bin'):
+      self._write_bin(FN, data_n)
     else:
       raise Exception('File type not supported')
   
@@ -133,8 +234,14 @@ object 2 class gridconnections counts {0[0]} {0[1]} {0[2]}
 object 3 class array type double rank 0 items {3} data follows
 """.format(data['counts'],data['origin'],data['spacing'],n_points))
     
-    for start_n in range(0,len(data['vals']),3):
-      F.write(' '.join(['%6e'%c for c in data['vals'][start_n:start_n+3]]) + '\n')
+    # Format complete lines of three values in chunks
+    vals = np.asarray(data['vals'], dtype=float)
+    n_full = 3*(len(vals)//3)
+    for start_n in range(0,n_full,3*self.dx_chunk_lines):
+      chunk = vals[start_n:min(start_n+3*self.dx_chunk_lines,n_full)]
+      F.write(('%6e %6e %6e\n'*(len(chunk)//3))%tuple(chunk))
+    if n_full<len(vals):
+      F.write(' '.join(['%6e'%c for c in vals[n_full:]]) + '\n')
 
     F.write('object 4 class field\n')
     F.write('component "positions" value 1\n')
@@ -160,6 +267,24 @@ object 3 class array type double rank 0 items {3} data follows
       grid_nc.variables[key][:] = data[key]
     grid_nc.close()
 
+  def _write_bin(self, FN, data, source_FN=None):
+    """
+    Writes a grid in binary format.
+    If source_FN is given, its modification time and size are stored.
+    """
+    header = np.zeros(1, dtype=self.bin_header)
+    header['magic'] = self.bin_magic
+    header['origin'] = data['origin']
+    header['spacing'] = data['spacing']
+    header['counts'] = data['counts']
+    if source_FN is not None:
+      header['source_mtime'] = os.path.getmtime(source_FN)
+      header['source_size'] = os.path.getsize(source_FN)
+    F = open(FN,'wb')
+    header.tofile(F)
+    np.asarray(data['vals'], dtype='<f8').tofile(F)
+    F.close()
+
   def truncate(self, in_FN, out_FN, counts, multiplier=None):
     """
     Truncates the grid at the origin and 
@@ -168,30 +293,20 @@ object 3 class array type double rank 0 items {3} data follows
     multiplier is for the values, not the grid scaling
     """
     data_o = self.read(in_FN)
-    nyz_o = data_o['counts'][1]*data_o['counts'][2]
-    nz_o = data_o['counts'][2]
-    
-    min_i = int(-data_o['origin'][0]/data_o['spacing'][0])
-    min_j = int(-data_o['origin'][1]/data_o['spacing'][1])
-    min_k = int(-data_o['origin'][2]/data_o['spacing'][2])
-
-#    vals = np.ndarray(shape=tuple(counts), dtype=float)
-#    for i in range(counts[0]):
-#      for j in range(counts[1]):
-#        for k in range(counts[2]):
-#          vals[i,j,k] = data_o['vals'][(i+min_i)*nyz_o + (j+min_j)*nz_o + (k+min_k)]
-
-    vals = np.array(
-      [[[data_o['vals'][(i+min_i)*nyz_o + (j+min_j)*nz_o + (k+min_k)]
-        for k in range(counts[2])]
-          for j in range(counts[1])]
-            for i in range(counts[0])])
+    min_i = [int(-data_o['origin'][d]/data_o['spacing'][d]) for d in range(3)]
+    vals = np.asarray(data_o['vals']).reshape(tuple(data_o['counts']))
+    vals = vals[min_i[0]:min_i[0]+counts[0], \
+                min_i[1]:min_i[1]+counts[1], \
+                min_i[2]:min_i[2]+counts[2]]
+    if vals.shape!=tuple(counts):
+      raise Exception('The truncated grid is outside of %s'%in_FN)
 
     if multiplier is not None:
       vals = vals*multiplier
     
     data_n = {'origin':np.array([0., 0., 0.]), \
-      'counts':counts, 'spacing':data_o['spacing'], 'vals':vals.flatten()}
+      'counts':np.array(counts), 'spacing':data_o['spacing'], \
+      'vals':np.ascontiguousarray(vals, dtype=float).reshape(-1)}
     self.write(out_FN,data_n)
 
 class crd:
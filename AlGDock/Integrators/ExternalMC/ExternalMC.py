@@ -6,31 +6,15 @@ import numpy as np
 
 import random
 
+from AlGDock.QuasiRandom import rotation_matrices
+
 R = 8.3144621*Units.J/Units.mol/Units.K
 
 def random_rotate():
   """
   Return a random rotation matrix
   """
-  u = np.random.uniform(size=3)
-
-  # Random quaternion
-  q = np.array([np.sqrt(1-u[0])*np.sin(2*np.pi*u[1]),
-               np.sqrt(1-u[0])*np.cos(2*np.pi*u[1]),
-               np.sqrt(u[0])*np.sin(2*np.pi*u[2]),
-               np.sqrt(u[0])*np.cos(2*np.pi*u[2])])
-  
-  # Convert the quaternion into a rotation matrix 
-  rotMat = np.array([[q[0]*q[0] + q[1]*q[1] - q[2]*q[2] - q[3]*q[3],
-                     2*q[1]*q[2] - 2*q[0]*q[3],
-                     2*q[1]*q[3] + 2*q[0]*q[2]],
-                    [2*q[1]*q[2] + 2*q[0]*q[3],
-                     q[0]*q[0] - q[1]*q[1] + q[2]*q[2] - q[3]*q[3],
-                     2*q[2]*q[3] - 2*q[0]*q[1]],
-                    [2*q[1]*q[3] - 2*q[0]*q[2],
-                     2*q[2]*q[3] + 2*q[0]*q[1],
-                     q[0]*q[0] - q[1]*q[1] - q[2]*q[2] + q[3]*q[3]]])
-  return rotMat
+  return rotation_matrices(np.random.uniform(size=(1,3)))[0]
 
 #
 # External Monte Carlo move integrator
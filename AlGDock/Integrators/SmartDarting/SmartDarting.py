@@ -11,10 +11,12 @@ twoPi = 2*np.pi
 # Smart Darting integrator
 #
 class SmartDartingIntegrator(Dynamics.Integrator):
-  def __init__(self, universe, molecule, extended, confs=None, **options):
+  def __init__(self, universe, molecule, extended, confs=None, cores=1, \
+      **options):
     """
     confs - configurations to dart to
     extended - whether or not to use external coordinates
+    cores - the number of processes that minimize configurations
     """
     Dynamics.Integrator.__init__(self, universe, options)
     # Supported features: none for the moment, to keep it simple
@@ -22,6 +24,7 @@ class SmartDartingIntegrator(Dynamics.Integrator):
 
     self.molecule = molecule
     self.extended = extended
+    self.cores = cores
     
     # Converter between Cartesian and BAT coordinates
     import AlGDock.RigidBodies
@@ -35,6 +38,10 @@ class SmartDartingIntegrator(Dynamics.Integrator):
     self._BAT_to_perturb = range(6) if extended else []
     self._BAT_to_perturb += self._BAT_util.getFirstTorsionInds(extended)
 
+    # Energies of the targets, which are only known if set by set_confs,
+    # and the key of the evaluator with which they were computed
+    self.energies = None
+    self.evaluator_key = None
     if confs is None:
       self.confs = None
     else:
@@ -42,116 +49,104 @@ class SmartDartingIntegrator(Dynamics.Integrator):
 
   def set_confs(self, confs, rmsd_threshold=0.05, period_frac_threshold=0.35, \
       append=False):
-
+    """
+    Minimizes confs and keeps unique, low-energy configurations
+    as smart darting targets.
+    If append is True, confs are added to the current targets, which
+    are not minimized again if the evaluator has not changed
+    since the targets were set.
+    """
     import time
     start_time = time.time()
 
     nconfs_attempted = len(confs)
-    if append and (self.confs is not None):
-      nconfs_o = len(self.confs)
+    evaluator_key = getattr(\
+      self.universe._evaluator.get((None,None,None)), 'key', None)
+    append = append and (self.confs is not None) and len(self.confs)>0
+    if append and ((self.energies is None) or \
+        (len(self.confs)!=len(self.energies)) or \
+        (evaluator_key is None) or (evaluator_key!=self.evaluator_key)):
+      # The targets were set outside of set_confs or with another
+      # energy function, so minimize all of them
       confs = confs + self.confs
-    else:
-      nconfs_o = 0
+      append = False
 
     # Minimize configurations
-    from MMTK.Minimization import SteepestDescentMinimizer # @UnresolvedImport
-    minimizer = SteepestDescentMinimizer(self.universe)
-
-    minimized_confs = []
-    minimized_energies = []
-    for conf in confs:
-      self.universe.setConfiguration(Configuration(self.universe, conf))
-      x_o = np.copy(self.universe.configuration().array)
-      e_o = self.universe.energy()
-      for rep in range(50):
-        minimizer(steps = 25)
-        x_n = np.copy(self.universe.configuration().array)
-        e_n = self.universe.energy()
-        diff = abs(e_o-e_n)
-        if np.isnan(e_n) or diff<0.05 or diff>1000.:
-          self.universe.setConfiguration(Configuration(self.universe, x_o))
-          break
-        else:
-          x_o = x_n
-          e_o = e_n
-      if not np.isnan(e_o):
-        minimized_confs.append(x_o)
-        minimized_energies.append(e_o)
-    confs = minimized_confs
-    energies = minimized_energies
-    
-    # Sort by increasing energy
-    energies, confs = (list(l) \
-      for l in zip(*sorted(zip(energies, confs), key=lambda p:p[0])))
+    from AlGDock import Minimization
+    (confs, energies) = Minimization.energies(self.universe, confs, \
+      minimize_confs=True, cores=self.cores)
+    inds = [n for n in range(len(confs)) if not np.isnan(energies[n])]
+    confs = [confs[n] for n in inds]
+    energies = np.array(energies)[inds]
+    confs_BAT = np.array([self._BAT_util.BAT(conf, extended=self.extended) \
+      for conf in confs])
+
+    if append:
+      confs = confs + self.confs
+      energies = np.concatenate((energies, self.energies))
+      if len(confs_BAT)==0:
+        confs_BAT = self.confs_BAT
+      else:
+        confs_BAT = np.concatenate((confs_BAT, self.confs_BAT))
 
+    # Sort by increasing energy
+    order = np.argsort(energies, kind='mergesort')
     # Only keep configurations with energy with 12 kJ/mol of the lowest energy
-    confs = [confs[i] for i in range(len(confs)) \
-      if (energies[i]-energies[0])<12.]
-    energies = energies[:len(confs)]
-
+    order = order[(energies[order]-energies[order[0]])<12.]
+    confs = [confs[i] for i in order]
+    energies = energies[order]
+    confs_BAT = confs_BAT[order]
+    confs_BAT_tp = confs_BAT[:,self._BAT_to_perturb]
+    confs_ha = np.array([conf[self.molecule.heavy_atoms,:] for conf in confs])
+    K = len(confs)
+
+    # Pairwise distances between configurations
     if self.extended:
-      # Keep only unique configurations, using rmsd as a threshold
-      inds_to_keep = [0]
-      for j in range(1,len(confs)):
-        min_rmsd = np.min([np.sqrt(np.sum(np.square(\
-          confs[j][self.molecule.heavy_atoms,:] - \
-          confs[k][self.molecule.heavy_atoms,:]))/self.molecule.nhatoms) \
-          for k in inds_to_keep])
-        if min_rmsd>rmsd_threshold:
-          inds_to_keep.append(j)
-      confs = [confs[i] for i in inds_to_keep]
-      energies = [energies[i] for i in inds_to_keep]
-
-    confs_BAT = [self._BAT_util.BAT(confs[n], extended=self.extended) \
-      for n in range(len(confs))]
-    confs_BAT_tp = [confs_BAT[c][self._BAT_to_perturb] \
-      for c in range(len(confs_BAT))]
-
-    if not self.extended:
-      # Keep only unique configurations based on period fraction threshold
-      inds_to_keep = [0]
-      for j in range(1,len(confs)):
-        period_fracs = np.array([np.abs(confs_BAT_tp[j] - confs_BAT_tp[k]) \
-          for k in inds_to_keep])/twoPi
-        period_fracs = np.min([period_fracs,1-period_fracs],0)
-        if (np.max(period_fracs,1)>period_frac_threshold).all():
-          inds_to_keep.append(j)
-      confs = [confs[i] for i in inds_to_keep]
-      confs_BAT = [confs_BAT[i] for i in inds_to_keep]
-      confs_BAT_tp = [confs_BAT_tp[i] for i in inds_to_keep]
-      energies = [energies[i] for i in inds_to_keep]
-
-    confs_ha = [confs[c][self.molecule.heavy_atoms,:] \
-      for c in range(len(confs))]
+      # Sum of square distances between heavy atom coordinates
+      x = confs_ha.reshape((K,-1))
+      sq = np.sum(x*x,1)
+      ssd = np.maximum(sq[:,None] + sq[None,:] - 2.*np.dot(x, x.T), 0.)
+      distinct = np.sqrt(ssd/self.molecule.nhatoms)>rmsd_threshold
+    else:
+      # Differences in torsion angles in units of periods, between 0 and 1
+      period_fracs = np.abs(confs_BAT_tp[None,:,:] - \
+        confs_BAT_tp[:,None,:])/twoPi
+      period_fracs = np.minimum(period_fracs, 1-period_fracs)
+      distinct = np.max(period_fracs,2)>period_frac_threshold
+
+    # Keep only unique configurations, in order of increasing energy
+    keep = np.zeros(K, dtype=bool)
+    keep[0] = True
+    for j in range(1,K):
+      keep[j] = distinct[j,:j][keep[:j]].all()
+    inds_to_keep = np.nonzero(keep)[0]
+    confs = [confs[i] for i in inds_to_keep]
+    energies = energies[inds_to_keep]
+    confs_BAT = confs_BAT[inds_to_keep]
+    confs_BAT_tp = confs_BAT_tp[inds_to_keep]
+    confs_ha = confs_ha[inds_to_keep]
 
     if len(confs)>1:
       # Probabilty of jumping to a conformation k
       # is proportional to exp(-E/(R*600.)).
-      logweight = np.array(energies)/(R*600.)
+      logweight = energies/(R*600.)
       weights = np.exp(-logweight+min(logweight))
       self.weights = weights/sum(weights)
 
-      # self.darts[j][k] will jump from conformation j to conformation k
-      self.darts = [[confs_BAT[j][self._BAT_to_perturb] - \
-        confs_BAT[k][self._BAT_to_perturb] \
-        for j in range(len(confs))] for k in range(len(confs))]
+      # self.darts[j,k] will jump from conformation j to conformation k
+      self.darts = confs_BAT_tp[None,:,:] - confs_BAT_tp[:,None,:]
 
       # Finds the minimum distance between target conformations.
       # This is the maximum allowed distance to permit a dart.
+      upper = np.triu_indices(len(confs),1)
       if self.extended:
-        ssd = np.concatenate([[np.sum(np.square(confs_ha[j] - confs_ha[k]))
-                for j in range(k+1,len(confs))] \
-                  for k in range(len(confs))])
+        ssd = ssd[np.ix_(inds_to_keep, inds_to_keep)][upper]
         # Uses the minimum distance or rmsd of 0.25 A
         self.epsilon = min(np.min(ssd)*3/4., confs_ha[0].shape[0]*0.025*0.025)
       else:
-        period_fracs = [[np.abs(self.darts[j][k])/twoPi \
-          for j in range(len(confs))] for k in range(len(confs))]
-        period_fracs = [[np.min([period_fracs[j][k], 1-period_fracs[j][k]],0) \
-          for j in range(len(confs))] for k in range(len(confs))]
-        spf = np.concatenate([[\
-          np.sum(period_fracs[j][k]) \
-          for j in range(k+1,len(confs))] for k in range(len(confs))])
+        period_fracs = np.abs(self.darts)/twoPi
+        period_fracs = np.minimum(period_fracs, 1-period_fracs)
+        spf = np.sum(period_fracs,2)[upper]
         self.epsilon = np.min(spf)*3/4.
     else:
       self.epsilon = 0.
@@ -160,6 +155,8 @@ class SmartDartingIntegrator(Dynamics.Integrator):
     self.universe.setConfiguration(Configuration(self.universe,np.copy(confs[0])))
 
     self.confs = confs
+    self.energies = energies
+    self.evaluator_key = evaluator_key
     self.confs_ha = confs_ha
     self.confs_BAT = confs_BAT
     self.confs_BAT_tp = confs_BAT_tp
@@ -190,18 +187,16 @@ class SmartDartingIntegrator(Dynamics.Integrator):
 
   def _closest_pose_Cartesian(self, conf_ha):
     # Closest pose has smallest sum of square distances between heavy atom coordinates
-    ssd = np.array([(np.square(self.confs_ha[c] - conf_ha)).sum() \
-      for c in range(len(self.confs_ha))])
+    ssd = np.sum(np.square(self.confs_ha - conf_ha),(1,2))
     closest_pose_index = np.argmin(ssd)
     return (closest_pose_index, ssd[closest_pose_index])
 
   def _closest_pose_BAT(self, conf_BAT_tp):
     # Closest pose has smallest sum of period fractions between torsion angles
     # For only torsion angles, differences in units of periods (between 0 and 1)
-    period_fracs = (np.abs(np.array([self.confs_BAT_tp[c] - conf_BAT_tp \
-      for c in range(len(self.confs_BAT_tp))]))%twoPi)/twoPi
+    period_fracs = (np.abs(self.confs_BAT_tp - conf_BAT_tp)%twoPi)/twoPi
     # Wraps around the period
-    period_fracs = np.min([period_fracs,1-period_fracs],0)
+    period_fracs = np.minimum(period_fracs,1-period_fracs)
     spf = np.sum(period_fracs,1)
     closest_pose_index = np.argmin(spf)
     return (closest_pose_index, spf[closest_pose_index])
@@ -256,7 +251,7 @@ class SmartDartingIntegrator(Dynamics.Integrator):
         dart_towards = np.random.choice(len(self.weights), p=self.weights)
       # Generate a trial move
       xn_BAT = np.copy(xo_BAT)
-      xn_BAT[self._BAT_to_perturb] = xo_BAT[self._BAT_to_perturb] + self.darts[closest_pose_o][dart_towards]
+      xn_BAT[self._BAT_to_perturb] = xo_BAT[self._BAT_to_perturb] + self.darts[closest_pose_o,dart_towards]
 
       # Check that the trial move is closest to dart_towards
       if self.extended:
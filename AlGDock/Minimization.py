@@ -0,0 +1,87 @@
+# Energy minimization of many configurations
+
+"""
+Minimizes configurations of a universe, or evaluates their energies,
+with the force field that is set in the universe.
+
+With more than one core, the configurations are spread over a pool of
+worker processes. The workers are forked with a copy of the universe
+and its evaluator, so only the configurations and results
+pass through the queues. Results are returned in the original order.
+"""
+
+import multiprocessing
+import numpy as np
+
+from AlGDock.WorkerPool import WorkerPool
+
+# Rounds of steepest descent steps, which stop when the energy
+# changes by less than min_diff or more than max_diff
+default_settings = {'minimizer':'SteepestDescent', \
+  'rounds':50, 'steps':25, 'min_diff':0.05, 'max_diff':1000.}
+
+def minimize(universe, conf, minimizer=None, settings=default_settings):
+  """
+  Minimizes a configuration, returning the minimized configuration
+  and its energy. The energy is nan if minimization failed.
+  """
+  from MMTK import Configuration
+  if minimizer is None:
+    from MMTK.Minimization import SteepestDescentMinimizer # @UnresolvedImport
+    minimizer = SteepestDescentMinimizer(universe)
+  universe.setConfiguration(Configuration(universe, conf))
+  x_o = np.copy(universe.configuration().array)
+  e_o = universe.energy()
+  for rep in range(settings['rounds']):
+    minimizer(steps = settings['steps'])
+    x_n = np.copy(universe.configuration().array)
+    e_n = universe.energy()
+    diff = abs(e_o-e_n)
+    if np.isnan(e_n) or diff<settings['min_diff'] or \
+        diff>settings['max_diff']:
+      universe.setConfiguration(Configuration(universe, x_o))
+      break
+    else:
+      x_o = x_n
+      e_o = e_n
+  return (x_o, e_o)
+
+def _energies(universe, confs, minimize_confs, settings, references):
+  # Minimizes or evaluates confs in the current process
+  from MMTK import Configuration
+  if minimize_confs:
+    from MMTK.Minimization import SteepestDescentMinimizer # @UnresolvedImport
+    minimizer = SteepestDescentMinimizer(universe)
+  results = []
+  for (reference, conf) in zip(references, confs):
+    if minimize_confs:
+      (x, e) = minimize(universe, conf, minimizer, settings)
+    else:
+      universe.setConfiguration(Configuration(universe, conf))
+      (x, e) = (conf, universe.energy())
+    results.append({'reference':reference, 'conf':x, 'energy':e})
+  return results
+
+def energies(universe, confs, minimize_confs=False, cores=1, \
+    settings=default_settings):
+  """
+  Returns lists of configurations and energies, in the order of confs.
+  If minimize_confs is True, the configurations are minimized.
+  """
+  if len(confs)==0:
+    return ([], [])
+  # Daemonic worker processes cannot start their own pools
+  if (cores>1) and (len(confs)>1) and \
+      (not multiprocessing.current_process().daemon):
+    def worker(input, output):
+      for (reference, conf) in iter(input.get, 'STOP'):
+        output.put(_energies(universe, [conf], minimize_confs, settings, \
+          [reference])[0])
+    pool = WorkerPool(worker, min(cores, len(confs)))
+    results = pool.map([(k, confs[k]) for k in range(len(confs))])
+    pool.close()
+  else:
+    results = _energies(universe, confs, minimize_confs, settings, \
+      range(len(confs)))
+  return ([result['conf'] for result in results], \
+    [result['energy'] for result in results])
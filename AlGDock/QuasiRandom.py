@@ -0,0 +1,98 @@
+# Low-discrepancy point sets
+
+"""
+Quasi-random sequences for sampling placements of a ligand.
+
+Points are from Halton sequences with a random shift modulo one
+(a Cranley-Patterson rotation), so that different runs use different
+points while every prefix of the sequence covers the unit cube evenly.
+Integrals over n points then converge nearly as 1/n, instead of
+as 1/sqrt(n) for independent uniform points.
+
+Points within a ball are the points in the cube around it that are
+inside the ball, in order. Rotations are from points in the unit cube
+mapped by the uniform (volume-preserving) map to quaternions
+of Shoemake, Graphics Gems III, 124-132 (1992).
+"""
+
+import numpy as np
+
+_primes = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29]
+
+def radical_inverse(i, base):
+  """
+  Returns the radical inverse of the integers in the array i,
+  their digits in base reflected about the decimal point
+  """
+  i = np.array(i, dtype=np.int64)
+  r = np.zeros(i.shape)
+  f = 1.
+  while (i>0).any():
+    f /= base
+    r += f*(i%base)
+    i //= base
+  return r
+
+def halton(n, dim, start=1, shift=None):
+  """
+  Returns n points of a Halton sequence in the unit cube,
+  as an array with shape (n,dim), starting at index start.
+  @shift: an array with shape (dim,) that is added modulo one.
+    If it is None, a random shift is used.
+  """
+  if dim>len(_primes):
+    raise Exception('Halton sequences are limited to %d dimensions'%\
+      len(_primes))
+  if shift is None:
+    shift = np.random.uniform(size=dim)
+  i = np.arange(start, start+n)
+  h = np.array([radical_inverse(i, _primes[d]) for d in range(dim)]).T
+  return (h + shift)%1.
+
+def ball_points(n, dim=3, extra_dims=0):
+  """
+  Returns the first n points of a shifted Halton sequence
+  that are within the unit ball centered at the origin,
+  as an array with shape (n,dim+extra_dims).
+  The coordinates of extra_dims are in [0,1) and are not constrained.
+  """
+  shift = np.random.uniform(size=dim+extra_dims)
+  points = np.zeros((0,dim+extra_dims))
+  start = 1
+  while len(points)<n:
+    # The unit ball fills more than half of the cube in 2 or 3 dimensions
+    n_try = 2*(n - len(points)) + 16
+    p = halton(n_try, dim+extra_dims, start=start, shift=shift)
+    p[:,:dim] = 2.*p[:,:dim] - 1.
+    points = np.concatenate((points, \
+      p[np.sum(p[:,:dim]**2, axis=1)<=1.]))
+    start += n_try
+  return points[:n]
+
+def rotation_matrices(u):
+  """
+  Returns rotation matrices, with shape (n,3,3),
+  for points u, an array with shape (n,3) in the unit cube.
+  Uniformly distributed points give uniformly distributed rotations.
+  """
+  u = np.asarray(u)
+  q = np.array([np.sqrt(1-u[:,0])*np.sin(2*np.pi*u[:,1]),
+               np.sqrt(1-u[:,0])*np.cos(2*np.pi*u[:,1]),
+               np.sqrt(u[:,0])*np.sin(2*np.pi*u[:,2]),
+               np.sqrt(u[:,0])*np.cos(2*np.pi*u[:,2])])
+  rotMat = np.array([[q[0]*q[0] + q[1]*q[1] - q[2]*q[2] - q[3]*q[3],
+                     2*q[1]*q[2] - 2*q[0]*q[3],
+                     2*q[1]*q[3] + 2*q[0]*q[2]],
+                    [2*q[1]*q[2] + 2*q[0]*q[3],
+                     q[0]*q[0] - q[1]*q[1] + q[2]*q[2] - q[3]*q[3],
+                     2*q[2]*q[3] - 2*q[0]*q[1]],
+                    [2*q[1]*q[3] - 2*q[0]*q[2],
+                     2*q[2]*q[3] + 2*q[0]*q[1],
+                     q[0]*q[0] - q[1]*q[1] - q[2]*q[2] + q[3]*q[3]]])
+  return np.transpose(rotMat, (2,0,1))
+
+def rotations(n):
+  """
+  Returns n rotation matrices from a shifted Halton sequence
+  """
+  return rotation_matrices(halton(n, 3))
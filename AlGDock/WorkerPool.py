@@ -0,0 +1,122 @@
+import multiprocessing
+import numpy as np
+
+def _shared_array(shape, dtype=float):
+  """
+  Returns a numpy view of an array in shared memory
+  """
+  typecode = 'd' if dtype==float else 'l'
+  raw = multiprocessing.RawArray(typecode, int(np.prod(shape)))
+  return np.frombuffer(raw, dtype=dtype).reshape(shape)
+
+class SharedReplicas:
+  """
+  Replica configurations and sampling results in shared memory.
+
+  The arrays are allocated before the workers are forked, so the main
+  process and the workers read and write the same memory. Only the
+  replica index needs to be sent through the queues, instead of
+  pickling the configurations and results dictionaries.
+  """
+  move_types = ['ExternalMC','SmartDarting','Sampler']
+
+  def __init__(self, nreplicas, natoms):
+    """
+    nreplicas - the number of replica slots
+    natoms - the number of atoms in each configuration
+    """
+    nmoves = len(self.move_types)
+    self.confs = _shared_array((nreplicas, natoms, 3))
+    self.Etot = _shared_array((nreplicas,))
+    self.delta_t = _shared_array((nreplicas,))
+    # Whether each move type was executed, and its statistics
+    self.moved = _shared_array((nreplicas, nmoves), dtype=int)
+    self.acc = _shared_array((nreplicas, nmoves), dtype=int)
+    self.att = _shared_array((nreplicas, nmoves), dtype=int)
+    self.time = _shared_array((nreplicas, nmoves))
+
+  def store(self, k, results):
+    """
+    Stores a results dictionary from a worker in slot k
+    """
+    self.confs[k] = results['confs']
+    self.Etot[k] = results['Etot']
+    self.delta_t[k] = results['delta_t']
+    for m in range(len(self.move_types)):
+      s = self.move_types[m]
+      self.moved[k,m] = ('acc_'+s in results.keys())
+      if self.moved[k,m]:
+        self.acc[k,m] = results['acc_'+s]
+        self.att[k,m] = results['att_'+s]
+        self.time[k,m] = results['time_'+s]
+
+  def load(self, k):
+    """
+    Returns the results dictionary in slot k
+    """
+    results = {'confs':np.copy(self.confs[k]), \
+               'Etot':self.Etot[k], 'delta_t':self.delta_t[k], \
+               'reference':k}
+    for m in range(len(self.move_types)):
+      s = self.move_types[m]
+      if self.moved[k,m]:
+        results['acc_'+s] = int(self.acc[k,m])
+        results['att_'+s] = int(self.att[k,m])
+        results['time_'+s] = self.time[k,m]
+    return results
+
+  def __len__(self):
+    return self.confs.shape[0]
+
+class WorkerPool:
+  """
+  A pool of long-lived worker processes.
+
+  The workers are forked once and then execute tasks until the pool is
+  closed. Everything that is set up before the pool is started,
+  such as the MMTK universe, grid force fields, and cached evaluators,
+  is inherited by the workers and stays loaded between tasks.
+  """
+  def __init__(self, worker, ncores, shared=None):
+    """
+    worker - a function, worker(input, output), that executes tasks
+      from the input queue until it receives 'STOP'
+      and puts the results in the output queue
+    ncores - the number of worker processes
+    shared - a SharedReplicas object. If it is not None,
+      the worker is called as worker(input, output, shared)
+    """
+    self.shared = shared
+    self.task_queue = multiprocessing.Queue()
+    self.done_queue = multiprocessing.Queue()
+    args = (self.task_queue, self.done_queue)
+    if shared is not None:
+      args += (shared,)
+    self.processes = [multiprocessing.Process(target=worker, args=args) \
+      for p in range(ncores)]
+    for p in self.processes:
+      p.daemon = True
+      p.start()
+
+  def map(self, tasks):
+    """
+    Executes a list of tasks and returns the results,
+    sorted by the 'reference' key of each result
+    """
+    for task in tasks:
+      self.task_queue.put(task)
+    results = [self.done_queue.get() for task in tasks]
+    return sorted(results, key=lambda result: result['reference'])
+
+  def close(self):
+    """
+    Stops and joins the worker processes
+    """
+    for p in self.processes:
+      self.task_queue.put('STOP')
+    for p in self.processes:
+      p.join()
+    self.processes = []
+
+  def __len__(self):
+    return len(self.processes)
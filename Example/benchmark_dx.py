@@ -0,0 +1,98 @@
+# Compares the time to write and read a synthetic grid in dx format
+# with line-by-line code (the previous behavior) and
+# with the chunked, vectorized code in AlGDock.IO.Grid.
+#
+# The number of points per dimension may be given as an argument.
+# The default is 200.
+
+import AlGDock.IO
+import numpy as np
+import os, sys, time, gzip
+
+n = int(sys.argv[1]) if len(sys.argv)>1 else 200
+
+def write_dx_lines(FN, data):
+  n_points = data['counts'][0]*data['counts'][1]*data['counts'][2]
+  if FN.endswith('.dx'):
+    F = open(FN,'w')
+  else:
+    F = gzip.open(FN,'w')
+  F.write("""object 1 class gridpositions counts {0[0]} {0[1]} {0[2]}
+origin {1[0]} {1[1]} {1[2]}
+delta {2[0]} 0.0 0.0
+delta 0.0 {2[1]} 0.0
+delta 0.0 0.0 {2[2]}
+object 2 class gridconnections counts {0[0]} {0[1]} {0[2]}
+object 3 class array type double rank 0 items {3} data follows
+""".format(data['counts'],data['origin'],data['spacing'],n_points))
+  for start_n in range(0,len(data['vals']),3):
+    F.write(' '.join(['%6e'%c for c in data['vals'][start_n:start_n+3]]) + '\n')
+  F.write('object 4 class field\n')
+  F.write('component "positions" value 1\n')
+  F.write('component "connections" value 2\n')
+  F.write('component "data" value 3\n')
+  F.close()
+
+def read_dx_lines(FN):
+  if FN.endswith('.dx'):
+    F = open(FN,'r')
+  else:
+    F = gzip.open(FN,'r')
+  line = F.readline()
+  while line.find('object')==-1:
+    line = F.readline()
+  counts = [int(x) for x in line.split(' ')[-3:]]
+  for name in ['origin','d0','d1','d2']:
+    F.readline()
+  F.readline()
+  npts = int(F.readline().split(' ')[-3])
+  vals = np.ndarray(shape=npts, dtype=float)
+  index = 0
+  while index<npts:
+    line = F.readline()[:-1]
+    items = [float(item) for item in line.split()]
+    vals[index:index+len(items)] = items
+    index = index + len(items)
+  F.close()
+  return vals
+
+# A smooth grid with a singularity, like a Lennard-Jones grid
+counts = np.array([n,n,n])
+spacing = np.array([0.25,0.25,0.25])
+x = np.arange(n)*spacing[0]
+r2 = (x[:,None,None]-x[n/2])**2 + (x[None,:,None]-x[n/2])**2 + \
+  (x[None,None,:]-x[n/2])**2
+data = {'origin':np.zeros(3), 'spacing':spacing, 'counts':counts, \
+  'vals':(1./(r2+1.)**6).flatten()}
+print '%d points'%len(data['vals'])
+
+IO_Grid = AlGDock.IO.Grid()
+for FN in ['benchmark.dx','benchmark.dx.gz']:
+  print FN
+  times = {}
+
+  start_time = time.time()
+  write_dx_lines(FN, data)
+  times['write, line by line'] = time.time()-start_time
+
+  start_time = time.time()
+  vals_lines = read_dx_lines(FN)
+  times['read, line by line'] = time.time()-start_time
+
+  start_time = time.time()
+  IO_Grid.write(FN, data)
+  times['write, vectorized'] = time.time()-start_time
+
+  start_time = time.time()
+  vals = IO_Grid.read(FN, cache=False)['vals']
+  times['read, vectorized'] = time.time()-start_time
+
+  for key in ['write, line by line','write, vectorized', \
+      'read, line by line','read, vectorized']:
+    print '  %s: %.2f s'%(key, times[key])
+  print '  write speedup: %.1f'%(\
+    times['write, line by line']/times['write, vectorized'])
+  print '  read speedup: %.1f'%(\
+    times['read, line by line']/times['read, vectorized'])
+  print '  maximum difference: %.3e'%np.max(np.abs(vals-vals_lines))
+  os.remove(FN)
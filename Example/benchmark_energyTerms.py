@@ -0,0 +1,69 @@
+# Compares configurations/second for calculating energy terms
+# one configuration at a time (the previous behavior) and
+# with the batched evaluation in _energyTerms,
+# which records every term in one pass over the configurations.
+#
+# Run test_python.py first so that the cooling and docking directories exist.
+
+import AlGDock.BindingPMF
+from AlGDock.BindingPMF import term_map
+from MMTK.ParticleProperties import Configuration
+import numpy as np
+import time
+
+N = 500
+
+self = AlGDock.BindingPMF.BPMF(\
+  dir_dock='dock', dir_cool='cool',\
+  ligand_tarball='prmtopcrd/ligand.tar.gz', \
+  ligand_database='ligand.db', \
+  forcefield='prmtopcrd/gaff.dat', \
+  ligand_prmtop='ligand.prmtop', \
+  ligand_inpcrd='ligand.trans.inpcrd', \
+  receptor_tarball='prmtopcrd/receptor.tar.gz', \
+  receptor_prmtop='receptor.prmtop', \
+  receptor_inpcrd='receptor.trans.inpcrd', \
+  receptor_fixed_atoms='receptor.pdb', \
+  complex_tarball='prmtopcrd/complex.tar.gz', \
+  complex_prmtop='complex.prmtop', \
+  complex_inpcrd='complex.trans.inpcrd', \
+  complex_fixed_atoms='complex.pdb', \
+  dir_grid='grids', \
+  site='Sphere', site_center=[1.74395, 1.74395, 1.74395], site_max_R=0.6, \
+  run_type=None)
+
+# Random rigid translations of the ligand within the binding site
+conf = self.confs['ligand']
+com = np.mean(conf,0)
+confs = [conf - com + np.array(self.params['dock']['site_center']) + \
+  np.random.uniform(-0.3, 0.3, size=3) for n in range(N)]
+
+# One configuration at a time
+lambda_full = {'T':self.T_HIGH,'MM':True,'site':True}
+for scalable in self._scalables:
+  lambda_full[scalable] = 1
+self._set_universe_evaluator(lambda_full)
+terms = ['MM','site','misc'] + self._scalables
+start_time = time.time()
+E_loop = {}
+for term in terms:
+  E_loop[term] = np.zeros(N, dtype=float)
+for c in range(N):
+  self.universe.setConfiguration(Configuration(self.universe,confs[c]))
+  eT = self.universe.energyTerms()
+  for (key,value) in eT.iteritems():
+    E_loop[term_map[key]][c] += value
+loop_rate = N/(time.time()-start_time)
+
+# Batched evaluation, after loading every evaluator once
+self._energyTerms(confs[:2])
+start_time = time.time()
+E_batch = self._energyTerms(confs)
+batch_rate = N/(time.time()-start_time)
+
+print '%d configurations'%N
+print 'one at a time: %.1f configurations/s'%loop_rate
+print 'batched: %.1f configurations/s'%batch_rate
+print 'speedup: %.2f'%(batch_rate/loop_rate)
+print 'maximum difference: %.3e kJ/mol'%max(\
+  [np.max(np.abs(E_loop[term]-E_batch[term])) for term in terms])
@@ -0,0 +1,63 @@
+# Compares the number of grid interpolations per second with grid values
+# stored in C order (the linear layout) and in bricks of 4x4x4 cells
+# (the blocked layout), for random positions near the center of a grid.
+#
+# The number of points per dimension and the half-width of the box
+# of positions, in nm, may be given as arguments.
+# The defaults are 300 and 0.5.
+
+import AlGDock
+import AlGDock.IO
+from AlGDock.ForceFields.Grid import Interpolation
+
+from MMTK import *
+import numpy as np
+import os, sys, time
+
+n = int(sys.argv[1]) if len(sys.argv)>1 else 300
+R = float(sys.argv[2]) if len(sys.argv)>2 else 0.5
+natoms = 5000
+nevals = 20
+
+# A smooth grid with a singularity, like a Lennard-Jones grid.
+# The spacing is 0.25 A.
+counts = np.array([n,n,n])
+spacing = np.array([0.25,0.25,0.25])
+x = np.arange(n)*spacing[0]
+r2 = (x[:,None,None]-x[n/2])**2 + (x[None,:,None]-x[n/2])**2 + \
+  (x[None,None,:]-x[n/2])**2
+FN = 'benchmark_grid_layout.bin'
+AlGDock.IO.Grid().write(FN, {'origin':np.zeros(3), 'spacing':spacing, \
+  'counts':counts, 'vals':(1./(r2+1.)**6).flatten()})
+del r2
+
+universe = InfiniteUniverse()
+center = 0.1*x[n/2] # nm
+np.random.seed(0)
+for pos in center + np.random.uniform(-R, R, size=(natoms,3)):
+  atom = Atom('C', position=Vector(*pos))
+  atom.test_charge = 1.
+  universe.addObject(atom)
+
+print '%d atoms in a box with a half-width of %.2f nm'%(natoms, R)
+print 'grid with %d points'%np.prod(counts)
+for interpolation_type in ['Trilinear','BSpline']:
+  for precision in ['double','single']:
+    rates = {}
+    for layout in ['linear','blocked']:
+      FF = Interpolation.InterpolationForceField(FN, name='LJr', \
+        interpolation_type=interpolation_type, \
+        scaling_property='test_charge', inv_power=-2, \
+        precision=precision, layout=layout)
+      universe.setForceField(FF)
+      universe.energyAndGradients() # Warm up
+      start_time = time.time()
+      for e in range(nevals):
+        universe.energyAndGradients()
+      rates[layout] = natoms*nevals/(time.time()-start_time)
+      Interpolation.clear_grid_cache()
+    print '%s, %s precision: '%(interpolation_type, precision) + \
+      'linear %.3e/s, blocked %.3e/s, speedup %.2f'%(\
+      rates['linear'], rates['blocked'], rates['blocked']/rates['linear'])
+
+os.remove(FN)
@@ -0,0 +1,85 @@
+# Compares replica exchange sweeps/second for
+# workers that are forked for every sweep (the previous behavior),
+# a persistent pool of workers that lasts for the whole cycle, and
+# a persistent pool that exchanges configurations through shared memory.
+#
+# Run test_python.py first so that the cooling and docking directories exist.
+
+import AlGDock.BindingPMF
+from AlGDock.WorkerPool import WorkerPool, SharedReplicas
+import numpy as np
+import time
+
+K = 20
+nsweeps = 20
+
+self = AlGDock.BindingPMF.BPMF(\
+  dir_dock='dock', dir_cool='cool',\
+  ligand_tarball='prmtopcrd/ligand.tar.gz', \
+  ligand_database='ligand.db', \
+  forcefield='prmtopcrd/gaff.dat', \
+  ligand_prmtop='ligand.prmtop', \
+  ligand_inpcrd='ligand.trans.inpcrd', \
+  receptor_tarball='prmtopcrd/receptor.tar.gz', \
+  receptor_prmtop='receptor.prmtop', \
+  receptor_inpcrd='receptor.trans.inpcrd', \
+  receptor_fixed_atoms='receptor.pdb', \
+  complex_tarball='prmtopcrd/complex.tar.gz', \
+  complex_prmtop='complex.prmtop', \
+  complex_inpcrd='complex.trans.inpcrd', \
+  complex_fixed_atoms='complex.pdb', \
+  dir_grid='grids', \
+  sampler='NUTS', MCMC_moves=1, \
+  steps_per_sweep=50, \
+  site='Sphere', site_center=[1.74395, 1.74395, 1.74395], site_max_R=0.6, \
+  cores=-1, \
+  run_type=None)
+
+# A 20-replica docking protocol
+lambdas = [self._lambda(a, 'dock', MM=True, site=True, crossed=False) \
+  for a in np.linspace(0., 1., K)]
+for lambda_k in lambdas:
+  lambda_k['delta_t'] = 1.5*AlGDock.BindingPMF.MMTK.Units.fs
+  self._set_universe_evaluator(lambda_k)
+confs = [np.copy(self.confs['ligand']) for k in range(K)]
+
+def sweep(pool):
+  if pool.shared is None:
+    results = pool.map([(confs[k], 'dock', lambdas[k], False, k) \
+      for k in range(K)])
+  else:
+    results = self._sim_shared(pool, confs, 'dock', lambdas, False)
+  for k in range(K):
+    confs[k] = results[k]['confs']
+
+# Workers forked for every sweep
+start_time = time.time()
+for n in range(nsweeps):
+  pool = WorkerPool(self._sim_one_state_worker, self._cores)
+  sweep(pool)
+  pool.close()
+forked_rate = nsweeps/(time.time()-start_time)
+
+# Persistent pool of workers
+start_time = time.time()
+pool = WorkerPool(self._sim_one_state_worker, self._cores)
+for n in range(nsweeps):
+  sweep(pool)
+pool.close()
+persistent_rate = nsweeps/(time.time()-start_time)
+
+# Persistent pool of workers with shared memory
+start_time = time.time()
+pool = WorkerPool(self._sim_one_state_worker, self._cores, \
+  SharedReplicas(K, self.universe.numberOfAtoms()))
+for n in range(nsweeps):
+  sweep(pool)
+pool.close()
+shared_rate = nsweeps/(time.time()-start_time)
+
+print '%d replicas on %d cores'%(K, self._cores)
+print 'forked for every sweep: %.3f sweeps/s'%forked_rate
+print 'persistent pool: %.3f sweeps/s'%persistent_rate
+print 'persistent pool with shared memory: %.3f sweeps/s'%shared_rate
+print 'speedup: %.2f, %.2f'%(\
+  persistent_rate/forked_rate, shared_rate/forked_rate)
@@ -0,0 +1,63 @@
+# Compares energies and gradients from grids stored in
+# double and single precision for stored docking configurations.
+# For every scalable grid, reports the maximum and root mean square
+# deviation over all the configurations.
+#
+# Run test_python.py first so that the docking directory exists.
+
+import AlGDock.BindingPMF
+from AlGDock.ForceFields.Grid.Interpolation import InterpolationForceField
+from MMTK.ParticleProperties import Configuration
+import numpy as np
+
+self = AlGDock.BindingPMF.BPMF(\
+  dir_dock='dock', dir_cool='cool',\
+  ligand_tarball='prmtopcrd/ligand.tar.gz', \
+  ligand_database='ligand.db', \
+  forcefield='prmtopcrd/gaff.dat', \
+  ligand_prmtop='ligand.prmtop', \
+  ligand_inpcrd='ligand.trans.inpcrd', \
+  receptor_tarball='prmtopcrd/receptor.tar.gz', \
+  receptor_prmtop='receptor.prmtop', \
+  receptor_inpcrd='receptor.trans.inpcrd', \
+  receptor_fixed_atoms='receptor.pdb', \
+  complex_tarball='prmtopcrd/complex.tar.gz', \
+  complex_prmtop='complex.prmtop', \
+  complex_inpcrd='complex.trans.inpcrd', \
+  complex_fixed_atoms='complex.pdb', \
+  dir_grid='grids', \
+  site='Sphere', site_center=[1.74395, 1.74395, 1.74395], site_max_R=0.6, \
+  run_type=None)
+
+# Stored configurations from all docking states and cycles
+confs = []
+for state_samples in self.confs['dock']['samples']:
+  for cycle_samples in state_samples:
+    confs += list(cycle_samples)
+if len(confs)==0:
+  raise Exception('There are no stored docking configurations')
+print '%d stored configurations'%len(confs)
+
+def energies_and_gradients(FF):
+  self.universe.setForceField(FF)
+  E = np.zeros(len(confs))
+  G = np.zeros((len(confs),self.universe.numberOfAtoms(),3))
+  for c in range(len(confs)):
+    self.universe.setConfiguration(Configuration(self.universe,confs[c]))
+    (E[c], g) = self.universe.energyAndGradients()
+    G[c] = g.array
+  return (E, G)
+
+print '%5s %12s %12s %12s %12s'%('grid', \
+  'max |dE|', 'rms dE', 'max |dG|', 'rms dG')
+for scalable in self._scalables:
+  results = {}
+  for precision in ['double','single']:
+    self._grid_precision = precision
+    results[precision] = energies_and_gradients(self._load_grid(scalable))
+  dE = results['single'][0] - results['double'][0]
+  dG = results['single'][1] - results['double'][1]
+  print '%5s %12.4e %12.4e %12.4e %12.4e'%(scalable, \
+    np.max(np.abs(dE)), np.sqrt(np.mean(dE**2)), \
+    np.max(np.abs(dG)), np.sqrt(np.mean(dG**2)))
+print 'energies in kJ/mol, gradients in kJ/mol/nm'
@@ -0,0 +1,110 @@
+# This module evaluates the potential energy of many configurations
+#
+# Written by David Minh
+#
+
+import numpy as np
+cimport numpy as np
+import cython
+
+cimport MMTK_trajectory_generator
+
+include "MMTK/python.pxi"
+include "MMTK/numeric.pxi"
+include "MMTK/core.pxi"
+include "MMTK/universe.pxi"
+include "MMTK/trajectory.pxi"
+include "MMTK/forcefield.pxi"
+
+#
+# Batch energy evaluator
+#
+cdef class BatchEnergyEvaluator(MMTK_trajectory_generator.EnergyBasedTrajectoryGenerator):
+
+  """
+  Evaluates the potential energy of a series of configurations
+  with the current evaluator of the universe.
+  The evaluation is started by calling the object with an
+  (N, natoms, 3) array of configurations.
+  It returns an array of N energies in kJ/mol.
+  If the number of energy terms in the evaluator, nterms, is also given,
+  it returns the energies and an (N, nterms) array of the energy terms,
+  which are recorded in the same pass.
+  The universe configuration is not changed.
+  """
+
+  cdef np.ndarray confs
+  cdef energy_data energy
+  cdef int nterms
+
+  def __init__(self, universe, **options):
+    """
+    @param universe: the universe for which energies are evaluated
+    @type universe: L{MMTK.Universe}
+    @keyword threads: the number of threads to use in energy evaluation
+                      (default set by MMTK_ENERGY_THREADS)
+    @type threads: C{int}
+    """
+    MMTK_trajectory_generator.EnergyBasedTrajectoryGenerator.__init__(
+        self, universe, options, "Batch energy evaluator")
+    # Supported features: none for the moment, to keep it simple
+    self.features = []
+
+  default_options = {'first_step': 0, 'steps': 0,
+                     'background': False, 'threads': None,
+                     'actions': []}
+
+  available_data = ['energy']
+
+  restart_data = []
+
+  def __call__(self, confs, nterms=0, **options):
+    self.setCallOptions(options)
+    self.actions = []
+    self.universe_spec = <PyUniverseSpecObject *>self.universe._spec
+    self.confs = np.ascontiguousarray(confs, dtype=float)
+    self.nterms = nterms
+    return self.start()
+
+  # Cython compiler directives set for efficiency:
+  # - No bound checks on index operations
+  # - No support for negative indices
+  @cython.boundscheck(False)
+  @cython.wraparound(False)
+  cdef start(self):
+    cdef int c, t, nconfs
+    cdef np.ndarray[double, ndim=3] confs = self.confs
+    cdef np.ndarray[double, ndim=1] energies
+    cdef np.ndarray[double, ndim=2] terms
+
+    nconfs = confs.shape[0]
+    energies = np.zeros(nconfs)
+    terms = np.zeros((nconfs, self.nterms))
+
+    # Gradients and force constants are not requested
+    self.energy.gradients = NULL
+    self.energy.gradient_fn = NULL
+    self.energy.force_constants = NULL
+    self.energy.fc_fn = NULL
+
+    self.initializeTrajectoryActions()
+
+    # Acquire the write lock of the universe.
+    # It is converted to a read lock for energy evaluation.
+    self.acquireWriteLock()
+
+    for c in range(nconfs):
+      self.calculateEnergies(confs[c], &self.energy, 0)
+      energies[c] = self.energy.energy
+      for t in range(self.nterms):
+        terms[c,t] = self.energy.energy_terms[t]
+
+    # Release the write lock.
+    self.releaseWriteLock()
+
+    # Finalize all trajectory actions (close files etc.)
+    self.finalizeTrajectoryActions(0)
+
+    if self.nterms==0:
+      return energies
+    return (energies, terms)
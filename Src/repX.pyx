@@ -8,19 +8,92 @@ ctypedef np.float_t float_t
 ctypedef np.int_t int_t
 
 @cython.boundscheck(False)
-cpdef attempt_swaps(\
-    state_inds, inv_state_inds, u_ij, \
+@cython.wraparound(False)
+cdef int _attempt_swaps(\
+    np.ndarray[int_t, ndim=1] state_inds, \
+    np.ndarray[int_t, ndim=1] inv_state_inds, \
+    np.ndarray[float_t, ndim=2] u_sc, \
+    np.ndarray[int_t, ndim=2] pairs, \
+    np.ndarray[float_t, ndim=1] log_rand):
+  """
+  Attempts to swap the configurations in each pair of states.
+
+  u_sc[s,c] is the reduced energy of configuration c in state s,
+  pairs[n] are the states in the nth attempt, and
+  log_rand[n] is the logarithm of a uniform random number for the attempt.
+  Because u_sc is indexed by state, it does not need to be reordered.
+  Returns the number of accepted swaps.
+  """
+  cdef int n, t1, t2, a, b
+  cdef int nacc = 0
+  cdef double ddu
+  for n in range(pairs.shape[0]):
+    t1 = pairs[n,0]
+    t2 = pairs[n,1]
+    a = inv_state_inds[t1]
+    b = inv_state_inds[t2]
+    ddu = -u_sc[t1,b]-u_sc[t2,a]+u_sc[t1,a]+u_sc[t2,b]
+    if (ddu>0) or (log_rand[n]<ddu):
+      inv_state_inds[t1] = b
+      inv_state_inds[t2] = a
+      state_inds[a] = t2
+      state_inds[b] = t1
+      nacc += 1
+  return nacc
+
+def _state_major(state_inds, u_ij):
+  """
+  Converts u_ij, where i is the replica and j is the configuration,
+  into a contiguous array indexed by state and configuration
+  """
+  u_ij = np.asarray(u_ij, dtype=np.float)
+  u_sc = np.empty_like(u_ij)
+  u_sc[state_inds,:] = u_ij
+  return u_sc
+
+def attempt_swaps(state_inds, inv_state_inds, u_ij, \
     pairs_to_swap, int nattempts):
-  cdef int attempt, t1, t2, a, b
-  cdef float ddu
-  for attempt in range(nattempts):
-    for (t1,t2) in pairs_to_swap:
-      a = inv_state_inds[t1]
-      b = inv_state_inds[t2]
-      ddu = -u_ij[a][b]-u_ij[b][a]+u_ij[a][a]+u_ij[b][b]
-      if (ddu>0) or (np.random.uniform()<np.exp(ddu)):
-        u_ij[a],u_ij[b] = u_ij[b],u_ij[a]
-        state_inds[a],state_inds[b] = state_inds[b],state_inds[a]
-        inv_state_inds[state_inds[a]],inv_state_inds[state_inds[b]] = \
-          inv_state_inds[state_inds[b]],inv_state_inds[state_inds[a]]
-  return state_inds, inv_state_inds
\ No newline at end of file
+  """
+  Attempts to swap neighboring replicas.
+
+  state_inds - the state of each replica
+  inv_state_inds - the replica in each state
+  u_ij - a (K,K) array (or list of arrays) of reduced energies, where
+    u_ij[i,j] is the energy of configuration j in the state of replica i
+  pairs_to_swap - a list of pairs of states
+  nattempts - the number of passes through pairs_to_swap
+
+  Returns arrays of state_inds and inv_state_inds.
+  """
+  state_inds = np.array(state_inds, dtype=np.int)
+  inv_state_inds = np.array(inv_state_inds, dtype=np.int)
+  u_sc = _state_major(state_inds, u_ij)
+  pairs = np.tile(np.array(pairs_to_swap, dtype=np.int).reshape(-1,2), \
+    (nattempts,1))
+  log_rand = np.log(np.random.uniform(size=pairs.shape[0]))
+  _attempt_swaps(state_inds, inv_state_inds, u_sc, pairs, log_rand)
+  return state_inds, inv_state_inds
+
+def attempt_independence_swaps(state_inds, inv_state_inds, u_ij, \
+    int nattempts):
+  """
+  Samples the permutation of states with Gibbs independence sampling.
+
+  Swaps between randomly selected pairs of states, which need not be
+  neighbors, are attempted nattempts times. With enough attempts,
+  the permutation is nearly independent of the previous one.
+  The arguments and return values are the same as for attempt_swaps.
+  """
+  state_inds = np.array(state_inds, dtype=np.int)
+  inv_state_inds = np.array(inv_state_inds, dtype=np.int)
+  K = len(state_inds)
+  if K<2:
+    return state_inds, inv_state_inds
+  u_sc = _state_major(state_inds, u_ij)
+  # Draw the first state of the pair and an offset to the second
+  pairs = np.empty((nattempts,2), dtype=np.int)
+  pairs[:,0] = np.random.randint(K, size=nattempts)
+  pairs[:,1] = (pairs[:,0] + np.random.randint(1, K, size=nattempts)) % K
+  log_rand = np.log(np.random.uniform(size=nattempts))
+  _attempt_swaps(state_inds, inv_state_inds, u_sc, pairs, log_rand)
+  return state_inds, inv_state_inds
@@ -0,0 +1,67 @@
+# Checks that replica exchange swaps satisfy detailed balance
+# on synthetic reduced energies.
+#
+# For every permutation of states, the stationary probability is
+#   pi(s) = exp(-sum_c u[s[c],c])/Z
+# where s[c] is the state of configuration c.
+# Transitions between permutations should satisfy
+#   pi(s) P(s->s') = pi(s') P(s'->s)
+
+import numpy as np
+import itertools
+
+try:
+  from repX import attempt_swaps, attempt_independence_swaps
+except ImportError:
+  import pyximport
+  pyximport.install(setup_args={'include_dirs':np.get_include()})
+  from repX import attempt_swaps, attempt_independence_swaps
+
+np.random.seed(0)
+
+K = 3
+# u[s,c] is the reduced energy of configuration c in state s
+u = np.random.normal(scale=1.0, size=(K,K))
+
+perms = list(itertools.permutations(range(K)))
+perm_index = dict([(perms[n],n) for n in range(len(perms))])
+pi = np.array([np.exp(-sum([u[s[c],c] for c in range(K)])) for s in perms])
+pi /= pi.sum()
+
+pairs_to_swap = [(0,1),(1,2),(0,2)]
+nsweeps = 200000
+
+def transition_counts(swap):
+  state_inds = range(K)
+  inv_state_inds = range(K)
+  counts = np.zeros((len(perms),len(perms)))
+  for sweep in range(nsweeps):
+    # u_ij[i,j] is the energy of configuration j in the state of replica i
+    u_ij = u[state_inds,:]
+    old = perm_index[tuple(state_inds)]
+    (state_inds, inv_state_inds) = swap(state_inds, inv_state_inds, u_ij)
+    assert (np.array(inv_state_inds)[state_inds]==np.arange(K)).all()
+    counts[old,perm_index[tuple(state_inds)]] += 1
+  return counts
+
+for (name, swap) in [\
+    ('neighbors', lambda s, i, u_ij: \
+      attempt_swaps(s, i, u_ij, pairs_to_swap[np.random.randint(3):][:1], 1)), \
+    ('Gibbs', lambda s, i, u_ij: \
+      attempt_independence_swaps(s, i, u_ij, 1)), \
+    ('Gibbs, many attempts', lambda s, i, u_ij: \
+      attempt_independence_swaps(s, i, u_ij, 27))]:
+  counts = transition_counts(swap)
+  visits = counts.sum(axis=1)
+  flux = counts/nsweeps
+  # Tolerance of about five standard deviations
+  tol = 5*np.sqrt(flux/nsweeps) + 1E-3
+  print '%s:'%name
+  print '  exact populations  ', ' '.join(['%.4f'%p for p in pi])
+  print '  sampled populations', \
+    ' '.join(['%.4f'%p for p in visits/nsweeps])
+  print '  max |flux(s->s\') - flux(s\'->s)| = %.5f'%\
+    np.max(np.abs(flux - flux.T))
+  assert np.allclose(visits/nsweeps, pi, atol=0.01)
+  assert (np.abs(flux - flux.T) < tol + tol.T).all()
+print 'Detailed balance is satisfied'
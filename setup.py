@@ -317,11 +317,16 @@ ext_module_name_and_path = [\
   ('MMTK_sphere', 'AlGDock/ForceFields/Sphere/MMTK_sphere.pyx'), \
   ('MMTK_trilinear_grid', 'AlGDock/ForceFields/Grid/MMTK_trilinear_grid.pyx'), \
   ('MMTK_trilinear_isqrt_grid', 'AlGDock/ForceFields/Grid/MMTK_trilinear_isqrt_grid.pyx'), \
+  ('MMTK_trilinear_multi_grid', 'AlGDock/ForceFields/Grid/MMTK_trilinear_multi_grid.pyx'), \
+  ('MMTK_trilinear_multires_grid', 'AlGDock/ForceFields/Grid/MMTK_trilinear_multires_grid.pyx'), \
+  ('MMTK_Tricubic_grid', 'AlGDock/ForceFields/Grid/MMTK_Tricubic_grid.pyx'), \
+  ('MMTK_Tricubic_transform_grid', 'AlGDock/ForceFields/Grid/MMTK_Tricubic_transform_grid.pyx'), \
   ('NUTS', 'AlGDock/Integrators/NUTS/NUTS.pyx'), \
   ('NUTS_no_stopping', 'AlGDock/Integrators/NUTS/NUTS_no_stopping.pyx'), \
   ('SmartDarting', 'AlGDock/Integrators/SmartDarting/SmartDarting.pyx'), \
   ('BAT', 'Src/BAT.pyx'),
-  ('repX', 'Src/repX.pyx')]
+  ('repX', 'Src/repX.pyx'),
+  ('BatchEnergies', 'Src/BatchEnergies.pyx')]
 
 if False:
   # These extension modules are not used in the current code,
@@ -335,12 +340,6 @@ if False:
      ('MMTK_CatmullRom_grid', 'AlGDock/ForceFields/Grid/MMTK_CatmullRom_grid.pyx'), \
      ('MMTK_CatmullRom_transform_grid', 'AlGDock/ForceFields/Grid/MMTK_CatmullRom_transform_grid.pyx')])
 
-if False:
-  # These extension modules need to be debugged.
-  ext_module_name_and_path.extend(\
-    [('MMTK_tricubic_grid', 'AlGDock/ForceFields/Grid/MMTK_tricubic_grid.pyx'), \
-     ('MMTK_tricubic_transform_grid', 'AlGDock/ForceFields/Grid/MMTK_tricubic_transformgrid.pyx')])
-
 setup (name = package_name,
        version = pkginfo.__version__,
        description = "Molecular docking with an adaptively alchemical interaction grid",